@@ -0,0 +1,223 @@
+"""
+# Summary
+
+Benchmarks comparing one-request-per-item scripts with the bulk classes:
+network attach (chunked multi-network POSTs) and network/VRF create
+(bounded concurrent POSTs).  The mock controller is reset before every
+round, so each round creates and attaches the same items.
+"""
+
+# We are using isort for import sorting.
+# pylint: disable=wrong-import-order
+
+import pytest
+
+pytest.importorskip("plugins.module_utils.common.rest_send_v2", reason="ansible-dcnm is not on PYTHONPATH")
+
+# pylint: disable=wrong-import-position
+from conftest import SWITCHES_PER_FABRIC, clear_caches
+from ndfc_python.network_attach import NetworkAttach
+from ndfc_python.network_attach_bulk import NetworkAttachBulk
+from ndfc_python.network_create import NetworkCreate
+from ndfc_python.network_create_bulk import NetworkCreateBulk
+from ndfc_python.validators.network_attach import NetworkAttachConfig
+from ndfc_python.validators.network_create import NetworkCreateConfig
+from ndfc_python.validators.vrf_create import VrfCreateConfig
+from ndfc_python.vrf_create import VrfCreate
+from ndfc_python.vrf_create_bulk import VrfCreateBulk
+
+ROUNDS = 5
+ITEMS = 32
+
+
+def attach_config() -> list[NetworkAttachConfig]:
+    """
+    Attach networks NET_1 .. NET_n to vPC pairs of switches in FABRIC_1.
+    """
+    config = []
+    for index in range(ITEMS):
+        switch_index = (index * 2) % SWITCHES_PER_FABRIC + 1
+        item = {}
+        item["fabric_name"] = "FABRIC_1"
+        item["network_name"] = f"NET_{index % 8 + 1}"
+        item["switch_name"] = f"FABRIC_1-LEAF-{switch_index}"
+        item["peer_switch_name"] = f"FABRIC_1-LEAF-{switch_index + 1}"
+        item["switch_ports"] = ["Ethernet1/1"]
+        item["vlan"] = 1000 + index % 8 + 1
+        config.append(NetworkAttachConfig(**item))
+    # The same network and vPC pair may only be listed once.
+    unique = {(cfg.networkName, cfg.switch_name): cfg for cfg in config}
+    return list(unique.values())
+
+
+def network_create_config() -> list[NetworkCreateConfig]:
+    """
+    New networks in FABRIC_1, with ids and VLANs clear of the synthetic ones.
+    """
+    config = []
+    for index in range(ITEMS):
+        item = {}
+        item["fabric_name"] = "FABRIC_1"
+        item["gateway_ip_address"] = f"10.200.{index}.1/24"
+        item["is_layer2_only"] = False
+        item["network_id"] = 40000 + index
+        item["network_name"] = f"BENCH_NET_{index}"
+        item["suppress_arp"] = False
+        item["vlan_id"] = 2000 + index
+        item["vrf_name"] = "VRF_1"
+        config.append(NetworkCreateConfig(**item))
+    return config
+
+
+def vrf_create_config() -> list[VrfCreateConfig]:
+    """
+    New VRFs in FABRIC_1, with ids and VLANs clear of the synthetic ones.
+    """
+    config = []
+    for index in range(ITEMS):
+        item = {}
+        item["fabric_name"] = "FABRIC_1"
+        item["vrf_display_name"] = f"BENCH_VRF_{index}"
+        item["vrf_id"] = 60000 + index
+        item["vrf_name"] = f"BENCH_VRF_{index}"
+        item["vrf_vlan_id"] = 3500 + index
+        config.append(VrfCreateConfig(**item))
+    return config
+
+
+@pytest.fixture
+def reset(mock_controller):
+    """
+    Return a pedantic setup function that resets the controller and caches.
+    """
+
+    def setup():
+        mock_controller.reset()
+        clear_caches()
+
+    return setup
+
+
+@pytest.mark.benchmark(group="network_attach")
+def bench_network_attach_per_item(benchmark, rest_send, results, reset):
+    """
+    NetworkAttach.commit() once per config item, as network_attach.py does
+    """
+    config = attach_config()
+
+    def run():
+        for cfg in config:
+            instance = NetworkAttach()
+            instance.rest_send = rest_send
+            instance.results = results
+            instance.fabric_name = cfg.fabric
+            instance.network_name = cfg.networkName
+            instance.peer_switch_name = cfg.peer_switch_name
+            instance.switch_name = cfg.switch_name
+            instance.switch_ports = cfg.switchPorts
+            instance.vlan = cfg.vlan
+            instance.commit()
+
+    benchmark.pedantic(run, setup=reset, rounds=ROUNDS)
+
+
+@pytest.mark.benchmark(group="network_attach")
+def bench_network_attach_bulk(benchmark, rest_send, results, reset):
+    """
+    NetworkAttachBulk.commit() for the same config, as network_attach.py --bulk does
+    """
+    config = attach_config()
+
+    def run():
+        instance = NetworkAttachBulk()
+        instance.rest_send = rest_send
+        instance.results = results
+        instance.config = config
+        instance.commit()
+        assert all(item["success"] for item in instance.item_results)
+
+    benchmark.pedantic(run, setup=reset, rounds=ROUNDS)
+
+
+@pytest.mark.benchmark(group="network_create")
+def bench_network_create_per_item(benchmark, rest_send, results, reset):
+    """
+    NetworkCreate.commit() once per config item, as network_create.py does
+    """
+    config = network_create_config()
+
+    def run():
+        for cfg in config:
+            instance = NetworkCreate()
+            instance.rest_send = rest_send
+            instance.results = results
+            instance.fabric_name = cfg.fabric_name
+            instance.network_name = cfg.network_name
+            instance.gateway_ip_address = cfg.gateway_ip_address
+            instance.network_id = cfg.network_id
+            instance.suppress_arp = cfg.suppress_arp
+            instance.vlan_id = cfg.vlan_id
+            instance.vrf_name = cfg.vrf_name
+            instance.commit()
+
+    benchmark.pedantic(run, setup=reset, rounds=ROUNDS)
+
+
+@pytest.mark.benchmark(group="network_create")
+@pytest.mark.parametrize("max_workers", [1, 8])
+def bench_network_create_bulk(benchmark, rest_send, reset, max_workers):
+    """
+    NetworkCreateBulk.commit() for the same config, as network_create.py --bulk does
+    """
+    config = network_create_config()
+
+    def run():
+        instance = NetworkCreateBulk()
+        instance.rest_send = rest_send
+        instance.max_workers = max_workers
+        instance.config = config
+        instance.commit()
+        assert all(item["success"] for item in instance.item_results)
+
+    benchmark.pedantic(run, setup=reset, rounds=ROUNDS)
+
+
+@pytest.mark.benchmark(group="vrf_create")
+def bench_vrf_create_per_item(benchmark, rest_send, results, reset):
+    """
+    VrfCreate.commit() once per config item, as vrf_create.py does
+    """
+    config = vrf_create_config()
+
+    def run():
+        for cfg in config:
+            instance = VrfCreate()
+            instance.rest_send = rest_send
+            instance.results = results
+            instance.display_name = cfg.vrf_display_name
+            instance.fabric_name = cfg.fabric_name
+            instance.vrf_id = cfg.vrf_id
+            instance.vrf_name = cfg.vrf_name
+            instance.vrf_vlan_id = cfg.vrf_vlan_id
+            instance.commit()
+
+    benchmark.pedantic(run, setup=reset, rounds=ROUNDS)
+
+
+@pytest.mark.benchmark(group="vrf_create")
+@pytest.mark.parametrize("max_workers", [1, 8])
+def bench_vrf_create_bulk(benchmark, rest_send, reset, max_workers):
+    """
+    VrfCreateBulk.commit() for the same config, as vrf_create.py --bulk does
+    """
+    config = vrf_create_config()
+
+    def run():
+        instance = VrfCreateBulk()
+        instance.rest_send = rest_send
+        instance.max_workers = max_workers
+        instance.config = config
+        instance.commit()
+        assert all(item["success"] for item in instance.item_results)
+
+    benchmark.pedantic(run, setup=reset, rounds=ROUNDS)
@@ -0,0 +1,122 @@
+"""
+# Summary
+
+Benchmarks for Sender's ControllerCluster against three mock controller
+nodes sharing one state, with 2, 10 and 20 ms of latency: 30 GETs
+distributed round_robin versus least_latency, and GETs from a cluster
+whose first node is unreachable (failover).
+
+extra_info records the requests served by each node.
+"""
+
+# We are using isort for import sorting.
+# pylint: disable=wrong-import-order,redefined-outer-name
+
+import socket
+
+import pytest
+from ndfc_python.controller_cluster import ControllerCluster
+from ndfc_python.mock_controller import MockController
+from ndfc_python.sender_request import SenderRequest
+from ndfc_python.sender_requests import Sender
+
+API = MockController.API
+REQUEST = SenderRequest("GET", f"{API}/top-down/fabrics/FABRIC_1/vrfs")
+NODE_LATENCY = (0.002, 0.010, 0.020)
+REQUESTS = 30
+
+
+@pytest.fixture(scope="module")
+def cluster_nodes():
+    """
+    Three MockController nodes of one cluster, slowest last.
+    """
+    nodes = []
+    for latency in NODE_LATENCY:
+        node = MockController(shared=nodes[0].shared if nodes else None)
+        node.fabrics = 1
+        node.default_latency = latency
+        node.start()
+        nodes.append(node)
+    yield nodes
+    for node in nodes:
+        node.stop()
+
+
+def unused_address() -> str:
+    """
+    Return a "host:port" on which nothing listens.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"127.0.0.1:{sock.getsockname()[1]}"
+
+
+def cluster_sender(hosts: list[str], strategy: str = "round_robin"):
+    """
+    Return a logged-in Sender over a ControllerCluster of hosts.
+    """
+    cluster = ControllerCluster()
+    cluster.hosts = hosts
+    cluster.strategy = strategy
+    sender = Sender()
+    sender.ip4 = hosts[-1]
+    sender.domain = "local"
+    sender.username = "admin"
+    sender.password = "password"
+    sender.cluster = cluster
+    sender.login()
+    return sender
+
+
+def run(benchmark, sender) -> dict:
+    """
+    Benchmark REQUESTS GETs and return the requests served per node,
+    which are also recorded in extra_info.
+    """
+
+    def send():
+        return [sender.send(REQUEST) for _ in range(REQUESTS)]
+
+    responses = benchmark.pedantic(send, rounds=3, iterations=1)
+    assert all(response.success for response in responses)
+    requests = sender.cluster.stats["requests"]
+    benchmark.extra_info["requests"] = requests
+    return requests
+
+
+@pytest.mark.benchmark(group="cluster")
+def bench_cluster_round_robin(benchmark, cluster_nodes):
+    """
+    30 GETs spread across three nodes in turn
+    """
+    sender = cluster_sender([node.address for node in cluster_nodes])
+    requests = run(benchmark, sender)
+    assert len(requests) == len(cluster_nodes)
+    sender.close()
+
+
+@pytest.mark.benchmark(group="cluster")
+def bench_cluster_least_latency(benchmark, cluster_nodes):
+    """
+    30 GETs to the node with the lowest moving-average latency
+    """
+    sender = cluster_sender([node.address for node in cluster_nodes], "least_latency")
+    sender.cluster.probe()
+    requests = run(benchmark, sender)
+    assert max(requests, key=requests.get) == cluster_nodes[0].address
+    sender.close()
+
+
+@pytest.mark.benchmark(group="cluster")
+def bench_cluster_failover(benchmark, cluster_nodes):
+    """
+    30 GETs from a cluster whose first node is unreachable
+    """
+    dead = unused_address()
+    sender = cluster_sender([dead, cluster_nodes[0].address])
+    requests = run(benchmark, sender)
+    assert sender.cluster.healthy == [cluster_nodes[0].address]
+    assert sender.cluster.stats["failovers"] >= 1
+    assert requests.get(dead, 0) <= 2
+    sender.close()
@@ -0,0 +1,166 @@
+"""
+# Summary
+
+Benchmarks for the fabric lookups every script performs before sending:
+the fabric list, fabric inventory and overlay (network/VRF) index, each
+cold (read from the controller) and cached.
+"""
+
+# We are using isort for import sorting.
+# pylint: disable=wrong-import-order,redefined-outer-name
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("plugins.module_utils.common.rest_send_v2", reason="ansible-dcnm is not on PYTHONPATH")
+
+# pylint: disable=wrong-import-position
+from conftest import FABRICS, NETWORKS_PER_FABRIC, clear_caches
+from ndfc_python.common.fabric.fabric_inventory import FabricInventory
+from ndfc_python.common.fabric.fabric_overlay_index import FabricOverlayIndex
+from ndfc_python.common.fabric.fabrics_info import FabricsInfo
+from ndfc_python.policy_info_switch import PolicyInfoSwitch
+from plugins.module_utils.common.response_handler import ResponseHandler
+from plugins.module_utils.common.rest_send_v2 import RestSend
+
+
+@pytest.mark.benchmark(group="fabrics_info")
+def bench_fabrics_info_cold(benchmark, rest_send):
+    """
+    FabricsInfo.commit() with the cache disabled
+    """
+
+    def commit():
+        instance = FabricsInfo()
+        instance.rest_send = rest_send
+        instance.commit()
+        instance.filter = "FABRIC_1"
+        return instance.fabric_exists
+
+    assert benchmark(commit) is True
+
+
+@pytest.mark.benchmark(group="fabrics_info")
+def bench_fabrics_info_cached(benchmark, rest_send):
+    """
+    FabricsInfo.commit() with the process-wide cache
+    """
+
+    def commit():
+        instance = FabricsInfo()
+        instance.rest_send = rest_send
+        instance.use_cache = True
+        instance.commit()
+        instance.filter = "FABRIC_1"
+        return instance.fabric_exists
+
+    assert benchmark(commit) is True
+
+
+@pytest.mark.benchmark(group="fabric_inventory")
+def bench_fabric_inventory_cold(benchmark, rest_send):
+    """
+    FabricInventory.commit() after discarding cached snapshots
+    """
+
+    def commit():
+        instance = FabricInventory()
+        instance.fabric_name = "FABRIC_1"
+        instance.rest_send = rest_send
+        instance.commit()
+        return instance
+
+    benchmark.pedantic(commit, setup=clear_caches, rounds=20)
+
+
+@pytest.mark.benchmark(group="fabric_inventory")
+def bench_fabric_inventory_cached(benchmark, rest_send):
+    """
+    FabricInventory.commit() served from the process-wide snapshot
+    """
+
+    def commit():
+        instance = FabricInventory()
+        instance.fabric_name = "FABRIC_1"
+        instance.rest_send = rest_send
+        instance.commit()
+        return instance
+
+    benchmark(commit)
+
+
+@pytest.mark.benchmark(group="overlay_index")
+def bench_overlay_index_cold(benchmark, rest_send):
+    """
+    Load the network and VRF indexes for one fabric from the controller
+    """
+
+    def load():
+        instance = FabricOverlayIndex()
+        instance.rest_send = rest_send
+        instance.fabric_name = "FABRIC_1"
+        instance.refresh()
+        return instance
+
+    benchmark.pedantic(load, setup=clear_caches, rounds=20)
+
+
+@pytest.mark.benchmark(group="overlay_index")
+def bench_overlay_index_cold_parallel(benchmark, sender):
+    """
+    Load the network and VRF indexes for every fabric at once, one thread
+    per fabric.  Loads of different fabrics do not wait for each other.
+    """
+
+    def load(fabric_name):
+        rest_send = RestSend({})
+        rest_send.sender = sender
+        rest_send.response_handler = ResponseHandler()
+        instance = FabricOverlayIndex()
+        instance.rest_send = rest_send
+        instance.fabric_name = fabric_name
+        instance.refresh()
+        return instance
+
+    def load_all():
+        with ThreadPoolExecutor(max_workers=FABRICS) as executor:
+            return list(executor.map(load, [f"FABRIC_{index}" for index in range(1, FABRICS + 1)]))
+
+    benchmark.pedantic(load_all, setup=clear_caches, rounds=20)
+
+
+@pytest.mark.benchmark(group="overlay_index")
+def bench_overlay_index_lookups(benchmark, rest_send):
+    """
+    Name, id and VLAN lookups for every network in a cached index
+    """
+    instance = FabricOverlayIndex()
+    instance.rest_send = rest_send
+    instance.fabric_name = "FABRIC_1"
+    instance.load_networks()
+
+    def lookups():
+        for index in range(1, NETWORKS_PER_FABRIC + 1):
+            instance.network_name_exists(f"NET_{index}")
+            instance.network_id_exists(30000 + index)
+            instance.vlan_id_in_use(1000 + index)
+
+    benchmark(lookups)
+
+
+@pytest.mark.benchmark(group="policy_info_switch")
+def bench_policy_info_switch(benchmark, rest_send):
+    """
+    PolicyInfoSwitch.commit() for one switch
+    """
+
+    def commit():
+        instance = PolicyInfoSwitch()
+        instance.rest_send = rest_send
+        instance.fabric_name = "FABRIC_1"
+        instance.switch_name = "FABRIC_1-LEAF-1"
+        instance.commit()
+        return instance
+
+    benchmark(commit)
@@ -0,0 +1,99 @@
+"""
+# Summary
+
+Benchmarks for JsonCodec backends on inventory- and policy-sized
+response bodies, compared with the previous json.loads(response.text)
+path (decode bytes to str, then parse).
+
+Backends that are not installed are skipped.
+"""
+
+# We are using isort for import sorting.
+# pylint: disable=wrong-import-order,protected-access
+
+import json
+
+import pytest
+from ndfc_python.json_codec import JsonCodec, available_backends
+from ndfc_python.mock_controller import MockController
+
+BACKENDS = ["orjson", "msgspec", "json"]
+SWITCHES = 500
+POLICIES = 10000
+
+
+def inventory() -> list[dict]:
+    """
+    A switchesByFabric response for a fabric of SWITCHES switches.
+    """
+    return [MockController._build_switch(1, "FABRIC_1", index) for index in range(SWITCHES)]
+
+
+def policies() -> list[dict]:
+    """
+    A policies response with POLICIES switch_freeform policies.
+    """
+    items = []
+    for index in range(POLICIES):
+        policy = {}
+        policy["description"] = "synthetic policy"
+        policy["entityName"] = "SWITCH"
+        policy["entityType"] = "SWITCH"
+        policy["nvPairs"] = {"CONF": "feature bash-shell\nfeature lldp", "FABRIC_NAME": "FABRIC_1"}
+        policy["policyId"] = f"POLICY-{index + 1}"
+        policy["priority"] = 500
+        policy["serialNumber"] = f"FABRIC_1-SN{index % SWITCHES + 1:04d}"
+        policy["source"] = ""
+        policy["templateName"] = "switch_freeform"
+        items.append(policy)
+    return items
+
+
+PAYLOADS = {"inventory": inventory(), "policies": policies()}
+BODIES = {name: json.dumps(value).encode("utf-8") for name, value in PAYLOADS.items()}
+
+
+def codec(backend: str) -> JsonCodec:
+    """
+    Return a JsonCodec using backend, or skip if it is not installed.
+    """
+    if backend not in available_backends():
+        pytest.skip(f"{backend} is not installed")
+    instance = JsonCodec()
+    instance.backend = backend
+    return instance
+
+
+@pytest.mark.parametrize("payload", sorted(PAYLOADS))
+@pytest.mark.benchmark(group="json_decode")
+def bench_decode_text(benchmark, payload):
+    """
+    The previous decode path: json.loads(response.text)
+    """
+    body = BODIES[payload]
+    data = benchmark(lambda: json.loads(body.decode("utf-8")))
+    assert data == PAYLOADS[payload]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("payload", sorted(PAYLOADS))
+@pytest.mark.benchmark(group="json_decode")
+def bench_decode(benchmark, payload, backend):
+    """
+    JsonCodec.loads(response.content)
+    """
+    instance = codec(backend)
+    data = benchmark(instance.loads, BODIES[payload])
+    assert data == PAYLOADS[payload]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("payload", sorted(PAYLOADS))
+@pytest.mark.benchmark(group="json_encode")
+def bench_encode(benchmark, payload, backend):
+    """
+    JsonCodec.dumps(payload)
+    """
+    instance = codec(backend)
+    body = benchmark(instance.dumps, PAYLOADS[payload])
+    assert json.loads(body) == PAYLOADS[payload]
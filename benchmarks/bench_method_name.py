@@ -0,0 +1,76 @@
+"""
+# Summary
+
+Micro-benchmarks for the cost of naming the current method in error and
+debug messages, and for Sender methods on the per-request hot path that
+need no controller.
+
+inspect.stack() builds a FrameInfo, including source context read from
+disk, for every frame on the stack, so its cost grows with stack depth.
+ndfc_python uses string literals instead, e.g. method_name = "commit".
+"""
+
+# We are using isort for import sorting.
+# pylint: disable=wrong-import-order,protected-access
+
+import inspect
+import sys
+
+import pytest
+from ndfc_python.sender_request import SenderRequest
+from ndfc_python.sender_requests import Sender
+
+PATH = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics"
+
+
+def nested(depth: int, function):
+    """
+    Call function from depth nested frames, to mimic a call from deep in
+    RestSend or a script.
+    """
+    if depth == 0:
+        return function()
+    return nested(depth - 1, function)
+
+
+def name_from_inspect_stack() -> str:
+    """inspect.stack()[0][3]"""
+    return inspect.stack()[0][3]
+
+
+def name_from_getframe() -> str:
+    """sys._getframe().f_code.co_name"""
+    return sys._getframe().f_code.co_name
+
+
+def name_from_literal() -> str:
+    """string literal"""
+    return "name_from_literal"
+
+
+@pytest.mark.benchmark(group="method_name")
+@pytest.mark.parametrize("function", [name_from_inspect_stack, name_from_getframe, name_from_literal], ids=lambda function: function.__name__)
+def bench_method_name(benchmark, function):
+    """
+    Name the current method, called 20 frames deep.
+    """
+    benchmark(nested, 20, function)
+
+
+@pytest.mark.benchmark(group="sender_hot_path")
+def bench_sender_request_setup(benchmark):
+    """
+    Set path, verb and payload, and build the URL and SenderRequest, as
+    Sender.commit() does for every request.
+    """
+    sender = Sender()
+    sender.ip4 = "10.1.1.1"
+
+    def setup_request():
+        sender.path = PATH
+        sender.verb = "POST"
+        sender.payload = {"key": "value"}
+        sender.build_url(sender.path)
+        return SenderRequest(sender.verb, sender.path, sender.payload)
+
+    benchmark(nested, 20, setup_request)
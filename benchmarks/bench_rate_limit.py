@@ -0,0 +1,113 @@
+"""
+# Summary
+
+Benchmarks for Sender's RateLimiter against the mock controller: 20 GETs
+from 8 threads limited to 50 requests per second, 32 GETs from 8
+threads in adaptive mode after the controller returns 429 four times, and
+32 concurrent AsyncSender GETs limited to 2 in flight.
+
+extra_info records the in-flight limit after the burst of 429s, and the
+limiter's decreases and increases of it.
+"""
+
+# We are using isort for import sorting.
+# pylint: disable=wrong-import-order,redefined-outer-name
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from conftest import new_async_sender, new_sender
+from ndfc_python.mock_controller import MockController
+from ndfc_python.rate_limiter import RateLimiter
+from ndfc_python.sender_request import SenderRequest
+
+API = MockController.API
+REQUEST = SenderRequest("GET", f"{API}/top-down/fabrics/FABRIC_1/vrfs")
+THREADS = 8
+
+
+@pytest.fixture
+def limited_sender(mock_controller):
+    """
+    A logged-in Sender with its own RateLimiter.
+    """
+    instance = new_sender(mock_controller)
+    instance.login()
+    instance.rate_limiter = RateLimiter()
+    instance.retry_policy.base_delay = 0.01
+    yield instance
+    instance.close()
+
+
+def send_all(sender, count: int) -> list:
+    """
+    Send REQUEST count times from THREADS threads.
+    """
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        return list(executor.map(lambda _: sender.send(REQUEST), range(count)))
+
+
+@pytest.mark.benchmark(group="rate_limit")
+def bench_rate_limit_token_bucket(benchmark, limited_sender):
+    """
+    20 GETs from 8 threads at 50 requests per second, burst 1 (about 0.4 seconds)
+    """
+    limited_sender.rate_limiter.rate = 50
+    limited_sender.rate_limiter.burst = 1
+    responses = benchmark.pedantic(send_all, args=(limited_sender, 20), rounds=2, iterations=1)
+    assert all(response.success for response in responses)
+    assert limited_sender.rate_limiter.stats["waited"] > 0
+
+
+@pytest.mark.benchmark(group="rate_limit")
+def bench_rate_limit_adaptive_429(benchmark, mock_controller, limited_sender):
+    """
+    32 GETs from 8 threads, adaptive with max_in_flight 8, after four 429s
+    """
+    limiter = limited_sender.rate_limiter
+    limiter.max_in_flight = THREADS
+    limiter.adaptive = True
+    limiter.cooldown = 0.01
+    limits = []
+
+    def run():
+        mock_controller.inject_faults("vrfs", [429] * 4)
+        responses = send_all(limited_sender, THREADS)
+        limits.append(limiter.limit)
+        return responses + send_all(limited_sender, 24)
+
+    responses = benchmark.pedantic(run, rounds=2, iterations=1)
+    stats = limiter.stats
+    benchmark.extra_info["limit_after_429"] = limits[-1]
+    benchmark.extra_info["decreases"] = stats["decreases"]
+    benchmark.extra_info["increases"] = stats["increases"]
+    assert all(response.success for response in responses)
+    assert stats["decreases"] > 0
+    assert min(limits) < THREADS
+
+
+@pytest.mark.benchmark(group="rate_limit")
+def bench_rate_limit_in_flight_async(benchmark, mock_controller):
+    """
+    AsyncSender: 32 concurrent (distinct) GETs with max_in_flight 2
+    """
+    sender = new_async_sender(mock_controller)
+    sender.rate_limiter = RateLimiter()
+    sender.rate_limiter.max_in_flight = 2
+
+    async def send_all_async():
+        try:
+            await sender.login()
+            # Distinct paths, so that single_flight does not coalesce them.
+            requests = [SenderRequest("GET", f"{REQUEST.path}?index={index}") for index in range(32)]
+            return await asyncio.gather(*[sender.send(request) for request in requests])
+        finally:
+            await sender.close()
+
+    responses = benchmark.pedantic(lambda: asyncio.run(send_all_async()), rounds=2, iterations=1)
+    stats = sender.rate_limiter.stats
+    benchmark.extra_info["waited"] = round(stats["waited"], 3)
+    assert all(response.success for response in responses)
+    assert stats["waited"] > 0
+    assert sender.rate_limiter._in_flight == 0  # pylint: disable=protected-access
@@ -0,0 +1,104 @@
+"""
+# Summary
+
+Benchmarks for Sender's ResponseCache against the mock controller: the
+GETs a script repeats within seconds (control/fabrics, switchesByFabric
+and top-down networks), sent ten times each without and with a cache,
+and the same with a successful write to one fabric between rounds.
+
+extra_info records the cache hits and misses.
+"""
+
+# We are using isort for import sorting.
+# pylint: disable=wrong-import-order,redefined-outer-name
+
+import pytest
+from conftest import new_sender
+from ndfc_python.mock_controller import MockController
+from ndfc_python.response_cache import ResponseCache
+from ndfc_python.sender_request import SenderRequest
+
+API = MockController.API
+REQUESTS = [
+    SenderRequest("GET", f"{API}/control/fabrics"),
+    SenderRequest("GET", f"{API}/control/fabrics/FABRIC_1/inventory/switchesByFabric"),
+    SenderRequest("GET", f"{API}/top-down/fabrics/FABRIC_1/networks"),
+    SenderRequest("GET", f"{API}/top-down/fabrics/FABRIC_2/networks"),
+]
+WRITE = SenderRequest("POST", f"{API}/top-down/fabrics/FABRIC_1/vrfs/attachments", [])
+REPEATS = 10
+
+
+@pytest.fixture
+def cache_sender(mock_controller):
+    """
+    A logged-in Sender, whose response_cache each benchmark sets.
+    """
+    instance = new_sender(mock_controller)
+    instance.login()
+    yield instance
+    instance.close()
+
+
+def send_all(sender, write: bool = False) -> list:
+    """
+    Send each of REQUESTS REPEATS times, with WRITE before each repeat if write is True.
+    """
+    responses = []
+    for _ in range(REPEATS):
+        if write:
+            sender.send(WRITE)
+        responses.extend(sender.send(request) for request in REQUESTS)
+    return responses
+
+
+def run(benchmark, sender, write: bool = False) -> int:
+    """
+    Benchmark send_all(), record the cache stats, if any, in extra_info,
+    and return the number of rounds run.
+    """
+    calls = []
+
+    def send():
+        calls.append(1)
+        return send_all(sender, write)
+
+    responses = benchmark.pedantic(send, rounds=3, iterations=1)
+    assert all(response.success for response in responses)
+    if sender.response_cache is not None:
+        stats = sender.response_cache.stats
+        benchmark.extra_info["hits"] = stats["hits"]
+        benchmark.extra_info["misses"] = stats["misses"]
+    return len(calls)
+
+
+@pytest.mark.benchmark(group="response_cache")
+def bench_response_cache_none(benchmark, cache_sender):
+    """
+    40 GETs without a cache (baseline)
+    """
+    run(benchmark, cache_sender)
+
+
+@pytest.mark.benchmark(group="response_cache")
+def bench_response_cache(benchmark, cache_sender):
+    """
+    40 GETs with a ResponseCache
+    """
+    cache_sender.response_cache = ResponseCache()
+    run(benchmark, cache_sender)
+    stats = cache_sender.response_cache.stats
+    assert stats["misses"] == len(REQUESTS)
+
+
+@pytest.mark.benchmark(group="response_cache")
+def bench_response_cache_write(benchmark, cache_sender):
+    """
+    40 GETs with a ResponseCache and a write to FABRIC_1 before every 4
+    (compare with 10 writes and 40 uncached GETs)
+    """
+    cache_sender.response_cache = ResponseCache()
+    rounds = run(benchmark, cache_sender, write=True)
+    stats = cache_sender.response_cache.stats
+    # FABRIC_2 networks are cached once; the other three are refetched after every write.
+    assert stats["misses"] == 1 + 3 * REPEATS * rounds
@@ -0,0 +1,121 @@
+"""
+# Summary
+
+Benchmarks for Sender's RetryPolicy against the mock controller: a GET
+that fails twice with 503 before succeeding, retried with backoff and
+jitter versus a fixed one-second interval (RestSend's shortest
+send_interval), a 429 with Retry-After (below and above max_delay, and
+beyond the deadline), and a 400, which is not retried.
+
+extra_info records the retries made and the seconds slept before them.
+"""
+
+# We are using isort for import sorting.
+# pylint: disable=wrong-import-order,redefined-outer-name
+
+import pytest
+from conftest import new_sender
+from ndfc_python.mock_controller import MockController
+from ndfc_python.sender_request import SenderRequest
+
+API = MockController.API
+REQUEST = SenderRequest("GET", f"{API}/top-down/fabrics/FABRIC_1/vrfs")
+
+
+@pytest.fixture
+def retry_sender(mock_controller):
+    """
+    A logged-in Sender with its own RetryPolicy, so that changes to the
+    policy do not affect other benchmarks.
+    """
+    instance = new_sender(mock_controller)
+    instance.login()
+    yield instance
+    instance.close()
+
+
+def run(benchmark, controller: MockController, sender, return_codes: list[int], retry_after: str | None = None, rounds: int = 5):
+    """
+    Benchmark sending REQUEST after injecting return_codes as faults.
+    Return the last response, and the retries and seconds slept per
+    round, which are also recorded in extra_info.
+    """
+    calls = []
+
+    def send():
+        controller.inject_faults("vrfs", return_codes, retry_after)
+        calls.append(1)
+        return sender.send(REQUEST)
+
+    response = benchmark.pedantic(send, rounds=rounds, iterations=1)
+    stats = sender.retry_policy.stats
+    retries = stats["retries"] / len(calls)
+    slept = stats["slept"] / len(calls)
+    benchmark.extra_info["retries_per_round"] = retries
+    benchmark.extra_info["slept_per_round"] = round(slept, 3)
+    return response, retries, slept
+
+
+@pytest.mark.benchmark(group="retry")
+def bench_retry_503_backoff(benchmark, mock_controller, retry_sender):
+    """
+    GET failing twice with 503, retried with exponential backoff and full jitter
+    """
+    response, retries, _ = run(benchmark, mock_controller, retry_sender, [503, 503])
+    assert response.success
+    assert retries == 2
+
+
+@pytest.mark.benchmark(group="retry")
+def bench_retry_503_fixed_interval(benchmark, mock_controller, retry_sender):
+    """
+    GET failing twice with 503, retried every second (baseline)
+    """
+    retry_sender.retry_policy.base_delay = 1
+    retry_sender.retry_policy.multiplier = 1
+    retry_sender.retry_policy.jitter = False
+    response, _, slept = run(benchmark, mock_controller, retry_sender, [503, 503], rounds=2)
+    assert response.success
+    assert slept == pytest.approx(2)
+
+
+@pytest.mark.benchmark(group="retry")
+def bench_retry_429_retry_after(benchmark, mock_controller, retry_sender):
+    """
+    GET failing once with 429 and Retry-After: 0.05
+    """
+    response, _, slept = run(benchmark, mock_controller, retry_sender, [429], "0.05")
+    assert response.success
+    assert slept == pytest.approx(0.05)
+
+
+@pytest.mark.benchmark(group="retry")
+def bench_retry_429_retry_after_above_max_delay(benchmark, mock_controller, retry_sender):
+    """
+    GET failing once with 429 and Retry-After: 0.2, above max_delay (0.05)
+    """
+    retry_sender.retry_policy.max_delay = 0.05
+    response, _, slept = run(benchmark, mock_controller, retry_sender, [429], "0.2", rounds=2)
+    assert response.success
+    assert slept == pytest.approx(0.2)
+
+
+@pytest.mark.benchmark(group="retry")
+def bench_retry_429_retry_after_beyond_deadline(benchmark, mock_controller, retry_sender):
+    """
+    GET failing with 429 and Retry-After: 30, beyond the deadline (1 second), returned without a retry
+    """
+    retry_sender.retry_policy.deadline = 1
+    response, retries, _ = run(benchmark, mock_controller, retry_sender, [429], "30")
+    assert response.return_code == 429
+    assert retries == 0
+
+
+@pytest.mark.benchmark(group="retry")
+def bench_retry_400_not_retried(benchmark, mock_controller, retry_sender):
+    """
+    GET failing with 400, returned without a retry
+    """
+    response, retries, _ = run(benchmark, mock_controller, retry_sender, [400])
+    assert response.return_code == 400
+    assert retries == 0
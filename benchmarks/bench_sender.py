@@ -0,0 +1,105 @@
+"""
+# Summary
+
+Benchmarks for Sender against the mock controller: login, single GET
+requests of increasing response size, and reading the last response.
+"""
+
+# We are using isort for import sorting.
+# pylint: disable=wrong-import-order
+
+import pytest
+from conftest import FABRICS, new_sender
+from ndfc_python.mock_controller import MockController
+from ndfc_python.sender_request import SenderRequest
+
+API = MockController.API
+
+
+@pytest.mark.benchmark(group="sender")
+def bench_login(benchmark, mock_controller):
+    """
+    Log in with a new Sender (new connection pool) each round.
+    """
+
+    def login():
+        sender = new_sender(mock_controller)
+        sender.login()
+        sender.close()
+
+    benchmark(login)
+
+
+@pytest.mark.benchmark(group="sender")
+def bench_get_fabrics(benchmark, sender):
+    """
+    GET control/fabrics
+    """
+    request = SenderRequest("GET", f"{API}/control/fabrics")
+    response = benchmark(sender.send, request)
+    assert len(response.data) == FABRICS
+
+
+@pytest.mark.benchmark(group="sender")
+def bench_get_switches_by_fabric(benchmark, sender):
+    """
+    GET switchesByFabric for one fabric
+    """
+    request = SenderRequest("GET", f"{API}/control/fabrics/FABRIC_1/inventory/switchesByFabric")
+    response = benchmark(sender.send, request)
+    assert response.success
+
+
+@pytest.mark.benchmark(group="sender")
+def bench_get_networks(benchmark, sender):
+    """
+    GET top-down networks for one fabric
+    """
+    request = SenderRequest("GET", f"{API}/top-down/fabrics/FABRIC_1/networks")
+    response = benchmark(sender.send, request)
+    assert response.success
+
+
+@pytest.mark.benchmark(group="sender")
+def bench_legacy_commit_get_networks(benchmark, sender):
+    """
+    GET top-down networks through the path/verb/commit() interface used by RestSend
+    """
+
+    def commit():
+        sender.path = f"{API}/top-down/fabrics/FABRIC_1/networks"
+        sender.verb = "GET"
+        sender.commit()
+        return sender.response
+
+    response = benchmark(commit)
+    assert response["RETURN_CODE"] == 200
+
+
+@pytest.fixture
+def networks_response(sender):
+    """
+    Leave the response to GET top-down networks in sender.response
+    """
+    sender.path = f"{API}/top-down/fabrics/FABRIC_1/networks"
+    sender.verb = "GET"
+    sender.commit()
+    return sender
+
+
+@pytest.mark.benchmark(group="response_view")
+def bench_response_read(benchmark, networks_response):
+    """
+    Read sender.response (a ReadOnlyDict, shared without copying)
+    """
+    response = benchmark(lambda: networks_response.response)
+    assert response["RETURN_CODE"] == 200
+
+
+@pytest.mark.benchmark(group="response_view")
+def bench_response_copy(benchmark, networks_response):
+    """
+    Read sender.response_copy (a mutable deep copy)
+    """
+    response = benchmark(lambda: networks_response.response_copy)
+    assert response["RETURN_CODE"] == 200
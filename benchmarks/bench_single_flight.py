@@ -0,0 +1,134 @@
+"""
+# Summary
+
+Benchmarks for Sender's request coalescing (SingleFlight) against the
+mock controller: 8 threads, or 8 coroutines, sending the same inventory
+GET at once, with and without single_flight, and a GET sent after a
+write while an identical GET from before the write is still in flight.
+
+extra_info records the HTTP requests the controller received per round.
+"""
+
+# We are using isort for import sorting.
+# pylint: disable=wrong-import-order,redefined-outer-name,import-outside-toplevel
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from conftest import LATENCY, new_sender
+from ndfc_python.mock_controller import MockController
+from ndfc_python.sender_request import SenderRequest
+from ndfc_python.single_flight import SingleFlight
+
+API = MockController.API
+REQUEST = SenderRequest("GET", f"{API}/control/fabrics/FABRIC_1/inventory/switchesByFabric")
+WORKERS = 8
+WRITE = SenderRequest("POST", f"{API}/control/fabrics/FABRIC_1/config-save")
+
+
+@pytest.fixture
+def flight_sender(mock_controller):
+    """
+    A logged-in Sender with its own SingleFlight.
+    """
+    instance = new_sender(mock_controller)
+    instance.login()
+    yield instance
+    instance.close()
+
+
+def run(benchmark, controller: MockController, send) -> int:
+    """
+    Benchmark send(), which sends REQUEST from WORKERS workers at once,
+    and return the inventory requests the controller received per round,
+    which are also recorded in extra_info.
+    """
+    calls = []
+
+    def counted():
+        calls.append(1)
+        return send()
+
+    controller.reset_counters()
+    responses = benchmark.pedantic(counted, rounds=5, iterations=1)
+    assert all(response.success for response in responses)
+    requests = controller.request_counts[("GET", "inventory")] / len(calls)
+    benchmark.extra_info["requests_per_round"] = requests
+    return requests
+
+
+def send_threads(sender) -> list:
+    """
+    Send REQUEST from WORKERS threads at once.
+    """
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        return list(executor.map(lambda _: sender.send(REQUEST), range(WORKERS)))
+
+
+@pytest.mark.benchmark(group="single_flight")
+def bench_single_flight_threads_none(benchmark, mock_controller, flight_sender):
+    """
+    8 threads, same GET, without coalescing (baseline)
+    """
+    flight_sender.single_flight = None
+    requests = run(benchmark, mock_controller, lambda: send_threads(flight_sender))
+    assert requests == WORKERS
+
+
+@pytest.mark.benchmark(group="single_flight")
+def bench_single_flight_threads(benchmark, mock_controller, flight_sender):
+    """
+    8 threads, same GET, coalesced
+    """
+    flight_sender.single_flight = SingleFlight()
+    requests = run(benchmark, mock_controller, lambda: send_threads(flight_sender))
+    assert requests < WORKERS
+
+
+def send_read_after_write(sender) -> list:
+    """
+    Send REQUEST, and, while it is in flight, WRITE, then REQUEST again.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        before = executor.submit(sender.send, REQUEST)
+        time.sleep(0.05)
+        written = sender.send(WRITE)
+        after = sender.send(REQUEST)
+        return [before.result(), written, after]
+
+
+@pytest.mark.benchmark(group="single_flight")
+def bench_single_flight_read_after_write(benchmark, mock_controller, flight_sender):
+    """
+    GET, write, GET again while the first GET is in flight: not coalesced
+    """
+    flight_sender.single_flight = SingleFlight()
+    mock_controller.latency = {**LATENCY, "inventory": 0.2}
+    try:
+        requests = run(benchmark, mock_controller, lambda: send_read_after_write(flight_sender))
+    finally:
+        mock_controller.latency = LATENCY
+    assert requests == 2
+
+
+@pytest.mark.benchmark(group="single_flight")
+def bench_single_flight_async(benchmark, mock_controller):
+    """
+    8 coroutines, same GET, coalesced
+    """
+    pytest.importorskip("aiohttp")
+    from ndfc_python.sender_aiohttp import AsyncSender
+
+    async def send_all():
+        async with AsyncSender() as sender:
+            sender.ip4 = mock_controller.address
+            sender.domain = "local"
+            sender.username = "admin"
+            sender.password = "password"
+            await sender.login()
+            return await asyncio.gather(*[sender.send(REQUEST) for _ in range(WORKERS)])
+
+    requests = run(benchmark, mock_controller, lambda: asyncio.run(send_all()))
+    assert requests == 1
@@ -0,0 +1,94 @@
+"""
+# Summary
+
+Startup benchmarks: the time for a fresh interpreter to import the
+modules every example script imports, measured with python -X importtime.
+
+Besides time, each benchmark records in extra_info the cumulative import
+time (microseconds) of the slowest imported packages, and fails if a
+module that should only be imported on first use (ansible, pydantic,
+logging.config, unused JSON backends, the credentials agent) is imported
+at startup.
+"""
+
+# We are using isort for import sorting.
+# pylint: disable=wrong-import-order
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from ndfc_python.json_codec import available_backends
+
+LIB = Path(__file__).resolve().parent.parent / "lib"
+EXAMPLES = Path(__file__).resolve().parent.parent / "examples"
+
+# Imported by every example script, directly or through NdfcPythonSender.
+SCRIPT_IMPORTS = [
+    "ndfc_python.ndfc_python_logger",
+    "ndfc_python.ndfc_python_sender",
+    "ndfc_python.parsers.parser_ansible_vault",
+    "ndfc_python.parsers.parser_loglevel",
+    "ndfc_python.parsers.parser_nd_domain",
+    "ndfc_python.parsers.parser_nd_ip4",
+    "ndfc_python.parsers.parser_nd_password",
+    "ndfc_python.parsers.parser_nd_username",
+]
+
+# Modules that must not be imported until they are used.
+LAZY = ["ansible", "pydantic", "logging.config", "ndfc_python.credentials.credentials_agent", "yaml"]
+
+
+def import_times(code: str, argv: list[str] | None = None) -> dict[str, int]:
+    """
+    Run code (or argv) in a fresh interpreter with -X importtime and return
+    the cumulative import time, in microseconds, of each imported module.
+    """
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(filter(None, [str(LIB), environment.get("PYTHONPATH")]))
+    environment.pop("NDFC_PYTHON_CREDENTIALS_AGENT", None)
+    environment.pop("NDFC_LOGGING_CONFIG", None)
+    command = [sys.executable, "-X", "importtime"] + (argv if argv is not None else ["-c", code])
+    result = subprocess.run(command, env=environment, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def verify_lazy(benchmark, times: dict[str, int]) -> None:
+    """
+    Record the slowest top-level imports in extra_info, and fail if a
+    module in LAZY, or a JSON backend other than the default, was imported.
+    """
+    benchmark.extra_info["total_import_us"] = sum(times[name] for name in times if "." not in name)
+    slowest = sorted(((time_us, name) for name, time_us in times.items() if "." not in name), reverse=True)[:8]
+    benchmark.extra_info["slowest_imports_us"] = {name: time_us for time_us, name in slowest}
+    unused_backends = [backend for backend in available_backends()[1:] if backend != "json"]
+    imported = [name for name in LAZY + unused_backends if name in times]
+    assert not imported, f"Imported at startup: {imported}"
+
+
+@pytest.mark.benchmark(group="startup")
+def bench_startup_script_imports(benchmark):
+    """
+    Import the modules that every example script imports
+    """
+    code = "; ".join(f"import {module}" for module in SCRIPT_IMPORTS)
+    times = benchmark.pedantic(import_times, args=(code,), rounds=5, iterations=1)
+    verify_lazy(benchmark, times)
+
+
+@pytest.mark.benchmark(group="startup")
+def bench_startup_login_help(benchmark):
+    """
+    Run examples/login.py --help (all of its imports, then exit)
+    """
+    pytest.importorskip("plugins.module_utils.common.rest_send_v2", reason="ansible-dcnm is not on PYTHONPATH")
+    times = benchmark.pedantic(import_times, args=("", [str(EXAMPLES / "login.py"), "--help"]), rounds=5, iterations=1)
+    verify_lazy(benchmark, times)
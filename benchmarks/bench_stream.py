@@ -0,0 +1,85 @@
+"""
+# Summary
+
+Benchmarks for Sender.stream() versus Sender.send() on a large top-down
+networks response, against a dedicated MockController with one large
+fabric.
+
+Besides time, each benchmark records in extra_info the peak memory
+allocated while reading every network's name (tracemalloc), which is
+what stream() is meant to keep flat.
+"""
+
+# We are using isort for import sorting.
+# pylint: disable=wrong-import-order,redefined-outer-name
+
+import tracemalloc
+
+import pytest
+from conftest import new_sender
+from ndfc_python.mock_controller import MockController
+from ndfc_python.sender_request import SenderRequest
+
+API = MockController.API
+NETWORKS = 20000
+
+
+@pytest.fixture(scope="module")
+def large_sender():
+    """
+    A logged-in Sender pointing at a MockController with one fabric of
+    NETWORKS networks.
+    """
+    controller = MockController()
+    controller.fabrics = 1
+    controller.switches_per_fabric = 2
+    controller.networks_per_fabric = NETWORKS
+    controller.vrfs_per_fabric = 10
+    controller.policies_per_switch = 0
+    controller.start()
+    sender = new_sender(controller)
+    sender.login()
+    yield sender
+    sender.close()
+    controller.stop()
+
+
+def peak_memory(function) -> int:
+    """
+    Return the peak memory, in bytes, allocated while calling function.
+    """
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+REQUEST = SenderRequest("GET", f"{API}/top-down/fabrics/FABRIC_1/networks")
+
+
+@pytest.mark.benchmark(group="stream")
+def bench_networks_send(benchmark, large_sender):
+    """
+    Buffer and parse the whole response with send()
+    """
+
+    def names():
+        return sum(1 for network in large_sender.send(REQUEST).data if network["networkName"])
+
+    benchmark.extra_info["peak_memory_bytes"] = peak_memory(names)
+    assert benchmark(names) == NETWORKS
+
+
+@pytest.mark.benchmark(group="stream")
+def bench_networks_stream(benchmark, large_sender):
+    """
+    Parse the response incrementally with stream()
+    """
+
+    def names():
+        return sum(1 for network in large_sender.stream(REQUEST) if network["networkName"])
+
+    benchmark.extra_info["peak_memory_bytes"] = peak_memory(names)
+    assert benchmark(names) == NETWORKS
@@ -0,0 +1,177 @@
+"""
+# Summary
+
+Benchmarks for Sender and AsyncSender token refresh against the mock
+controller: a GET after every token was invalidated (401, log in again,
+retry), and a GET after the token neared the end of its lifetime
+(log in again first), and concurrent AsyncSender.login() calls.
+
+extra_info records the logins the controller received per round.
+"""
+
+# We are using isort for import sorting.
+# pylint: disable=wrong-import-order,redefined-outer-name
+
+import asyncio
+import time
+
+import pytest
+from conftest import new_async_sender, new_sender
+from ndfc_python.mock_controller import MockController
+from ndfc_python.sender_request import SenderRequest
+
+REQUEST = SenderRequest("GET", f"{MockController.API}/control/fabrics")
+WORKERS = 8
+# Seconds until a token expires, for the token lifetime benchmarks.
+TOKEN_LIFETIME = 2
+
+
+@pytest.fixture(scope="module")
+def token_controller():
+    """
+    A MockController of its own, so that expiring its tokens does not
+    affect the Sender shared by the other benchmarks.
+    """
+    controller = MockController()
+    controller.start()
+    yield controller
+    controller.stop()
+
+
+@pytest.fixture
+def lifetime_controller(token_controller):
+    """
+    token_controller, issuing tokens that expire after TOKEN_LIFETIME seconds.
+    """
+    token_controller.token_lifetime = TOKEN_LIFETIME
+    yield token_controller
+    token_controller.token_lifetime = 0
+
+
+async def login(sender) -> None:
+    """
+    Log sender (an AsyncSender) in, and close its client session, which
+    is bound to the event loop of this asyncio.run().
+    """
+    await sender.login()
+    await sender.close()
+
+
+def wait_for_refresh(sender) -> None:
+    """
+    Sleep until sender.token_manager.needs_refresh(), which, for a token
+    of TOKEN_LIFETIME seconds, is before the token expires.
+    """
+    while not sender.token_manager.needs_refresh():
+        time.sleep(0.05)
+
+
+def run(benchmark, controller: MockController, send, setup, rounds: int) -> float:
+    """
+    Benchmark send(), after setup(), and return the logins the controller
+    received per round, which are also recorded in extra_info.
+    """
+    calls = []
+
+    def counted():
+        calls.append(1)
+        return send()
+
+    controller.reset_counters()
+    responses = benchmark.pedantic(counted, setup=setup, rounds=rounds, iterations=1)
+    assert all(response.success for response in responses)
+    logins = controller.request_counts[("POST", "login")] / len(calls)
+    benchmark.extra_info["logins_per_round"] = logins
+    return logins
+
+
+@pytest.mark.benchmark(group="token_expired")
+def bench_token_expired(benchmark, token_controller):
+    """
+    Sender: GET after expire_tokens()
+    """
+    sender = new_sender(token_controller)
+    sender.login()
+    try:
+        logins = run(benchmark, token_controller, lambda: [sender.send(REQUEST)], token_controller.expire_tokens, rounds=5)
+    finally:
+        sender.close()
+    assert logins == 1
+
+
+@pytest.mark.benchmark(group="token_expired")
+def bench_token_expired_async(benchmark, token_controller):
+    """
+    AsyncSender: 8 concurrent GETs after expire_tokens()
+    """
+    sender = new_async_sender(token_controller)
+    asyncio.run(login(sender))
+
+    async def send_all():
+        try:
+            return await asyncio.gather(*[sender.send(REQUEST) for _ in range(WORKERS)])
+        finally:
+            await sender.close()
+
+    logins = run(benchmark, token_controller, lambda: asyncio.run(send_all()), token_controller.expire_tokens, rounds=5)
+    assert logins == 1
+
+
+@pytest.mark.benchmark(group="token_lifetime")
+def bench_token_lifetime(benchmark, lifetime_controller):
+    """
+    Sender: GET when the token is about to expire
+    """
+    sender = new_sender(lifetime_controller)
+    sender.login()
+    try:
+        logins = run(benchmark, lifetime_controller, lambda: [sender.send(REQUEST)], lambda: wait_for_refresh(sender), rounds=2)
+    finally:
+        sender.close()
+    assert logins == 1
+
+
+@pytest.mark.benchmark(group="token_lifetime")
+def bench_token_lifetime_async(benchmark, lifetime_controller):
+    """
+    AsyncSender, with token_manager.background set (and ignored): 8
+    concurrent GETs when the token is about to expire
+    """
+    sender = new_async_sender(lifetime_controller)
+    sender.token_manager.background = True
+    asyncio.run(login(sender))
+
+    async def send_all():
+        try:
+            return await asyncio.gather(*[sender.send(REQUEST) for _ in range(WORKERS)])
+        finally:
+            await sender.close()
+
+    logins = run(benchmark, lifetime_controller, lambda: asyncio.run(send_all()), lambda: wait_for_refresh(sender), rounds=2)
+    assert logins == 1
+
+
+@pytest.mark.benchmark(group="token_login")
+def bench_login_concurrent_async(benchmark, token_controller):
+    """
+    AsyncSender: 8 concurrent login() calls
+    """
+    sender = new_async_sender(token_controller)
+    calls = []
+
+    async def login_all():
+        calls.append(1)
+        try:
+            await asyncio.gather(*[sender.login() for _ in range(WORKERS)])
+        finally:
+            await sender.close()
+
+    def logout():
+        sender.logged_in = False
+
+    token_controller.reset_counters()
+    benchmark.pedantic(lambda: asyncio.run(login_all()), setup=logout, rounds=5, iterations=1)
+    logins = token_controller.request_counts[("POST", "login")] / len(calls)
+    benchmark.extra_info["logins_per_round"] = logins
+    assert sender.logged_in is True
+    assert logins == 1
@@ -0,0 +1,139 @@
+"""
+# Summary
+
+Fixtures shared by the ndfc_python benchmarks.
+
+All benchmarks run against a local MockController, so no Nexus Dashboard
+is needed.  Benchmarks that use RestSend need ansible-dcnm on PYTHONPATH
+(see docs/setup/update-your-pythonpath.md) and are skipped otherwise.
+"""
+
+# We are using isort for import sorting.
+# pylint: disable=wrong-import-order,redefined-outer-name,protected-access,import-outside-toplevel
+
+import pytest
+from ndfc_python.mock_controller import MockController
+from ndfc_python.sender_requests import Sender
+
+FABRICS = 2
+SWITCHES_PER_FABRIC = 16
+NETWORKS_PER_FABRIC = 200
+VRFS_PER_FABRIC = 20
+POLICIES_PER_SWITCH = 10
+
+# Per-endpoint latency (seconds), roughly a controller on the same LAN.
+LATENCY = {
+    "attachments": 0.010,
+    "fabrics": 0.002,
+    "inventory": 0.005,
+    "networks": 0.005,
+    "policies": 0.003,
+    "vrfs": 0.005,
+}
+
+
+@pytest.fixture(scope="session")
+def mock_controller():
+    """
+    A MockController shared by all benchmarks.
+    """
+    controller = MockController()
+    controller.fabrics = FABRICS
+    controller.switches_per_fabric = SWITCHES_PER_FABRIC
+    controller.networks_per_fabric = NETWORKS_PER_FABRIC
+    controller.vrfs_per_fabric = VRFS_PER_FABRIC
+    controller.policies_per_switch = POLICIES_PER_SWITCH
+    controller.latency = LATENCY
+    controller.start()
+    yield controller
+    controller.stop()
+
+
+def new_sender(controller: MockController) -> Sender:
+    """
+    Return a Sender, not yet logged in, pointing at controller.
+    """
+    sender = Sender()
+    sender.ip4 = controller.address
+    sender.domain = "local"
+    sender.username = "admin"
+    sender.password = "password"
+    return sender
+
+
+def new_async_sender(controller: MockController):
+    """
+    Return an AsyncSender, not yet logged in, pointing at controller.
+    Skips the benchmark if aiohttp is not installed.
+    """
+    pytest.importorskip("aiohttp")
+    from ndfc_python.sender_aiohttp import AsyncSender
+
+    sender = AsyncSender()
+    sender.ip4 = controller.address
+    sender.domain = "local"
+    sender.username = "admin"
+    sender.password = "password"
+    return sender
+
+
+@pytest.fixture(scope="session")
+def sender(mock_controller):
+    """
+    A logged-in Sender shared by all benchmarks.
+    """
+    instance = new_sender(mock_controller)
+    instance.login()
+    yield instance
+    instance.close()
+
+
+@pytest.fixture
+def rest_send(sender):
+    """
+    A RestSend over the shared Sender, configured as in the example scripts.
+    """
+    rest_send_v2 = pytest.importorskip("plugins.module_utils.common.rest_send_v2")
+    response_handler = pytest.importorskip("plugins.module_utils.common.response_handler")
+    instance = rest_send_v2.RestSend({})
+    instance.sender = sender
+    instance.response_handler = response_handler.ResponseHandler()
+    instance.timeout = 2
+    instance.send_interval = 5
+    return instance
+
+
+@pytest.fixture
+def results():
+    """
+    A new Results instance.
+    """
+    module = pytest.importorskip("plugins.module_utils.common.results")
+    return module.Results()
+
+
+def clear_caches() -> None:
+    """
+    Discard all process-wide controller caches.
+    """
+    try:
+        from ndfc_python.common.fabric.fabric_inventory_cache import FabricInventoryCache
+        from ndfc_python.common.fabric.fabric_overlay_index import FabricOverlayIndex
+        from ndfc_python.common.fabric.fabrics_info_cache import FabricsInfoCache
+    except ImportError:
+        # ansible-dcnm is not on PYTHONPATH, so nothing can have been cached.
+        return
+    FabricsInfoCache().invalidate()
+    FabricInventoryCache().invalidate()
+    FabricOverlayIndex._cache.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def reset_state(mock_controller):
+    """
+    Start every benchmark from the synthetic state with empty caches.
+    """
+    mock_controller.reset()
+    clear_caches()
+    yield
+    clear_caches()
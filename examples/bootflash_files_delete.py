@@ -20,7 +20,6 @@ __metaclass__ = type
 __author__ = "Allen Robel"
 
 import argparse
-import inspect
 import json
 import logging
 import sys
@@ -37,6 +36,7 @@ from ndfc_python.parsers.parser_nd_password import parser_nd_password
 from ndfc_python.parsers.parser_nd_username import parser_nd_username
 from ndfc_python.parsers.parser_nxos_password import parser_nxos_password
 from ndfc_python.parsers.parser_nxos_username import parser_nxos_username
+from ndfc_python.parsers.parser_rate_limit import parser_rate_limit
 from ndfc_python.read_config import ReadConfig
 from ndfc_python.validators.bootflash_files_info import BootflashFilesInfoConfigValidator, SwitchSpec
 from plugins.module_utils.bootflash.bootflash_files import BootflashFiles
@@ -247,7 +247,7 @@ def add_files_to_bootflash_files(bootflash_files: BootflashFiles, converter: Con
             -     Updating ``BootflashFiles`` properties raises ``TypeError`` or ``ValueError``.
             -   ``BootflashFiles().add_file`` raises ``ValueError``.
     """
-    method_name = inspect.stack()[0][3]
+    method_name = "add_files_to_bootflash_files"
 
     for target in targets:
         try:
@@ -351,6 +351,7 @@ def setup_parser() -> argparse.Namespace:
             parser_nd_username,
             parser_nxos_password,
             parser_nxos_username,
+            parser_rate_limit,
         ],
         description=description,
     )
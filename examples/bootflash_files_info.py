@@ -32,6 +32,7 @@ from ndfc_python.parsers.parser_nd_password import parser_nd_password
 from ndfc_python.parsers.parser_nd_username import parser_nd_username
 from ndfc_python.parsers.parser_nxos_password import parser_nxos_password
 from ndfc_python.parsers.parser_nxos_username import parser_nxos_username
+from ndfc_python.parsers.parser_rate_limit import parser_rate_limit
 from ndfc_python.read_config import ReadConfig
 from ndfc_python.validators.bootflash_files_info import BootflashFilesInfoConfigValidator, SwitchSpec
 from plugins.module_utils.bootflash.bootflash_info import BootflashInfo
@@ -205,6 +206,7 @@ def setup_parser() -> argparse.Namespace:
             parser_nd_username,
             parser_nxos_password,
             parser_nxos_username,
+            parser_rate_limit,
         ],
         description=description,
     )
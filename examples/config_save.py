@@ -50,6 +50,7 @@ from ndfc_python.parsers.parser_nd_domain import parser_nd_domain
 from ndfc_python.parsers.parser_nd_ip4 import parser_nd_ip4
 from ndfc_python.parsers.parser_nd_password import parser_nd_password
 from ndfc_python.parsers.parser_nd_username import parser_nd_username
+from ndfc_python.parsers.parser_rate_limit import parser_rate_limit
 from ndfc_python.read_config import ReadConfig
 from ndfc_python.validators.config_save import ConfigSaveConfig, ConfigSaveConfigValidator
 from plugins.module_utils.common.response_handler import ResponseHandler
@@ -92,6 +93,7 @@ def setup_parser() -> argparse.Namespace:
             parser_nd_ip4,
             parser_nd_password,
             parser_nd_username,
+            parser_rate_limit,
         ],
         description="DESCRIPTION: Trigger Config Save on one or more fabrics.",
     )
@@ -33,6 +33,7 @@ from ndfc_python.parsers.parser_nd_password import parser_nd_password
 from ndfc_python.parsers.parser_nd_username import parser_nd_username
 from ndfc_python.parsers.parser_nxos_password import parser_nxos_password
 from ndfc_python.parsers.parser_nxos_username import parser_nxos_username
+from ndfc_python.parsers.parser_rate_limit import parser_rate_limit
 from plugins.module_utils.common.controller_version import ControllerVersion
 from plugins.module_utils.common.exceptions import ControllerResponseError
 from plugins.module_utils.common.response_handler import ResponseHandler
@@ -58,6 +59,7 @@ def setup_parser() -> argparse.Namespace:
             parser_nd_username,
             parser_nxos_password,
             parser_nxos_username,
+            parser_rate_limit,
             parser_loglevel,
         ],
         description="DESCRIPTION: Print controller version information.",
@@ -36,6 +36,7 @@ from ndfc_python.parsers.parser_nd_password import parser_nd_password
 from ndfc_python.parsers.parser_nd_username import parser_nd_username
 from ndfc_python.parsers.parser_nxos_password import parser_nxos_password
 from ndfc_python.parsers.parser_nxos_username import parser_nxos_username
+from ndfc_python.parsers.parser_rate_limit import parser_rate_limit
 from ndfc_python.read_config import ReadConfig
 from plugins.module_utils.common.response_handler import ResponseHandler
 from plugins.module_utils.common.rest_send_v2 import RestSend
@@ -63,6 +64,7 @@ def setup_parser() -> argparse.Namespace:
             parser_nd_username,
             parser_nxos_password,
             parser_nxos_username,
+            parser_rate_limit,
         ],
         description=description,
     )
@@ -88,7 +90,8 @@ def main():
         print(err_msg)
         sys.exit(1)
 
-    validated_config = ndfc_config.contents
+    # Merged receives params["config"], so give it its own copy.
+    validated_config = ndfc_config.contents_copy
 
     try:
         ndfc_sender = NdfcPythonSender()
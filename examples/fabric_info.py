@@ -70,6 +70,7 @@ from ndfc_python.parsers.parser_nd_domain import parser_nd_domain
 from ndfc_python.parsers.parser_nd_ip4 import parser_nd_ip4
 from ndfc_python.parsers.parser_nd_password import parser_nd_password
 from ndfc_python.parsers.parser_nd_username import parser_nd_username
+from ndfc_python.parsers.parser_rate_limit import parser_rate_limit
 from ndfc_python.read_config import ReadConfig
 from ndfc_python.validators.fabric_info import FabricInfoConfigValidator
 
@@ -129,6 +130,7 @@ def setup_parser() -> argparse.Namespace:
             parser_nd_ip4,
             parser_nd_password,
             parser_nd_username,
+            parser_rate_limit,
         ],
         description="DESCRIPTION: Print information about one or more fabrics.",
     )
@@ -52,6 +52,7 @@ from ndfc_python.parsers.parser_nd_domain import parser_nd_domain
 from ndfc_python.parsers.parser_nd_ip4 import parser_nd_ip4
 from ndfc_python.parsers.parser_nd_password import parser_nd_password
 from ndfc_python.parsers.parser_nd_username import parser_nd_username
+from ndfc_python.parsers.parser_rate_limit import parser_rate_limit
 from ndfc_python.read_config import ReadConfig
 from ndfc_python.validators.interface_access import InterfaceAccessCreateConfig, InterfaceAccessCreateConfigValidator
 from plugins.module_utils.common.response_handler import ResponseHandler
@@ -129,6 +130,7 @@ def setup_parser() -> argparse.Namespace:
             parser_nd_ip4,
             parser_nd_password,
             parser_nd_username,
+            parser_rate_limit,
         ],
         description="DESCRIPTION: Create an access-mode interface.",
     )
@@ -171,8 +173,8 @@ except ValueError as error:
 rest_send = RestSend({})
 rest_send.sender = ndfc_sender.sender
 rest_send.response_handler = ResponseHandler()
-rest_send.timeout = 2
-rest_send.send_interval = 5
+rest_send.timeout = 1
+rest_send.send_interval = 1
 
 for item in validator.config:
     action(item)
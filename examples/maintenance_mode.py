@@ -39,7 +39,6 @@ export NDFC_LOGGING_CONFIG=$HOME/repos/ndfc-python/lib/ndfc_python/logging_confi
 """
 import argparse
 import copy
-import inspect
 import json
 import logging
 import sys
@@ -55,6 +54,7 @@ from ndfc_python.parsers.parser_nd_password import parser_nd_password
 from ndfc_python.parsers.parser_nd_username import parser_nd_username
 from ndfc_python.parsers.parser_nxos_password import parser_nxos_password
 from ndfc_python.parsers.parser_nxos_username import parser_nxos_username
+from ndfc_python.parsers.parser_rate_limit import parser_rate_limit
 from ndfc_python.read_config import ReadConfig
 from ndfc_python.validators.maintenance_mode import MaintenanceModeConfigValidator
 from plugins.module_utils.common.maintenance_mode import MaintenanceMode
@@ -83,7 +83,7 @@ class Merged:
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
 
-        method_name = inspect.stack()[0][3]
+        method_name = "__init__"
 
         msg = f"ENTERED Merged.{method_name}: "
         self.log.debug(msg)
@@ -143,7 +143,7 @@ class Merged:
         }
         ```
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = "get_have"  # pylint: disable=unused-variable
 
         try:
             instance = MaintenanceModeInfo(self.rest_send.params)
@@ -169,7 +169,7 @@ class Merged:
         ### Raises
         -   ``ValueError`` if any of the above cases are true
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "fabric_deployment_disabled"
         for ip_address, value in self.have.items():
             fabric_name = value.get("fabric_name")
             mode = value.get("mode")
@@ -258,7 +258,7 @@ class Merged:
             }
         ]
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "get_need"
         self.need = []
         for want in self.want:
             ip_address = want.get("ip_address", None)
@@ -302,7 +302,7 @@ class Merged:
                 -   ``get_have()`` raises ``ValueError``
                 -   ``send_need()`` raises ``ValueError``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         msg = f"{self.class_name}.{method_name}: entered"
         self.log.debug(msg)
 
@@ -346,7 +346,7 @@ class Merged:
             ``TypeError`` or ``ValueError``
 
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = "send_need"  # pylint: disable=unused-variable
 
         if len(self.need) == 0:
             msg = f"{self.class_name}.{method_name}: "
@@ -411,6 +411,7 @@ def setup_parser() -> argparse.Namespace:
             parser_nd_username,
             parser_nxos_password,
             parser_nxos_username,
+            parser_rate_limit,
         ],
         description=description,
     )
@@ -462,7 +463,7 @@ try:
     task = Merged()
     # pylint: disable=attribute-defined-outside-init
     task.rest_send = rest_send  # type: ignore[attr-defined]
-    task.want = ndfc_config.contents["config"]
+    task.want = ndfc_config.contents_copy["config"]
     task.commit()
 except ValueError as error:
     err_msg = f"Exiting.  Error detail: {error}"
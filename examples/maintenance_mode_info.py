@@ -38,7 +38,6 @@ export NDFC_LOGGING_CONFIG=$HOME/repos/ndfc-python/lib/ndfc_python/logging_confi
 
 """
 import argparse
-import inspect
 import json
 import logging
 import sys
@@ -54,6 +53,7 @@ from ndfc_python.parsers.parser_nd_password import parser_nd_password
 from ndfc_python.parsers.parser_nd_username import parser_nd_username
 from ndfc_python.parsers.parser_nxos_password import parser_nxos_password
 from ndfc_python.parsers.parser_nxos_username import parser_nxos_username
+from ndfc_python.parsers.parser_rate_limit import parser_rate_limit
 from ndfc_python.read_config import ReadConfig
 from ndfc_python.validators.maintenance_mode import MaintenanceModeInfoConfigValidator
 from plugins.module_utils.common.maintenance_mode_info import MaintenanceModeInfo
@@ -81,7 +81,7 @@ class Query:
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
 
-        method_name = inspect.stack()[0][3]
+        method_name = "__init__"
 
         msg = f"ENTERED Query.{method_name}: "
         self.log.debug(msg)
@@ -139,7 +139,7 @@ class Query:
         }
         ```
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = "get_have"  # pylint: disable=unused-variable
 
         try:
             instance = MaintenanceModeInfo(self.rest_send.params)
@@ -166,7 +166,7 @@ class Query:
                 -   ``get_want()`` raises ``ValueError``
                 -   ``get_have()`` raises ``ValueError``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         msg = f"{self.class_name}.{method_name}: entered"
         self.log.debug(msg)
 
@@ -249,6 +249,7 @@ def setup_parser() -> argparse.Namespace:
             parser_nd_username,
             parser_nxos_password,
             parser_nxos_username,
+            parser_rate_limit,
         ],
         description=description,
     )
@@ -300,7 +301,7 @@ try:
     task = Query()
     # pylint: disable=attribute-defined-outside-init
     task.rest_send = rest_send  # type: ignore[attr-defined]
-    task.want = ndfc_config.contents["config"]
+    task.want = ndfc_config.contents_copy["config"]
     task.commit()
 except ValueError as error:
     err_msg = f"Exiting.  Error detail: {error}"
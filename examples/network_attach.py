@@ -36,6 +36,17 @@ export NDFC_LOGGING_CONFIG=$HOME/repos/ndfc-python/lib/ndfc_python/logging_confi
 
 ```
 
+6. Optional, with many networks and switches, use --bulk to validate the
+   whole config first and then attach in chunked multi-network requests
+   (--chunk-size networks per request, default 50).
+
+``` bash
+./examples/network_attach.py \
+    --config ./examples/config/network_attach.yaml \
+    --bulk \
+    --chunk-size 100
+```
+
 """
 # pylint: disable=duplicate-code
 import argparse
@@ -45,13 +56,16 @@ import sys
 from ndfc_python.ndfc_python_logger import NdfcPythonLogger
 from ndfc_python.ndfc_python_sender import NdfcPythonSender
 from ndfc_python.network_attach import NetworkAttach
+from ndfc_python.network_attach_bulk import NetworkAttachBulk
 from ndfc_python.parsers.parser_ansible_vault import parser_ansible_vault
+from ndfc_python.parsers.parser_bulk import parser_bulk
 from ndfc_python.parsers.parser_config import parser_config
 from ndfc_python.parsers.parser_loglevel import parser_loglevel
 from ndfc_python.parsers.parser_nd_domain import parser_nd_domain
 from ndfc_python.parsers.parser_nd_ip4 import parser_nd_ip4
 from ndfc_python.parsers.parser_nd_password import parser_nd_password
 from ndfc_python.parsers.parser_nd_username import parser_nd_username
+from ndfc_python.parsers.parser_rate_limit import parser_rate_limit
 from ndfc_python.read_config import ReadConfig
 from ndfc_python.validators.network_attach import NetworkAttachConfig, NetworkAttachConfigValidator
 from plugins.module_utils.common.response_handler import ResponseHandler
@@ -115,6 +129,40 @@ def action(cfg: NetworkAttachConfig) -> None:
     print(result_msg)
 
 
+def action_bulk(config: list[NetworkAttachConfig], chunk_size: int) -> None:
+    """
+    Given a list of network-attach configurations, attach all networks
+    with chunked multi-network requests.
+    """
+    try:
+        instance = NetworkAttachBulk()
+        instance.rest_send = rest_send
+        instance.results = Results()
+        instance.chunk_size = chunk_size
+        instance.config = config
+        instance.commit()
+    except (TypeError, ValueError) as error:
+        errmsg = f"Error attaching networks. Error detail: {error}"
+        log.error(errmsg)
+        print(errmsg)
+        return
+
+    for item in instance.item_results:
+        if item["success"] is False:
+            errmsg = f"Error attaching fabric {item['fabric_name']}, "
+            errmsg += f"network {item['network_name']}, "
+            errmsg += f"to switch_name {item['switch_name']}. "
+            errmsg += f"Error detail: {item['message']}"
+            log.error(errmsg)
+            print(errmsg)
+            continue
+        result_msg = f"Network {item['network_name']} "
+        result_msg += f"attached to fabric {item['fabric_name']}, "
+        result_msg += f"switch_name {item['switch_name']}."
+        log.info(result_msg)
+        print(result_msg)
+
+
 def setup_parser() -> argparse.Namespace:
     """
     ### Summary
@@ -127,12 +175,14 @@ def setup_parser() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         parents=[
             parser_ansible_vault,
+            parser_bulk,
             parser_config,
             parser_loglevel,
             parser_nd_domain,
             parser_nd_ip4,
             parser_nd_password,
             parser_nd_username,
+            parser_rate_limit,
         ],
         description="DESCRIPTION: Attach a network.",
     )
@@ -175,8 +225,11 @@ except ValueError as error:
 rest_send = RestSend({})
 rest_send.sender = ndfc_sender.sender
 rest_send.response_handler = ResponseHandler()
-rest_send.timeout = 2
-rest_send.send_interval = 5
-
-for item in validator.config:
-    action(item)
+rest_send.timeout = 1
+rest_send.send_interval = 1
+
+if args.bulk:
+    action_bulk(validator.config, args.chunk_size)
+else:
+    for item in validator.config:
+        action(item)
@@ -36,6 +36,19 @@ export NDFC_LOGGING_CONFIG=$HOME/repos/ndfc-python/lib/ndfc_python/logging_confi
 
 ```
 
+6. Optional, with many networks, use --bulk to validate the whole config
+   first (against one snapshot of the fabric's networks and VRFs, plus
+   duplicate networkName, networkId and vlanId within the config), and
+   then create the networks with up to --max-workers requests in flight
+   (default 8).
+
+``` bash
+./examples/network_create.py \
+    --config ./examples/config/network_create.yaml \
+    --bulk \
+    --max-workers 16
+```
+
 """
 # pylint: disable=duplicate-code
 import argparse
@@ -45,13 +58,16 @@ import sys
 from ndfc_python.ndfc_python_logger import NdfcPythonLogger
 from ndfc_python.ndfc_python_sender import NdfcPythonSender
 from ndfc_python.network_create import NetworkCreate
+from ndfc_python.network_create_bulk import NetworkCreateBulk
 from ndfc_python.parsers.parser_ansible_vault import parser_ansible_vault
+from ndfc_python.parsers.parser_bulk import parser_bulk
 from ndfc_python.parsers.parser_config import parser_config
 from ndfc_python.parsers.parser_loglevel import parser_loglevel
 from ndfc_python.parsers.parser_nd_domain import parser_nd_domain
 from ndfc_python.parsers.parser_nd_ip4 import parser_nd_ip4
 from ndfc_python.parsers.parser_nd_password import parser_nd_password
 from ndfc_python.parsers.parser_nd_username import parser_nd_username
+from ndfc_python.parsers.parser_rate_limit import parser_rate_limit
 from ndfc_python.read_config import ReadConfig
 from ndfc_python.validators.network_create import NetworkCreateConfig, NetworkCreateConfigValidator
 from plugins.module_utils.common.response_handler import ResponseHandler
@@ -91,6 +107,37 @@ def action(cfg: NetworkCreateConfig):
     print(result_msg)
 
 
+def action_bulk(config: list[NetworkCreateConfig], max_workers: int) -> None:
+    """
+    Given a list of network configurations, validate them together and
+    create all networks with concurrent requests.
+    """
+    try:
+        instance = NetworkCreateBulk()
+        instance.rest_send = rest_send
+        instance.max_workers = max_workers
+        instance.config = config
+        instance.commit()
+    except (TypeError, ValueError) as error:
+        errmsg = f"Error creating networks. Error detail: {error}"
+        log.error(errmsg)
+        print(errmsg)
+        return
+
+    for item in instance.item_results:
+        if item["success"] is False:
+            errmsg = f"Error creating fabric {item['fabric_name']}, "
+            errmsg += f"network {item['network_name']}. "
+            errmsg += f"Error detail: {item['message']}"
+            log.error(errmsg)
+            print(errmsg)
+            continue
+        result_msg = f"Network {item['network_name']} with id {item['network_id']} "
+        result_msg += f"created in fabric {item['fabric_name']}"
+        log.info(result_msg)
+        print(result_msg)
+
+
 def setup_parser() -> argparse.Namespace:
     """
     ### Summary
@@ -103,12 +150,14 @@ def setup_parser() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         parents=[
             parser_ansible_vault,
+            parser_bulk,
             parser_config,
             parser_loglevel,
             parser_nd_domain,
             parser_nd_ip4,
             parser_nd_password,
             parser_nd_username,
+            parser_rate_limit,
         ],
         description="DESCRIPTION: Create a network.",
     )
@@ -151,8 +200,11 @@ except ValueError as error:
 rest_send = RestSend({})
 rest_send.sender = ndfc_sender.sender
 rest_send.response_handler = ResponseHandler()
-rest_send.timeout = 2
-rest_send.send_interval = 5
-
-for item in validator.config:
-    action(item)
+rest_send.timeout = 1
+rest_send.send_interval = 1
+
+if args.bulk:
+    action_bulk(validator.config, args.max_workers)
+else:
+    for item in validator.config:
+        action(item)
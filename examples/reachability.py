@@ -22,6 +22,7 @@ from ndfc_python.parsers.parser_nd_password import parser_nd_password
 from ndfc_python.parsers.parser_nd_username import parser_nd_username
 from ndfc_python.parsers.parser_nxos_password import parser_nxos_password
 from ndfc_python.parsers.parser_nxos_username import parser_nxos_username
+from ndfc_python.parsers.parser_rate_limit import parser_rate_limit
 from ndfc_python.reachability import Reachability
 from ndfc_python.read_config import ReadConfig
 from ndfc_python.validators.reachability import ReachabilityConfigValidator
@@ -93,6 +94,7 @@ def setup_parser() -> argparse.Namespace:
             parser_nd_username,
             parser_nxos_password,
             parser_nxos_username,
+            parser_rate_limit,
         ],
         description="DESCRIPTION: Display reachability information for a switch.",
     )
@@ -36,6 +36,17 @@ export NDFC_LOGGING_CONFIG=$HOME/repos/ndfc-python/lib/ndfc_python/logging_confi
 
 ```
 
+6. Optional, with many VRFs and switches, use --bulk to validate the
+   whole config first and then attach in chunked multi-VRF requests
+   (--chunk-size VRFs per request, default 50).
+
+``` bash
+./examples/vrf_attach.py \
+    --config ./examples/config/vrf_attach.yaml \
+    --bulk \
+    --chunk-size 100
+```
+
 """
 # pylint: disable=duplicate-code
 import argparse
@@ -45,15 +56,18 @@ import sys
 from ndfc_python.ndfc_python_logger import NdfcPythonLogger
 from ndfc_python.ndfc_python_sender import NdfcPythonSender
 from ndfc_python.parsers.parser_ansible_vault import parser_ansible_vault
+from ndfc_python.parsers.parser_bulk import parser_bulk
 from ndfc_python.parsers.parser_config import parser_config
 from ndfc_python.parsers.parser_loglevel import parser_loglevel
 from ndfc_python.parsers.parser_nd_domain import parser_nd_domain
 from ndfc_python.parsers.parser_nd_ip4 import parser_nd_ip4
 from ndfc_python.parsers.parser_nd_password import parser_nd_password
 from ndfc_python.parsers.parser_nd_username import parser_nd_username
+from ndfc_python.parsers.parser_rate_limit import parser_rate_limit
 from ndfc_python.read_config import ReadConfig
 from ndfc_python.validators.vrf_attach import VrfAttachConfig, VrfAttachConfigValidator
 from ndfc_python.vrf_attach import VrfAttach
+from ndfc_python.vrf_attach_bulk import VrfAttachBulk
 from plugins.module_utils.common.response_handler import ResponseHandler
 from plugins.module_utils.common.rest_send_v2 import RestSend
 from plugins.module_utils.common.results import Results
@@ -104,6 +118,41 @@ def action(cfg: VrfAttachConfig) -> None:
     print(result_msg)
 
 
+def action_bulk(config: list[VrfAttachConfig], chunk_size: int) -> None:
+    """
+    Given a list of vrf-attach configurations, attach all VRFs with
+    chunked multi-VRF requests.
+    """
+    try:
+        instance = VrfAttachBulk()
+        instance.rest_send = rest_send
+        instance.results = Results()
+        instance.chunk_size = chunk_size
+        instance.config = config
+        instance.commit()
+    except (TypeError, ValueError) as error:
+        errmsg = "Error attaching VRFs. "
+        errmsg += f"Error detail: {error}"
+        log.error(errmsg)
+        print(errmsg)
+        return
+
+    for item in instance.item_results:
+        if item["success"] is False:
+            errmsg = f"Error attaching VRF {item['vrf_name']} "
+            errmsg += f"to fabric {item['fabric_name']}, "
+            errmsg += f"switch_name {item['switch_name']}. "
+            errmsg += f"Error detail: {item['message']}"
+            log.error(errmsg)
+            print(errmsg)
+            continue
+        result_msg = f"VRF {item['vrf_name']} "
+        result_msg += f"attached to fabric {item['fabric_name']}, "
+        result_msg += f"switch_name {item['switch_name']}."
+        log.info(result_msg)
+        print(result_msg)
+
+
 def setup_parser() -> argparse.Namespace:
     """
     ### Summary
@@ -116,12 +165,14 @@ def setup_parser() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         parents=[
             parser_ansible_vault,
+            parser_bulk,
             parser_config,
             parser_loglevel,
             parser_nd_domain,
             parser_nd_ip4,
             parser_nd_password,
             parser_nd_username,
+            parser_rate_limit,
         ],
         description="DESCRIPTION: Attach a VRF.",
     )
@@ -164,8 +215,11 @@ except ValueError as error:
 rest_send = RestSend({})
 rest_send.sender = ndfc_sender.sender
 rest_send.response_handler = ResponseHandler()
-rest_send.timeout = 2
-rest_send.send_interval = 5
-
-for item in validator.config:
-    action(item)
+rest_send.timeout = 1
+rest_send.send_interval = 1
+
+if args.bulk:
+    action_bulk(validator.config, args.chunk_size)
+else:
+    for item in validator.config:
+        action(item)
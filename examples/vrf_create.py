@@ -34,6 +34,16 @@ environment variables, you can override them like so:
 
 ```bash
 ./vrf_create.py --config config/config_vrf_create.yaml --nd-username admin --nd-password MyPassword --nd-domain local --nd-ip4 10.1.1.2
+```
+
+With many VRFs, use --bulk to validate the whole config first (against one
+snapshot of the fabric's VRFs and networks, plus duplicate vrfName, vrfId
+and vrfVlanId within the config), and then create the VRFs with up to
+--max-workers requests in flight (default 8).
+
+```bash
+./vrf_create.py --config config/config_vrf_create.yaml --bulk --max-workers 16
+```
 """
 # pylint: disable=duplicate-code
 import argparse
@@ -43,15 +53,18 @@ import sys
 from ndfc_python.ndfc_python_logger import NdfcPythonLogger
 from ndfc_python.ndfc_python_sender import NdfcPythonSender
 from ndfc_python.parsers.parser_ansible_vault import parser_ansible_vault
+from ndfc_python.parsers.parser_bulk import parser_bulk
 from ndfc_python.parsers.parser_config import parser_config
 from ndfc_python.parsers.parser_loglevel import parser_loglevel
 from ndfc_python.parsers.parser_nd_domain import parser_nd_domain
 from ndfc_python.parsers.parser_nd_ip4 import parser_nd_ip4
 from ndfc_python.parsers.parser_nd_password import parser_nd_password
 from ndfc_python.parsers.parser_nd_username import parser_nd_username
+from ndfc_python.parsers.parser_rate_limit import parser_rate_limit
 from ndfc_python.read_config import ReadConfig
 from ndfc_python.validators.vrf_create import VrfCreateConfig, VrfCreateConfigValidator
 from ndfc_python.vrf_create import VrfCreate
+from ndfc_python.vrf_create_bulk import VrfCreateBulk
 from plugins.module_utils.common.response_handler import ResponseHandler
 from plugins.module_utils.common.rest_send_v2 import RestSend
 from plugins.module_utils.common.results import Results
@@ -88,6 +101,39 @@ def action(cfg: VrfCreateConfig) -> None:
     print(result_msg)
 
 
+def action_bulk(config: list[VrfCreateConfig], max_workers: int) -> None:
+    """
+    Given a list of VRF configurations, validate them together and
+    create all VRFs with concurrent requests.
+    """
+    try:
+        instance = VrfCreateBulk()
+        instance.rest_send = rest_send
+        instance.max_workers = max_workers
+        instance.config = config
+        instance.commit()
+    except (TypeError, ValueError) as error:
+        errmsg = f"Error creating VRFs. Error detail: {error}"
+        log.error(errmsg)
+        print(errmsg)
+        return
+
+    for item in instance.item_results:
+        if item["success"] is False:
+            errmsg = "Error creating "
+            errmsg += f"fabric {item['fabric_name']}, "
+            errmsg += f"vrf {item['vrf_name']}. "
+            errmsg += f"Error detail: {item['message']}"
+            log.error(errmsg)
+            print(errmsg)
+            continue
+        result_msg = "Created "
+        result_msg += f"fabric {item['fabric_name']}, "
+        result_msg += f"vrf {item['vrf_name']}."
+        log.info(result_msg)
+        print(result_msg)
+
+
 def setup_parser() -> argparse.Namespace:
     """
     ### Summary
@@ -100,12 +146,14 @@ def setup_parser() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         parents=[
             parser_ansible_vault,
+            parser_bulk,
             parser_config,
             parser_loglevel,
             parser_nd_domain,
             parser_nd_ip4,
             parser_nd_password,
             parser_nd_username,
+            parser_rate_limit,
         ],
         description="DESCRIPTION: Create a vrf.",
     )
@@ -150,8 +198,11 @@ except ValidationError as error:
 rest_send = RestSend({})
 rest_send.sender = ndfc_sender.sender
 rest_send.response_handler = ResponseHandler()
-rest_send.timeout = 2
-rest_send.send_interval = 5
-
-for item in validator.config:
-    action(item)
+rest_send.timeout = 1
+rest_send.send_interval = 1
+
+if args.bulk:
+    action_bulk(validator.config, args.max_workers)
+else:
+    for item in validator.config:
+        action(item)
@@ -0,0 +1,584 @@
+#!/usr/bin/env python3
+"""
+# Name
+
+cli.py
+
+# Description
+
+One ndfc-python command with subcommands, for running several operations
+in one process.
+
+Each example script logs in, and retrieves fabric and inventory
+information, before doing one thing.  A workflow such as create VRFs,
+create networks, attach them, then config-save and config-deploy, run as
+five scripts, pays for five interpreter startups, five logins and five
+sets of fabric and inventory GETs.
+
+ndfc-python runs any number of operations in one process, which logs in
+once and shares one Sender (one token, one connection pool) and the
+process-wide fabric, inventory and overlay caches across them.
+
+## Usage
+
+One operation (credentials as for the example scripts: --nd-* arguments,
+environment variables or --ansible-vault):
+
+```bash
+./ndfc-python vrf-create --config config/config_vrf_create.yaml
+```
+
+Several operations from a file, one per line, as they would be typed
+after ndfc-python.  Empty lines and lines starting with # are ignored.
+
+```bash
+cat workflow.txt
+vrf-create --config config/config_vrf_create.yaml
+network-create --config config/config_network_create.yaml
+vrf-attach --config config/config_vrf_attach.yaml
+network-attach --config config/config_network_attach.yaml
+config-save --config config/config_save.yaml
+config-deploy --config config/config_deploy.yaml
+
+./ndfc-python batch workflow.txt
+```
+
+Interactively:
+
+```bash
+./ndfc-python shell
+ndfc-python> fabrics
+ndfc-python> vrf-create --config config/config_vrf_create.yaml
+ndfc-python> exit
+```
+
+Or from one desired-state file, in dependency order, with independent
+steps running concurrently (see PlanApply):
+
+```bash
+./ndfc-python plan --config config/plan.yaml
+./ndfc-python apply --config config/plan.yaml
+```
+
+Create and attach commands validate the whole config before sending
+anything, and send concurrent or chunked requests (see VrfCreateBulk,
+NetworkCreateBulk, VrfAttachBulk and NetworkAttachBulk).
+
+The exit status is 0 if every operation succeeded, else 1.
+"""
+
+# We are using isort for import sorting.
+# pylint: disable=wrong-import-order,import-outside-toplevel
+
+import argparse
+import logging
+import shlex
+import sys
+
+from ndfc_python.ndfc_python_logger import NdfcPythonLogger
+from ndfc_python.ndfc_python_sender import NdfcPythonSender
+from ndfc_python.parsers.parser_ansible_vault import parser_ansible_vault
+from ndfc_python.parsers.parser_config import parser_config
+from ndfc_python.parsers.parser_loglevel import parser_loglevel
+from ndfc_python.parsers.parser_nd_domain import parser_nd_domain
+from ndfc_python.parsers.parser_nd_ip4 import parser_nd_ip4
+from ndfc_python.parsers.parser_nd_password import parser_nd_password
+from ndfc_python.parsers.parser_nd_username import parser_nd_username
+from ndfc_python.parsers.parser_rate_limit import parser_rate_limit
+from ndfc_python.read_config import ReadConfig
+
+PROMPT = "ndfc-python> "
+
+
+class NdfcPythonCli:
+    """
+    # Summary
+
+    Parse and run ndfc-python subcommands, sharing one logged-in Sender
+    and one RestSend across all of them.
+
+    ## Raises
+
+    None.  Errors are logged and printed, and reflected in the return
+    value of run().
+
+    ## Usage
+
+    ```python
+    cli = NdfcPythonCli()
+    sys.exit(cli.run(sys.argv[1:]))
+    ```
+
+    ## Properties
+
+    - ndfc_sender (NdfcPythonSender): getter: the logged-in sender, created on first use
+    - rest_send (RestSend): getter: the RestSend shared by all commands, created on first use
+    """
+
+    def __init__(self):
+        self.class_name = self.__class__.__name__
+        self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
+
+        self._args = None
+        self._ndfc_sender = None
+        self._rest_send = None
+
+        self.commands = {}
+        self.commands["config-deploy"] = self.config_deploy
+        self.commands["config-save"] = self.config_save
+        self.commands["fabrics"] = self.fabrics
+        self.commands["login"] = self.login
+        self.commands["network-attach"] = self.network_attach
+        self.commands["network-create"] = self.network_create
+        self.commands["plan"] = self.plan
+        self.commands["apply"] = self.apply
+        self.commands["vrf-attach"] = self.vrf_attach
+        self.commands["vrf-create"] = self.vrf_create
+
+        self.parser = self._build_parser(top_level=True)
+        self.line_parser = self._build_parser(top_level=False)
+
+    def _build_parser(self, top_level: bool) -> argparse.ArgumentParser:
+        """
+        Return the parser for the ndfc-python command line (top_level True)
+        or for one line of a batch file or the shell.
+        """
+        parents = []
+        if top_level:
+            parents = [parser_ansible_vault, parser_loglevel, parser_nd_domain, parser_nd_ip4, parser_nd_password, parser_nd_username, parser_rate_limit]
+        parser = argparse.ArgumentParser(
+            prog="ndfc-python",
+            parents=parents,
+            description="DESCRIPTION: Run one or more ndfc-python operations in one process, with one login.",
+        )
+        subparsers = parser.add_subparsers(dest="command", metavar="COMMAND", required=True)
+
+        subparsers.add_parser("login", help="Log in to the controller (verifies credentials).")
+        subparsers.add_parser("fabrics", help="List the fabrics on the controller.")
+        for name, item in (("vrf-create", "VRFs"), ("network-create", "networks")):
+            subparser = subparsers.add_parser(name, parents=[parser_config], help=f"Create the {item} in a config file.")
+            subparser.add_argument("--max-workers", dest="max_workers", type=int, default=8, help="Maximum number of requests in flight. Default: 8")
+        for name, item in (("vrf-attach", "VRFs"), ("network-attach", "networks")):
+            subparser = subparsers.add_parser(name, parents=[parser_config], help=f"Attach the {item} in a config file to switches.")
+            subparser.add_argument("--chunk-size", dest="chunk_size", type=int, default=50, help="Maximum number of items per request. Default: 50")
+        subparsers.add_parser("config-save", parents=[parser_config], help="Config Save the fabrics in a config file.")
+        subparsers.add_parser("config-deploy", parents=[parser_config], help="Config Deploy the fabrics in a config file.")
+        subparsers.add_parser("plan", parents=[parser_config], help="Print the steps needed to reach the desired state in a config file.")
+        subparser = subparsers.add_parser("apply", parents=[parser_config], help="Apply the desired state in a config file.")
+        subparser.add_argument("--max-parallel", dest="max_parallel", type=int, default=4, help="Maximum number of steps running at once. Default: 4")
+        subparser.add_argument("--max-workers", dest="max_workers", type=int, default=8, help="Maximum number of create requests in flight per step. Default: 8")
+        subparser.add_argument("--chunk-size", dest="chunk_size", type=int, default=50, help="Maximum number of items per attach request. Default: 50")
+
+        if top_level:
+            subparser = subparsers.add_parser("batch", help="Run the operations in a file, one per line.")
+            subparser.add_argument("filename", help="File with one operation per line, e.g. vrf-create --config vrfs.yaml")
+            subparser.add_argument("--stop-on-error", dest="stop_on_error", action="store_true", help="Stop at the first operation that fails.")
+            subparsers.add_parser("shell", help="Read operations interactively.")
+        return parser
+
+    def run(self, argv: list[str]) -> int:
+        """
+        # Summary
+
+        Run the ndfc-python command line argv (without the program name).
+        Return 0 if every operation succeeded, else 1.
+        """
+        self._args = self.parser.parse_args(argv)
+        NdfcPythonLogger()
+        if self._args.command == "batch":
+            return self.batch(self._args.filename, self._args.stop_on_error)
+        if self._args.command == "shell":
+            return self.shell()
+        return self.run_command(self._args)
+
+    def run_command(self, args: argparse.Namespace) -> int:
+        """
+        # Summary
+
+        Run the subcommand in args.  Return 0 on success, else 1.
+        """
+        try:
+            success = self.commands[args.command](args)
+        except ValueError as error:
+            self._error(f"{args.command}: Error detail: {error}")
+            return 1
+        return 0 if success else 1
+
+    def run_line(self, line: str) -> int | None:
+        """
+        # Summary
+
+        Run one line of a batch file or the shell.  Return None for an
+        empty or comment line, 0 on success, else 1.
+        """
+        try:
+            argv = shlex.split(line, comments=True)
+        except ValueError as error:
+            self._error(f"Unable to parse '{line}'. Error detail: {error}")
+            return 1
+        if not argv:
+            return None
+        try:
+            args = self.line_parser.parse_args(argv)
+        except SystemExit:
+            # argparse has already printed the usage error (or help).
+            return 1
+        return self.run_command(args)
+
+    def batch(self, filename: str, stop_on_error: bool = False) -> int:
+        """
+        # Summary
+
+        Run each line of filename.  Return 0 if every line succeeded, else 1.
+        """
+        try:
+            with open(filename, "r", encoding="utf-8") as handle:
+                lines = handle.readlines()
+        except OSError as error:
+            self._error(f"Unable to read {filename}. Error detail: {error}")
+            return 1
+        status = 0
+        for number, line in enumerate(lines, start=1):
+            result = self.run_line(line)
+            if result is None:
+                continue
+            if result != 0:
+                status = 1
+                if stop_on_error:
+                    self._error(f"{filename}, line {number}: failed. Stopping.")
+                    break
+        return status
+
+    def shell(self) -> int:
+        """
+        # Summary
+
+        Read and run operations until exit, quit or end of input.  Return
+        0 if every operation succeeded, else 1.
+        """
+        try:
+            import readline  # noqa: F401  pylint: disable=unused-import
+        except ImportError:
+            pass
+        status = 0
+        interactive = sys.stdin.isatty()
+        while True:
+            try:
+                line = input(PROMPT if interactive else "")
+            except EOFError:
+                break
+            except KeyboardInterrupt:
+                print()
+                continue
+            if line.strip() in ("exit", "quit"):
+                break
+            if line.strip() in ("help", "?"):
+                self.line_parser.print_help()
+                continue
+            if self.run_line(line) == 1:
+                status = 1
+        return status
+
+    def _error(self, msg: str) -> None:
+        """
+        Log and print msg.
+        """
+        self.log.error(msg)
+        print(msg)
+
+    def _report(self, item_results: list[dict], describe) -> bool:
+        """
+        Print one line per item result, using describe(item) to name each
+        item.  Return True if every item succeeded.
+        """
+        success = True
+        for item in item_results:
+            if item["success"] is False:
+                success = False
+                self._error(f"Error: {describe(item)}. Error detail: {item['message']}")
+                continue
+            msg = f"Done: {describe(item)}."
+            self.log.info(msg)
+            print(msg)
+        return success
+
+    @staticmethod
+    def _read_config(filename: str) -> dict:
+        """
+        Return the contents of the YAML config file filename.
+
+        ## Raises
+
+        - ValueError if the file cannot be read
+        """
+        instance = ReadConfig()
+        instance.filename = filename
+        instance.commit()
+        return instance.contents
+
+    @staticmethod
+    def _validate(validator_class, filename: str) -> list:
+        """
+        Return the config items in filename, validated by validator_class.
+
+        ## Raises
+
+        - ValueError if the file cannot be read or is invalid
+        """
+        from pydantic import ValidationError
+
+        contents = NdfcPythonCli._read_config(filename)
+        try:
+            return validator_class(**contents).config
+        except ValidationError as error:
+            msg = f"Invalid config in {filename}. Error detail: {error}"
+            raise ValueError(msg) from error
+
+    def _results(self):
+        """
+        Return a new Results instance.
+        """
+        from plugins.module_utils.common.results import Results
+
+        return Results()
+
+    def login(self, args: argparse.Namespace) -> bool:  # pylint: disable=unused-argument
+        """
+        Log in (once per process).
+        """
+        _ = self.ndfc_sender
+        print(f"Logged in to {self.ndfc_sender.nd_ip4} as {self.ndfc_sender.nd_username}.")
+        return True
+
+    def fabrics(self, args: argparse.Namespace) -> bool:  # pylint: disable=unused-argument
+        """
+        Print the name and type of each fabric.
+        """
+        from ndfc_python.common.fabric.fabrics_info import FabricsInfo
+
+        instance = FabricsInfo()
+        instance.rest_send = self.rest_send
+        instance.results = self._results()
+        instance.use_cache = True
+        instance.commit()
+        for fabric in instance.fabrics:
+            print(f"{fabric.get('fabricName')} ({fabric.get('fabricType', fabric.get('fabricTechnology', ''))})")
+        return True
+
+    def vrf_create(self, args: argparse.Namespace) -> bool:
+        """
+        Create the VRFs in args.config.
+        """
+        from ndfc_python.validators.vrf_create import VrfCreateConfigValidator
+        from ndfc_python.vrf_create_bulk import VrfCreateBulk
+
+        instance = VrfCreateBulk()
+        instance.rest_send = self._rest_send_with_timeout(1)
+        instance.results = self._results()
+        instance.max_workers = args.max_workers
+        instance.config = self._validate(VrfCreateConfigValidator, args.config)
+        instance.commit()
+        return self._report(instance.item_results, lambda item: f"create fabric {item['fabric_name']}, vrf {item['vrf_name']}")
+
+    def network_create(self, args: argparse.Namespace) -> bool:
+        """
+        Create the networks in args.config.
+        """
+        from ndfc_python.network_create_bulk import NetworkCreateBulk
+        from ndfc_python.validators.network_create import NetworkCreateConfigValidator
+
+        instance = NetworkCreateBulk()
+        instance.rest_send = self._rest_send_with_timeout(1)
+        instance.results = self._results()
+        instance.max_workers = args.max_workers
+        instance.config = self._validate(NetworkCreateConfigValidator, args.config)
+        instance.commit()
+        return self._report(instance.item_results, lambda item: f"create fabric {item['fabric_name']}, network {item['network_name']}")
+
+    def vrf_attach(self, args: argparse.Namespace) -> bool:
+        """
+        Attach the VRFs in args.config.
+        """
+        from ndfc_python.validators.vrf_attach import VrfAttachConfigValidator
+        from ndfc_python.vrf_attach_bulk import VrfAttachBulk
+
+        instance = VrfAttachBulk()
+        instance.rest_send = self._rest_send_with_timeout(1)
+        instance.results = self._results()
+        instance.chunk_size = args.chunk_size
+        instance.config = self._validate(VrfAttachConfigValidator, args.config)
+        instance.commit()
+        return self._report(instance.item_results, lambda item: f"attach vrf {item['vrf_name']} to fabric {item['fabric_name']}, switch_name {item['switch_name']}")
+
+    def network_attach(self, args: argparse.Namespace) -> bool:
+        """
+        Attach the networks in args.config.
+        """
+        from ndfc_python.network_attach_bulk import NetworkAttachBulk
+        from ndfc_python.validators.network_attach import NetworkAttachConfigValidator
+
+        instance = NetworkAttachBulk()
+        instance.rest_send = self._rest_send_with_timeout(1)
+        instance.results = self._results()
+        instance.chunk_size = args.chunk_size
+        instance.config = self._validate(NetworkAttachConfigValidator, args.config)
+        instance.commit()
+        return self._report(instance.item_results, lambda item: f"attach network {item['network_name']} to fabric {item['fabric_name']}, switch_name {item['switch_name']}")
+
+    def config_save(self, args: argparse.Namespace) -> bool:
+        """
+        Config Save each fabric in args.config.
+        """
+        from ndfc_python.config_save import ConfigSave
+        from ndfc_python.validators.config_save import ConfigSaveConfigValidator
+
+        return self._fabric_action(ConfigSave, "Config Save", self._validate(ConfigSaveConfigValidator, args.config))
+
+    def config_deploy(self, args: argparse.Namespace) -> bool:
+        """
+        Config Deploy each fabric in args.config.
+        """
+        from ndfc_python.config_deploy import ConfigDeploy
+        from ndfc_python.validators.config_deploy import ConfigDeployConfigValidator
+
+        return self._fabric_action(ConfigDeploy, "Config Deploy", self._validate(ConfigDeployConfigValidator, args.config))
+
+    def _fabric_action(self, action_class, action_name: str, config: list) -> bool:
+        """
+        Run action_class (ConfigSave or ConfigDeploy) for each fabric in config.
+        """
+        success = True
+        # Give Nexus Dashboard time to complete the request.
+        rest_send = self._rest_send_with_timeout(300, send_interval=5)
+        for cfg in config:
+            try:
+                instance = action_class()
+                instance.rest_send = rest_send
+                instance.results = self._results()
+                instance.fabric_name = cfg.fabric_name
+                print(f"Triggering {action_name} for fabric '{cfg.fabric_name}'")
+                instance.commit()
+                print(instance.status)
+            except (TypeError, ValueError) as error:
+                success = False
+                self._error(f"Error triggering {action_name} for fabric '{cfg.fabric_name}'. Error detail: {error}")
+        return success
+
+    def _plan_apply(self, args: argparse.Namespace):
+        """
+        Return a PlanApply for the desired state in args.config, with its
+        plan built and printed.
+        """
+        from ndfc_python.plan_apply import PlanApply
+        from ndfc_python.validators.plan import PlanConfigValidator
+
+        instance = PlanApply()
+        instance.rest_send = self._rest_send_with_timeout(1)
+        instance.config = self._validate(PlanConfigValidator, args.config)
+        for number, wave in enumerate(instance.plan(), start=1):
+            for node in wave:
+                after = ""
+                if node.depends_on:
+                    after = f" (after {', '.join(other.name for other in node.depends_on)})"
+                print(f"{number}. {node.name}{after}")
+                for description in node.describe_items():
+                    print(f"     + {description}")
+                for description in node.unchanged:
+                    print(f"     = {description} (exists)")
+        if not instance.nodes:
+            print("Nothing to do.")
+        return instance
+
+    def plan(self, args: argparse.Namespace) -> bool:
+        """
+        Print the steps needed to reach the desired state in args.config.
+        """
+        self._plan_apply(args)
+        return True
+
+    def apply(self, args: argparse.Namespace) -> bool:
+        """
+        Apply the desired state in args.config.
+        """
+        method_name = "apply"
+        instance = self._plan_apply(args)
+        instance.max_parallel = args.max_parallel
+        instance.max_workers = args.max_workers
+        instance.chunk_size = args.chunk_size
+        try:
+            instance.apply()
+        except ValueError as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Error detail: {error}"
+            self.log.error(msg)
+        success = True
+        for node in instance.nodes:
+            if node.status != "succeeded":
+                success = False
+                self._error(f"Error: {node.name}: {node.status}. Error detail: {node.message}")
+                continue
+            msg = f"Done: {node.name}." + (f" {node.message}" if node.message else "")
+            self.log.info(msg)
+            print(msg)
+        return success
+
+    def _rest_send_with_timeout(self, timeout: int, send_interval: int = 1):
+        """
+        Return the shared RestSend, with its timeout and send_interval set.
+
+        Sender retries transient failures itself (see RetryPolicy), so
+        most commands need only one RestSend attempt (timeout 1,
+        send_interval 1).  Config Save and Config Deploy poll for up to
+        300 seconds.
+        """
+        rest_send = self.rest_send
+        rest_send.timeout = timeout
+        rest_send.send_interval = send_interval
+        return rest_send
+
+    @property
+    def ndfc_sender(self) -> NdfcPythonSender:
+        """
+        The NdfcPythonSender shared by all commands.  Logs in on first use.
+
+        ## Raises
+
+        - ValueError if login fails
+        """
+        if self._ndfc_sender is None:
+            ndfc_sender = NdfcPythonSender()
+            ndfc_sender.args = self._args if self._args is not None else argparse.Namespace()
+            ndfc_sender.commit()
+            self._ndfc_sender = ndfc_sender
+        return self._ndfc_sender
+
+    @property
+    def rest_send(self):
+        """
+        The RestSend shared by all commands, using ndfc_sender.sender.
+
+        ## Raises
+
+        - ValueError if login fails
+        """
+        if self._rest_send is None:
+            from plugins.module_utils.common.response_handler import ResponseHandler
+            from plugins.module_utils.common.rest_send_v2 import RestSend
+
+            rest_send = RestSend({})
+            rest_send.sender = self.ndfc_sender.sender
+            rest_send.response_handler = ResponseHandler()
+            rest_send.send_interval = 1
+            self._rest_send = rest_send
+        return self._rest_send
+
+
+def main() -> None:
+    """
+    Run ndfc-python with the command line arguments.
+    """
+    sys.exit(NdfcPythonCli().run(sys.argv[1:]))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,11 @@
 import copy
 import logging
 import sys
+from collections.abc import Iterator
 
+from ndfc_python.common.fabric.fabric_inventory_cache import FabricInventoryCache
+from ndfc_python.common.ttl_cache import controller_key, sender_key
+from ndfc_python.json_stream import iter_response_items
 from plugins.module_utils.common.properties import Properties
 
 
@@ -16,9 +20,27 @@ class FabricInventory:
 
     See examples/fabric_inventory.py
 
+    ## Caching
+
+    Inventory snapshots are shared process-wide through FabricInventoryCache,
+    keyed on controller and fabric name.  If use_cache is True (the default)
+    commit() reuses a cached snapshot when one exists and has not expired.
+    Every GET refreshes the cache.  Each instance works on its own copy of
+    the snapshot, so modifying its dictionaries does not affect others.
+
+    ## Streaming
+
+    iter_switches() yields switches one at a time as they arrive, without
+    building the inventory dictionaries, for very large fabrics.
+
+    Operations that change a fabric's inventory (e.g. Reachability, which
+    precedes adding switches) should call refresh(), which always
+    re-fetches, or invalidate(), which discards the cached snapshot.
+
     ## Properties
     - fabric_name (str): getter/setter: name of the fabric to query
     - rest_send (RestSend): getter/setter: RestSend instance to use for REST calls
+    - use_cache (bool): getter/setter: reuse the process-wide inventory cache.  Default True.
     - devices (list): getter: list of device names in the fabric inventory
     - inventory (dict): getter: fabric inventory dictionary, keyed on device name
     """
@@ -26,6 +48,7 @@ class FabricInventory:
     def __init__(self):
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
+        self.cache = FabricInventoryCache()
         self._committed = False
         self._fabric_name = None
         self._inventory = {}  # legacy, keyed on switch name, remove in future
@@ -34,6 +57,7 @@ class FabricInventory:
         self._inventory_by_switch_serial_number = {}
         self._inventory_data = []
         self._return_code = 0
+        self._use_cache = True
         self.api_v1 = "/appcenter/cisco/ndfc/api/v1"
         self.ep_fabrics = f"{self.api_v1}/lan-fabric/rest/control/fabrics"
 
@@ -182,25 +206,172 @@ class FabricInventory:
             }
         """
         self.final_verification()
-        verb = "GET"
-        path = f"{self.ep_fabrics}/{self.fabric_name}/inventory/switchesByFabric"
         # pylint: disable=no-member
+        controller = controller_key(self.rest_send)  # type: ignore[attr-defined]
+        if self.use_cache and self._load_snapshot(controller):
+            return
+        verb = "GET"
         try:
-            self.rest_send.path = path  # type: ignore[attr-defined]
+            self.rest_send.path = self.path  # type: ignore[attr-defined]
             self.rest_send.verb = verb  # type: ignore[attr-defined]
             self.rest_send.commit()  # type: ignore[attr-defined]
         except (TypeError, ValueError) as error:
             msg = f"Unable to send {verb} request to the controller. "
             msg += f"Error details: {error}"
             raise ValueError(msg) from error
-        self._return_code = self.rest_send.response_current.get("RETURN_CODE", 0)  # type: ignore[attr-defined]
-        if self._return_code not in [200, 201]:  # type: ignore[attr-defined]
+        self._populate(self.rest_send.response_current)  # type: ignore[attr-defined]
+        # pylint: enable=no-member
+        self._save_snapshot(controller)
+
+    def iter_switches(self) -> Iterator[dict]:
+        """
+        # Summary
+
+        Yield the switches in fabric_name one at a time, as they are
+        received from the controller.
+
+        If use_cache is True and a cached snapshot exists, its switches
+        are yielded.  Otherwise the inventory is streamed and, unlike
+        commit(), neither stored on this instance nor cached, so peak
+        memory is independent of the size of the fabric.
+
+        ## Raises
+
+        - ValueError if fabric_name or rest_send is not set, or the request fails.
+        """
+        self.final_verification()
+        # pylint: disable=no-member
+        if self.use_cache:
+            snapshot = self.cache.get(controller_key(self.rest_send), self.fabric_name)  # type: ignore[attr-defined]
+            if snapshot is not None:
+                for switch in snapshot["inventory_data"]:
+                    yield copy.deepcopy(switch)
+                return
+        try:
+            yield from iter_response_items(self.rest_send, self.path)  # type: ignore[attr-defined]
+        except (TypeError, ValueError) as error:
             msg = f"Unable to retrieve fabric inventory for fabric {self.fabric_name}. "
-            msg += f"Controller response: {self.rest_send.response_current}."  # type: ignore[attr-defined]
-            raise ValueError(msg)
+            msg += f"Error details: {error}"
+            raise ValueError(msg) from error
+        # pylint: enable=no-member
+
+    def refresh(self) -> None:
+        """
+        # Summary
+
+        Re-fetch the inventory from the controller, ignoring (and replacing)
+        any cached snapshot.
+
+        ## Raises
+
+        - ValueError if fabric_name or rest_send is not set, or the request fails.
+        """
+        use_cache = self.use_cache
+        self.use_cache = False
+        try:
+            self.commit()
+        finally:
+            self.use_cache = use_cache
+
+    def invalidate(self) -> None:
+        """
+        # Summary
+
+        Discard the cached inventory snapshot for fabric_name.  The next
+        access re-fetches the inventory from the controller.
+
+        ## Raises
+
+        None
+        """
         # pylint: disable=no-member
-        self._inventory_data = self.rest_send.response_current.get("DATA", [])  # type: ignore[attr-defined]
+        self.cache.invalidate(controller_key(self.rest_send), self.fabric_name)  # type: ignore[attr-defined]
         # pylint: enable=no-member
+        self._committed = False
+
+    def _load_snapshot(self, controller: str) -> bool:
+        """
+        Populate the inventory dictionaries from the cached snapshot for
+        controller and fabric_name.  Return True if a snapshot was found.
+
+        The snapshot is shared process-wide, so this instance gets its own
+        copy, which callers may modify.
+        """
+        snapshot = self.cache.get(controller, self.fabric_name)
+        if snapshot is None:
+            return False
+        snapshot = copy.deepcopy(snapshot)
+        self._inventory_data = snapshot["inventory_data"]
+        self._inventory = snapshot["inventory"]
+        self._inventory_by_switch_name = snapshot["inventory_by_switch_name"]
+        self._inventory_by_switch_ipv4_address = snapshot["inventory_by_switch_ipv4_address"]
+        self._inventory_by_switch_serial_number = snapshot["inventory_by_switch_serial_number"]
+        self._return_code = snapshot["return_code"]
+        self._committed = True
+        return True
+
+    def _save_snapshot(self, controller: str) -> None:
+        """
+        Store a copy of the inventory dictionaries in the cache for
+        controller and fabric_name, so that changes callers make to this
+        instance's dictionaries are not shared.
+        """
+        snapshot = {}
+        snapshot["inventory_data"] = self._inventory_data
+        snapshot["inventory"] = self._inventory
+        snapshot["inventory_by_switch_name"] = self._inventory_by_switch_name
+        snapshot["inventory_by_switch_ipv4_address"] = self._inventory_by_switch_ipv4_address
+        snapshot["inventory_by_switch_serial_number"] = self._inventory_by_switch_serial_number
+        snapshot["return_code"] = self._return_code
+        self.cache.set(controller, self.fabric_name, copy.deepcopy(snapshot))
+
+    async def commit_async(self, sender) -> None:
+        """
+        # Summary
+
+        Same as commit(), but send the request with an AsyncSender instead
+        of rest_send.  Use with AsyncSender.gather() to retrieve the
+        inventories of many fabrics concurrently.
+
+        ## Raises
+
+        - ValueError if fabric_name is not set, or the request fails.
+
+        ## Usage
+
+        ```python
+        inventories = {}
+        for fabric_name in fabric_names:
+            inventories[fabric_name] = FabricInventory()
+            inventories[fabric_name].fabric_name = fabric_name
+        await sender.gather(*[instance.commit_async(sender) for instance in inventories.values()])
+        ```
+        """
+        if self.fabric_name is None:
+            msg = f"{self.class_name}.commit_async: fabric_name must be set."
+            raise ValueError(msg)
+        controller = sender_key(sender)
+        if self.use_cache and self._load_snapshot(controller):
+            return
+        try:
+            response = await sender.request("GET", self.path)
+        except (TypeError, ValueError) as error:
+            msg = "Unable to send GET request to the controller. "
+            msg += f"Error details: {error}"
+            raise ValueError(msg) from error
+        self._populate(response)
+        self._save_snapshot(controller)
+
+    def _populate(self, response: dict) -> None:
+        """
+        Populate the inventory dictionaries from a controller response.
+        """
+        self._return_code = response.get("RETURN_CODE", 0)
+        if self._return_code not in [200, 201]:
+            msg = f"Unable to retrieve fabric inventory for fabric {self.fabric_name}. "
+            msg += f"Controller response: {response}."
+            raise ValueError(msg)
+        self._inventory_data = response.get("DATA", [])
         self._build_legacy_inventory()
         self._build_inventory_by_switch_name()
         self._build_inventory_by_switch_ipv4_address()
@@ -432,6 +603,29 @@ class FabricInventory:
     def fabric_name(self, value: str) -> None:
         self._fabric_name = value
 
+    @property
+    def use_cache(self) -> bool:
+        """
+        use_cache (setter) accepts a bool.  If True, commit() reuses the
+        process-wide inventory cache.
+        """
+        return self._use_cache
+
+    @use_cache.setter
+    def use_cache(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            msg = f"{self.class_name}.use_cache: "
+            msg += f"use_cache must be a bool. Got {type(value).__name__}."
+            raise TypeError(msg)
+        self._use_cache = value
+
+    @property
+    def path(self) -> str:
+        """
+        return the switchesByFabric endpoint path for fabric_name
+        """
+        return f"{self.ep_fabrics}/{self.fabric_name}/inventory/switchesByFabric"
+
     @property
     def return_code(self) -> int:
         """
@@ -0,0 +1,94 @@
+import logging
+import sys
+
+from ndfc_python.common.ttl_cache import TtlCache
+
+
+class FabricInventoryCache:
+    """
+    # Summary
+
+    Process-wide registry of fabric inventory snapshots (the controller's
+    switchesByFabric response, plus the dictionaries FabricInventory builds
+    from it), keyed on controller and fabric name.
+
+    All FabricInventoryCache instances share the same storage, so
+    NetworkAttach, VrfAttach, PolicyCreate, RmSwitchResourceUsage, etc
+    reuse one download of a fabric's inventory until the snapshot expires
+    or is invalidated.
+
+    ## Usage
+
+    ```python
+    cache = FabricInventoryCache()
+    cache.ttl = 120
+    snapshot = cache.get("10.1.1.1", "SITE1")  # None if not cached
+    cache.set("10.1.1.1", "SITE1", snapshot)
+    cache.invalidate("10.1.1.1", "SITE1")  # one fabric
+    cache.invalidate("10.1.1.1")  # all fabrics on controller 10.1.1.1
+    cache.invalidate()  # everything
+    ```
+
+    ## Properties
+    - ttl (int | float): getter/setter: time-to-live, in seconds, shared by all instances.  0 disables caching.
+    """
+
+    _cache = TtlCache(ttl=300)
+
+    def __init__(self):
+        self.class_name = self.__class__.__name__
+        self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
+
+    def get(self, controller: str, fabric_name: str) -> dict | None:
+        """
+        Return the inventory snapshot for fabric_name on controller, or None
+        if not cached or expired.
+        """
+        snapshot = self._cache.get((controller, fabric_name))
+        msg = f"{self.class_name}.get: controller {controller}, "
+        msg += f"fabric_name {fabric_name}, "
+        msg += f"{'hit' if snapshot is not None else 'miss'}"
+        self.log.debug(msg)
+        return snapshot
+
+    def set(self, controller: str, fabric_name: str, snapshot: dict) -> None:
+        """
+        Cache the inventory snapshot for fabric_name on controller.
+        """
+        self._cache.set((controller, fabric_name), snapshot)
+
+    def invalidate(self, controller: str | None = None, fabric_name: str | None = None) -> None:
+        """
+        Discard cached inventory snapshots.
+
+        - controller and fabric_name: discard one fabric's snapshot
+        - controller only: discard all snapshots for controller
+        - neither: discard all snapshots
+        """
+        msg = f"{self.class_name}.invalidate: controller {controller}, "
+        msg += f"fabric_name {fabric_name}"
+        self.log.debug(msg)
+        if controller is None:
+            self._cache.invalidate()
+            return
+        if fabric_name is not None:
+            self._cache.invalidate((controller, fabric_name))
+            return
+        self._cache.invalidate_matching(lambda key: key[0] == controller)
+
+    @property
+    def ttl(self) -> int | float:
+        """
+        Time-to-live, in seconds, shared by all FabricInventoryCache instances.
+        """
+        return self._cache.ttl
+
+    @ttl.setter
+    def ttl(self, value: int | float) -> None:
+        self._cache.ttl = value
+
+
+if __name__ == "__main__":
+    print("This is a library for ND Python.")
+    print("It is not meant to be executed directly.")
+    sys.exit(1)
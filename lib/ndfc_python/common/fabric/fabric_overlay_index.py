@@ -0,0 +1,429 @@
+import json
+import logging
+import sys
+import threading
+
+from ndfc_python.common.properties import Properties
+from ndfc_python.common.ttl_cache import TtlCache, controller_key
+
+
+class FabricOverlayIndex:
+    """
+    # Summary
+
+    Index of the networks and VRFs in a fabric, for O(1) existence checks.
+
+    The networks and VRFs lists are each retrieved from the controller once,
+    on first use, and indexed as follows.
+
+    - networks by networkName
+    - networks by networkId
+    - networks by vlanId
+    - networks by VRF (dict of networkName -> network, keyed on VRF name)
+    - VRFs by vrfName
+    - VRFs by vrfId
+    - VRFs by vrfVlanId
+
+    The index is shared process-wide, keyed on controller and fabric name,
+    and expires after ttl seconds.  Classes that create or delete networks
+    and VRFs update the index in place (add_network(), remove_network(),
+    add_vrf(), remove_vrf()) after a successful request, so the index stays
+    current without another GET.
+
+    ## Usage
+
+    ```python
+    index = FabricOverlayIndex()
+    index.rest_send = rest_send
+    index.fabric_name = "SITE1"
+    if index.network_id_exists(30000):
+        print("networkId 30000 is in use")
+    index.add_network(payload)  # after a successful network create
+    ```
+
+    ## Properties
+    - fabric_name (str): getter/setter: name of the fabric to index
+    - rest_send (RestSend): getter/setter: RestSend instance to use for REST calls
+    - ttl (int | float): getter/setter: time-to-live, in seconds, shared by all instances.  0 disables caching.
+    """
+
+    _cache = TtlCache(ttl=300)
+    # One lock per index (controller, fabric, kind), so that loading one
+    # index does not block lookups in, or loads of, the others.
+    _locks: dict = {}
+    _locks_lock = threading.Lock()
+
+    def __init__(self):
+        self.class_name = self.__class__.__name__
+        self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
+
+        self.properties = Properties()
+        self.rest_send = self.properties.rest_send
+
+        self._fabric_name = None
+        self.api_v1 = "/appcenter/cisco/ndfc/api/v1"
+        self.ep_fabrics = f"{self.api_v1}/lan-fabric/rest/top-down/fabrics"
+
+    def final_verification(self) -> None:
+        """
+        Verify that required properties have been set.
+        """
+        if self.fabric_name is None:
+            msg = f"{self.class_name}.final_verification: fabric_name must be set."
+            raise ValueError(msg)
+        if self.rest_send is None:
+            msg = f"{self.class_name}.final_verification: rest_send must be set."
+            raise ValueError(msg)
+
+    def _key(self, kind: str) -> tuple:
+        """
+        Return the cache key for kind ("networks" or "vrfs").
+        """
+        return (controller_key(self.rest_send), self.fabric_name, kind)
+
+    def _lock(self, key: tuple) -> threading.Lock:
+        """
+        Return the lock that serializes loads and updates of the index for key.
+        """
+        with self._locks_lock:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = threading.Lock()
+                self._locks[key] = lock
+            return lock
+
+    def _get(self, kind: str) -> list:
+        """
+        Send a GET request for kind ("networks" or "vrfs") and return DATA.
+
+        ## Raises
+
+        - ValueError if the request fails, or the controller returns an error.
+        """
+        path = f"{self.ep_fabrics}/{self.fabric_name}/{kind}"
+        verb = "GET"
+        try:
+            self.rest_send.path = path
+            self.rest_send.verb = verb
+            self.rest_send.commit()
+        except (TypeError, ValueError) as error:
+            msg = f"{self.class_name}._get: "
+            msg += f"Unable to send {verb} request to the controller. "
+            msg += f"Error details: {error}"
+            raise ValueError(msg) from error
+        data = self.rest_send.response_current.get("DATA", [])
+        if not isinstance(data, list):
+            msg = f"{self.class_name}._get: "
+            if data.get("message") == "Resource not found":
+                msg += f"Fabric {self.fabric_name} does not exist on the controller."
+            else:
+                msg += f"Unable to retrieve {kind} for fabric {self.fabric_name}. "
+                msg += f"Controller response: {self.rest_send.response_current}"
+            raise ValueError(msg)
+        return data
+
+    @staticmethod
+    def _template_config_value(item: dict, template_config_key: str, key: str) -> str:
+        """
+        Return item[template_config_key][key] as a string, where
+        item[template_config_key] may be a dict or a JSON string.
+        Return "" if the value is missing.
+        """
+        template_config = item.get(template_config_key) or {}
+        if isinstance(template_config, str):
+            try:
+                template_config = json.loads(template_config)
+            except json.JSONDecodeError:
+                return ""
+        value = template_config.get(key)
+        if value in (None, ""):
+            return ""
+        return str(value)
+
+    def _network_vlan_id(self, network: dict) -> str:
+        """
+        Return the vlanId of network, from networkTemplateConfig, as a string.
+        Return "" if the network has no vlanId.
+        """
+        return self._template_config_value(network, "networkTemplateConfig", "vlanId")
+
+    def _vrf_vlan_id(self, vrf: dict) -> str:
+        """
+        Return the vrfVlanId of vrf, from vrfTemplateConfig, as a string.
+        Return "" if the VRF has no vrfVlanId.
+        """
+        return self._template_config_value(vrf, "vrfTemplateConfig", "vrfVlanId")
+
+    def _index_network(self, index: dict, network: dict) -> None:
+        """
+        Add network to the network index dictionaries.
+        """
+        network_name = network.get("networkName")
+        if network_name is None:
+            return
+        index["by_name"][network_name] = network
+        if network.get("networkId") not in (None, ""):
+            index["by_network_id"][str(network["networkId"])] = network
+        vlan_id = self._network_vlan_id(network)
+        if vlan_id:
+            index["by_vlan_id"][vlan_id] = network
+        vrf_name = network.get("vrf")
+        if vrf_name:
+            index["by_vrf"].setdefault(vrf_name, {})[network_name] = network
+
+    def _index_vrf(self, index: dict, vrf: dict) -> None:
+        """
+        Add vrf to the VRF index dictionaries.
+        """
+        vrf_name = vrf.get("vrfName")
+        if vrf_name is None:
+            return
+        if vrf.get("fabric", self.fabric_name) != self.fabric_name:
+            return
+        index["by_name"][vrf_name] = vrf
+        if vrf.get("vrfId") not in (None, ""):
+            index["by_vrf_id"][str(vrf["vrfId"])] = vrf
+        vlan_id = self._vrf_vlan_id(vrf)
+        if vlan_id:
+            index["by_vlan_id"][vlan_id] = vrf
+
+    def _networks(self) -> dict:
+        """
+        Return the network index for fabric_name, retrieving it if needed.
+        """
+        self.final_verification()
+        key = self._key("networks")
+        index = self._cache.get(key)
+        if index is not None:
+            return index
+        with self._lock(key):
+            index = self._cache.get(key)
+            if index is not None:
+                return index
+            index = {"by_name": {}, "by_network_id": {}, "by_vlan_id": {}, "by_vrf": {}}
+            for network in self._get("networks"):
+                self._index_network(index, network)
+            self._cache.set(key, index)
+            return index
+
+    def _vrfs(self) -> dict:
+        """
+        Return the VRF index for fabric_name, retrieving it if needed.
+        """
+        self.final_verification()
+        key = self._key("vrfs")
+        index = self._cache.get(key)
+        if index is not None:
+            return index
+        with self._lock(key):
+            index = self._cache.get(key)
+            if index is not None:
+                return index
+            index = {"by_name": {}, "by_vlan_id": {}, "by_vrf_id": {}}
+            for vrf in self._get("vrfs"):
+                self._index_vrf(index, vrf)
+            self._cache.set(key, index)
+            return index
+
+    def load_networks(self) -> None:
+        """
+        # Summary
+
+        Retrieve the networks list for fabric_name, if not already indexed.
+
+        ## Raises
+
+        - ValueError if fabric_name or rest_send is not set, or the request fails.
+        """
+        self._networks()
+
+    def load_vrfs(self) -> None:
+        """
+        # Summary
+
+        Retrieve the VRFs list for fabric_name, if not already indexed.
+
+        ## Raises
+
+        - ValueError if fabric_name or rest_send is not set, or the request fails.
+        """
+        self._vrfs()
+
+    def refresh(self) -> None:
+        """
+        # Summary
+
+        Discard the index for fabric_name and retrieve the networks and VRFs
+        lists from the controller again.
+
+        ## Raises
+
+        - ValueError if fabric_name or rest_send is not set, or a request fails.
+        """
+        self.invalidate()
+        self.load_networks()
+        self.load_vrfs()
+
+    def invalidate(self) -> None:
+        """
+        # Summary
+
+        Discard the index for fabric_name.  The next lookup retrieves the
+        networks and VRFs lists from the controller again.
+        """
+        self.final_verification()
+        for kind in ("networks", "vrfs"):
+            key = self._key(kind)
+            with self._lock(key):
+                self._cache.invalidate(key)
+
+    def network(self, network_name: str) -> dict | None:
+        """
+        Return the network dictionary for network_name, or None.
+        """
+        return self._networks()["by_name"].get(network_name)
+
+    def network_name_exists(self, network_name: str) -> bool:
+        """
+        Return True if network_name exists in fabric_name.
+        """
+        return network_name in self._networks()["by_name"]
+
+    def network_id_exists(self, network_id: int | str) -> bool:
+        """
+        Return True if network_id is in use in fabric_name.
+        """
+        return str(network_id) in self._networks()["by_network_id"]
+
+    def vlan_id_exists(self, vlan_id: int | str) -> bool:
+        """
+        Return True if a network in fabric_name uses vlan_id.
+        """
+        return str(vlan_id) in self._networks()["by_vlan_id"]
+
+    def networks_in_vrf(self, vrf_name: str) -> list[dict]:
+        """
+        Return the networks in fabric_name that belong to vrf_name.
+        """
+        return list(self._networks()["by_vrf"].get(vrf_name, {}).values())
+
+    def vrf(self, vrf_name: str) -> dict | None:
+        """
+        Return the VRF dictionary for vrf_name, or None.
+        """
+        return self._vrfs()["by_name"].get(vrf_name)
+
+    def vrf_name_exists(self, vrf_name: str) -> bool:
+        """
+        Return True if vrf_name exists in fabric_name.
+        """
+        return vrf_name in self._vrfs()["by_name"]
+
+    def vrf_id_exists(self, vrf_id: int | str) -> bool:
+        """
+        Return True if vrf_id is in use in fabric_name.
+        """
+        return str(vrf_id) in self._vrfs()["by_vrf_id"]
+
+    def vrf_vlan_id_exists(self, vlan_id: int | str) -> bool:
+        """
+        Return True if a VRF in fabric_name uses vlan_id.
+        """
+        return str(vlan_id) in self._vrfs()["by_vlan_id"]
+
+    def vlan_id_in_use(self, vlan_id: int | str) -> bool:
+        """
+        Return True if any network or VRF in fabric_name uses vlan_id.
+        """
+        return self.vlan_id_exists(vlan_id) or self.vrf_vlan_id_exists(vlan_id)
+
+    def add_network(self, network: dict) -> None:
+        """
+        Add network (e.g. a successful network create payload) to the index.
+        Does nothing if the index has not been retrieved yet.
+        """
+        self.final_verification()
+        key = self._key("networks")
+        with self._lock(key):
+            index = self._cache.get(key)
+            if index is not None:
+                self._index_network(index, network)
+
+    def remove_network(self, network_name: str) -> None:
+        """
+        Remove network_name from the index.
+        """
+        self.final_verification()
+        key = self._key("networks")
+        with self._lock(key):
+            index = self._cache.get(key)
+            if index is None:
+                return
+            network = index["by_name"].pop(network_name, None)
+            if network is None:
+                return
+            if network.get("networkId") not in (None, ""):
+                index["by_network_id"].pop(str(network["networkId"]), None)
+            vlan_id = self._network_vlan_id(network)
+            if vlan_id and index["by_vlan_id"].get(vlan_id) is network:
+                index["by_vlan_id"].pop(vlan_id)
+            index["by_vrf"].get(network.get("vrf"), {}).pop(network_name, None)
+
+    def add_vrf(self, vrf: dict) -> None:
+        """
+        Add vrf (e.g. a successful VRF create payload) to the index.
+        Does nothing if the index has not been retrieved yet.
+        """
+        self.final_verification()
+        key = self._key("vrfs")
+        with self._lock(key):
+            index = self._cache.get(key)
+            if index is not None:
+                self._index_vrf(index, vrf)
+
+    def remove_vrf(self, vrf_name: str) -> None:
+        """
+        Remove vrf_name from the index.
+        """
+        self.final_verification()
+        key = self._key("vrfs")
+        with self._lock(key):
+            index = self._cache.get(key)
+            if index is None:
+                return
+            vrf = index["by_name"].pop(vrf_name, None)
+            if vrf is None:
+                return
+            if vrf.get("vrfId") not in (None, ""):
+                index["by_vrf_id"].pop(str(vrf["vrfId"]), None)
+            vlan_id = self._vrf_vlan_id(vrf)
+            if vlan_id and index["by_vlan_id"].get(vlan_id) is vrf:
+                index["by_vlan_id"].pop(vlan_id)
+
+    @property
+    def fabric_name(self) -> str:
+        """
+        return the current value of fabric_name
+        """
+        return self._fabric_name
+
+    @fabric_name.setter
+    def fabric_name(self, value: str) -> None:
+        self._fabric_name = value
+
+    @property
+    def ttl(self) -> int | float:
+        """
+        Time-to-live, in seconds, shared by all FabricOverlayIndex instances.
+        """
+        return self._cache.ttl
+
+    @ttl.setter
+    def ttl(self, value: int | float) -> None:
+        self._cache.ttl = value
+
+
+if __name__ == "__main__":
+    print("This is a library for ND Python.")
+    print("It is not meant to be executed directly.")
+    sys.exit(1)
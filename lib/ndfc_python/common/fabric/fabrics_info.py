@@ -1,7 +1,9 @@
 import logging
 import sys
 
+from ndfc_python.common.fabric.fabrics_info_cache import FabricsInfoCache
 from ndfc_python.common.properties import Properties
+from ndfc_python.common.ttl_cache import controller_key
 
 
 class FabricsInfo:
@@ -14,15 +16,24 @@ class FabricsInfo:
 
     See examples/fabrics_info.py
 
+    ## Caching
+
+    If use_cache is True, commit() reuses the fabric list held in the
+    process-wide FabricsInfoCache (keyed on controller) rather than sending
+    a GET request, as long as the cached list has not expired.  Every
+    successful GET refreshes the cache, regardless of use_cache.
+
     ## Properties
     - rest_send (RestSend): getter/setter: RestSend instance to use for REST calls
     - results (Results): getter/setter: Results instance to manage controller responses
+    - use_cache (bool): getter/setter: reuse the process-wide fabric list cache.  Default False.
     """
 
     def __init__(self):
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
 
+        self.cache = FabricsInfoCache()
         self.properties = Properties()
         self.rest_send = self.properties.rest_send
 
@@ -31,6 +42,7 @@ class FabricsInfo:
         self._fabrics_by_fabric_name = {}
         self._fabrics = []
         self._return_code = 0
+        self._use_cache = False
         self.api_v1 = "/appcenter/cisco/ndfc/api/v1"
         self.ep_path = f"{self.api_v1}/lan-fabric/rest/control/fabrics"
         self.ep_verb = "GET"
@@ -51,6 +63,14 @@ class FabricsInfo:
 
         """
         self.final_verification()
+        controller = controller_key(self.rest_send)
+        if self.use_cache:
+            entry = self.cache.get(controller)
+            if entry is not None:
+                self._fabrics, self._fabrics_by_fabric_name = entry
+                self._return_code = 200
+                self._committed = True
+                return
         try:
             self.rest_send.path = self.ep_path
             self.rest_send.verb = self.ep_verb
@@ -66,8 +86,17 @@ class FabricsInfo:
             raise ValueError(msg)
         self._fabrics = self.rest_send.response_current.get("DATA", [])
         self._build_fabrics_by_fabric_name()
+        self.cache.set(controller, self._fabrics, self._fabrics_by_fabric_name)
         self._committed = True
 
+    def invalidate(self) -> None:
+        """
+        Discard the cached fabric list for the controller that rest_send
+        talks to.  Call after creating or deleting fabrics.
+        """
+        self.cache.invalidate(controller_key(self.rest_send))
+        self._committed = False
+
     def _build_fabrics_by_fabric_name(self) -> None:
         """Build the fabric inventory keyed on fabric name."""
         self._fabrics_by_fabric_name = {}
@@ -139,6 +168,22 @@ class FabricsInfo:
     def filter(self, value: str) -> None:
         self._filter = value
 
+    @property
+    def use_cache(self) -> bool:
+        """
+        use_cache (setter) accepts a bool.  If True, commit() reuses the
+        process-wide fabric list cache.
+        """
+        return self._use_cache
+
+    @use_cache.setter
+    def use_cache(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            msg = f"{self.class_name}.use_cache: "
+            msg += f"use_cache must be a bool. Got {type(value).__name__}."
+            raise TypeError(msg)
+        self._use_cache = value
+
     @property
     def return_code(self) -> int:
         """
@@ -0,0 +1,83 @@
+import logging
+import sys
+
+from ndfc_python.common.ttl_cache import TtlCache
+
+
+class FabricsInfoCache:
+    """
+    # Summary
+
+    Process-wide cache of the fabric list returned by the controller's
+    control/fabrics endpoint, keyed on controller.  Within each controller
+    entry, fabrics are indexed by fabric name.
+
+    All FabricsInfoCache instances share the same storage, so every
+    FabricsInfo in a process (and hence every fabric_exists() check in
+    NetworkAttach, VrfAttach, NetworkCreate, etc) reuses one download of
+    the fabric list until the entry expires or is invalidated.
+
+    ## Usage
+
+    ```python
+    cache = FabricsInfoCache()
+    cache.ttl = 120
+    fabrics_by_fabric_name = cache.get("10.1.1.1")  # None if not cached
+    cache.set("10.1.1.1", fabrics, fabrics_by_fabric_name)
+    cache.invalidate("10.1.1.1")  # e.g. after creating or deleting a fabric
+    cache.invalidate()  # all controllers
+    ```
+
+    ## Properties
+    - ttl (int | float): getter/setter: time-to-live, in seconds, shared by all instances.  0 disables caching.
+    """
+
+    _cache = TtlCache(ttl=300)
+
+    def __init__(self):
+        self.class_name = self.__class__.__name__
+        self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
+
+    def get(self, controller: str) -> tuple[list, dict] | None:
+        """
+        Return (fabrics, fabrics_by_fabric_name) for controller, or None if
+        not cached or expired.
+        """
+        entry = self._cache.get(controller)
+        msg = f"{self.class_name}.get: controller {controller}, "
+        msg += f"{'hit' if entry is not None else 'miss'}"
+        self.log.debug(msg)
+        return entry
+
+    def set(self, controller: str, fabrics: list, fabrics_by_fabric_name: dict) -> None:
+        """
+        Cache the fabric list, and the same fabrics keyed on fabric name,
+        for controller.
+        """
+        self._cache.set(controller, (fabrics, fabrics_by_fabric_name))
+
+    def invalidate(self, controller: str | None = None) -> None:
+        """
+        Discard the cached fabric list for controller.  If controller is
+        None, discard the cached fabric lists for all controllers.
+        """
+        msg = f"{self.class_name}.invalidate: controller {controller}"
+        self.log.debug(msg)
+        self._cache.invalidate(controller)
+
+    @property
+    def ttl(self) -> int | float:
+        """
+        Time-to-live, in seconds, shared by all FabricsInfoCache instances.
+        """
+        return self._cache.ttl
+
+    @ttl.setter
+    def ttl(self, value: int | float) -> None:
+        self._cache.ttl = value
+
+
+if __name__ == "__main__":
+    print("This is a library for ND Python.")
+    print("It is not meant to be executed directly.")
+    sys.exit(1)
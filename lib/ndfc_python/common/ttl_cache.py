@@ -0,0 +1,144 @@
+import threading
+import time
+
+
+def normalize_controller(hosts) -> str:
+    """
+    # Summary
+
+    Return a string identifying the controller at hosts: an address, a
+    comma-separated string of addresses, or a list of addresses (the
+    nodes of a cluster).  The addresses are sorted, so that the same
+    cluster gets the same string however its nodes are listed.
+
+    Returns "default" if hosts contains no address.
+    """
+    if isinstance(hosts, (list, tuple)):
+        hosts = ",".join(str(host) for host in hosts)
+    hosts = sorted({host.strip() for host in str(hosts or "").split(",")} - {""})
+    return ",".join(hosts) or "default"
+
+
+def sender_key(sender) -> str:
+    """
+    # Summary
+
+    Return a string identifying the controller that sender (a Sender or
+    AsyncSender) talks to: the nodes of sender.cluster if set, else
+    sender.get_host() (see normalize_controller()).
+
+    ## Raises
+
+    - AttributeError or ValueError if the address cannot be determined.
+    """
+    cluster = getattr(sender, "cluster", None)
+    if cluster is not None:
+        return normalize_controller(cluster.hosts)
+    return normalize_controller(sender.get_host())
+
+
+def controller_key(rest_send) -> str:
+    """
+    # Summary
+
+    Return a string identifying the controller that rest_send talks to
+    (see sender_key()).  Used to key process-wide caches so that data
+    from different controllers is never mixed.
+
+    Returns "default" if the controller address cannot be determined
+    (e.g. rest_send has no sender yet).
+    """
+    try:
+        return sender_key(rest_send.sender)
+    except (AttributeError, ValueError):
+        return "default"
+
+
+class TtlCache:
+    """
+    # Summary
+
+    A thread-safe dictionary whose entries expire ttl seconds after they
+    are set.
+
+    ## Usage
+
+    ```python
+    cache = TtlCache()
+    cache.ttl = 60
+    cache.set(("10.1.1.1", "SITE1"), data)
+    data = cache.get(("10.1.1.1", "SITE1"))  # None if missing or expired
+    cache.invalidate(("10.1.1.1", "SITE1"))
+    ```
+
+    ## Properties
+    - ttl (int | float): getter/setter: default time-to-live, in seconds.  0 disables caching.
+    """
+
+    def __init__(self, ttl: int | float = 300):
+        self.class_name = self.__class__.__name__
+        self._entries: dict = {}
+        self._lock = threading.Lock()
+        self._ttl = ttl
+
+    def get(self, key):
+        """
+        Return the value for key, or None if key is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if time.monotonic() >= expires:
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key, value, ttl: int | float | None = None) -> None:
+        """
+        Store value under key.  ttl overrides the default ttl for this entry.
+        """
+        if ttl is None:
+            ttl = self.ttl
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+
+    def invalidate(self, key=None) -> None:
+        """
+        Remove key from the cache.  If key is None, remove all entries.
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                return
+            self._entries.pop(key, None)
+
+    def invalidate_matching(self, predicate) -> None:
+        """
+        Remove all entries whose key satisfies predicate(key).
+        """
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    @property
+    def ttl(self) -> int | float:
+        """
+        Default time-to-live, in seconds, for new entries.  0 disables caching.
+        """
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, value: int | float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            msg = f"{self.class_name}.ttl: "
+            msg += f"ttl must be an int or float. Got {type(value).__name__}."
+            raise TypeError(msg)
+        if value < 0:
+            msg = f"{self.class_name}.ttl: "
+            msg += f"ttl must be >= 0. Got {value}."
+            raise ValueError(msg)
+        self._ttl = value
@@ -22,7 +22,6 @@ No JSON payload is required for this request.
 # We're using isort for import linting
 # pylint: disable=wrong-import-order
 
-import inspect
 import logging
 
 from ndfc_python.common.fabric.fabrics_info import FabricsInfo
@@ -71,7 +70,7 @@ class ConfigDeploy:
         """
         Any final verification steps before sending the request
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_final_verification"
         if self.fabric_name is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "fabric_name must be set before calling commit()."
@@ -88,6 +87,7 @@ class ConfigDeploy:
         Return False otherwise.
         """
         self.fabrics_info.rest_send = self.rest_send
+        self.fabrics_info.use_cache = True
         self.fabrics_info.commit()
         self.fabrics_info.filter = self.fabric_name
         return self.fabrics_info.fabric_exists
@@ -96,7 +96,7 @@ class ConfigDeploy:
         """
         Send a POST request to the controller to the config-deploy endpoint
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         self._final_verification()
 
         if self.fabric_exists() is False:
@@ -139,7 +139,7 @@ class ConfigDeploy:
 
         See accessor properties
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_get"
         if self.response_data is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Call {self.class_name}.commit before calling "
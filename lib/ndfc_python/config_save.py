@@ -22,7 +22,6 @@ No JSON payload is required for this request.
 # We're using isort for import linting
 # pylint: disable=wrong-import-order
 
-import inspect
 import logging
 
 from ndfc_python.common.fabric.fabrics_info import FabricsInfo
@@ -73,7 +72,7 @@ class ConfigSave:
         """
         Any final verification steps before sending the request
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_final_verification"
         if not self.fabric_name:
             msg = f"{self.class_name}.{method_name}: "
             msg += "fabric_name must be set to a non-empty string before calling commit()."
@@ -90,6 +89,7 @@ class ConfigSave:
         Return False otherwise.
         """
         self.fabrics_info.rest_send = self.rest_send
+        self.fabrics_info.use_cache = True
         self.fabrics_info.commit()
         self.fabrics_info.filter = self.fabric_name
         return self.fabrics_info.fabric_exists
@@ -98,7 +98,7 @@ class ConfigSave:
         """
         Send a POST request to the controller to the config-save endpoint
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         self._final_verification()
 
         if self.fabric_exists() is False:
@@ -143,7 +143,7 @@ class ConfigSave:
 
         See accessor properties
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_get"
         if self.response_data is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Call {self.class_name}.commit before calling "
@@ -0,0 +1,397 @@
+"""
+# Name
+
+controller_cluster.py
+
+# Description
+
+Spread requests across the nodes of a Nexus Dashboard cluster, and fail
+over to another node when one cannot be reached.
+
+Sender talks to one address (ip4, else ip6), so every request lands on
+the same node of a three-node cluster, and the scripts fail if that node
+is down.  A ControllerCluster attached to Sender (sender.cluster) picks
+the node for each request instead.
+"""
+
+import logging
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Verbs that read, and can be sent to any node.
+READ_VERBS = frozenset({"GET", "HEAD", "OPTIONS"})
+STRATEGIES = ("round_robin", "least_latency")
+# Weight of the newest latency in each node's latency moving average.
+LATENCY_ALPHA = 0.2
+
+
+class ControllerCluster:
+    """
+    # Summary
+
+    Choose a node of a Nexus Dashboard cluster for each request.
+
+    - Reads (GET) are distributed across the healthy nodes, either in
+      turn (strategy "round_robin") or to the node with the lowest
+      moving-average latency (strategy "least_latency").
+    - Writes (POST, PUT, DELETE) go to one node, primary, while it stays
+      healthy (sticky_writes True), so that a read-modify-write sequence
+      is not split across nodes.  If sticky_writes is False, writes are
+      distributed like reads.
+    - Sender calls mark_down() for a node that cannot be reached.  The
+      node is skipped for down_interval seconds, then re-admitted if a
+      health check (a TCP connection to its HTTPS port) succeeds.  If
+      every node is down, the node that went down first is used.
+    - probe() checks every node at once, and ranks the healthy nodes by
+      connection latency.  primary is the fastest healthy node.
+
+    A JWT from one node is accepted by every node of the cluster, so
+    Sender logs in once, whichever node is chosen.
+
+    ## Usage
+
+    ```python
+    cluster = ControllerCluster()
+    cluster.hosts = ["10.1.1.1", "10.1.1.2", "10.1.1.3"]
+    cluster.strategy = "least_latency"
+    cluster.probe()
+    sender.ip4 = cluster.hosts[0]
+    sender.cluster = cluster
+    sender.login()
+    ```
+
+    ## Raises
+
+    - TypeError, ValueError from the property setters if values are invalid.
+
+    ## Properties
+
+    - down_interval (float): getter/setter: seconds an unreachable node is skipped.  Default 30
+    - healthy (list): getter: the nodes not marked down, in rank order
+    - hosts (list): getter/setter: node addresses, with an optional ":port".  Setting hosts resets their state.
+    - latency (dict): getter: moving-average latency, in seconds, per node
+    - port (int): getter/setter: port for health checks if a host has none.  Default 443
+    - primary (str): getter: the node that receives writes
+    - probe_timeout (float): getter/setter: seconds to wait for a health check.  Default 2
+    - stats (dict): getter: requests per node, and failovers
+    - sticky_writes (bool): getter/setter: send writes to primary.  Default True
+    - strategy (str): getter/setter: "round_robin" or "least_latency".  Default "round_robin"
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
+
+        self._lock = threading.Lock()
+
+        self._down_interval = 30.0
+        self._hosts: list[str] = []
+        self._port = 443
+        self._probe_timeout = 2.0
+        self._sticky_writes = True
+        self._strategy = "round_robin"
+
+        self._down_until: dict[str, float] = {}
+        self._failovers = 0
+        self._latency: dict[str, float] = {}
+        self._next = 0
+        self._primary = None
+        self._ranked: list[str] = []
+        self._requests: dict[str, int] = {}
+
+    def _address(self, host: str) -> tuple[str, int]:
+        """
+        Return the (address, port) to which a health check for host connects.
+        """
+        if host.startswith("["):
+            address, _, port = host[1:].partition("]")
+            return address, int(port[1:]) if port.startswith(":") else self._port
+        if host.count(":") == 1:
+            address, port = host.split(":")
+            return address, int(port)
+        return host, self._port
+
+    def check(self, host: str) -> float | None:
+        """
+        # Summary
+
+        Health check: return the seconds taken to open a TCP connection to
+        host, or None if it cannot be opened within probe_timeout.
+        """
+        method_name = "check"
+        started = time.monotonic()
+        try:
+            with socket.create_connection(self._address(host), timeout=self._probe_timeout):
+                return time.monotonic() - started
+        except (OSError, ValueError) as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Health check of {host} failed. Error detail: {error}"
+            self.log.debug(msg)
+            return None
+
+    def probe(self) -> dict:
+        """
+        # Summary
+
+        Health check every node at once.  Mark the nodes that fail down,
+        and rank the others, and choose primary, by latency.  Return a
+        dict of latency (None if unreachable) per node.
+        """
+        method_name = "probe"
+        hosts = list(self._hosts)
+        if not hosts:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(hosts)) as executor:
+            results = dict(zip(hosts, executor.map(self.check, hosts)))
+        now = time.monotonic()
+        with self._lock:
+            for host, latency in results.items():
+                if latency is None:
+                    self._down_until[host] = now + self._down_interval
+                    continue
+                self._down_until.pop(host, None)
+                self._latency[host] = latency
+            reachable = sorted((host for host in hosts if results[host] is not None), key=lambda host: results[host])
+            self._ranked = reachable + [host for host in hosts if results[host] is None]
+            self._primary = self._ranked[0]
+        msg = f"{self.class_name}.{method_name}: "
+        msg += "Node latency: "
+        msg += ", ".join(f"{host} {'unreachable' if latency is None else f'{latency * 1000:.1f}ms'}" for host, latency in results.items())
+        msg += f". Primary: {self._primary}."
+        self.log.info(msg)
+        return results
+
+    def _readmit(self, now: float) -> None:
+        """
+        Health check the nodes whose down_interval has passed, and
+        re-admit those that pass.
+        """
+        with self._lock:
+            due = [host for host, until in self._down_until.items() if until <= now]
+            # Push the deadline out, so that only one caller checks each node.
+            for host in due:
+                self._down_until[host] = now + self._down_interval
+        for host in due:
+            latency = self.check(host)
+            if latency is None:
+                continue
+            with self._lock:
+                self._down_until.pop(host, None)
+                self._latency[host] = latency
+            msg = f"{self.class_name}._readmit: "
+            msg += f"{host} passed its health check. Re-admitted."
+            self.log.info(msg)
+
+    def select(self, verb: str) -> str:
+        """
+        # Summary
+
+        Return the node to which to send a request with verb.
+
+        ## Raises
+
+        - ValueError if hosts is not set.
+        """
+        method_name = "select"
+        if not self._hosts:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "hosts must be set before calling select()."
+            raise ValueError(msg)
+        now = time.monotonic()
+        if self._down_until and min(self._down_until.values()) <= now:
+            self._readmit(now)
+        with self._lock:
+            healthy = [host for host in self._ranked if host not in self._down_until]
+            if not healthy:
+                host = min(self._down_until, key=self._down_until.get)
+            elif verb not in READ_VERBS and self._sticky_writes:
+                if self._primary not in healthy:
+                    self._primary = healthy[0]
+                host = self._primary
+            elif self._strategy == "least_latency":
+                host = min(healthy, key=lambda node: self._latency.get(node, 0.0))
+            else:
+                host = healthy[self._next % len(healthy)]
+                self._next += 1
+            self._requests[host] = self._requests.get(host, 0) + 1
+            return host
+
+    def record(self, host: str, latency: float) -> None:
+        """
+        Update the moving-average latency of host with the latency, in
+        seconds, of a request to it.
+        """
+        with self._lock:
+            previous = self._latency.get(host)
+            if previous is None:
+                self._latency[host] = latency
+            else:
+                self._latency[host] = LATENCY_ALPHA * latency + (1 - LATENCY_ALPHA) * previous
+
+    def mark_down(self, host: str) -> None:
+        """
+        # Summary
+
+        Skip host for down_interval seconds, after a request to it failed
+        to connect.
+        """
+        method_name = "mark_down"
+        with self._lock:
+            if host in self._down_until:
+                return
+            self._down_until[host] = time.monotonic() + self._down_interval
+            self._failovers += 1
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"{host} is unreachable. Skipping it for {self._down_interval:g} seconds."
+        self.log.warning(msg)
+
+    def _verify_seconds(self, name: str, value) -> float:
+        """
+        Return value as a float if it is a number >= 0.
+
+        ## Raises
+
+        - TypeError if value is not a number
+        - ValueError if value is negative
+        """
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            msg = f"{self.class_name}.{name}: "
+            msg += f"{name} must be a number. Got {type(value).__name__}."
+            raise TypeError(msg)
+        if value < 0:
+            msg = f"{self.class_name}.{name}: "
+            msg += f"{name} must be >= 0. Got {value}."
+            raise ValueError(msg)
+        return float(value)
+
+    @property
+    def down_interval(self) -> float:
+        """
+        Seconds an unreachable node is skipped before its next health check.
+        """
+        return self._down_interval
+
+    @down_interval.setter
+    def down_interval(self, value: float) -> None:
+        self._down_interval = self._verify_seconds("down_interval", value)
+
+    @property
+    def healthy(self) -> list[str]:
+        """
+        The nodes not marked down, in rank order.
+        """
+        with self._lock:
+            return [host for host in self._ranked if host not in self._down_until]
+
+    @property
+    def hosts(self) -> list[str]:
+        """
+        The addresses of the cluster nodes, e.g. ["10.1.1.1", "10.1.1.2"].
+        An address may include a port, e.g. "10.1.1.1:8443".
+        """
+        return list(self._hosts)
+
+    @hosts.setter
+    def hosts(self, value: list[str]) -> None:
+        method_name = "hosts"
+        if not isinstance(value, (list, tuple)) or not all(isinstance(host, str) and host for host in value):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "hosts must be a list of non-empty str. "
+            msg += f"Got {value}."
+            raise TypeError(msg)
+        if not value:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "hosts must contain at least one address."
+            raise ValueError(msg)
+        hosts = list(dict.fromkeys(value))
+        with self._lock:
+            self._hosts = hosts
+            self._ranked = list(hosts)
+            self._primary = hosts[0]
+            self._down_until = {}
+            self._latency = {}
+            self._requests = {}
+            self._next = 0
+
+    @property
+    def latency(self) -> dict:
+        """
+        Moving-average latency, in seconds, per node, from probe(),
+        health checks and requests.
+        """
+        with self._lock:
+            return dict(self._latency)
+
+    @property
+    def port(self) -> int:
+        """
+        The port to which health checks connect, for hosts without a port.
+        """
+        return self._port
+
+    @port.setter
+    def port(self, value: int) -> None:
+        if isinstance(value, bool) or not isinstance(value, int):
+            msg = f"{self.class_name}.port: "
+            msg += f"port must be an int. Got {type(value).__name__}."
+            raise TypeError(msg)
+        self._port = value
+
+    @property
+    def primary(self) -> str | None:
+        """
+        The node that receives writes while sticky_writes is True.
+        """
+        return self._primary
+
+    @property
+    def probe_timeout(self) -> float:
+        """
+        Seconds to wait for a health check connection.
+        """
+        return self._probe_timeout
+
+    @probe_timeout.setter
+    def probe_timeout(self, value: float) -> None:
+        self._probe_timeout = self._verify_seconds("probe_timeout", value)
+
+    @property
+    def stats(self) -> dict:
+        """
+        Requests sent to each node ("requests"), and the number of times a
+        node was marked down ("failovers").
+        """
+        with self._lock:
+            return {"requests": dict(self._requests), "failovers": self._failovers}
+
+    @property
+    def sticky_writes(self) -> bool:
+        """
+        If True, writes are sent to primary while it is healthy.
+        """
+        return self._sticky_writes
+
+    @sticky_writes.setter
+    def sticky_writes(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            msg = f"{self.class_name}.sticky_writes: "
+            msg += f"sticky_writes must be a bool. Got {type(value).__name__}."
+            raise TypeError(msg)
+        self._sticky_writes = value
+
+    @property
+    def strategy(self) -> str:
+        """
+        How reads are distributed: "round_robin" or "least_latency".
+        """
+        return self._strategy
+
+    @strategy.setter
+    def strategy(self, value: str) -> None:
+        if value not in STRATEGIES:
+            msg = f"{self.class_name}.strategy: "
+            msg += f"strategy must be one of {', '.join(STRATEGIES)}. Got {value}."
+            raise ValueError(msg)
+        self._strategy = value
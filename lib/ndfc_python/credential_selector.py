@@ -18,6 +18,11 @@ prioritizes them as follows:
 3.  Ansible Vault (assuming the --ansible-vault argument is present and points
     to a valid vault file)
 
+If the environment variable NDFC_PYTHON_CREDENTIALS_AGENT points to a
+running credentials agent (see credentials/credentials_agent.py) that
+serves the same vault, the vault credentials are taken from the agent
+instead, without asking for the vault password or importing ansible.
+
 Given the following, return the value of a credential from the source of
 greatest priority.
 
@@ -55,13 +60,10 @@ the value from the script command line).
 """
 
 import argparse
-import inspect
 import logging
 from os import environ
 from typing import Any
 
-from ndfc_python.credentials.credentials_ansible_vault import CredentialsAnsibleVault
-
 
 class CredentialSelector:
     """
@@ -269,6 +271,32 @@ class CredentialSelector:
             return None
         return self.get_value(self._ansible_vault_instance)
 
+    @property
+    def vault_secrets(self):
+        """
+        # Summary
+
+        The Ansible Vault secrets used to read credentials, or None if
+        credentials were not read from an Ansible Vault.
+        """
+        if self._ansible_vault_instance is None:
+            return None
+        return self._ansible_vault_instance.vault_secrets
+
+    @property
+    def token_cache_password(self):
+        """
+        # Summary
+
+        The password with which TokenCache encrypts cached login tokens,
+        derived from the Ansible Vault password, whether credentials were
+        read from the vault or from a credentials agent.  None if
+        credentials were not read from an Ansible Vault.
+        """
+        if self._ansible_vault_instance is None:
+            return None
+        return self._ansible_vault_instance.token_cache_password
+
     def instantiate_ansible_vault(self) -> None:
         """
         # Summary
@@ -279,6 +307,9 @@ class CredentialSelector:
         -   self.script_args contains `ansible_vault`
         -   self.ansible_vault_instance is not instantiated
 
+        Use a CredentialsAgentClient() instead if a credentials agent is
+        running for the same vault.
+
         ## Raises
 
         ### ValueError
@@ -286,7 +317,7 @@ class CredentialSelector:
         -   If `script_args` is not set
         -   If an error occurred when reading the Ansible Vault
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "instantiate_ansible_vault"
         ansible_vault = None
         try:
             ansible_vault = self.script_args.ansible_vault
@@ -299,6 +330,25 @@ class CredentialSelector:
         if self._ansible_vault_instance is not None:
             return
 
+        if environ.get("NDFC_PYTHON_CREDENTIALS_AGENT"):
+            from ndfc_python.credentials.credentials_agent import CredentialsAgentClient  # pylint: disable=import-outside-toplevel
+
+            agent = CredentialsAgentClient()
+            agent.ansible_vault = ansible_vault
+            try:
+                agent.commit()
+            except ValueError as error:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += "Reading the Ansible Vault instead. "
+                msg += f"Error detail: {error}"
+                self.log.debug(msg)
+            else:
+                self._ansible_vault_instance = agent
+                return
+
+        # Imported here so that ansible is imported only if the vault is read.
+        from ndfc_python.credentials.credentials_ansible_vault import CredentialsAnsibleVault  # pylint: disable=import-outside-toplevel
+
         try:
             self._ansible_vault_instance = CredentialsAnsibleVault()
             self._ansible_vault_instance.ansible_vault = ansible_vault
@@ -323,7 +373,7 @@ class CredentialSelector:
         - If script_args is not set
         - If unable to find the value in any credential source
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         if self.credential_name is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Call {self.class_name}.credential_name before calling "
@@ -407,7 +457,7 @@ class CredentialSelector:
 
     @script_args.setter
     def script_args(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "script_args"
         if not isinstance(value, argparse.Namespace):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{method_name} must be an instance of argparse.Namespace"
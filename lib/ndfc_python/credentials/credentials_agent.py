@@ -0,0 +1,484 @@
+#!/usr/bin/env python
+"""
+# Description
+
+An ssh-agent style credentials agent.  The agent reads an Ansible Vault
+once (asking for the vault password once), then hands the decrypted
+credentials to scripts over a Unix socket until its TTL expires.
+
+While the agent runs, scripts invoked with --ansible-vault get their
+credentials from the agent, so they skip the vault password prompt, the
+ansible import and the vault key derivation.
+
+- CredentialsAgent: the agent (server)
+- CredentialsAgentClient: used by CredentialSelector.  Exposes the same
+  properties as CredentialsAnsibleVault.
+
+## Security
+
+The socket is created with mode 0600 in a directory with mode 0700, and
+(on Linux) the agent also refuses connections from other users.  The
+agent answers only for the vault it was started with.  It exits, and
+removes the socket, when its TTL expires.
+
+The agent never shares the vault password.  With the credentials, it
+sends the password with which TokenCache encrypts cached login tokens,
+which is derived from the vault password (token_cache_password()), so
+that tokens cached by scripts that use the agent stay encrypted, and are
+shared with scripts that read the vault themselves.
+
+## Usage
+
+```bash
+eval $(python -m ndfc_python.credentials.credentials_agent --ansible-vault ~/.ansible/vault --ttl 3600)
+./fabric_info.py --ansible-vault ~/.ansible/vault --config config/fabric_info.yaml
+```
+
+The agent prints (as ssh-agent does) a command that sets
+NDFC_PYTHON_CREDENTIALS_AGENT to the socket path, then forks into the
+background.  Use --foreground to keep it in the foreground.
+"""
+
+# We are using isort for import sorting.
+# pylint: disable=wrong-import-order
+
+import argparse
+import json
+import logging
+import os
+import signal
+import socket
+import struct
+import sys
+import tempfile
+import threading
+import time
+from os import environ
+
+from ndfc_python.token_cache import token_cache_password
+
+CREDENTIAL_NAMES = ("nd_domain", "nd_ip4", "nd_password", "nd_username", "nxos_password", "nxos_username")
+MAX_MESSAGE_SIZE = 65536
+
+
+def _receive_message(connection: socket.socket) -> dict:
+    """
+    Return the newline-terminated JSON object read from connection.
+
+    ## Raises
+
+    - ValueError if the message is too large, truncated or not a JSON object
+    """
+    data = b""
+    while not data.endswith(b"\n"):
+        chunk = connection.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+        if len(data) > MAX_MESSAGE_SIZE:
+            msg = "Message too large."
+            raise ValueError(msg)
+    message = json.loads(data)
+    if not isinstance(message, dict):
+        msg = f"Expected a JSON object. Got {type(message).__name__}."
+        raise ValueError(msg)
+    return message
+
+
+def _send_message(connection: socket.socket, message: dict) -> None:
+    """
+    Send message to connection as a newline-terminated JSON object.
+    """
+    connection.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+class CredentialsAgent:
+    """
+    # Summary
+
+    Serve the credentials in ansible_vault over a Unix socket for ttl seconds.
+
+    ## Raises
+
+    - ValueError in commit() if ansible_vault is not set, or the vault
+      cannot be read.
+    - TypeError, ValueError from the ttl setter if value is invalid.
+
+    ## Properties
+
+    - ansible_vault (str): getter/setter: path to the Ansible Vault
+    - socket_path (str): getter/setter: path of the Unix socket.  Default:
+      agent.sock in a new private temporary directory
+    - ttl (float): getter/setter: seconds to serve credentials.  Default 3600
+
+    ## Usage
+
+    ```python
+    agent = CredentialsAgent()
+    agent.ansible_vault = "/home/me/.ansible/vault"
+    agent.ttl = 600
+    agent.commit()  # asks for the vault password
+    agent.serve()  # returns when ttl expires
+    ```
+    """
+
+    def __init__(self):
+        self.class_name = self.__class__.__name__
+        self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
+
+        self._ansible_vault = None
+        self._credentials = None
+        self._deadline = None
+        self._directory = None
+        self._server = None
+        self._socket_path = None
+        self._token_cache_password = None
+        self._ttl = 3600.0
+
+    def commit(self) -> None:
+        """
+        # Summary
+
+        Read ansible_vault (asking for the vault password) and listen on
+        socket_path.
+        """
+        method_name = "commit"
+        if self.ansible_vault is None:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "set instance.ansible_vault before calling commit."
+            raise ValueError(msg)
+
+        # Imported here so that clients of the agent do not import ansible.
+        from ndfc_python.credentials.credentials_ansible_vault import CredentialsAnsibleVault  # pylint: disable=import-outside-toplevel
+
+        vault = CredentialsAnsibleVault()
+        vault.ansible_vault = self.ansible_vault
+        vault.commit()
+        self._credentials = {name: getattr(vault, name) for name in CREDENTIAL_NAMES}
+        self._token_cache_password = token_cache_password(vault.vault_secrets)
+
+        if self._socket_path is None:
+            self._directory = tempfile.mkdtemp(prefix="ndfc-python-")
+            self._socket_path = os.path.join(self._directory, "agent.sock")
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        umask = os.umask(0o177)
+        try:
+            self._server.bind(self._socket_path)
+        finally:
+            os.umask(umask)
+        os.chmod(self._socket_path, 0o600)
+        self._server.listen()
+        self._deadline = time.monotonic() + self.ttl
+
+    def serve(self) -> None:
+        """
+        # Summary
+
+        Answer requests until ttl expires, then remove the socket.  Each
+        connection is answered in its own short-lived thread, so that a
+        slow or silent client does not hold up the others.
+        """
+        try:
+            while True:
+                remaining = self._deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._server.settimeout(remaining)
+                try:
+                    connection, _ = self._server.accept()
+                except socket.timeout:
+                    break
+                thread = threading.Thread(target=self._handle, args=(connection,), name="credentials_agent", daemon=True)
+                thread.start()
+        finally:
+            self.close()
+
+    def _handle(self, connection: socket.socket) -> None:
+        """
+        Answer one connection, then close it.
+        """
+        method_name = "_handle"
+        with connection:
+            connection.settimeout(5)
+            try:
+                self._answer(connection)
+            except (OSError, ValueError) as error:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Ignoring bad request. Error detail: {error}"
+                self.log.debug(msg)
+
+    def _answer(self, connection: socket.socket) -> None:
+        """
+        Send the credentials if the peer is this user and asks for our vault.
+        """
+        if hasattr(socket, "SO_PEERCRED"):
+            credentials = connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+            _, uid, _ = struct.unpack("3i", credentials)
+            if uid != os.getuid():
+                return
+        request = _receive_message(connection)
+        # close() may run while this thread is answering.
+        credentials = self._credentials
+        token_cache_password = self._token_cache_password
+        if credentials is None:
+            return
+        requested_vault = request.get("ansible_vault")
+        if not isinstance(requested_vault, str) or os.path.realpath(requested_vault) != os.path.realpath(self.ansible_vault):
+            _send_message(connection, {"error": f"This agent serves {self.ansible_vault} only."})
+            return
+        response = {"credentials": credentials, "expires_in": self._deadline - time.monotonic()}
+        if token_cache_password is not None:
+            response["token_cache_password"] = token_cache_password.decode("ascii")
+        _send_message(connection, response)
+
+    def close(self) -> None:
+        """
+        # Summary
+
+        Stop listening, and remove the socket (and its directory, if the
+        agent created it).
+        """
+        if self._server is None:
+            return
+        self._server.close()
+        self._server = None
+        self._credentials = None
+        self._token_cache_password = None
+        try:
+            os.unlink(self._socket_path)
+            if self._directory is not None:
+                os.rmdir(self._directory)
+        except OSError:
+            pass
+
+    @property
+    def ansible_vault(self):
+        """
+        Path to the Ansible Vault file.
+        """
+        return self._ansible_vault
+
+    @ansible_vault.setter
+    def ansible_vault(self, value):
+        self._ansible_vault = value
+
+    @property
+    def socket_path(self):
+        """
+        Path of the Unix socket.  Set before commit(), or read after commit().
+        """
+        return self._socket_path
+
+    @socket_path.setter
+    def socket_path(self, value):
+        self._socket_path = value
+
+    @property
+    def ttl(self) -> float:
+        """
+        Seconds, from commit(), for which the agent serves credentials.
+        """
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            msg = f"{self.class_name}.ttl: "
+            msg += f"ttl must be a number. Got {type(value).__name__}."
+            raise TypeError(msg)
+        if value <= 0:
+            msg = f"{self.class_name}.ttl: "
+            msg += f"ttl must be > 0. Got {value}."
+            raise ValueError(msg)
+        self._ttl = float(value)
+
+
+class CredentialsAgentClient:
+    """
+    # Summary
+
+    Get the credentials in ansible_vault from a running CredentialsAgent
+    and expose them via properties of the same name, as
+    CredentialsAnsibleVault does.
+
+    ## Raises
+
+    - ValueError in commit() if socket_path or ansible_vault is not set,
+      no agent is listening, or the agent does not serve ansible_vault.
+
+    ## Properties
+
+    - ansible_vault (str): getter/setter: path to the Ansible Vault
+    - socket_path (str): getter/setter: path of the agent's socket.
+      Default: environment variable NDFC_PYTHON_CREDENTIALS_AGENT
+    - token_cache_password (bytes): getter: the password with which
+      TokenCache encrypts cached login tokens, from the agent
+    - vault_secrets: getter: always None.  The agent does not share the
+      vault password.
+    """
+
+    def __init__(self):
+        self.class_name = self.__class__.__name__
+        self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
+
+        self._ansible_vault = None
+        self._socket_path = environ.get("NDFC_PYTHON_CREDENTIALS_AGENT")
+        self._token_cache_password = None
+        self.credentials = {}
+
+    def commit(self) -> None:
+        """
+        # Summary
+
+        Ask the agent at socket_path for the credentials in ansible_vault.
+        """
+        method_name = "commit"
+        if self.socket_path is None or self.ansible_vault is None:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "set instance.socket_path and instance.ansible_vault before calling commit."
+            raise ValueError(msg)
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+                connection.settimeout(5)
+                connection.connect(self.socket_path)
+                _send_message(connection, {"ansible_vault": os.path.realpath(self.ansible_vault)})
+                response = _receive_message(connection)
+        except (OSError, ValueError) as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Unable to get credentials from the agent at {self.socket_path}. "
+            msg += f"Error detail: {error}"
+            raise ValueError(msg) from error
+        credentials = response.get("credentials")
+        if not isinstance(credentials, dict) or set(CREDENTIAL_NAMES) - set(credentials):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"The agent at {self.socket_path} did not return credentials. "
+            msg += f"Error detail: {response.get('error')}"
+            raise ValueError(msg)
+        self.credentials = credentials
+        password = response.get("token_cache_password")
+        self._token_cache_password = password.encode("ascii") if isinstance(password, str) else None
+
+    @property
+    def ansible_vault(self):
+        """
+        Path to the Ansible Vault file.
+        """
+        return self._ansible_vault
+
+    @ansible_vault.setter
+    def ansible_vault(self, value):
+        self._ansible_vault = value
+
+    @property
+    def socket_path(self):
+        """
+        Path of the agent's Unix socket.
+        """
+        return self._socket_path
+
+    @socket_path.setter
+    def socket_path(self, value):
+        self._socket_path = value
+
+    @property
+    def token_cache_password(self):
+        """
+        The password with which TokenCache encrypts cached login tokens,
+        derived by the agent from the vault password, or None before
+        commit().
+        """
+        return self._token_cache_password
+
+    @property
+    def vault_secrets(self):
+        """
+        Always None.  The agent does not share the vault password.
+        """
+        return None
+
+    @property
+    def nd_domain(self):
+        """
+        return current value of nd_domain
+        """
+        return self.credentials["nd_domain"]
+
+    @property
+    def nd_ip4(self):
+        """
+        return current value of nd_ip4
+        """
+        return self.credentials["nd_ip4"]
+
+    @property
+    def nd_password(self):
+        """
+        return current value of nd_password
+        """
+        return self.credentials["nd_password"]
+
+    @property
+    def nd_username(self):
+        """
+        return current value of nd_username
+        """
+        return self.credentials["nd_username"]
+
+    @property
+    def nxos_password(self):
+        """
+        return current value of nxos_password
+        """
+        return self.credentials["nxos_password"]
+
+    @property
+    def nxos_username(self):
+        """
+        return current value of nxos_username
+        """
+        return self.credentials["nxos_username"]
+
+
+def main() -> None:
+    """
+    Start a CredentialsAgent, print the command that points scripts at it,
+    and serve in the background (or the foreground with --foreground).
+    """
+    parser = argparse.ArgumentParser(description="DESCRIPTION: Serve Ansible Vault credentials to ndfc-python scripts for a limited time.")
+    parser.add_argument("-v", "--ansible-vault", dest="ansible_vault", required=True, help="Absolute path to an Ansible Vault. e.g. /home/myself/.ansible/vault.")
+    parser.add_argument("--ttl", type=float, default=3600.0, help="Seconds to serve credentials. Default: 3600")
+    parser.add_argument("--socket", dest="socket_path", default=None, help="Path of the Unix socket. Default: a new private temporary directory.")
+    parser.add_argument("--foreground", action="store_true", help="Do not fork into the background.")
+    args = parser.parse_args()
+
+    agent = CredentialsAgent()
+    agent.ansible_vault = args.ansible_vault
+    agent.ttl = args.ttl
+    agent.socket_path = args.socket_path
+    try:
+        agent.commit()
+    except (OSError, ValueError) as error:
+        print(f"Exiting. Error detail: {error}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"NDFC_PYTHON_CREDENTIALS_AGENT={agent.socket_path}; export NDFC_PYTHON_CREDENTIALS_AGENT;")
+    print(f"echo Credentials agent serving {args.ansible_vault} for {args.ttl:.0f} seconds;")
+    sys.stdout.flush()
+    if not args.foreground and os.fork() != 0:
+        os._exit(0)  # pylint: disable=protected-access
+    if not args.foreground:
+        os.setsid()
+        with open(os.devnull, "r+b") as devnull:
+            for stream in (sys.stdin, sys.stdout, sys.stderr):
+                os.dup2(devnull.fileno(), stream.fileno())
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        agent.serve()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        agent.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -28,13 +28,13 @@ exist in the vault.
 pip install ansible
 
 """
-import inspect
 import logging
 
 from ansible.cli import CLI
 from ansible.errors import AnsibleFileNotFound, AnsibleParserError
 from ansible.parsing.dataloader import DataLoader
 from ansible.parsing.vault import AnsibleVaultError, AnsibleVaultPasswordError
+from ndfc_python.token_cache import token_cache_password
 
 
 class CredentialsAnsibleVault:
@@ -48,6 +48,7 @@ class CredentialsAnsibleVault:
         self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
 
         self._ansible_vault = None
+        self._vault_secrets = None
         self.credentials = {}
 
         self.mandatory_vault_keys = set()
@@ -63,7 +64,7 @@ class CredentialsAnsibleVault:
         Load user credentials from ansible vault.  This asked for the ansible
         vault password.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
 
         if self.ansible_vault is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -75,6 +76,7 @@ class CredentialsAnsibleVault:
             secrets = CLI.setup_vault_secrets(loader=loader, vault_ids=None)
             loader.set_vault_secrets(secrets)
             data = loader.load_from_file(self.ansible_vault)
+            self._vault_secrets = secrets
         except AnsibleFileNotFound as error:
             msg = f"{self.class_name}.{method_name}: "
             msg += "Unable to load credentials in "
@@ -126,6 +128,22 @@ class CredentialsAnsibleVault:
     def ansible_vault(self, value):
         self._ansible_vault = value
 
+    @property
+    def vault_secrets(self):
+        """
+        The vault secrets used to decrypt the vault, or None before commit().
+        Used e.g. by TokenCache to encrypt cached login tokens.
+        """
+        return self._vault_secrets
+
+    @property
+    def token_cache_password(self):
+        """
+        The password with which TokenCache encrypts cached login tokens
+        (token_cache_password() of vault_secrets), or None before commit().
+        """
+        return token_cache_password(self._vault_secrets)
+
     @property
     def nd_domain(self):
         """
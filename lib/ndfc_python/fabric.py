@@ -1,8 +1,9 @@
 import copy
-import inspect
 import json
 import logging
 
+from ndfc_python.common.fabric.fabrics_info_cache import FabricsInfoCache
+from ndfc_python.common.ttl_cache import controller_key
 from plugins.module_utils.common.controller_features import ControllerFeatures
 from plugins.module_utils.common.exceptions import ControllerResponseError
 from plugins.module_utils.common.properties import Properties
@@ -37,7 +38,7 @@ class Common(FabricCommon):
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         super().__init__()
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = "__init__"  # pylint: disable=unused-variable
 
         self.controller_features = ControllerFeatures()
         self.features = {}
@@ -75,7 +76,7 @@ class Common(FabricCommon):
         ### Raises
         -   ValueError if check_mode is not provided.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "populate_check_mode"
         self.check_mode = self.params.get("check_mode", None)
         if self.check_mode is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -92,7 +93,7 @@ class Common(FabricCommon):
                 -   ``state`` is "merged" or "replaced" and ``config`` is None.
                 -   ``config`` is not a list.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "populate_config"
         states_requiring_config = {"merged", "replaced"}
         self.config = self.params.get("config", None)
         if self.state in states_requiring_config:
@@ -116,7 +117,7 @@ class Common(FabricCommon):
                 -   ``state`` is not provided.
                 -   ``state`` is not a valid state.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "populate_state"
 
         valid_states = ["deleted", "merged", "query", "replaced"]
 
@@ -158,7 +159,7 @@ class Common(FabricCommon):
         ```
 
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = "get_have"  # pylint: disable=unused-variable
         try:
             self.have = FabricDetailsByName()
             # pylint: disable=no-member
@@ -210,7 +211,7 @@ class Common(FabricCommon):
         -   ``ValueError`` if the controller returns an error when attempting to
             retrieve the controller features.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "get_controller_features"
         self.features = {}
         # pylint: disable=no-member
         self.controller_features.rest_send = self.rest_send
@@ -229,6 +230,19 @@ class Common(FabricCommon):
             self.controller_features.filter = self.fabric_types.feature_name
             self.features[fabric_type] = self.controller_features.started
 
+    def invalidate_fabrics_info_cache(self) -> None:
+        """
+        ### Summary
+        Discard the process-wide fabric list cached by ``FabricsInfo`` for
+        this controller, since fabrics have been created, updated or deleted.
+
+        ### Raises
+        None
+        """
+        # pylint: disable=no-member
+        FabricsInfoCache().invalidate(controller_key(self.rest_send))
+        # pylint: enable=no-member
+
 
 class Deleted(Common):
     """
@@ -265,7 +279,7 @@ class Deleted(Common):
             delete the fabrics.
         """
         self.get_want()
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
 
         msg = f"ENTERED: {self.class_name}.{method_name}"
         self.log.debug(msg)
@@ -296,6 +310,8 @@ class Deleted(Common):
             self.delete.commit()
         except ValueError as error:
             raise ValueError(f"{error}") from error
+        finally:
+            self.invalidate_fabrics_info_cache()
 
 
 class Merged(Common):
@@ -322,7 +338,7 @@ class Merged(Common):
     def __init__(self, params):
         self.class_name = self.__class__.__name__
         super().__init__(params)
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = "__init__"  # pylint: disable=unused-variable
 
         self.action = "fabric_create"
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
@@ -360,7 +376,7 @@ class Merged(Common):
                 the fabric details.
         """
         # pylint: disable=too-many-branches
-        method_name = inspect.stack()[0][3]
+        method_name = "get_need"
         self.payloads = {}
         for want in self.want:
 
@@ -472,7 +488,7 @@ class Merged(Common):
                 the fabric.
             -   The controller returns an error when attempting to update
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = "commit"  # pylint: disable=unused-variable
         msg = f"{self.class_name}.{method_name}: entered"
         self.log.debug(msg)
 
@@ -501,7 +517,7 @@ class Merged(Common):
             -   The controller returns an error when attempting to create
                 the fabric.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = "send_need_create"  # pylint: disable=unused-variable
         msg = f"{self.class_name}.{method_name}: entered. "
         msg += f"self.need_create: {json_pretty(self.need_create)}"
         self.log.debug(msg)
@@ -525,6 +541,8 @@ class Merged(Common):
             self.fabric_create.commit()
         except ValueError as error:
             raise ValueError(f"{error}") from error
+        finally:
+            self.invalidate_fabrics_info_cache()
 
     def send_need_update(self) -> None:
         """
@@ -538,7 +556,7 @@ class Merged(Common):
             -   The controller returns an error when attempting to update
                 the fabric.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = "send_need_update"  # pylint: disable=unused-variable
         msg = f"{self.class_name}.{method_name}: entered. "
         msg += "self.need_update: "
         msg += f"{json_pretty(self.need_update)}"
@@ -564,6 +582,8 @@ class Merged(Common):
             self.fabric_update.commit()
         except ValueError as error:
             raise ValueError(f"{error}") from error
+        finally:
+            self.invalidate_fabrics_info_cache()
 
 
 class Query(Common):
@@ -657,7 +677,7 @@ class Replaced(Common):
     def __init__(self, params):
         self.class_name = self.__class__.__name__
         super().__init__(params)
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = "__init__"  # pylint: disable=unused-variable
 
         self.action = "fabric_replaced"
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
@@ -687,7 +707,7 @@ class Replaced(Common):
             -   The controller features required for the fabric type are not
                 running on the controller.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "get_need"
         self.payloads = {}
         for want in self.want:
 
@@ -723,7 +743,7 @@ class Replaced(Common):
             -   The controller features required for the fabric type are not
                 running on the controller.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         msg = f"{self.class_name}.{method_name}: entered"
         self.log.debug(msg)
 
@@ -754,7 +774,7 @@ class Replaced(Common):
             -   The controller returns an error when attempting to
                  update the fabric.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = "send_need_replaced"  # pylint: disable=unused-variable
         msg = f"{self.class_name}.{method_name}: entered. "
         msg += "self.need_replaced: "
         msg += f"{json_pretty(self.need_replaced)}"
@@ -793,3 +813,5 @@ class Replaced(Common):
             self.fabric_replaced.commit()
         except ValueError as error:
             raise ValueError(f"{error}") from error
+        finally:
+            self.invalidate_fabrics_info_cache()
@@ -1,5 +1,4 @@
 import copy
-import inspect
 import json
 import logging
 from typing import Any
@@ -24,7 +23,7 @@ class Common:
 
     def __init__(self, params) -> None:
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = "__init__"
 
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self.params: dict[Any, Any] = params
@@ -73,7 +72,7 @@ class Common:
         `ValueError` if:
             - `Config2Payload` raises `ValueError`
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "get_want"
 
         for config in self.config:
             payload = Config2Payload()
@@ -95,7 +94,7 @@ class Common:
 
         self.have consists of the current image policies on the controller
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "get_have"
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
 
@@ -114,7 +113,7 @@ class Deleted(Common):
 
     def __init__(self, params):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = "__init__"
 
         try:
             super().__init__(params)
@@ -142,7 +141,7 @@ class Deleted(Common):
         If config is present, delete all policies in self.want that exist on the controller
         If config is not present, delete all policies on the controller
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         msg = f"ENTERED {self.class_name}.{method_name}: "
         msg += f"state: {self.state}, "
         msg += f"check_mode: {self.check_mode}"
@@ -176,7 +175,7 @@ class Deleted(Common):
             which ``ImagePolicyDelete()`` interprets as "delete all image
             policies on the controller".
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "get_policies_to_delete"
         msg = f"{self.class_name}.{method_name}: "
         msg += f"self.config: {self.config}"
         self.log.debug(msg)
@@ -202,7 +201,7 @@ class Overridden(Common):
 
     def __init__(self, params):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = "__init__"
 
         try:
             super().__init__(params)
@@ -233,7 +232,7 @@ class Overridden(Common):
         -   Delete all policies on the controller that are not in self.want
         -   Instantiate`` Merged()`` and call ``Merged().commit()``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         msg = f"ENTERED {self.class_name}.{method_name}: "
         msg += f"state: {self.state}, "
         msg += f"check_mode: {self.check_mode}"
@@ -269,7 +268,7 @@ class Overridden(Common):
         ### Summary
         Delete all policies on the controller that are not in self.want
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_delete_policies_not_in_want"
         want_policy_names = set()
         for want in self.want:
             want_policy_names.add(want["policyName"])
@@ -318,7 +317,7 @@ class Merged(Common):
 
     def __init__(self, params):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = "__init__"
 
         try:
             super().__init__(params)
@@ -370,7 +369,7 @@ class Merged(Common):
                     are identical, do not append the policy to self.need_update
                     (i.e. do nothing).
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "get_need"
         msg = f"ENTERED {self.class_name}.{method_name}: "
         msg += f"state: {self.state}, "
         msg += f"check_mode: {self.check_mode}"
@@ -397,7 +396,7 @@ class Merged(Common):
         """
         Commit the merged state requests
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         msg = f"ENTERED {self.class_name}.{method_name}: "
         msg += f"state: {self.state}, "
         msg += f"check_mode: {self.check_mode}"
@@ -445,7 +444,7 @@ class Merged(Common):
         ### Summary
         Merge the parameters in want with the parameters in have.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_merge_policies"
         (have, want) = self._prepare_for_merge(have, want)
 
         # Merge the parameters in want with the parameters in have.
@@ -505,7 +504,7 @@ class Query(Common):
 
     def __init__(self, params):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = "__init__"
 
         try:
             super().__init__(params)
@@ -533,7 +532,7 @@ class Query(Common):
         """
         query the fabrics in self.want that exist on the controller
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         msg = f"ENTERED {self.class_name}.{method_name}: "
         msg += f"state: {self.state}, "
         msg += f"check_mode: {self.check_mode}"
@@ -578,7 +577,7 @@ class Replaced(Common):
 
     def __init__(self, params):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = "__init__"
 
         try:
             super().__init__(params)
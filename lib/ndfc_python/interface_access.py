@@ -38,7 +38,6 @@ instance.commit()
 
 # We are using isort/black to link imports
 # pylint: disable=wrong-import-order
-import inspect
 import logging
 
 from ndfc_python.common.fabric.fabric_inventory import FabricInventory
@@ -305,7 +304,7 @@ class InterfaceAccessCreate:
 
     def _final_verification(self):
         """final verification of user configuration"""
-        method_name = inspect.stack()[0][3]
+        method_name = "_final_verification"
         for param in self._payload_set_mandatory:
             if self.payload[param] in (None, ""):
                 msg = f"{self.class_name}.{method_name}: Missing mandatory payload property: {param}"
@@ -326,7 +325,7 @@ class InterfaceAccessCreate:
 
     def commit(self):
         """Commit the configuration changes to the controller."""
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         # pylint: disable=no-member
         self.fabric_inventory.fabric_name = self.fabric_name
         self.fabric_inventory.rest_send = self.rest_send  # type: ignore[attr-defined]
@@ -0,0 +1,195 @@
+"""
+# Name
+
+json_codec.py
+
+# Description
+
+Encode request payloads and decode controller responses with the fastest
+JSON library installed.
+
+Backends, in order of preference:
+
+- orjson (pip install orjson)
+- msgspec (pip install msgspec)
+- json (standard library, always available)
+
+Responses are decoded straight from the body bytes, so the body is never
+first decoded to str.  The backend can be forced with the environment
+variable NDFC_PYTHON_JSON_BACKEND, or per JsonCodec instance.
+
+Backends are only imported when selected, so that importing this module
+(and Sender) does not import every installed JSON library.
+"""
+
+import importlib
+import json
+import logging
+from importlib.util import find_spec
+from os import environ
+
+HAS_ORJSON = find_spec("orjson") is not None
+HAS_MSGSPEC = find_spec("msgspec") is not None
+
+
+def available_backends() -> list[str]:
+    """
+    # Summary
+
+    Return the names of the installed JSON backends, fastest first.
+    """
+    backends = []
+    if HAS_ORJSON:
+        backends.append("orjson")
+    if HAS_MSGSPEC:
+        backends.append("msgspec")
+    backends.append("json")
+    return backends
+
+
+class JsonCodec:
+    """
+    # Summary
+
+    Encode and decode JSON with a pluggable backend (orjson, msgspec or json).
+
+    orjson and msgspec reject a few inputs that the standard library accepts
+    (e.g. integers wider than 64 bits, NaN).  If the selected backend
+    rejects an input, JsonCodec retries with the standard library.
+
+    ## Usage
+
+    ```python
+    codec = JsonCodec()
+    codec.backend = "json"  # optional.  Default: fastest installed backend
+    body = codec.dumps({"fabric": "SITE1"})  # bytes
+    data = codec.loads(response.content)  # bytes or str
+    ```
+
+    ## Raises
+
+    - ValueError from loads() if the input is not valid JSON
+    - TypeError from dumps() if the object cannot be serialized
+    - ValueError from backend setter if the backend is unknown or not installed
+
+    ## Properties
+
+    - backend (str): getter/setter: orjson, msgspec or json.  Default: the
+      value of NDFC_PYTHON_JSON_BACKEND, else the fastest installed backend.
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
+
+        self._backend = "json"
+        self._dumps = self._dumps_json
+        self._loads = json.loads
+        self._msgspec = None
+        self.backend = environ.get("NDFC_PYTHON_JSON_BACKEND", available_backends()[0])
+
+    @staticmethod
+    def _dumps_json(value) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+    def dumps(self, value) -> bytes:
+        """
+        # Summary
+
+        Return value encoded as compact JSON bytes.
+
+        ## Raises
+
+        - TypeError if value cannot be serialized
+        """
+        try:
+            return self._dumps(value)
+        except (TypeError, ValueError, OverflowError):
+            if self._backend == "json":
+                raise
+        try:
+            return self._dumps_json(value)
+        except ValueError as error:
+            raise TypeError(str(error)) from error
+
+    @staticmethod
+    def dumps_pretty(value) -> str:
+        """
+        # Summary
+
+        Return value as indented JSON with sorted keys, for log messages.
+
+        Formatting is always done by the standard library.  Callers should
+        only call dumps_pretty() once they know the message will be logged,
+        e.g. if log.isEnabledFor(logging.DEBUG).
+        """
+        return json.dumps(value, indent=4, sort_keys=True, default=str)
+
+    def loads(self, value: bytes | str):
+        """
+        # Summary
+
+        Return the python object decoded from value (bytes or str).
+
+        ## Raises
+
+        - ValueError if value is not valid JSON
+        """
+        try:
+            return self._loads(value)
+        except ValueError:
+            if self._backend == "json":
+                raise
+        return json.loads(value)
+
+    @property
+    def backend(self) -> str:
+        """
+        # Summary
+
+        The JSON library used to encode and decode.
+
+        ## Raises
+
+        - ValueError if the backend is unknown or not installed
+        """
+        return self._backend
+
+    @backend.setter
+    def backend(self, value: str) -> None:
+        method_name = "backend"
+        if value not in available_backends():
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Unknown or uninstalled JSON backend {value}. "
+            msg += f"Expected one of {', '.join(available_backends())}."
+            raise ValueError(msg)
+        self._backend = value
+        if value == "orjson":
+            orjson = importlib.import_module("orjson")
+            self._dumps = orjson.dumps
+            self._loads = orjson.loads
+        elif value == "msgspec":
+            self._msgspec = importlib.import_module("msgspec")
+            self._dumps = self._msgspec_dumps
+            self._loads = self._msgspec_loads
+        else:
+            self._dumps = self._dumps_json
+            self._loads = json.loads
+
+    def _msgspec_dumps(self, value) -> bytes:
+        """
+        msgspec.EncodeError is not a TypeError; raise TypeError like the other backends.
+        """
+        try:
+            return self._msgspec.json.encode(value)
+        except self._msgspec.EncodeError as error:
+            raise TypeError(str(error)) from error
+
+    def _msgspec_loads(self, value):
+        """
+        msgspec.DecodeError is not a ValueError; raise ValueError like the other backends.
+        """
+        try:
+            return self._msgspec.json.decode(value)
+        except self._msgspec.DecodeError as error:
+            raise ValueError(str(error)) from error
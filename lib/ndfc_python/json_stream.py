@@ -0,0 +1,152 @@
+"""
+# Name
+
+json_stream.py
+
+# Description
+
+Yield the elements of a top-level JSON array as the response body
+arrives, instead of buffering and parsing the whole body first.
+
+Controller responses such as switchesByFabric, top-down networks and
+switch policies are JSON arrays whose size grows with the fabric.
+iter_json_array() holds at most one chunk of the body plus the element
+being parsed, so peak memory does not depend on the number of elements.
+"""
+
+import codecs
+import inspect
+import json
+import re
+
+from ndfc_python.sender_request import SenderRequest
+
+_DECODER = json.JSONDecoder()
+_NUMBER_CHARS = frozenset("0123456789+-.eE")
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def iter_json_array(chunks):
+    """
+    # Summary
+
+    Given an iterable of bytes chunks (e.g. requests' iter_content()) that
+    together hold a JSON array, yield each element of the array as soon as
+    it has been received.
+
+    Elements are decoded with the standard library.  An element that spans
+    several chunks is decoded once all of its chunks have arrived.
+
+    ## Raises
+
+    - ValueError if the body is not a JSON array, or is malformed or truncated
+
+    ## Usage
+
+    ```python
+    for switch in iter_json_array(response.iter_content(chunk_size=65536)):
+        print(switch["logicalName"])
+    ```
+    """
+    chunks = iter(chunks)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    position = 0
+    eof = False
+    expect = "open"
+
+    while True:
+        position = _WHITESPACE.match(buffer, position).end()
+        need_more = position == len(buffer)
+        if not need_more:
+            char = buffer[position]
+            if expect == "open":
+                if char != "[":
+                    msg = f"Expected a JSON array. Got a body starting with {buffer[position:position + 40]!r}."
+                    raise ValueError(msg)
+                position += 1
+                expect = "first"
+                continue
+            if expect == "separator":
+                if char == ",":
+                    position += 1
+                    expect = "value"
+                    continue
+                if char == "]":
+                    position += 1
+                    break
+                msg = f"Expected ',' or ']' at {buffer[position:position + 40]!r}."
+                raise ValueError(msg)
+            if char == "]" and expect == "first":
+                position += 1
+                break
+            try:
+                value, end = _DECODER.raw_decode(buffer, position)
+            except ValueError as error:
+                if eof:
+                    msg = f"Malformed JSON array element. Error detail: {error}"
+                    raise ValueError(msg) from error
+                need_more = True
+            else:
+                # A number at the end of the buffer may continue in the next chunk.
+                if eof or (end < len(buffer) and buffer[end] not in _NUMBER_CHARS):
+                    position = end
+                    expect = "separator"
+                    yield value
+                    continue
+                need_more = True
+
+        if eof:
+            msg = "Truncated JSON array."
+            raise ValueError(msg)
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+            text = decoder.decode(b"", final=True)
+        else:
+            text = decoder.decode(chunk)
+        buffer = buffer[position:] + text
+        position = 0
+
+    for chunk in chunks:
+        buffer += decoder.decode(chunk)
+    if buffer[position:].strip():
+        msg = "Unexpected data after the JSON array."
+        raise ValueError(msg)
+
+
+def iter_response_items(rest_send, path: str):
+    """
+    # Summary
+
+    GET path and yield the elements of the JSON array in the response DATA.
+
+    If the Sender attached to rest_send has a synchronous stream() method
+    (Sender from ndfc_python.sender_requests), elements are yielded as
+    they arrive.  Otherwise (e.g. a Sender from ansible-dcnm) the request
+    is sent through rest_send and the elements of response_current["DATA"]
+    are yielded.
+
+    ## Raises
+
+    - ValueError if the request fails, the controller returns an error,
+      or the response is not a JSON array
+    """
+    stream = getattr(getattr(rest_send, "sender", None), "stream", None)
+    if stream is not None and not inspect.iscoroutinefunction(stream):
+        yield from stream(SenderRequest("GET", path))
+        return
+
+    rest_send.path = path
+    rest_send.verb = "GET"
+    rest_send.payload = None
+    rest_send.commit()
+    response = rest_send.response_current
+    if response.get("RETURN_CODE") not in (200, 201):
+        msg = f"Unable to GET {path}. Controller response: {response}."
+        raise ValueError(msg)
+    data = response.get("DATA", [])
+    if not isinstance(data, list):
+        msg = f"Expected a JSON array from {path}. Got {type(data).__name__}."
+        raise ValueError(msg)
+    yield from data
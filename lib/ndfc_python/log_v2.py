@@ -18,10 +18,8 @@ __metaclass__ = type  # pylint: disable=invalid-name
 __copyright__ = "Copyright (c) 2024 Cisco and/or its affiliates."
 __author__ = "Allen Robel"
 
-import inspect
 import json
 import logging
-from logging.config import dictConfig
 from os import environ
 
 
@@ -254,6 +252,10 @@ class Log:
         except ValueError as error:
             raise ValueError(str(error)) from error
 
+        # Imported here since logging.config is slow to import and most
+        # script runs do not enable logging.
+        from logging.config import dictConfig  # pylint: disable=import-outside-toplevel
+
         try:
             dictConfig(logging_config)
         except (
@@ -381,7 +383,7 @@ class Log:
 
     @develop.setter
     def develop(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "develop"
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: Expected boolean for develop. "
             msg += f"Got: type {type(value).__name__} for value {value}."
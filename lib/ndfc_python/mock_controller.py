@@ -0,0 +1,967 @@
+"""
+# Name
+
+mock_controller.py
+
+# Description
+
+A local stand-in for a Nexus Dashboard / NDFC controller, for offline
+benchmarking and regression testing of ndfc_python.
+
+MockController serves HTTPS (Sender always builds https:// URLs) from a
+threaded HTTP/1.1 server on 127.0.0.1, with synthetic fabrics of
+configurable size and configurable per-endpoint latency.  State is kept in
+memory, so creates, attaches and deletes are reflected in later GETs.
+
+## Endpoints
+
+All paths below are relative to /appcenter/cisco/ndfc/api/v1/lan-fabric/rest
+
+- POST /login (absolute path)
+- GET control/fabrics
+- GET control/fabrics/{fabric}/inventory/switchesByFabric
+- POST control/fabrics/{fabric}/config-save
+- POST control/fabrics/{fabric}/config-deploy
+- GET, POST top-down/fabrics/{fabric}/networks
+- DELETE top-down/fabrics/{fabric}/networks/{network}
+- POST top-down/fabrics/{fabric}/networks/attachments
+- GET, POST top-down/fabrics/{fabric}/vrfs
+- DELETE top-down/fabrics/{fabric}/bulk-delete/vrfs?vrf-names={vrf},{vrf}
+- POST top-down/fabrics/{fabric}/vrfs/attachments
+- GET control/policies/switches?serialNumber={serial},{serial}
+- POST control/policies
+- DELETE control/policies/policyIds?policyIds={id},{id}
+
+## Latency
+
+Latency is set per endpoint name, in seconds.  Endpoint names are:
+login, fabrics, inventory, config, networks, vrfs, attachments, policies.
+Endpoints not in latency use default_latency.
+
+## Faults
+
+inject_faults(endpoint, return_codes, retry_after) makes the next
+len(return_codes) requests to endpoint fail with those return codes,
+e.g. to exercise Sender's retries.  If retry_after is set, each fault
+response has a Retry-After header with that value.
+
+## Tokens
+
+POST /login returns a JWT (unsigned) whose exp claim is token_lifetime
+seconds away.  Requests with an unknown or expired token get 401.
+expire_tokens() invalidates every token at once, as a controller
+restart would.
+
+## Clusters
+
+MockController(shared=other.shared) makes a MockController serve the
+same state and login tokens as other, like two nodes of a Nexus
+Dashboard cluster, e.g. to exercise Sender's ControllerCluster.  Stop a
+node to simulate a node failure.
+
+## TLS
+
+If certfile and keyfile are not set, a self-signed certificate is
+generated with the openssl command line tool.
+"""
+
+# We are using isort for import sorting.
+# pylint: disable=wrong-import-order
+
+import argparse
+import base64
+import itertools
+import json
+import logging
+import shutil
+import socket
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+
+class MockControllerRequestHandler(BaseHTTPRequestHandler):
+    """
+    # Summary
+
+    Route one HTTP request to the MockController attached to the server.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        """
+        Disable Nagle's algorithm.  Headers and body are written separately,
+        and without TCP_NODELAY every response waits on a delayed ACK.
+        """
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """
+        Log to the ndfc_python logger rather than stderr.
+        """
+        self.server.controller.log.debug(format, *args)
+
+    def _read_payload(self):
+        """
+        Return the decoded JSON request body, or None if there is no body.
+        """
+        length = int(self.headers.get("Content-Length") or 0)
+        if length == 0:
+            return None
+        body = self.rfile.read(length)
+        try:
+            return json.loads(body)
+        except json.JSONDecodeError:
+            return None
+
+    def _handle(self, verb):
+        controller = self.server.controller
+        payload = self._read_payload()
+        return_code, data, headers = controller.dispatch(verb, self.path, self.headers, payload)
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(return_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_DELETE(self):  # pylint: disable=invalid-name
+        """Handle DELETE"""
+        self._handle("DELETE")
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Handle GET"""
+        self._handle("GET")
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Handle POST"""
+        self._handle("POST")
+
+    def do_PUT(self):  # pylint: disable=invalid-name
+        """Handle PUT"""
+        self._handle("PUT")
+
+
+class MockControllerState:
+    """
+    # Summary
+
+    The state shared by the MockController nodes of one cluster: the
+    synthetic fabrics and policies, the login tokens issued, and the lock
+    that guards them.
+
+    ## Usage
+
+    ```python
+    first = MockController()
+    second = MockController(shared=first.shared)
+    ```
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.next_policy_id = 1
+        self.state = {}
+        self.token_ids = itertools.count(1)
+        self.tokens = {}
+
+
+class MockController:
+    """
+    # Summary
+
+    Local stand-in controller with synthetic fabrics.
+
+    ## Usage
+
+    ```python
+    from ndfc_python.mock_controller import MockController
+    from ndfc_python.sender_requests import Sender
+
+    with MockController() as controller:
+        controller.fabrics = 2
+        controller.switches_per_fabric = 16
+        controller.latency = {"inventory": 0.05}
+        controller.start()
+
+        sender = Sender()
+        sender.ip4 = controller.address
+        sender.username = "admin"
+        sender.password = "password"
+        sender.domain = "local"
+        sender.login()
+        ...
+        print(controller.request_counts)
+    ```
+
+    ## Raises
+
+    - ValueError from start() if the server is already running, or if a
+      certificate cannot be generated.
+    - TypeError, ValueError from the property setters if values are invalid.
+
+    ## Properties
+
+    - address (str): getter: "host:port" to use as Sender.ip4.  Set after start().
+    - certfile, keyfile (str): getter/setter: TLS certificate and key.  Default: self-signed.
+    - default_latency (float): getter/setter: seconds added to endpoints not in latency.  Default 0.0
+    - faults (dict): getter: faults not yet served, keyed on endpoint name.  See inject_faults().
+    - fabrics (int): getter/setter: number of synthetic fabrics.  Default 2
+    - host (str): getter/setter: address to listen on.  Default 127.0.0.1
+    - latency (dict): getter/setter: seconds added per endpoint name.  Default {}
+    - networks_per_fabric (int): getter/setter: Default 100
+    - policies_per_switch (int): getter/setter: Default 5
+    - port (int): getter/setter: port to listen on.  Default 0 (any free port)
+    - request_counts (Counter): getter: number of requests, keyed on (verb, endpoint name)
+    - shared (MockControllerState): getter: state shared with the other
+      nodes of the cluster (MockController(shared=...)).  Faults, latency
+      and request_counts stay per node.
+    - switches_per_fabric (int): getter/setter: Default 8.  Consecutive switches are vPC peers.
+    - token_lifetime (float): getter/setter: seconds until a login token expires.  Default 0 (never)
+    - vrfs_per_fabric (int): getter/setter: Default 10
+    """
+
+    API = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest"
+    ENDPOINTS = ("attachments", "config", "fabrics", "inventory", "login", "networks", "policies", "vrfs")
+
+    def __init__(self, shared: MockControllerState | None = None):
+        self.class_name = __class__.__name__
+        self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
+
+        self._shared = shared if shared is not None else MockControllerState()
+        self._lock = self._shared.lock
+        self._server = None
+        self._thread = None
+        self._tmpdir = None
+
+        self._certfile = None
+        self._default_latency = 0.0
+        self._faults = {}
+        self._fabrics = 2
+        self._host = "127.0.0.1"
+        self._keyfile = None
+        self._latency = {}
+        self._networks_per_fabric = 100
+        self._policies_per_switch = 5
+        self._port = 0
+        self._switches_per_fabric = 8
+        self._vrfs_per_fabric = 10
+
+        self._request_counts = Counter()
+        self._token_lifetime = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _build_state(self) -> None:
+        """
+        Build the synthetic fabrics, switches, VRFs, networks and policies.
+        """
+        self._shared.state = {"fabrics": {}, "policies": {}}
+        self._shared.next_policy_id = 1
+        for fabric_index in range(1, self.fabrics + 1):
+            fabric_name = f"FABRIC_{fabric_index}"
+            fabric = {}
+            fabric["fabric"] = {
+                "fabricName": fabric_name,
+                "fabricType": "Switch_Fabric",
+                "templateName": "Easy_Fabric",
+                "nvPairs": {"FABRIC_NAME": fabric_name, "BGP_AS": str(65000 + fabric_index)},
+            }
+            fabric["switches"] = [self._build_switch(fabric_index, fabric_name, index) for index in range(self.switches_per_fabric)]
+            fabric["vrfs"] = {}
+            for index in range(1, self.vrfs_per_fabric + 1):
+                vrf = self._build_vrf(fabric_name, index)
+                fabric["vrfs"][vrf["vrfName"]] = vrf
+            fabric["networks"] = {}
+            for index in range(1, self.networks_per_fabric + 1):
+                network = self._build_network(fabric_name, index)
+                fabric["networks"][network["networkName"]] = network
+            fabric["attachments"] = {"networks": {}, "vrfs": {}}
+            self._shared.state["fabrics"][fabric_name] = fabric
+            for switch in fabric["switches"]:
+                for _ in range(self.policies_per_switch):
+                    policy = {}
+                    policy["description"] = "synthetic policy"
+                    policy["entityName"] = "SWITCH"
+                    policy["entityType"] = "SWITCH"
+                    policy["nvPairs"] = {"CONF": "feature bash-shell"}
+                    policy["priority"] = 500
+                    policy["serialNumber"] = switch["serialNumber"]
+                    policy["source"] = ""
+                    policy["templateName"] = "switch_freeform"
+                    self._add_policy(policy)
+
+    @staticmethod
+    def _build_switch(fabric_index: int, fabric_name: str, index: int) -> dict:
+        """
+        Return a switchesByFabric item.  Switches 0/1, 2/3, ... are vPC peers.
+        """
+        peer_index = index + 1 if index % 2 == 0 else index - 1
+        switch = {}
+        switch["fabricName"] = fabric_name
+        switch["ipAddress"] = f"10.{fabric_index}.{index // 250}.{index % 250 + 1}"
+        switch["isVpcConfigured"] = True
+        switch["logicalName"] = f"{fabric_name}-LEAF-{index + 1}"
+        switch["model"] = "N9K-C93180YC-EX"
+        switch["peerSerialNumber"] = f"{fabric_name}-SN{peer_index + 1:04d}"
+        switch["release"] = "10.4(3)"
+        switch["serialNumber"] = f"{fabric_name}-SN{index + 1:04d}"
+        switch["status"] = "ok"
+        switch["switchRole"] = "leaf"
+        return switch
+
+    @staticmethod
+    def _build_vrf(fabric_name: str, index: int) -> dict:
+        """
+        Return a top-down VRF item.
+        """
+        vrf_name = f"VRF_{index}"
+        template_config = {"vrfName": vrf_name, "vrfSegmentId": 50000 + index, "vrfVlanId": str(3000 + index)}
+        vrf = {}
+        vrf["fabric"] = fabric_name
+        vrf["vrfExtensionTemplate"] = "Default_VRF_Extension_Universal"
+        vrf["vrfId"] = 50000 + index
+        vrf["vrfName"] = vrf_name
+        vrf["vrfStatus"] = "NA"
+        vrf["vrfTemplate"] = "Default_VRF_Universal"
+        vrf["vrfTemplateConfig"] = json.dumps(template_config)
+        return vrf
+
+    def _build_network(self, fabric_name: str, index: int) -> dict:
+        """
+        Return a top-down network item.
+        """
+        network_name = f"NET_{index}"
+        vrf_name = f"VRF_{(index - 1) % self.vrfs_per_fabric + 1}" if self.vrfs_per_fabric else "NA"
+        template_config = {
+            "gatewayIpAddress": f"10.{100 + index // 250}.{index % 250}.1/24",
+            "networkName": network_name,
+            "segmentId": str(30000 + index),
+            "vlanId": str(1000 + index),
+            "vrfName": vrf_name,
+        }
+        network = {}
+        network["displayName"] = network_name
+        network["fabric"] = fabric_name
+        network["networkExtensionTemplate"] = "Default_Network_Extension_Universal"
+        network["networkId"] = 30000 + index
+        network["networkName"] = network_name
+        network["networkStatus"] = "NA"
+        network["networkTemplate"] = "Default_Network_Universal"
+        network["networkTemplateConfig"] = json.dumps(template_config)
+        network["vrf"] = vrf_name
+        return network
+
+    def _add_policy(self, policy: dict) -> dict:
+        """
+        Assign a policyId to policy and store it.
+        """
+        policy = dict(policy)
+        policy["policyId"] = f"POLICY-{self._shared.next_policy_id}"
+        self._shared.next_policy_id += 1
+        self._shared.state["policies"][policy["policyId"]] = policy
+        return policy
+
+    def _generate_certificate(self) -> None:
+        """
+        Generate a self-signed certificate for 127.0.0.1 with openssl.
+        """
+        method_name = "_generate_certificate"
+        if shutil.which("openssl") is None:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "openssl not found. Set certfile and keyfile instead."
+            raise ValueError(msg)
+        self._tmpdir = tempfile.TemporaryDirectory(prefix="ndfc_python_mock_")
+        self._certfile = str(Path(self._tmpdir.name) / "cert.pem")
+        self._keyfile = str(Path(self._tmpdir.name) / "key.pem")
+        command = ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1", "-subj", "/CN=127.0.0.1"]
+        command += ["-keyout", self._keyfile, "-out", self._certfile]
+        try:
+            subprocess.run(command, check=True, capture_output=True)
+        except subprocess.CalledProcessError as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Unable to generate a certificate. Error detail: {error.stderr}"
+            raise ValueError(msg) from error
+
+    def start(self) -> None:
+        """
+        # Summary
+
+        Build the synthetic state, unless it was already built (by an
+        earlier start() of this node, or of another node sharing it), and
+        start serving in a daemon thread.  Use reset() to rebuild it.
+
+        ## Raises
+
+        - ValueError if the server is already running, or a certificate
+          cannot be generated.
+        """
+        method_name = "start"
+        if self._server is not None:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "MockController is already running."
+            raise ValueError(msg)
+        if self._certfile is None or self._keyfile is None:
+            self._generate_certificate()
+        with self._lock:
+            if not self._shared.state:
+                self._build_state()
+            self._request_counts = Counter()
+
+        server = ThreadingHTTPServer((self.host, self.port), MockControllerRequestHandler)
+        server.daemon_threads = True
+        server.controller = self
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(self._certfile, self._keyfile)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+        self._server = server
+        self._thread = threading.Thread(target=server.serve_forever, name=self.class_name, daemon=True)
+        self._thread.start()
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"Listening on https://{self.address}"
+        self.log.debug(msg)
+
+    def stop(self) -> None:
+        """
+        Stop serving and release the listening socket.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+        self._server = None
+        self._thread = None
+        if self._tmpdir is not None:
+            self._tmpdir.cleanup()
+            self._tmpdir = None
+            self._certfile = None
+            self._keyfile = None
+
+    def reset(self) -> None:
+        """
+        Rebuild the synthetic state, discarding creates, attaches and
+        deletes, and reset request_counts and faults.  Login tokens stay
+        valid.
+        """
+        with self._lock:
+            self._build_state()
+            self._faults = {}
+            self._request_counts = Counter()
+
+    def inject_faults(self, endpoint: str, return_codes: list[int], retry_after: str | None = None) -> None:
+        """
+        # Summary
+
+        Make the next len(return_codes) requests to endpoint return those
+        return codes, in order, without being processed.  If retry_after
+        is set, each of those responses has a Retry-After header with that
+        value (seconds, or an HTTP-date).
+
+        ## Raises
+
+        - ValueError if endpoint is not one of ENDPOINTS
+        """
+        if endpoint not in self.ENDPOINTS:
+            msg = f"{self.class_name}.inject_faults: "
+            msg += f"Unknown endpoint {endpoint}. Expected one of {', '.join(self.ENDPOINTS)}."
+            raise ValueError(msg)
+        with self._lock:
+            self._faults.setdefault(endpoint, []).extend((int(return_code), retry_after) for return_code in return_codes)
+
+    def _next_fault(self, endpoint: str) -> tuple[int, dict, dict] | None:
+        """
+        Return the next fault response for endpoint, or None if there is none.
+        """
+        with self._lock:
+            faults = self._faults.get(endpoint)
+            if not faults:
+                return None
+            return_code, retry_after = faults.pop(0)
+        return_code, data, headers = self._error(return_code, f"Injected fault {return_code}")
+        if retry_after is not None:
+            headers["Retry-After"] = str(retry_after)
+        return return_code, data, headers
+
+    def reset_counters(self) -> None:
+        """
+        Reset request_counts.
+        """
+        with self._lock:
+            self._request_counts = Counter()
+
+    @staticmethod
+    def _error(return_code: int, message: str) -> tuple[int, dict, dict]:
+        return return_code, {"code": return_code, "message": message}, {}
+
+    def _endpoint_name(self, verb: str, parts: list[str]) -> str:
+        """
+        Return the latency/counter endpoint name for the path parts, which
+        follow /appcenter/cisco/ndfc/api/v1/lan-fabric/rest
+        """
+        if "attachments" in parts:
+            return "attachments"
+        if parts[:2] == ["control", "policies"]:
+            return "policies"
+        if "inventory" in parts:
+            return "inventory"
+        if parts[-1:] in (["config-save"], ["config-deploy"]):
+            return "config"
+        if "networks" in parts:
+            return "networks"
+        if "vrfs" in parts:
+            return "vrfs"
+        if parts[:2] == ["control", "fabrics"] and verb == "GET":
+            return "fabrics"
+        return "unknown"
+
+    def dispatch(self, verb: str, raw_path: str, headers, payload) -> tuple[int, dict | list, dict]:
+        """
+        # Summary
+
+        Return (return_code, data, response_headers) for one request.
+        Called by MockControllerRequestHandler from the server threads.
+        """
+        url = urlsplit(raw_path)
+        query = {key: value[0] for key, value in parse_qs(url.query).items()}
+        if url.path == "/login":
+            endpoint = "login"
+        elif url.path.startswith(self.API + "/"):
+            parts = [unquote(part) for part in url.path[len(self.API) + 1 :].split("/") if part]
+            endpoint = self._endpoint_name(verb, parts)
+        else:
+            endpoint = "unknown"
+
+        with self._lock:
+            self._request_counts[(verb, endpoint)] += 1
+        delay = self.latency.get(endpoint, self.default_latency)
+        if delay:
+            time.sleep(delay)
+
+        fault = self._next_fault(endpoint)
+        if fault is not None:
+            return fault
+        if endpoint == "login":
+            return self._login(verb, payload)
+        if not self._authorized(headers):
+            return self._error(401, "Unauthorized")
+        if endpoint == "unknown":
+            return self._error(404, f"Unknown path {url.path}")
+        with self._lock:
+            return self._route(verb, endpoint, parts, query, payload)
+
+    def _login(self, verb: str, payload) -> tuple[int, dict, dict]:
+        if verb != "POST" or not isinstance(payload, dict) or not payload.get("userName"):
+            return self._error(400, "Invalid login request")
+        with self._lock:
+            expires_at = time.time() + self.token_lifetime if self.token_lifetime else None
+            token = self._build_token(payload["userName"], next(self._shared.token_ids), expires_at)
+            self._shared.tokens[token] = expires_at
+        return 200, {"jwttoken": token, "rbac": "admin"}, {}
+
+    @staticmethod
+    def _build_token(username: str, index: int, expires_at: float | None) -> str:
+        """
+        Return an unsigned JWT for username, with an exp claim if expires_at is set.
+        """
+
+        def encode(value: dict) -> str:
+            return base64.urlsafe_b64encode(json.dumps(value).encode("utf-8")).decode("ascii").rstrip("=")
+
+        claims = {"sub": username, "jti": str(index)}
+        if expires_at is not None:
+            claims["exp"] = int(expires_at)
+        return f"{encode({'alg': 'none', 'typ': 'JWT'})}.{encode(claims)}.mock"
+
+    def _authorized(self, headers) -> bool:
+        token = headers.get("Authorization") or headers.get("AuthCookie")
+        with self._lock:
+            if token not in self._shared.tokens:
+                return False
+            expires_at = self._shared.tokens[token]
+            return expires_at is None or time.time() < expires_at
+
+    def expire_tokens(self) -> None:
+        """
+        Invalidate every token issued so far.  Later requests with those
+        tokens get 401 until the client logs in again.
+        """
+        with self._lock:
+            self._shared.tokens.clear()
+
+    def _route(self, verb: str, endpoint: str, parts: list[str], query: dict, payload) -> tuple[int, dict | list, dict]:
+        """
+        Serve one request.  Called with _lock held.
+        """
+        if endpoint == "policies":
+            return self._policies(verb, parts, query, payload)
+        if endpoint == "fabrics":
+            if len(parts) == 2:
+                return 200, [fabric["fabric"] for fabric in self._shared.state["fabrics"].values()], {}
+            fabric = self._shared.state["fabrics"].get(parts[2])
+            if fabric is None:
+                return self._error(404, f"Fabric {parts[2]} not found")
+            return 200, fabric["fabric"], {}
+
+        fabric_name = parts[2] if len(parts) > 2 else ""
+        fabric = self._shared.state["fabrics"].get(fabric_name)
+        if fabric is None:
+            return self._error(404, f"Fabric {fabric_name} not found")
+
+        if endpoint == "inventory" and verb == "GET":
+            return 200, fabric["switches"], {}
+        if endpoint == "config" and verb == "POST":
+            if parts[-1] == "config-save":
+                return 200, {"status": "Config save is completed"}, {}
+            return 200, {"status": "Configuration deployment completed."}, {}
+        if endpoint == "attachments" and verb == "POST":
+            return self._attach(fabric, parts[3], payload)
+        if endpoint == "networks":
+            return self._overlay(verb, fabric, "networks", "networkName", "networkId", parts[4:], payload)
+        if endpoint == "vrfs":
+            if parts[3] == "bulk-delete" and verb == "DELETE":
+                names = [name for name in query.get("vrf-names", "").split(",") if name]
+                return self._overlay_delete(fabric, "vrfs", names)
+            return self._overlay(verb, fabric, "vrfs", "vrfName", "vrfId", parts[4:], payload)
+        return self._error(405, f"{verb} not supported for {endpoint}")
+
+    def _overlay(self, verb: str, fabric: dict, kind: str, name_key: str, id_key: str, rest: list[str], payload) -> tuple[int, dict | list, dict]:
+        """
+        GET, POST or DELETE networks or VRFs.
+        """
+        items = fabric[kind]
+        if verb == "GET" and not rest:
+            return 200, list(items.values()), {}
+        if verb == "GET":
+            if rest[0] not in items:
+                return self._error(404, f"{name_key} {rest[0]} not found")
+            return 200, items[rest[0]], {}
+        if verb == "DELETE" and rest:
+            return self._overlay_delete(fabric, kind, [rest[0]])
+        if verb == "POST" and not rest:
+            if not isinstance(payload, dict) or not payload.get(name_key):
+                return self._error(400, f"{name_key} is mandatory")
+            if payload[name_key] in items:
+                return self._error(400, f"{name_key} {payload[name_key]} already exists")
+            if any(str(item.get(id_key)) == str(payload.get(id_key)) for item in items.values()):
+                return self._error(400, f"{id_key} {payload.get(id_key)} is already in use")
+            item = dict(payload)
+            item[f"{kind[:-1]}Status"] = "NA"
+            items[item[name_key]] = item
+            return 200, item, {}
+        return self._error(405, f"{verb} not supported for {kind}")
+
+    def _overlay_delete(self, fabric: dict, kind: str, names: list[str]) -> tuple[int, dict, dict]:
+        missing = [name for name in names if name not in fabric[kind]]
+        if missing:
+            return self._error(404, f"{kind} not found: {','.join(missing)}")
+        for name in names:
+            fabric[kind].pop(name)
+            fabric["attachments"][kind].pop(name, None)
+        return 200, {}, {}
+
+    def _attach(self, fabric: dict, kind: str, payload) -> tuple[int, dict, dict]:
+        """
+        Attach (deployment true) or detach (deployment false) networks or VRFs.
+        Returns DATA keyed on "{name}-[{serialNumber}/{switchName}]".
+        """
+        name_key = "networkName" if kind == "networks" else "vrfName"
+        if not isinstance(payload, list):
+            return self._error(400, "Payload must be a list")
+        switches = {switch["serialNumber"]: switch["logicalName"] for switch in fabric["switches"]}
+        data = {}
+        for item in payload:
+            name = item.get(name_key, "")
+            attached = fabric["attachments"][kind].setdefault(name, set())
+            for attach in item.get("lanAttachList", []):
+                serial_number = attach.get("serialNumber", "")
+                key = f"{name}-[{serial_number}/{switches.get(serial_number, '')}]"
+                if name not in fabric[kind]:
+                    data[key] = f"{name_key} {name} does not exist"
+                    continue
+                if serial_number not in switches:
+                    data[key] = f"Switch {serial_number} not found"
+                    continue
+                if str(attach.get("deployment")).lower() == "false":
+                    attached.discard(serial_number)
+                else:
+                    attached.add(serial_number)
+                data[key] = "SUCCESS"
+        return 200, data, {}
+
+    def _policies(self, verb: str, parts: list[str], query: dict, payload) -> tuple[int, dict | list, dict]:
+        policies = self._shared.state["policies"]
+        if verb == "GET" and parts[2:] == ["switches"]:
+            serial_numbers = set(query.get("serialNumber", "").split(","))
+            return 200, [policy for policy in policies.values() if policy["serialNumber"] in serial_numbers], {}
+        if verb == "POST" and len(parts) == 2:
+            if not isinstance(payload, dict) or not payload.get("serialNumber"):
+                return self._error(400, "serialNumber is mandatory")
+            return 200, self._add_policy(payload), {}
+        if verb == "DELETE" and parts[2:] == ["policyIds"]:
+            policy_ids = [policy_id for policy_id in query.get("policyIds", "").split(",") if policy_id]
+            missing = [policy_id for policy_id in policy_ids if policy_id not in policies]
+            if missing:
+                return self._error(404, f"Policies not found: {','.join(missing)}")
+            for policy_id in policy_ids:
+                policies.pop(policy_id)
+            return 200, {}, {}
+        return self._error(405, f"{verb} not supported for policies")
+
+    def _verify_count(self, name: str, value: int) -> None:
+        if isinstance(value, bool) or not isinstance(value, int):
+            msg = f"{self.class_name}.{name}: "
+            msg += f"{name} must be an int. Got {type(value).__name__}."
+            raise TypeError(msg)
+        if value < 0:
+            msg = f"{self.class_name}.{name}: "
+            msg += f"{name} must be >= 0. Got {value}."
+            raise ValueError(msg)
+
+    def _verify_seconds(self, name: str, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            msg = f"{self.class_name}.{name}: "
+            msg += f"{name} must be a number of seconds. Got {type(value).__name__}."
+            raise TypeError(msg)
+        if value < 0:
+            msg = f"{self.class_name}.{name}: "
+            msg += f"{name} must be >= 0. Got {value}."
+            raise ValueError(msg)
+
+    @property
+    def address(self) -> str:
+        """
+        "host:port" the server is listening on, for use as Sender.ip4.
+        """
+        if self._server is None:
+            return ""
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    @property
+    def certfile(self) -> str | None:
+        """
+        Path to the TLS certificate.  Default: a generated self-signed certificate.
+        """
+        return self._certfile
+
+    @certfile.setter
+    def certfile(self, value: str) -> None:
+        self._certfile = value
+
+    @property
+    def default_latency(self) -> float:
+        """
+        Seconds to wait before responding, for endpoints not in latency.
+        """
+        return self._default_latency
+
+    @default_latency.setter
+    def default_latency(self, value: float) -> None:
+        self._verify_seconds("default_latency", value)
+        self._default_latency = value
+
+    @property
+    def faults(self) -> dict[str, list[tuple[int, str | None]]]:
+        """
+        Faults not yet served: (return_code, retry_after) tuples keyed on
+        endpoint name.
+        """
+        with self._lock:
+            return {endpoint: list(faults) for endpoint, faults in self._faults.items() if faults}
+
+    @property
+    def fabrics(self) -> int:
+        """
+        Number of synthetic fabrics, named FABRIC_1 .. FABRIC_n
+        """
+        return self._fabrics
+
+    @fabrics.setter
+    def fabrics(self, value: int) -> None:
+        self._verify_count("fabrics", value)
+        self._fabrics = value
+
+    @property
+    def host(self) -> str:
+        """
+        Address to listen on.
+        """
+        return self._host
+
+    @host.setter
+    def host(self, value: str) -> None:
+        self._host = value
+
+    @property
+    def keyfile(self) -> str | None:
+        """
+        Path to the TLS private key.  Default: a generated key.
+        """
+        return self._keyfile
+
+    @keyfile.setter
+    def keyfile(self, value: str) -> None:
+        self._keyfile = value
+
+    @property
+    def latency(self) -> dict[str, float]:
+        """
+        Seconds to wait before responding, keyed on endpoint name.
+        See ENDPOINTS for the endpoint names.
+        """
+        return self._latency
+
+    @latency.setter
+    def latency(self, value: dict[str, float]) -> None:
+        if not isinstance(value, dict):
+            msg = f"{self.class_name}.latency: "
+            msg += f"latency must be a dict. Got {type(value).__name__}."
+            raise TypeError(msg)
+        for endpoint, seconds in value.items():
+            if endpoint not in self.ENDPOINTS:
+                msg = f"{self.class_name}.latency: "
+                msg += f"Unknown endpoint {endpoint}. Expected one of {', '.join(self.ENDPOINTS)}."
+                raise ValueError(msg)
+            self._verify_seconds("latency", seconds)
+        self._latency = dict(value)
+
+    @property
+    def networks_per_fabric(self) -> int:
+        """
+        Number of synthetic networks per fabric, named NET_1 .. NET_n
+        """
+        return self._networks_per_fabric
+
+    @networks_per_fabric.setter
+    def networks_per_fabric(self, value: int) -> None:
+        self._verify_count("networks_per_fabric", value)
+        self._networks_per_fabric = value
+
+    @property
+    def policies_per_switch(self) -> int:
+        """
+        Number of synthetic policies per switch.
+        """
+        return self._policies_per_switch
+
+    @policies_per_switch.setter
+    def policies_per_switch(self, value: int) -> None:
+        self._verify_count("policies_per_switch", value)
+        self._policies_per_switch = value
+
+    @property
+    def port(self) -> int:
+        """
+        Port to listen on.  0 selects any free port; see address.
+        """
+        return self._port
+
+    @port.setter
+    def port(self, value: int) -> None:
+        self._verify_count("port", value)
+        self._port = value
+
+    @property
+    def request_counts(self) -> Counter:
+        """
+        Number of requests received, keyed on (verb, endpoint name).
+        """
+        with self._lock:
+            return Counter(self._request_counts)
+
+    @property
+    def shared(self) -> MockControllerState:
+        """
+        The state this node shares with the other nodes of its cluster.
+        Pass it to MockController() to add a node to the cluster.
+        """
+        return self._shared
+
+    @property
+    def switches_per_fabric(self) -> int:
+        """
+        Number of synthetic switches per fabric, named {fabric}-LEAF-1 .. n
+        """
+        return self._switches_per_fabric
+
+    @switches_per_fabric.setter
+    def switches_per_fabric(self, value: int) -> None:
+        self._verify_count("switches_per_fabric", value)
+        self._switches_per_fabric = value
+
+    @property
+    def token_lifetime(self) -> float:
+        """
+        Seconds until a login token expires.  0 means tokens never expire.
+        """
+        return self._token_lifetime
+
+    @token_lifetime.setter
+    def token_lifetime(self, value: float) -> None:
+        self._verify_seconds("token_lifetime", value)
+        self._token_lifetime = value
+
+    @property
+    def vrfs_per_fabric(self) -> int:
+        """
+        Number of synthetic VRFs per fabric, named VRF_1 .. VRF_n
+        """
+        return self._vrfs_per_fabric
+
+    @vrfs_per_fabric.setter
+    def vrfs_per_fabric(self, value: int) -> None:
+        self._verify_count("vrfs_per_fabric", value)
+        self._vrfs_per_fabric = value
+
+
+def main() -> None:
+    """
+    Run a MockController in the foreground.
+    """
+    parser = argparse.ArgumentParser(description="DESCRIPTION: Run a local mock controller for offline testing.")
+    parser.add_argument("--port", type=int, default=8443, help="Port to listen on. Default: 8443")
+    parser.add_argument("--fabrics", type=int, default=2, help="Number of fabrics. Default: 2")
+    parser.add_argument("--switches-per-fabric", type=int, default=8, help="Default: 8")
+    parser.add_argument("--networks-per-fabric", type=int, default=100, help="Default: 100")
+    parser.add_argument("--vrfs-per-fabric", type=int, default=10, help="Default: 10")
+    parser.add_argument("--policies-per-switch", type=int, default=5, help="Default: 5")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response. Default: 0.0")
+    parser.add_argument("--token-lifetime", type=float, default=0.0, help="Seconds until a login token expires. Default: 0 (never)")
+    args = parser.parse_args()
+
+    controller = MockController()
+    controller.port = args.port
+    controller.fabrics = args.fabrics
+    controller.switches_per_fabric = args.switches_per_fabric
+    controller.networks_per_fabric = args.networks_per_fabric
+    controller.vrfs_per_fabric = args.vrfs_per_fabric
+    controller.policies_per_switch = args.policies_per_switch
+    controller.default_latency = args.latency
+    controller.token_lifetime = args.token_lifetime
+    controller.start()
+    print(f"Mock controller listening on https://{controller.address}. Ctrl-C to stop.")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        controller.stop()
+
+
+if __name__ == "__main__":
+    main()
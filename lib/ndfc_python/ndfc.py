@@ -23,7 +23,6 @@ ndfc.username = "my_username"
 ndfc.login()
 """
 
-import inspect
 import json
 import logging
 import sys
@@ -95,7 +94,7 @@ class NDFC:
         """
         login to an NDFC controller
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "login"
         for key, value in self.properties.items():
             if value is None:
                 msg = f"{self.class_name}.{method_name}: "
@@ -187,7 +186,7 @@ class NDFC:
         *request_type - string: one of DELETE, GET, POST, PUT
         *url    -   string: the REST API endpoint
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "ndfc_action"
         mandatory_keys = {"url", "request_type"}
         if not mandatory_keys.issubset(params):
             msg = f"{self.class_name}.{method_name}: "
@@ -380,7 +379,7 @@ class NDFC:
         """
         Return the base URL for the NDFC controller
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "url_base"
         if self.ip4 is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "Exit. Set instance.ip4 before calling NDFC() url properties."
@@ -434,7 +433,7 @@ class NDFC:
 
     @request_timeout.setter
     def request_timeout(self, param):
-        method_name = inspect.stack()[0][3]
+        method_name = "request_timeout"
         if not isinstance(param, int):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"exiting. expected integer, got {param}"
@@ -454,7 +453,7 @@ class NDFC:
 
     @request_verify.setter
     def request_verify(self, param):
-        method_name = inspect.stack()[0][3]
+        method_name = "request_verify"
         if not isinstance(param, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"exiting. expected boolean, got {param}"
@@ -488,7 +487,7 @@ class NDFC:
         """
         Return the JSON response from the last request
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "response_json"
         try:
             return self.response.json()
         except json.decoder.JSONDecodeError:
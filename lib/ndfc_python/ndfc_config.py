@@ -15,7 +15,6 @@ c = NdfcLoadConfig()
 print(f"c.ansible_vault {c.config['ansible_vault']}")
 """
 
-import inspect
 import logging
 import sys
 from os import environ
@@ -64,7 +63,7 @@ class NdfcLoadConfig:
         """
         Exit if all mandatory keys are not present in self.properties["config"]
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "verify_mandatory_keys"
         for key in self.mandatory_keys:
             if key in self.properties["config"]:
                 continue
@@ -79,7 +78,7 @@ class NdfcLoadConfig:
         Open the YAML self.config_file, and load its contents
         into self.properties["config"]
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "load_config"
         try:
             with open(self.config_file, "r", encoding="utf-8") as handle:
                 self.properties["config"] = yaml.safe_load(handle)
@@ -49,7 +49,6 @@ network = {
 }
 """
 
-import inspect
 import json
 import logging
 from ipaddress import AddressValueError
@@ -254,7 +253,7 @@ class NdfcNetwork:
 
         3. Any other fixup that may be required
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_preprocess_payload"
         # if source is null, NDFC complains if it's present
         if self.source == "":
             self.payload.pop("source", None)
@@ -327,7 +326,7 @@ class NdfcNetwork:
         the correct property to call if there's a missing mandatory
         payload property.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_map_payload_param"
         if param not in self._payload_mapping_dict:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"param {param} not in _payload_mapping_dict"
@@ -345,7 +344,7 @@ class NdfcNetwork:
         the correct property to call if there's a missing mandatory
         template_config property.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_map_template_config_param"
         if param not in self._template_config_mapping_dict:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"param {param} not in "
@@ -358,7 +357,7 @@ class NdfcNetwork:
         """
         final verification of all parameters
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_final_verification"
         try:
             self.validations.verify_ndfc(self.ndfc)
         except (AttributeError, TypeError) as error:
@@ -440,7 +439,7 @@ class NdfcNetwork:
         """
         Create a network
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "create"
         self._preprocess_payload()
         self._final_verification()
 
@@ -476,7 +475,7 @@ class NdfcNetwork:
         """
         Delete a network
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "delete"
         if self.network_name == "":
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Call {self.class_name}.networkName before calling "
@@ -662,7 +661,7 @@ class NdfcNetwork:
 
     @enable_ir.setter
     def enable_ir(self, param):
-        method_name = inspect.stack()[0][3]
+        method_name = "enable_ir"
         try:
             self.validations.verify_boolean(param)
         except TypeError as error:
@@ -680,7 +679,7 @@ class NdfcNetwork:
 
     @enable_l3_on_border.setter
     def enable_l3_on_border(self, param):
-        method_name = inspect.stack()[0][3]
+        method_name = "enable_l3_on_border"
         try:
             self.validations.verify_boolean(param)
         except TypeError as error:
@@ -698,7 +697,7 @@ class NdfcNetwork:
 
     @gateway_ip_address.setter
     def gateway_ip_address(self, param):
-        method_name = inspect.stack()[0][3]
+        method_name = "gateway_ip_address"
         try:
             self.validations.verify_ipv4_address_with_prefix(param)
         except AddressValueError as error:
@@ -716,7 +715,7 @@ class NdfcNetwork:
 
     @gateway_ipv6_address.setter
     def gateway_ipv6_address(self, param):
-        method_name = inspect.stack()[0][3]
+        method_name = "gateway_ipv6_address"
         try:
             self.validations.verify_ipv6_address_with_prefix(param)
         except AddressValueError as error:
@@ -745,7 +744,7 @@ class NdfcNetwork:
 
     @is_layer2_only.setter
     def is_layer2_only(self, param):
-        method_name = inspect.stack()[0][3]
+        method_name = "is_layer2_only"
         try:
             self.validations.verify_boolean(param)
         except TypeError as error:
@@ -775,7 +774,7 @@ class NdfcNetwork:
 
     @mcast_group.setter
     def mcast_group(self, param):
-        method_name = inspect.stack()[0][3]
+        method_name = "mcast_group"
         try:
             self.validations.verify_ipv4_multicast_address(param)
         except AddressValueError as error:
@@ -793,7 +792,7 @@ class NdfcNetwork:
 
     @mtu.setter
     def mtu(self, param):
-        method_name = inspect.stack()[0][3]
+        method_name = "mtu"
         try:
             self.validations.verify_mtu(param)
         except ValueError as error:
@@ -815,7 +814,7 @@ class NdfcNetwork:
 
     @nve_id.setter
     def nve_id(self, param):
-        method_name = inspect.stack()[0][3]
+        method_name = "nve_id"
         try:
             self.validations.verify_nve_id(param)
         except ValueError as error:
@@ -833,7 +832,7 @@ class NdfcNetwork:
 
     @rt_both_auto.setter
     def rt_both_auto(self, param):
-        method_name = inspect.stack()[0][3]
+        method_name = "rt_both_auto"
         try:
             self.validations.verify_boolean(param)
         except TypeError as error:
@@ -851,7 +850,7 @@ class NdfcNetwork:
 
     @secondary_gw_1.setter
     def secondary_gw_1(self, param):
-        method_name = inspect.stack()[0][3]
+        method_name = "secondary_gw_1"
         try:
             self.validations.verify_ipv4_address_with_prefix(param)
         except AddressValueError as error:
@@ -869,7 +868,7 @@ class NdfcNetwork:
 
     @secondary_gw_2.setter
     def secondary_gw_2(self, param):
-        method_name = inspect.stack()[0][3]
+        method_name = "secondary_gw_2"
         try:
             self.validations.verify_ipv4_address_with_prefix(param)
         except AddressValueError as error:
@@ -887,7 +886,7 @@ class NdfcNetwork:
 
     @secondary_gw_3.setter
     def secondary_gw_3(self, param):
-        method_name = inspect.stack()[0][3]
+        method_name = "secondary_gw_3"
         try:
             self.validations.verify_ipv4_address_with_prefix(param)
         except AddressValueError as error:
@@ -905,7 +904,7 @@ class NdfcNetwork:
 
     @secondary_gw_4.setter
     def secondary_gw_4(self, param):
-        method_name = inspect.stack()[0][3]
+        method_name = "secondary_gw_4"
         try:
             self.validations.verify_ipv4_address_with_prefix(param)
         except AddressValueError as error:
@@ -935,7 +934,7 @@ class NdfcNetwork:
 
     @suppress_arp.setter
     def suppress_arp(self, param):
-        method_name = inspect.stack()[0][3]
+        method_name = "suppress_arp"
         try:
             self.validations.verify_boolean(param)
         except TypeError as error:
@@ -965,7 +964,7 @@ class NdfcNetwork:
 
     @trm_enabled.setter
     def trm_enabled(self, param):
-        method_name = inspect.stack()[0][3]
+        method_name = "trm_enabled"
         try:
             self.validations.verify_boolean(param)
         except TypeError as error:
@@ -2,11 +2,17 @@
 # pylint: disable=wrong-import-order
 
 import argparse  # used for validating args
-import inspect
 import logging
+from os import environ
 
+from ndfc_python.common.ttl_cache import normalize_controller
+from ndfc_python.controller_cluster import ControllerCluster
 from ndfc_python.credential_selector import CredentialSelector
+from ndfc_python.rate_limiter import RateLimiter
+from ndfc_python.response_cache import ResponseCache
 from ndfc_python.sender_requests import Sender
+from ndfc_python.sender_session import SenderSession
+from ndfc_python.token_cache import TokenCache
 
 
 class NdfcPythonSender:
@@ -38,12 +44,84 @@ class NdfcPythonSender:
     rest_send.sender = ndfc_sender.sender
     ```
 
+    ### Connection pooling
+
+    By default, commit() attaches the process-wide pooled session
+    (SenderSession.shared()) to Sender(), so every NdfcPythonSender and
+    RestSend in a process reuses the same keep-alive connections.  Set
+    session to a dedicated SenderSession() to use a separate pool.
+
+    ### Token cache
+
+    If token_cache is set to a TokenCache(), or the environment variable
+    NDFC_PYTHON_TOKEN_CACHE is set, commit() reuses a still-valid token
+    cached by an earlier script invocation for the same controller,
+    username and domain, and skips POST /login.  New tokens (from login,
+    or from re-login when a token expires) are saved to the cache.
+
+    NDFC_PYTHON_TOKEN_CACHE is either the path of the cache file or 1 to
+    use the default path (~/.cache/ndfc-python/tokens.json).  If the
+    credentials were read from an Ansible Vault, directly or through the
+    credentials agent, cached tokens are encrypted with a password
+    derived from the vault password.
+
+    ```bash
+    export NDFC_PYTHON_TOKEN_CACHE=1
+    ./fabric_info.py --config config/fabric_info.yaml  # logs in
+    ./network_info.py --config config/network_info.yaml  # reuses the token
+    ```
+
+    ### Clusters
+
+    If nd_ip4 (from args, ND_IP4 or an Ansible Vault) is a comma-separated
+    list of addresses, commit() probes the latency of each node and
+    attaches a ControllerCluster to Sender(), which spreads reads across
+    the nodes (round_robin, or least_latency with --nd-read-strategy or
+    NDFC_PYTHON_READ_STRATEGY), sends writes to one node, and fails over
+    when a node cannot be reached.
+
+    ```bash
+    export ND_IP4=10.1.1.1,10.1.1.2,10.1.1.3
+    ```
+
+    ### Response cache
+
+    If the environment variable NDFC_PYTHON_RESPONSE_CACHE is set, commit()
+    attaches the process-wide ResponseCache for the controller
+    (ResponseCache.shared(), keyed on nd_ip4) to Sender(), so that
+    repeated GETs are answered from memory until a write to the same
+    fabric.
+    NDFC_PYTHON_RESPONSE_CACHE is either 1, to cache responses for 30
+    seconds, or the number of seconds to cache them.
+
+    ```bash
+    export NDFC_PYTHON_RESPONSE_CACHE=10
+    ```
+
+    ### Rate limiting
+
+    If a request rate, an in-flight limit or adaptive mode is given, in
+    args (--rate-limit, --rate-burst, --max-in-flight, --adaptive) or in
+    the environment variables NDFC_PYTHON_RATE_LIMIT,
+    NDFC_PYTHON_RATE_BURST, NDFC_PYTHON_MAX_IN_FLIGHT and
+    NDFC_PYTHON_ADAPTIVE, commit() configures the process-wide
+    RateLimiter for the controller (RateLimiter.shared(), keyed on
+    nd_ip4) and attaches it to Sender().  args take precedence over the
+    environment.
+
+    ```bash
+    export NDFC_PYTHON_MAX_IN_FLIGHT=8
+    export NDFC_PYTHON_ADAPTIVE=1
+    ./vrf_create.py --config config/vrf_create.yaml --bulk
+    ```
+
     """
 
     def __init__(self):
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
         self._args = None
+        self._cluster = None
         self._credential_names = []
         self._credential_names.append("nd_domain")
         self._credential_names.append("nd_ip4")
@@ -52,6 +130,7 @@ class NdfcPythonSender:
         self._credential_names.append("nxos_password")
         self._credential_names.append("nxos_username")
         self._sender = Sender()
+        self._session = SenderSession.shared()
         self._login = True
         self._nd_domain = None
         self._nd_ip4 = None
@@ -59,7 +138,12 @@ class NdfcPythonSender:
         self._nd_username = None
         self._nxos_password = None
         self._nxos_username = None
+        self._rate_limiter = None
+        self._response_cache = None
         self._timeout = 10  # seconds
+        self._cached_token = None
+        self._token_cache = self._token_cache_from_environment()
+        self._token_cache_password = None
 
     @property
     def args(self):
@@ -87,7 +171,7 @@ class NdfcPythonSender:
 
     @args.setter
     def args(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "args"
         if not isinstance(value, argparse.Namespace):
             msg = f"{self.class_name}.{method_name}: "
             msg += "args must be an argparse.Namespace instance."
@@ -109,7 +193,7 @@ class NdfcPythonSender:
         Use CredentialSelector to get Nexus Dashboard credentials from
         environment variables, args, or an Ansible Vault.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "set_sender_credentials"
         cs = CredentialSelector()
         cs.script_args = self.args
         for credential in self._credential_names:
@@ -136,6 +220,8 @@ class NdfcPythonSender:
                 self._nxos_password = cs.credential_value
             if credential == "nxos_username":
                 self._nxos_username = cs.credential_value
+        if self.token_cache is not None:
+            self._token_cache_password = cs.token_cache_password
 
     def commit(self) -> None:
         """
@@ -146,12 +232,20 @@ class NdfcPythonSender:
         - ValueError if:
             -   sender.login() is not successful
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         self.set_sender_credentials()
+        self.sender.session = self.session
+        self._set_cluster()
+        self._set_rate_limiter()
+        self._set_response_cache()
         if self.login is False:
             return
+        self.sender.timeout = self.timeout
+        if self.token_cache is not None:
+            self.sender.token_manager.on_update = self._save_token
+            if self._load_token():
+                return
         try:
-            self.sender.timeout = self.timeout
             self.sender.login()
         except ValueError as error:
             msg = f"{self.class_name}.{method_name}: "
@@ -159,6 +253,161 @@ class NdfcPythonSender:
             msg += f"Error detail: {error}"
             raise ValueError(msg) from error
 
+    def _set_cluster(self) -> None:
+        """
+        If nd_ip4 is a list of addresses, probe them and attach a
+        ControllerCluster to sender.
+
+        ## Raises
+        - ValueError if the read strategy is invalid.
+        """
+        method_name = "_set_cluster"
+        if isinstance(self.nd_ip4, list):
+            hosts = [str(host).strip() for host in self.nd_ip4]
+        else:
+            hosts = [host.strip() for host in str(self.nd_ip4).split(",")]
+        hosts = [host for host in hosts if host]
+        if len(hosts) < 2:
+            return
+        cluster = ControllerCluster()
+        try:
+            cluster.hosts = hosts
+            strategy = getattr(self.args, "nd_read_strategy", None) or environ.get("NDFC_PYTHON_READ_STRATEGY")
+            if strategy:
+                cluster.strategy = strategy
+        except (TypeError, ValueError) as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Invalid cluster setting. Error detail: {error}"
+            raise ValueError(msg) from error
+        cluster.probe()
+        self._cluster = cluster
+        # The address get_host() returns, e.g. for log messages.
+        self.sender.ip4 = hosts[0]
+        self.sender.cluster = cluster
+
+    def _rate_limit_setting(self, name: str, env_name: str, value_type: type):
+        """
+        Return the rate limit setting name from args, else from the
+        environment variable env_name converted to value_type, else None.
+
+        ## Raises
+        - ValueError if the environment variable cannot be converted.
+        """
+        method_name = "_rate_limit_setting"
+        value = getattr(self.args, name, None)
+        if value is not None:
+            return value
+        value = environ.get(env_name, "")
+        if value == "":
+            return None
+        if value_type is bool:
+            return value.lower() in ("1", "true", "yes")
+        try:
+            return value_type(value)
+        except ValueError as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{env_name} must be a {value_type.__name__}. Got {value}."
+            raise ValueError(msg) from error
+
+    def _set_rate_limiter(self) -> None:
+        """
+        If any rate limit setting is given, configure RateLimiter.shared()
+        for the controller and attach it to sender.
+
+        ## Raises
+        - ValueError if a setting is invalid.
+        """
+        method_name = "_set_rate_limiter"
+        settings = {
+            "rate": self._rate_limit_setting("rate_limit", "NDFC_PYTHON_RATE_LIMIT", float),
+            "burst": self._rate_limit_setting("rate_burst", "NDFC_PYTHON_RATE_BURST", int),
+            "max_in_flight": self._rate_limit_setting("max_in_flight", "NDFC_PYTHON_MAX_IN_FLIGHT", int),
+            "adaptive": self._rate_limit_setting("adaptive", "NDFC_PYTHON_ADAPTIVE", bool),
+        }
+        if not settings["rate"] and not settings["max_in_flight"] and not settings["adaptive"]:
+            return
+        rate_limiter = RateLimiter.shared(normalize_controller(self.nd_ip4))
+        try:
+            for name, value in settings.items():
+                if value is not None:
+                    setattr(rate_limiter, name, value)
+        except (TypeError, ValueError) as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Invalid rate limit setting. Error detail: {error}"
+            raise ValueError(msg) from error
+        self._rate_limiter = rate_limiter
+        self.sender.rate_limiter = rate_limiter
+
+    def _set_response_cache(self) -> None:
+        """
+        If NDFC_PYTHON_RESPONSE_CACHE is set, attach ResponseCache.shared()
+        for the controller to sender.
+
+        ## Raises
+        - ValueError if NDFC_PYTHON_RESPONSE_CACHE is not 0, 1 or a number of seconds.
+        """
+        method_name = "_set_response_cache"
+        value = environ.get("NDFC_PYTHON_RESPONSE_CACHE", "")
+        if value in ("", "0"):
+            return
+        response_cache = ResponseCache.shared(normalize_controller(self.nd_ip4))
+        if value != "1":
+            try:
+                response_cache.ttl = float(value)
+            except ValueError as error:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += "NDFC_PYTHON_RESPONSE_CACHE must be 0, 1 or a number of seconds. "
+                msg += f"Got {value}."
+                raise ValueError(msg) from error
+        self._response_cache = response_cache
+        self.sender.response_cache = response_cache
+
+    def _token_cache_from_environment(self) -> TokenCache | None:
+        """
+        Return a TokenCache if NDFC_PYTHON_TOKEN_CACHE is set, else None.
+        """
+        value = environ.get("NDFC_PYTHON_TOKEN_CACHE", "")
+        if value in ("", "0"):
+            return None
+        token_cache = TokenCache()
+        if value != "1":
+            token_cache.path = value
+        return token_cache
+
+    def _load_token(self) -> bool:
+        """
+        Log the sender in with a cached token and return True, or return
+        False if no valid token is cached.
+        """
+        method_name = "_load_token"
+        if self._token_cache_password and not self.token_cache.encrypted:
+            try:
+                self.token_cache.vault_password = self._token_cache_password
+            except ValueError as error:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += "Cached tokens will not be encrypted. "
+                msg += f"Error detail: {error}"
+                self.log.warning(msg)
+        entry = self.token_cache.get(normalize_controller(self.nd_ip4), self.nd_username, self.nd_domain)
+        if entry is None:
+            return False
+        self._cached_token = entry["jwttoken"]
+        self.sender.login_with_token(entry["jwttoken"], entry["rbac"])
+        msg = f"{self.class_name}.{method_name}: "
+        msg += "Reusing a cached token. Skipping login."
+        self.log.debug(msg)
+        return True
+
+    def _save_token(self, token) -> None:
+        """
+        Called by sender.token_manager with each new token.  Save token to
+        token_cache, unless it is already there.
+        """
+        if token == self._cached_token:
+            return
+        self._cached_token = token
+        self.token_cache.set(normalize_controller(self.nd_ip4), self.nd_username, self.nd_domain, token, self.sender.rbac)
+
     @property
     def nd_domain(self):
         """
@@ -228,6 +477,80 @@ class NdfcPythonSender:
     def login(self, value):
         self._login = value
 
+    @property
+    def cluster(self):
+        """
+        # Summary
+        The ControllerCluster attached to Sender() in commit(), or None if
+        nd_ip4 is a single address.
+        """
+        return self._cluster
+
+    @property
+    def rate_limiter(self):
+        """
+        # Summary
+        The RateLimiter attached to Sender() in commit(), or None if no
+        rate limit setting was given.
+        """
+        return self._rate_limiter
+
+    @property
+    def response_cache(self):
+        """
+        # Summary
+        The ResponseCache attached to Sender() in commit(), or None if
+        NDFC_PYTHON_RESPONSE_CACHE is not set.
+        """
+        return self._response_cache
+
+    @property
+    def session(self):
+        """
+        # Summary
+        The SenderSession (connection pool) attached to Sender() in commit().
+
+        # Raises
+        - TypeError if value is not a SenderSession instance.
+
+        # Default
+        SenderSession.shared()
+        """
+        return self._session
+
+    @session.setter
+    def session(self, value):
+        if not isinstance(value, SenderSession):
+            msg = f"{self.class_name}.session: "
+            msg += "session must be a SenderSession instance. "
+            msg += f"Got type {type(value).__name__}."
+            raise TypeError(msg)
+        self._session = value
+
+    @property
+    def token_cache(self):
+        """
+        # Summary
+        The TokenCache in which to look up and save login tokens, or None
+        to always log in.
+
+        # Raises
+        - TypeError if value is not a TokenCache instance or None.
+
+        # Default
+        A TokenCache() if NDFC_PYTHON_TOKEN_CACHE is set, else None.
+        """
+        return self._token_cache
+
+    @token_cache.setter
+    def token_cache(self, value):
+        if value is not None and not isinstance(value, TokenCache):
+            msg = f"{self.class_name}.token_cache: "
+            msg += "token_cache must be a TokenCache instance or None. "
+            msg += f"Got type {type(value).__name__}."
+            raise TypeError(msg)
+        self._token_cache = value
+
     @property
     def timeout(self):
         """
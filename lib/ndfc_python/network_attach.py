@@ -41,10 +41,10 @@ Send network attach POST requests to the controller
 # pylint: disable=wrong-import-order
 # pylint: disable=too-many-branches
 
-import inspect
 import logging
 
 from ndfc_python.common.fabric.fabric_inventory import FabricInventory
+from ndfc_python.common.fabric.fabric_overlay_index import FabricOverlayIndex
 from ndfc_python.common.fabric.fabrics_info import FabricsInfo
 from ndfc_python.common.properties import Properties
 from ndfc_python.validations import Validations
@@ -68,6 +68,7 @@ class NetworkAttach:
         self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
 
         self.fabrics_info = FabricsInfo()
+        self.overlay_index = FabricOverlayIndex()
         self.properties = Properties()
         self.rest_send = self.properties.rest_send
         self.results = self.properties.results
@@ -113,7 +114,7 @@ class NetworkAttach:
         """
         final verification of all parameters
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_final_verification"
         if self.rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.rest_send must be set before calling "
@@ -191,6 +192,7 @@ class NetworkAttach:
         Return False otherwise.
         """
         self.fabrics_info.rest_send = self.rest_send
+        self.fabrics_info.use_cache = True
         self.fabrics_info.commit()
         self.fabrics_info.filter = self.fabric_name
         return self.fabrics_info.fabric_exists
@@ -200,27 +202,15 @@ class NetworkAttach:
         Return True if networkName exists in the fabric.
         Else return False
         """
-        method_name = inspect.stack()[0][3]
-        # TODO: Update when we add endpoint to ansible-dcnm
-        path = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/top-down/fabrics"
-        path += f"/{self.fabric_name}/networks"
-        verb = "GET"
-
+        method_name = "network_name_exists_in_fabric"
+        self.overlay_index.rest_send = self.rest_send
+        self.overlay_index.fabric_name = self.fabric_name
         try:
-            self.rest_send.path = path
-            self.rest_send.verb = verb
-            self.rest_send.commit()
-        except (TypeError, ValueError) as error:
+            return self.overlay_index.network_name_exists(self.network_name)
+        except ValueError as error:
             msg = f"{self.class_name}.{method_name}: "
-            msg += f"Unable to send {self.rest_send.verb} request to the controller. "
-            msg += f"Error details: {error}"
+            msg += f"{error}"
             raise ValueError(msg) from error
-        for item in self.rest_send.response_current["DATA"]:
-            if "networkName" not in item:
-                continue
-            if item["networkName"] == self.network_name:
-                return True
-        return False
 
     def populate_fabric_inventory(self) -> None:
         """
@@ -233,7 +223,7 @@ class NetworkAttach:
         - ValueError: if FabricInventory raises
 
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "populate_fabric_inventory"
         try:
             self.fabric_inventory.fabric_name = self.fabric_name
             self.fabric_inventory.rest_send = self.rest_send
@@ -275,19 +265,26 @@ class NetworkAttach:
         _lan_attach_list_item["vlan"] = self.vlan
         return _lan_attach_list_item
 
-    def _build_payload(self) -> list[dict]:
+    def build_lan_attach_list(self) -> list[dict]:
         """
-        Build and return the payload for the API request
+        Build and return the lanAttachList items for switch_name and, if set,
+        peer_switch_name.  Used by NetworkAttachBulk to build multi-network
+        payloads.
         """
-        _payload = []
-        _payload_item = {}
-        _payload_item["networkName"] = self.network_name
         _lan_attach_list = []
         _lan_attach_list.append(self._build_lan_attach_list_item(self.switch_name))
         if self.peer_switch_name:
             _lan_attach_list.append(self._build_lan_attach_list_item(self.peer_switch_name))
+        return _lan_attach_list
 
-        _payload_item["lanAttachList"] = _lan_attach_list
+    def _build_payload(self) -> list[dict]:
+        """
+        Build and return the payload for the API request
+        """
+        _payload = []
+        _payload_item = {}
+        _payload_item["networkName"] = self.network_name
+        _payload_item["lanAttachList"] = self.build_lan_attach_list()
         _payload.append(_payload_item)
         return _payload
 
@@ -295,7 +292,7 @@ class NetworkAttach:
         """
         Attach a network to a switch
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         self.fabric_inventory.fabric_name = self.fabric_name
         self.fabric_inventory.rest_send = self.rest_send
         self.fabric_inventory.results = self.results
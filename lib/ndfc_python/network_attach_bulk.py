@@ -0,0 +1,402 @@
+"""
+# Name
+
+network_attach_bulk.py
+
+# Description
+
+Attach many networks, to many switches, with chunked multi-network
+POST requests to the controller.
+
+NetworkAttach sends one POST per network and switch (or vPC pair).
+NetworkAttachBulk validates an entire configuration up front, against the
+cached fabric list, fabric inventory and overlay index, then groups all
+attachments by fabric and network and sends them, through RestSend, in
+chunks of chunk_size networks per POST.
+
+# Payload Example
+
+```json
+[
+    {
+        "networkName": "net1",
+        "lanAttachList": [
+            {"fabric": "SITE1", "networkName": "net1", "serialNumber": "FDO1", "switchPorts": "Ethernet1/2", ...},
+            {"fabric": "SITE1", "networkName": "net1", "serialNumber": "FDO2", "switchPorts": "Ethernet1/2", ...}
+        ]
+    },
+    {
+        "networkName": "net2",
+        "lanAttachList": [...]
+    }
+]
+```
+"""
+
+# We are using isort for import sorting.
+# pylint: disable=wrong-import-order
+
+import logging
+
+from ndfc_python.common.fabric.fabric_inventory import FabricInventory
+from ndfc_python.common.fabric.fabric_overlay_index import FabricOverlayIndex
+from ndfc_python.common.fabric.fabrics_info import FabricsInfo
+from ndfc_python.common.properties import Properties
+from ndfc_python.network_attach import NetworkAttach
+from ndfc_python.validators.network_attach import NetworkAttachConfig
+
+
+class NetworkAttachBulk:
+    """
+    # Summary
+
+    Attach many networks in as few requests as possible.
+
+    ## Usage
+
+    ```python
+    instance = NetworkAttachBulk()
+    instance.rest_send = rest_send
+    instance.results = Results()
+    instance.config = validator.config  # list[NetworkAttachConfig]
+    instance.chunk_size = 50
+    instance.commit()
+    for item in instance.item_results:
+        print(item)
+    ```
+
+    ## Raises
+
+    - ValueError from commit() if rest_send or results is not set, or if
+      any config item fails validation.  All validation errors are
+      reported together and nothing is sent.
+
+    ## Properties
+
+    - chunk_size (int): getter/setter: maximum networks per POST.  Default 50.
+    - config (list[NetworkAttachConfig]): getter/setter: items to attach
+    - item_results (list[dict]): getter: one result per attachment, with
+      keys fabric_name, network_name, serial_number, switch_name,
+      success (bool) and message (str)
+    - responses (list[dict]): getter: controller response for each POST
+    - rest_send (RestSend): getter/setter: RestSend instance to use for REST calls
+    - results (Results): getter/setter: Results instance to manage controller responses
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
+
+        self.fabrics_info = FabricsInfo()
+        self.overlay_index = FabricOverlayIndex()
+        self.properties = Properties()
+        self.rest_send = self.properties.rest_send
+        self.results = self.properties.results
+
+        self.api_v1 = "/appcenter/cisco/ndfc/api/v1"
+        self.ep_fabrics = f"{self.api_v1}/lan-fabric/rest/top-down/fabrics"
+
+        self._chunk_size = 50
+        self._config = []
+        self._fabric_inventories = {}
+        self._item_results = []
+        self._responses = []
+
+    def _final_verification(self) -> None:
+        """
+        Verify that mandatory properties are set.
+        """
+        method_name = "_final_verification"
+        if self.rest_send is None:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{self.class_name}.rest_send must be set before calling "
+            msg += f"{self.class_name}.commit"
+            raise ValueError(msg)
+
+        if self.results is None:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{self.class_name}.results must be set before calling "
+            msg += f"{self.class_name}.commit"
+            raise ValueError(msg)
+
+    def fabric_inventory(self, fabric_name: str) -> FabricInventory:
+        """
+        Return the (cached) FabricInventory for fabric_name.
+        """
+        if fabric_name not in self._fabric_inventories:
+            instance = FabricInventory()
+            instance.fabric_name = fabric_name
+            instance.rest_send = self.rest_send
+            instance.results = self.results
+            instance.commit()
+            self._fabric_inventories[fabric_name] = instance
+        return self._fabric_inventories[fabric_name]
+
+    def _attach_instance(self, cfg: NetworkAttachConfig) -> NetworkAttach:
+        """
+        Return a NetworkAttach instance populated from cfg.  NetworkAttach
+        performs the same conversions (lists to strings, vlan validation)
+        as for a single attach.
+        """
+        instance = NetworkAttach()
+        instance.rest_send = self.rest_send
+        instance.results = self.results
+        instance.detach_switch_ports = cfg.detachSwitchPorts
+        instance.dot1q_vlan = cfg.dot1QVlan
+        instance.extension_values = cfg.extensionValues
+        instance.fabric_name = cfg.fabric
+        instance.freeform_config = cfg.freeformConfig
+        instance.instance_values = cfg.instanceValues
+        instance.network_name = cfg.networkName
+        instance.peer_switch_name = cfg.peer_switch_name
+        instance.switch_name = cfg.switch_name
+        instance.switch_ports = cfg.switchPorts
+        instance.tor_ports = cfg.torPorts
+        instance.untagged = cfg.untagged
+        instance.vlan = cfg.vlan
+        instance.fabric_inventory = self.fabric_inventory(cfg.fabric)
+        return instance
+
+    def _missing_fabrics(self) -> set[str]:
+        """
+        Return the fabric names in config that do not exist on the controller,
+        checking each distinct fabric once against the cached fabric list.
+        """
+        self.fabrics_info.rest_send = self.rest_send
+        self.fabrics_info.use_cache = True
+        self.fabrics_info.commit()
+        missing_fabrics = set()
+        for fabric_name in {cfg.fabric for cfg in self.config}:
+            self.fabrics_info.filter = fabric_name
+            if self.fabrics_info.fabric_exists is False:
+                missing_fabrics.add(fabric_name)
+        return missing_fabrics
+
+    def _verify_item(self, cfg: NetworkAttachConfig, missing_fabrics: set[str]) -> None:
+        """
+        Verify one config item against the fabrics missing from the
+        controller (missing_fabrics), the overlay index and the fabric
+        inventory.
+
+        ## Raises
+
+        - ValueError if the item is invalid.
+        """
+        if cfg.peer_switch_name == cfg.switch_name:
+            msg = f"peer_switch_name {cfg.peer_switch_name} must be different from switch_name {cfg.switch_name}."
+            raise ValueError(msg)
+
+        if cfg.fabric in missing_fabrics:
+            msg = f"fabric_name {cfg.fabric} does not exist on the controller."
+            raise ValueError(msg)
+
+        self.overlay_index.rest_send = self.rest_send
+        self.overlay_index.fabric_name = cfg.fabric
+        if self.overlay_index.network_name_exists(cfg.networkName) is False:
+            msg = f"networkName {cfg.networkName} does not exist in fabric {cfg.fabric}."
+            raise ValueError(msg)
+
+        fabric_inventory = self.fabric_inventory(cfg.fabric)
+        if cfg.switch_name not in fabric_inventory.inventory_by_switch_name:
+            msg = f"switch_name {cfg.switch_name} not found in fabric {cfg.fabric}."
+            raise ValueError(msg)
+
+        if cfg.peer_switch_name:
+            if cfg.peer_switch_name not in fabric_inventory.inventory_by_switch_name:
+                msg = f"peer_switch_name {cfg.peer_switch_name} not found in fabric {cfg.fabric}."
+                raise ValueError(msg)
+            if not fabric_inventory.is_vpc_peer(cfg.switch_name, cfg.peer_switch_name):
+                msg = f"switch_name {cfg.switch_name} and peer_switch_name {cfg.peer_switch_name} "
+                msg += "are not vPC peer switches."
+                raise ValueError(msg)
+
+    def _build_payloads(self) -> dict[str, list[dict]]:
+        """
+        # Summary
+
+        Validate every config item and return the payload items, grouped by
+        fabric and then by network.
+
+        ```python
+        {
+            "SITE1": [
+                {"networkName": "net1", "lanAttachList": [...]},
+                {"networkName": "net2", "lanAttachList": [...]},
+            ],
+        }
+        ```
+
+        ## Raises
+
+        - ValueError listing every invalid config item.
+        """
+        method_name = "_build_payloads"
+        errors = []
+        payloads: dict[str, dict[str, dict]] = {}
+        missing_fabrics = self._missing_fabrics()
+        for index, cfg in enumerate(self.config):
+            try:
+                self._verify_item(cfg, missing_fabrics)
+                lan_attach_list = self._attach_instance(cfg).build_lan_attach_list()
+            except ValueError as error:
+                errors.append(f"config[{index}] (fabric {cfg.fabric}, network {cfg.networkName}, switch {cfg.switch_name}): {error}")
+                continue
+            networks = payloads.setdefault(cfg.fabric, {})
+            if cfg.networkName not in networks:
+                networks[cfg.networkName] = {"networkName": cfg.networkName, "lanAttachList": []}
+            networks[cfg.networkName]["lanAttachList"].extend(lan_attach_list)
+
+        if errors:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{len(errors)} invalid config item(s). Nothing was sent. "
+            msg += "; ".join(errors)
+            raise ValueError(msg)
+
+        return {fabric_name: list(networks.values()) for fabric_name, networks in payloads.items()}
+
+    def _chunks(self, payload: list[dict]) -> list[list[dict]]:
+        """
+        Split payload into lists of at most chunk_size networks.
+        """
+        return [payload[index : index + self.chunk_size] for index in range(0, len(payload), self.chunk_size)]
+
+    def _send_chunk(self, fabric_name: str, chunk: list[dict]) -> dict:
+        """
+        POST one chunk to the attachments endpoint for fabric_name and
+        return the controller response.
+        """
+        method_name = "_send_chunk"
+        path = f"{self.ep_fabrics}/{fabric_name}/networks/attachments"
+        verb = "POST"
+
+        try:
+            self.rest_send.path = path
+            self.rest_send.verb = verb
+            self.rest_send.payload = chunk
+            self.rest_send.commit()
+        except (TypeError, ValueError) as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Unable to send {verb} request to the controller. "
+            msg += f"Error details: {error}"
+            raise ValueError(msg) from error
+        return self.rest_send.response_current
+
+    def _record_results(self, fabric_name: str, chunk: list[dict], response: dict | None, error: str = "") -> None:
+        """
+        Append one item_results entry per lanAttachList item in chunk.
+
+        The controller response DATA is keyed on
+        "{networkName}-[{serialNumber}/{switchName}]" with value "SUCCESS"
+        or an error message.
+        """
+        data = {}
+        return_code = None
+        if response is not None:
+            return_code = response.get("RETURN_CODE")
+            if isinstance(response.get("DATA"), dict):
+                data = response["DATA"]
+        messages = {}
+        for key, value in data.items():
+            network_name, _, switch = key.rpartition("-[")
+            messages[(network_name, switch.split("/")[0])] = str(value)
+        for network in chunk:
+            for attach in network["lanAttachList"]:
+                serial_number = attach["serialNumber"]
+                message = messages.get((network["networkName"], serial_number))
+                if error:
+                    success = False
+                    message = error
+                elif message is None:
+                    success = return_code in (200, 201)
+                    message = "" if success else str(data.get("message", response))
+                else:
+                    success = "SUCCESS" in message
+                result = {}
+                result["fabric_name"] = fabric_name
+                result["network_name"] = network["networkName"]
+                result["serial_number"] = serial_number
+                result["switch_name"] = self.fabric_inventory(fabric_name).serial_number_to_switch_name(serial_number)
+                result["success"] = success
+                result["message"] = message
+                self._item_results.append(result)
+
+    def commit(self) -> None:
+        """
+        # Summary
+
+        Validate the whole config, then attach all networks with chunked
+        multi-network POST requests.
+
+        A failed chunk does not stop the remaining chunks.  Check
+        item_results for the outcome of each attachment.
+
+        ## Raises
+
+        - ValueError if mandatory properties are not set, or any config
+          item is invalid.
+        """
+        self._final_verification()
+        self._item_results = []
+        self._responses = []
+        payloads = self._build_payloads()
+        for fabric_name, payload in payloads.items():
+            for chunk in self._chunks(payload):
+                msg = f"{self.class_name}.commit: fabric {fabric_name}, "
+                msg += f"sending {len(chunk)} networks, "
+                msg += f"{sum(len(network['lanAttachList']) for network in chunk)} attachments."
+                self.log.debug(msg)
+                try:
+                    response = self._send_chunk(fabric_name, chunk)
+                except ValueError as error:
+                    self._record_results(fabric_name, chunk, None, str(error))
+                    continue
+                self._responses.append(response)
+                self._record_results(fabric_name, chunk, response)
+
+    @property
+    def chunk_size(self) -> int:
+        """
+        Maximum number of networks per POST request.
+        """
+        return self._chunk_size
+
+    @chunk_size.setter
+    def chunk_size(self, value: int) -> None:
+        if isinstance(value, bool) or not isinstance(value, int):
+            msg = f"{self.class_name}.chunk_size: "
+            msg += f"chunk_size must be an int. Got {type(value).__name__}."
+            raise TypeError(msg)
+        if value < 1:
+            msg = f"{self.class_name}.chunk_size: "
+            msg += f"chunk_size must be >= 1. Got {value}."
+            raise ValueError(msg)
+        self._chunk_size = value
+
+    @property
+    def config(self) -> list[NetworkAttachConfig]:
+        """
+        The list of network attach config items.
+        """
+        return self._config
+
+    @config.setter
+    def config(self, value: list[NetworkAttachConfig]) -> None:
+        if not isinstance(value, list):
+            msg = f"{self.class_name}.config: "
+            msg += f"config must be a list of NetworkAttachConfig. Got {type(value).__name__}."
+            raise TypeError(msg)
+        self._config = value
+
+    @property
+    def item_results(self) -> list[dict]:
+        """
+        One result dictionary per attachment, populated by commit().
+        """
+        return self._item_results
+
+    @property
+    def responses(self) -> list[dict]:
+        """
+        The controller response for each POST, populated by commit().
+        """
+        return self._responses
@@ -61,11 +61,12 @@ Send network create POST requests to the controller
 # We are using isort for import sorting.
 # pylint: disable=wrong-import-order
 
-import inspect
+import copy
 import json
 import logging
 from ipaddress import AddressValueError, IPv4Interface
 
+from ndfc_python.common.fabric.fabric_overlay_index import FabricOverlayIndex
 from ndfc_python.common.fabric.fabrics_info import FabricsInfo
 from ndfc_python.common.properties import Properties
 from ndfc_python.validations import Validations
@@ -89,6 +90,7 @@ class NetworkCreate:
         self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
 
         self.fabrics_info = FabricsInfo()
+        self.overlay_index = FabricOverlayIndex()
         self.properties = Properties()
         self.validations = Validations()
 
@@ -240,7 +242,7 @@ class NetworkCreate:
 
         3. Any other fixup that may be required
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_preprocess_payload"
         # if source is null, NDFC complains if it's present
         if self.source == "":
             self.payload.pop("source", None)
@@ -320,7 +322,7 @@ class NetworkCreate:
         is used in _final_verification to provide the user with the correct
         property to call if there's a missing mandatory payload property.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_map_payload_param"
         if param not in self._payload_mapping_dict:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"param {param} not in _payload_mapping_dict"
@@ -336,7 +338,7 @@ class NetworkCreate:
         is used in _final_verification to provide the user with the correct
         property to call if there's a missing mandatory template_config property.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_map_template_config_param"
         if param not in self._template_config_mapping_dict:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"param {param} not in "
@@ -345,17 +347,14 @@ class NetworkCreate:
             return param
         return self._template_config_mapping_dict[param]
 
-    def _final_verification(self):
-        """
-        final verification of all parameters
+    def _verify_mandatory_parameters(self):
         """
-        method_name = inspect.stack()[0][3]
-        if self.rest_send is None:
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"{self.class_name}.rest_send must be set before calling "
-            msg += f"{self.class_name}.commit"
-            raise ValueError(msg)
+        Verify that all mandatory payload and template_config
+        parameters are set.
 
+        Raise ValueError if a mandatory parameter is not set.
+        """
+        method_name = "_verify_mandatory_parameters"
         for param in self._payload_set_mandatory:
             if self.payload.get(param) == "" or self.payload.get(param) is None:
                 msg = f"{self.class_name}.{method_name}: "
@@ -371,6 +370,34 @@ class NetworkCreate:
                 msg += f"before calling {self.class_name}.commit"
                 raise ValueError(msg)
 
+    def build_payload(self) -> dict:
+        """
+        Preprocess and verify the mandatory parameters, then return a copy
+        of the network create payload, with networkTemplateConfig serialized,
+        without contacting the controller.
+
+        Used by NetworkCreateBulk, which verifies the fabric, VRF and network
+        against the cached fabric list and overlay index itself.
+        """
+        self._preprocess_payload()
+        self._verify_mandatory_parameters()
+        payload = copy.deepcopy(self.payload)
+        payload["networkTemplateConfig"] = json.dumps(self.template_config)
+        return payload
+
+    def _final_verification(self):
+        """
+        final verification of all parameters
+        """
+        method_name = "_final_verification"
+        if self.rest_send is None:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{self.class_name}.rest_send must be set before calling "
+            msg += f"{self.class_name}.commit"
+            raise ValueError(msg)
+
+        self._verify_mandatory_parameters()
+
         if not self.fabric_exists():
             msg = f"{self.class_name}.{method_name}: "
             msg += f"fabric_name {self.fabric_name} "
@@ -397,6 +424,7 @@ class NetworkCreate:
         Return False otherwise.
         """
         self.fabrics_info.rest_send = self.rest_send
+        self.fabrics_info.use_cache = True
         self.fabrics_info.commit()
         self.fabrics_info.filter = self.fabric_name
         return self.fabrics_info.fabric_exists
@@ -406,93 +434,51 @@ class NetworkCreate:
         Return True if self.vrf_name exists in self.fabric_name.
         Else, return False
         """
-        method_name = inspect.stack()[0][3]
-        # TODO: update when this path is added to ansible-dcnm
-        path = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/top-down/fabrics"
-        path += f"/{self.fabric_name}/vrfs"
-        verb = "GET"
-
+        method_name = "vrf_exists_in_fabric"
+        self.overlay_index.rest_send = self.rest_send
+        self.overlay_index.fabric_name = self.fabric_name
         try:
-            self.rest_send.path = path
-            self.rest_send.verb = verb
-            self.rest_send.commit()
-        except (TypeError, ValueError) as error:
+            return self.overlay_index.vrf_name_exists(self.vrf_name)
+        except ValueError as error:
             msg = f"{self.class_name}.{method_name}: "
-            msg += f"Unable to send {self.rest_send.verb} request to the controller. "
-            msg += f"Error details: {error}"
+            msg += f"{error}"
             raise ValueError(msg) from error
 
-        for item_d in self.rest_send.response_current["DATA"]:
-            if "fabric" not in item_d:
-                continue
-            if "vrfName" not in item_d:
-                continue
-            if item_d["fabric"] != self.fabric_name:
-                continue
-            if item_d["vrfName"] != self.vrf_name:
-                continue
-            return True
-        return False
-
     def network_id_exists_in_fabric(self):
         """
         Return True if networkId is present in the fabric
         Else, return False
         """
-        method_name = inspect.stack()[0][3]
-        # TODO: Update when we add endpoint to ansible-dcnm
-        path = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/top-down/fabrics"
-        path += f"/{self.fabric_name}/networks"
-        verb = "GET"
+        method_name = "network_id_exists_in_fabric"
+        self.overlay_index.rest_send = self.rest_send
+        self.overlay_index.fabric_name = self.fabric_name
         try:
-            self.rest_send.path = path
-            self.rest_send.verb = verb
-            self.rest_send.commit()
-        except (TypeError, ValueError) as error:
+            return self.overlay_index.network_id_exists(self.network_id)
+        except ValueError as error:
             msg = f"{self.class_name}.{method_name}: "
-            msg += f"Unable to send {self.rest_send.verb} request to the controller. "
-            msg += f"Error details: {error}"
+            msg += f"{error}"
             raise ValueError(msg) from error
 
-        for item in self.rest_send.response_current["DATA"]:
-            if "networkId" not in item:
-                continue
-            if item["networkId"] == self.network_id:
-                return True
-        return False
-
     def network_name_exists_in_fabric(self):
         """
         Return True if networkName exists in the fabric.
         Else return False
         """
-        method_name = inspect.stack()[0][3]
-        # TODO: Update when we add endpoint to ansible-dcnm
-        path = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/top-down/fabrics"
-        path += f"/{self.fabric_name}/networks"
-        verb = "GET"
-
+        method_name = "network_name_exists_in_fabric"
+        self.overlay_index.rest_send = self.rest_send
+        self.overlay_index.fabric_name = self.fabric_name
         try:
-            self.rest_send.path = path
-            self.rest_send.verb = verb
-            self.rest_send.commit()
-        except (TypeError, ValueError) as error:
+            return self.overlay_index.network_name_exists(self.network_name)
+        except ValueError as error:
             msg = f"{self.class_name}.{method_name}: "
-            msg += f"Unable to send {self.rest_send.verb} request to the controller. "
-            msg += f"Error details: {error}"
+            msg += f"{error}"
             raise ValueError(msg) from error
-        for item in self.rest_send.response_current["DATA"]:
-            if "networkName" not in item:
-                continue
-            if item["networkName"] == self.network_name:
-                return True
-        return False
 
     def commit(self):
         """
         Create a network
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         self._preprocess_payload()
         self._final_verification()
 
@@ -513,6 +499,9 @@ class NetworkCreate:
             msg += f"Error details: {error}"
             raise ValueError(msg) from error
 
+        if self.rest_send.result_current.get("success") is not False:
+            self.overlay_index.add_network(self.payload)
+
     # top_level payload properties
     @property
     def display_name(self):
@@ -656,7 +645,7 @@ class NetworkCreate:
 
     @enable_l3_on_border.setter
     def enable_l3_on_border(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "enable_l3_on_border"
         try:
             self.validations.verify_boolean(value)
         except TypeError as error:
@@ -674,7 +663,7 @@ class NetworkCreate:
 
     @enable_l3_on_border_vpc_bgw.setter
     def enable_l3_on_border_vpc_bgw(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "enable_l3_on_border_vpc_bgw"
         try:
             self.validations.verify_boolean(value)
         except TypeError as error:
@@ -725,7 +714,7 @@ class NetworkCreate:
 
     @igmp_version.setter
     def igmp_version(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "igmp_version"
         if value not in self.validations.valid_igmp_versions:
             msg = f"{self.class_name}.{method_name}: "
             msg += "Invalid igmp_version.  Expected one of "
@@ -753,7 +742,7 @@ class NetworkCreate:
 
     @is_layer2_only.setter
     def is_layer2_only(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "is_layer2_only"
         try:
             self.validations.verify_boolean(value)
         except TypeError as error:
@@ -783,7 +772,7 @@ class NetworkCreate:
 
     @mcast_group.setter
     def mcast_group(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "mcast_group"
         try:
             self.validations.verify_ipv4_multicast_address(value)
         except AddressValueError as error:
@@ -801,7 +790,7 @@ class NetworkCreate:
 
     @mtu.setter
     def mtu(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "mtu"
         try:
             self.validations.verify_mtu(value)
         except ValueError as error:
@@ -823,7 +812,7 @@ class NetworkCreate:
 
     @nve_id.setter
     def nve_id(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "nve_id"
         try:
             self.validations.verify_nve_id(value)
         except ValueError as error:
@@ -841,7 +830,7 @@ class NetworkCreate:
 
     @rt_both_auto.setter
     def rt_both_auto(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "rt_both_auto"
         try:
             self.validations.verify_boolean(value)
         except TypeError as error:
@@ -859,7 +848,7 @@ class NetworkCreate:
 
     @secondary_gw_1.setter
     def secondary_gw_1(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "secondary_gw_1"
         try:
             self.validations.verify_ipv4_address_with_prefix(value)
         except AddressValueError as error:
@@ -877,7 +866,7 @@ class NetworkCreate:
 
     @secondary_gw_2.setter
     def secondary_gw_2(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "secondary_gw_2"
         try:
             self.validations.verify_ipv4_address_with_prefix(value)
         except AddressValueError as error:
@@ -895,7 +884,7 @@ class NetworkCreate:
 
     @secondary_gw_3.setter
     def secondary_gw_3(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "secondary_gw_3"
         try:
             self.validations.verify_ipv4_address_with_prefix(value)
         except AddressValueError as error:
@@ -913,7 +902,7 @@ class NetworkCreate:
 
     @secondary_gw_4.setter
     def secondary_gw_4(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "secondary_gw_4"
         try:
             self.validations.verify_ipv4_address_with_prefix(value)
         except AddressValueError as error:
@@ -943,7 +932,7 @@ class NetworkCreate:
 
     @suppress_arp.setter
     def suppress_arp(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "suppress_arp"
         try:
             self.validations.verify_boolean(value)
         except TypeError as error:
@@ -984,7 +973,7 @@ class NetworkCreate:
 
     @trm_enabled.setter
     def trm_enabled(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "trm_enabled"
         try:
             self.validations.verify_boolean(value)
         except TypeError as error:
@@ -1002,7 +991,7 @@ class NetworkCreate:
 
     @trm_v6_enabled.setter
     def trm_v6_enabled(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "trm_v6_enabled"
         try:
             self.validations.verify_boolean(value)
         except TypeError as error:
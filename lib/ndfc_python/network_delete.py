@@ -12,9 +12,9 @@ Send network delete DELETE requests to the controller
 # We are using isort for import sorting.
 # pylint: disable=wrong-import-order
 
-import inspect
 import logging
 
+from ndfc_python.common.fabric.fabric_overlay_index import FabricOverlayIndex
 from ndfc_python.common.fabric.fabrics_info import FabricsInfo
 from ndfc_python.common.properties import Properties
 
@@ -37,6 +37,7 @@ class NetworkDelete:
         self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
 
         self.fabrics_info = FabricsInfo()
+        self.overlay_index = FabricOverlayIndex()
         self.properties = Properties()
         self.rest_send = self.properties.rest_send
 
@@ -47,7 +48,7 @@ class NetworkDelete:
         """
         final verification of all parameters
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_final_verification"
         if self.rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.rest_send must be set before calling "
@@ -87,6 +88,7 @@ class NetworkDelete:
         Return False otherwise.
         """
         self.fabrics_info.rest_send = self.rest_send
+        self.fabrics_info.use_cache = True
         self.fabrics_info.commit()
         self.fabrics_info.filter = self.fabric_name
         return self.fabrics_info.fabric_exists
@@ -96,7 +98,7 @@ class NetworkDelete:
         Return True if network_name exists in fabric_name and its status is not DEPLOYED.
         Return False otherwise.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "ok_to_delete_network"
         # TODO: Update when we add endpoint to ansible-dcnm
         path = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/top-down/fabrics"
         path += f"/{self.fabric_name}/networks"
@@ -134,7 +136,7 @@ class NetworkDelete:
         """
         Delete a network
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         self._final_verification()
 
         # TODO: Update when we add endpoint to ansible-dcnm
@@ -156,6 +158,11 @@ class NetworkDelete:
             msg += f"Error details: {error}"
             raise ValueError(msg) from error
 
+        if self.rest_send.result_current.get("success") is not False:
+            self.overlay_index.rest_send = self.rest_send
+            self.overlay_index.fabric_name = self.fabric_name
+            self.overlay_index.remove_network(self.network_name)
+
     # top_level properties
     @property
     def fabric_name(self):
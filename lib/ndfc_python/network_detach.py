@@ -33,10 +33,10 @@ network detach operation is determined by lanAttachList[x].deployment == false
 # We are using isort for import sorting.
 # pylint: disable=wrong-import-order
 
-import inspect
 import logging
 
 from ndfc_python.common.fabric.fabric_inventory import FabricInventory
+from ndfc_python.common.fabric.fabric_overlay_index import FabricOverlayIndex
 from ndfc_python.common.fabric.fabrics_info import FabricsInfo
 from ndfc_python.common.properties import Properties
 from ndfc_python.validations import Validations
@@ -60,6 +60,7 @@ class NetworkDetach:
         self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
 
         self.fabrics_info = FabricsInfo()
+        self.overlay_index = FabricOverlayIndex()
         self.properties = Properties()
         self.rest_send = self.properties.rest_send
         self.results = self.properties.results
@@ -88,7 +89,7 @@ class NetworkDetach:
         """
         final verification of all parameters
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_final_verification"
         if self.rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.rest_send must be set before calling "
@@ -143,6 +144,7 @@ class NetworkDetach:
         Return False otherwise.
         """
         self.fabrics_info.rest_send = self.rest_send
+        self.fabrics_info.use_cache = True
         self.fabrics_info.commit()
         self.fabrics_info.filter = self.fabric_name
         return self.fabrics_info.fabric_exists
@@ -152,33 +154,21 @@ class NetworkDetach:
         Return True if networkName exists in the fabric.
         Else return False
         """
-        method_name = inspect.stack()[0][3]
-        # TODO: Update when we add endpoint to ansible-dcnm
-        path = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/top-down/fabrics"
-        path += f"/{self.fabric_name}/networks"
-        verb = "GET"
-
+        method_name = "network_name_exists_in_fabric"
+        self.overlay_index.rest_send = self.rest_send
+        self.overlay_index.fabric_name = self.fabric_name
         try:
-            self.rest_send.path = path
-            self.rest_send.verb = verb
-            self.rest_send.commit()
-        except (TypeError, ValueError) as error:
+            return self.overlay_index.network_name_exists(self.network_name)
+        except ValueError as error:
             msg = f"{self.class_name}.{method_name}: "
-            msg += f"Unable to send {self.rest_send.verb} request to the controller. "
-            msg += f"Error details: {error}"
+            msg += f"{error}"
             raise ValueError(msg) from error
-        for item in self.rest_send.response_current["DATA"]:
-            if "networkName" not in item:
-                continue
-            if item["networkName"] == self.network_name:
-                return True
-        return False
 
     def _build_lan_attach_list_item(self, switch_name: str) -> dict:
         """
         Build and return a lanAttachList item for the given switch_name
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_build_lan_attach_list_item"
         _lan_attach_list_item = {}
         _lan_attach_list_item["deployment"] = False
         _lan_attach_list_item["detachSwitchPorts"] = self.detach_switch_ports
@@ -214,7 +204,7 @@ class NetworkDetach:
         """
         Detach a network from a switch
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         self.fabric_inventory.fabric_name = self.fabric_name
         self.fabric_inventory.rest_send = self.rest_send
         self.fabric_inventory.results = self.results
@@ -17,11 +17,12 @@ Path: /appcenter/cisco/ndfc/api/v1/lan-fabric/rest/top-down/fabrics/{{fabric_nam
 # We are using isort for import sorting.
 # pylint: disable=wrong-import-order
 
-import inspect
 import logging
+from collections.abc import Iterator
 
 from ndfc_python.common.fabric.fabrics_info import FabricsInfo
 from ndfc_python.common.properties import Properties
+from ndfc_python.json_stream import iter_response_items
 from ndfc_python.validations import Validations
 
 
@@ -47,7 +48,7 @@ class NetworkInfoEndpoint:
         """
         final verification of all parameters
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_final_verification"
         if not self.fabric_name:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.fabric_name must be set before calling "
@@ -106,6 +107,9 @@ class NetworkInfo:
 
     Get network information
 
+    Use commit() and response to retrieve one network, or iter_networks()
+    to process every network in a fabric one at a time as they arrive.
+
     ## Example network info request
 
     ### See
@@ -126,12 +130,13 @@ class NetworkInfo:
 
         self._fabric_name = ""
         self._network_name = ""
+        self._response = {}
 
     def _final_verification(self) -> None:
         """
         final verification of all parameters
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_final_verification"
         if self.rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.rest_send must be set before calling "
@@ -156,6 +161,7 @@ class NetworkInfo:
         Return False otherwise.
         """
         self.fabrics_info.rest_send = self.rest_send
+        self.fabrics_info.use_cache = True
         self.fabrics_info.commit()
         self.fabrics_info.filter = self.fabric_name
         return self.fabrics_info.fabric_exists
@@ -165,7 +171,7 @@ class NetworkInfo:
         Return True if networkName exists in the fabric.
         Else return False
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "network_name_exists_in_fabric"
         # TODO: Update when we add endpoint to ansible-dcnm
         path = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/top-down/fabrics"
         path += f"/{self.fabric_name}/networks"
@@ -191,7 +197,7 @@ class NetworkInfo:
         """
         Retrieve network information from the controller.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         self._final_verification()
 
         self.endpoint.fabric_name = self.fabric_name
@@ -209,6 +215,79 @@ class NetworkInfo:
             msg += f"Unable to send {self.rest_send.verb} request to the controller. "
             msg += f"Error details: {error}"
             raise ValueError(msg) from error
+        self._response = self.rest_send.response_current
+
+    def iter_networks(self) -> Iterator[dict]:
+        """
+        # Summary
+
+        Yield every network in fabric_name one at a time, as they are
+        received from the controller.  network_name is not used.
+
+        Peak memory is independent of the number of networks in the fabric.
+
+        ## Raises
+
+        - ValueError if fabric_name does not exist, or the request fails.
+        """
+        method_name = "iter_networks"
+        if self.rest_send is None:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{self.class_name}.rest_send must be set before calling "
+            msg += f"{self.class_name}.{method_name}"
+            raise ValueError(msg)
+
+        if self.fabric_exists() is False:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"fabric_name {self.fabric_name} "
+            msg += "does not exist on the controller."
+            raise ValueError(msg)
+
+        path = f"{self.endpoint.ep_fabrics}/{self.fabric_name}/networks"
+        try:
+            yield from iter_response_items(self.rest_send, path)
+        except (TypeError, ValueError) as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Unable to retrieve networks for fabric {self.fabric_name}. "
+            msg += f"Error details: {error}"
+            raise ValueError(msg) from error
+
+    async def commit_async(self, sender) -> None:
+        """
+        # Summary
+
+        Same as commit(), but send the request with an AsyncSender instead
+        of rest_send.  Use with AsyncSender.gather() to retrieve many
+        networks concurrently.
+
+        The fabric and network existence checks are skipped; the
+        controller response for an unknown fabric or network is returned
+        in response.
+
+        ## Raises
+
+        - ValueError if fabric_name or network_name is not set, or the request fails.
+        """
+        method_name = "commit_async"
+        endpoint = NetworkInfoEndpoint()
+        endpoint.fabric_name = self.fabric_name
+        endpoint.network_name = self.network_name
+        endpoint._final_verification()  # pylint: disable=protected-access
+        endpoint.commit()
+        try:
+            self._response = await sender.request(endpoint.verb, endpoint.path)
+        except (TypeError, ValueError) as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Unable to send {endpoint.verb} request to the controller. "
+            msg += f"Error details: {error}"
+            raise ValueError(msg) from error
+
+    @property
+    def response(self) -> dict:
+        """
+        Return the controller response from the most recent commit() or commit_async()
+        """
+        return self._response
 
     @property
     def fabric_name(self) -> str:
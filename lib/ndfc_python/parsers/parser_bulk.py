@@ -0,0 +1,18 @@
+import argparse
+
+parser_help_bulk = "Send all config items in chunked multi-item requests "
+parser_help_bulk += "rather than one request per item. "
+parser_help_bulk += "The whole config is validated before anything is sent."
+
+parser_help_chunk_size = "With --bulk, the maximum number of items per request. "
+parser_help_chunk_size += "Default: 50"
+
+parser_help_max_workers = "With --bulk, for scripts whose endpoint accepts one item per request "
+parser_help_max_workers += "(e.g. network and vrf create), the maximum number of requests in flight. "
+parser_help_max_workers += "Default: 8"
+
+parser_bulk = argparse.ArgumentParser(add_help=False)
+optional = parser_bulk.add_argument_group(title="OPTIONAL ARGS")
+optional.add_argument("--bulk", dest="bulk", action="store_true", required=False, default=False, help=f"{parser_help_bulk}")
+optional.add_argument("--chunk-size", dest="chunk_size", type=int, required=False, default=50, help=f"{parser_help_chunk_size}")
+optional.add_argument("--max-workers", dest="max_workers", type=int, required=False, default=8, help=f"{parser_help_max_workers}")
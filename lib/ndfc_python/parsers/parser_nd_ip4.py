@@ -1,9 +1,22 @@
 import argparse
 
 parser_help = "IPv4 address for the Nexus Dashboard controller. "
+parser_help += "For a cluster, a comma-separated list of the node addresses. "
 parser_help += "If missing, the environment variable ND_IP4 "
 parser_help += "or Ansible Vault is used."
 
+parser_help_read_strategy = "With a list of addresses in --nd-ip4, how reads are distributed across the nodes. "
+parser_help_read_strategy += "Writes go to one node while it is reachable. "
+parser_help_read_strategy += "If missing, the environment variable NDFC_PYTHON_READ_STRATEGY is used. "
+parser_help_read_strategy += "Default: round_robin"
+
 parser_nd_ip4 = argparse.ArgumentParser(add_help=False)
 optional = parser_nd_ip4.add_argument_group(title="OPTIONAL ARGS")
 optional.add_argument("--nd-ip4", dest="nd_ip4", required=False, help=f"{parser_help}")
+optional.add_argument(
+    "--nd-read-strategy",
+    dest="nd_read_strategy",
+    choices=["round_robin", "least_latency"],
+    required=False,
+    help=f"{parser_help_read_strategy}",
+)
@@ -0,0 +1,27 @@
+import argparse
+
+parser_help_rate_limit = "Maximum requests per second sent to the controller, "
+parser_help_rate_limit += "shared by every request in the process. "
+parser_help_rate_limit += "If missing, the environment variable NDFC_PYTHON_RATE_LIMIT is used. "
+parser_help_rate_limit += "Default: 0 (unlimited)"
+
+parser_help_rate_burst = "With --rate-limit, the number of requests that can be sent at once "
+parser_help_rate_burst += "after an idle period. "
+parser_help_rate_burst += "If missing, the environment variable NDFC_PYTHON_RATE_BURST is used. "
+parser_help_rate_burst += "Default: the rate limit, rounded up"
+
+parser_help_max_in_flight = "Maximum requests awaiting a response from the controller, "
+parser_help_max_in_flight += "shared by every request in the process. "
+parser_help_max_in_flight += "If missing, the environment variable NDFC_PYTHON_MAX_IN_FLIGHT is used. "
+parser_help_max_in_flight += "Default: 0 (unlimited)"
+
+parser_help_adaptive = "Adapt the in-flight limit to the controller: halve it when latency, "
+parser_help_adaptive += "or the rate of 429 and 503 responses, rises, and raise it again when they fall. "
+parser_help_adaptive += "If missing, the environment variable NDFC_PYTHON_ADAPTIVE (1 to enable) is used."
+
+parser_rate_limit = argparse.ArgumentParser(add_help=False)
+optional = parser_rate_limit.add_argument_group(title="OPTIONAL ARGS")
+optional.add_argument("--rate-limit", dest="rate_limit", type=float, required=False, help=f"{parser_help_rate_limit}")
+optional.add_argument("--rate-burst", dest="rate_burst", type=int, required=False, help=f"{parser_help_rate_burst}")
+optional.add_argument("--max-in-flight", dest="max_in_flight", type=int, required=False, help=f"{parser_help_max_in_flight}")
+optional.add_argument("--adaptive", dest="adaptive", action="store_true", required=False, default=None, help=f"{parser_help_adaptive}")
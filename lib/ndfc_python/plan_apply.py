@@ -0,0 +1,575 @@
+"""
+# Name
+
+plan_apply.py
+
+# Description
+
+Bring the controller to the desired state in one YAML file: create VRFs
+and networks, attach them to switches, then Config Save and Config Deploy,
+in dependency order, running independent steps concurrently.
+
+PlanApply.plan() turns a PlanConfig (see validators/plan.py) into a
+directed acyclic graph of PlanNode.  Each node is one operation (kind) on
+one fabric and carries all the items of that kind for that fabric, so
+same-type operations are batched: each node runs once, through
+VrfCreateBulk, NetworkCreateBulk, VrfAttachBulk, NetworkAttachBulk,
+ConfigSave or ConfigDeploy.
+
+VRFs and networks that already exist on the controller (per
+FabricOverlayIndex) are left out of the plan.  Nodes with nothing left to
+do are dropped.
+
+## Dependencies
+
+- network-create depends on each vrf-create node that creates one of its VRFs
+- vrf-attach depends on each vrf-create node that creates one of its VRFs
+- network-attach depends on each network-create node that creates one of
+  its networks, and on vrf-attach for the same fabric
+- config-save depends on every create and attach node.  Config Save nodes
+  run in the order they are listed (e.g. child fabrics before their MSD
+  fabric), one at a time.
+- config-deploy depends on every config-save node.  Config Deploy nodes
+  run in the order they are listed, one at a time.
+
+VRFs and networks in a multi-site domain are created in the MSD fabric and
+attached in its child fabrics, so create/attach dependencies follow the
+VRF and network names rather than the fabric name.
+
+PlanApply.apply() runs every node whose dependencies have succeeded, at
+most max_parallel nodes at a time, each with its own RestSend on the one
+shared Sender (one login, one connection pool).  If a node fails, the
+nodes that depend on it are skipped; independent nodes still run.
+
+## Example desired state
+
+```yaml
+---
+config:
+  vrfs:
+    - fabric_name: MSD
+      vrf_display_name: v1
+      vrf_id: 50001
+      vrf_name: v1
+      vrf_vlan_id: 3001
+  networks:
+    - fabric_name: MSD
+      network_name: n1
+      ...
+  vrf_attachments:
+    - fabric_name: SITE1
+      switch_name: LE1
+      vrf_name: v1
+  network_attachments:
+    - fabric_name: SITE1
+      network_name: n1
+      switch_name: LE1
+  config_save:
+    - fabric_name: SITE1
+    - fabric_name: MSD
+  config_deploy:
+    - fabric_name: SITE1
+    - fabric_name: MSD
+```
+"""
+
+# We are using isort for import sorting.
+# pylint: disable=wrong-import-order,import-outside-toplevel
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from ndfc_python.common.fabric.fabric_overlay_index import FabricOverlayIndex
+from ndfc_python.common.properties import Properties
+from ndfc_python.validators.plan import PlanConfig
+
+# Node kinds, in the order they run for one fabric.
+KINDS = ("vrf-create", "network-create", "vrf-attach", "network-attach", "config-save", "config-deploy")
+
+
+class PlanNode:
+    """
+    # Summary
+
+    One step of a plan: one operation (kind) on the items of one fabric.
+
+    ## Attributes
+
+    - depends_on (list[PlanNode]): nodes that must succeed before this one runs
+    - fabric_name (str): the fabric the operation applies to
+    - item_results (list[dict]): per-item results, from the Bulk class, after the node runs
+    - items (list): validated config items (VrfCreateConfig, etc.).  Empty for config-save and config-deploy.
+    - kind (str): one of KINDS
+    - message (str): error detail if the node failed or was skipped
+    - status (str): pending, running, succeeded, failed or skipped
+    - unchanged (list[str]): names of items left out because they already exist
+    """
+
+    def __init__(self, kind: str, fabric_name: str) -> None:
+        self.kind = kind
+        self.fabric_name = fabric_name
+        self.depends_on: list[PlanNode] = []
+        self.item_results: list[dict] = []
+        self.items: list = []
+        self.message = ""
+        self.status = "pending"
+        self.unchanged: list[str] = []
+
+    @property
+    def name(self) -> str:
+        """
+        The node name, e.g. "vrf-create MSD".
+        """
+        return f"{self.kind} {self.fabric_name}"
+
+    def describe_items(self) -> list[str]:
+        """
+        Return a short description of each item, for printing the plan.
+        """
+        if self.kind == "vrf-create":
+            return [f"vrf {item.vrf_name}" for item in self.items]
+        if self.kind == "network-create":
+            return [f"network {item.network_name} (vrf {item.vrf_name})" for item in self.items]
+        if self.kind == "vrf-attach":
+            return [f"vrf {item.vrfName} -> {item.switch_name}" for item in self.items]
+        if self.kind == "network-attach":
+            return [f"network {item.networkName} -> {item.switch_name}" for item in self.items]
+        return []
+
+    def __repr__(self) -> str:
+        return f"PlanNode({self.name!r}, status={self.status!r})"
+
+
+class PlanApply:
+    """
+    # Summary
+
+    Plan and apply a desired state (PlanConfig) as a dependency-ordered
+    graph of batched operations.
+
+    ## Raises
+
+    - ValueError from plan() or apply() if rest_send or config is not
+      set, or if the controller cannot be queried while planning.
+    - ValueError from apply() if any node fails.  Nodes that do not
+      depend on the failed node still run; check nodes for details.
+
+    ## Usage
+
+    ```python
+    instance = PlanApply()
+    instance.rest_send = rest_send
+    instance.config = PlanConfigValidator(**contents).config
+    instance.max_parallel = 4
+    for wave in instance.plan():
+        print([node.name for node in wave])
+    instance.apply()
+    for node in instance.nodes:
+        print(node.name, node.status, node.message)
+    ```
+
+    ## Properties
+
+    - chunk_size (int): getter/setter: maximum items per attach request.  Default 50.
+    - config (PlanConfig): getter/setter: the desired state
+    - max_parallel (int): getter/setter: maximum nodes running at once.  Default 4.
+    - max_workers (int): getter/setter: maximum create requests in flight per node.  Default 8.
+    - nodes (list[PlanNode]): getter: the plan, in dependency order.  Empty until plan() is called.
+    - rest_send (RestSend): getter/setter: RestSend whose sender is shared by all nodes, used for planning
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
+
+        self.properties = Properties()
+        self.rest_send = self.properties.rest_send
+
+        self._chunk_size = 50
+        self._config = None
+        self._max_parallel = 4
+        self._max_workers = 8
+        self._nodes: list[PlanNode] = []
+
+    def _final_verification(self, method_name: str) -> None:
+        """
+        Verify that mandatory properties are set.
+        """
+        if self.rest_send is None:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{self.class_name}.rest_send must be set before calling "
+            msg += f"{self.class_name}.{method_name}"
+            raise ValueError(msg)
+
+        if self.config is None:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{self.class_name}.config must be set before calling "
+            msg += f"{self.class_name}.{method_name}"
+            raise ValueError(msg)
+
+    def _overlay_index(self, fabric_name: str) -> FabricOverlayIndex:
+        """
+        Return a FabricOverlayIndex for fabric_name, using rest_send.
+        """
+        index = FabricOverlayIndex()
+        index.rest_send = self.rest_send
+        index.fabric_name = fabric_name
+        return index
+
+    def _node(self, nodes: dict, kind: str, fabric_name: str) -> PlanNode:
+        """
+        Return the node for (kind, fabric_name), creating it if needed.
+        """
+        if (kind, fabric_name) not in nodes:
+            nodes[(kind, fabric_name)] = PlanNode(kind, fabric_name)
+        return nodes[(kind, fabric_name)]
+
+    def _build_nodes(self) -> dict:
+        """
+        Return a dict, keyed on (kind, fabric_name), of nodes holding the
+        config items that still need to be applied.
+        """
+        nodes: dict[tuple[str, str], PlanNode] = {}
+        for cfg in self.config.vrfs:
+            node = self._node(nodes, "vrf-create", cfg.fabric_name)
+            if self._overlay_index(cfg.fabric_name).vrf_name_exists(cfg.vrf_name):
+                node.unchanged.append(f"vrf {cfg.vrf_name}")
+                continue
+            node.items.append(cfg)
+        for cfg in self.config.networks:
+            node = self._node(nodes, "network-create", cfg.fabric_name)
+            if self._overlay_index(cfg.fabric_name).network_name_exists(cfg.network_name):
+                node.unchanged.append(f"network {cfg.network_name}")
+                continue
+            node.items.append(cfg)
+        for cfg in self.config.vrf_attachments:
+            self._node(nodes, "vrf-attach", cfg.fabric).items.append(cfg)
+        for cfg in self.config.network_attachments:
+            self._node(nodes, "network-attach", cfg.fabric).items.append(cfg)
+        for cfg in self.config.config_save:
+            self._node(nodes, "config-save", cfg.fabric_name)
+        for cfg in self.config.config_deploy:
+            self._node(nodes, "config-deploy", cfg.fabric_name)
+        return nodes
+
+    @staticmethod
+    def _add_dependencies(nodes: list[PlanNode]) -> None:
+        """
+        Set depends_on for each node.  See the module docstring.
+        """
+        by_kind: dict[str, list[PlanNode]] = {kind: [] for kind in KINDS}
+        for node in nodes:
+            by_kind[node.kind].append(node)
+        vrf_creators = {}
+        for node in by_kind["vrf-create"]:
+            for item in node.items:
+                vrf_creators[item.vrf_name] = node
+        network_creators = {}
+        for node in by_kind["network-create"]:
+            for item in node.items:
+                network_creators[item.network_name] = node
+
+        def depend(node: PlanNode, other: PlanNode | None) -> None:
+            if other is not None and other is not node and other not in node.depends_on:
+                node.depends_on.append(other)
+
+        for node in by_kind["network-create"]:
+            for item in node.items:
+                depend(node, vrf_creators.get(item.vrf_name))
+        for node in by_kind["vrf-attach"]:
+            for item in node.items:
+                depend(node, vrf_creators.get(item.vrfName))
+        for node in by_kind["network-attach"]:
+            for item in node.items:
+                depend(node, network_creators.get(item.networkName))
+            for other in by_kind["vrf-attach"]:
+                if other.fabric_name == node.fabric_name:
+                    depend(node, other)
+        changes = by_kind["vrf-create"] + by_kind["network-create"] + by_kind["vrf-attach"] + by_kind["network-attach"]
+        previous = None
+        for node in by_kind["config-save"]:
+            for other in changes:
+                depend(node, other)
+            depend(node, previous)
+            previous = node
+        previous = None
+        for node in by_kind["config-deploy"]:
+            for other in by_kind["config-save"]:
+                depend(node, other)
+            depend(node, previous)
+            previous = node
+
+    def plan(self) -> list[list[PlanNode]]:
+        """
+        # Summary
+
+        Build the plan and return it as waves: lists of nodes whose
+        dependencies are all in earlier waves, so the nodes in a wave can
+        run concurrently.
+
+        ## Raises
+
+        - ValueError if mandatory properties are not set, or the
+          controller cannot be queried.
+        """
+        self._final_verification("plan")
+        nodes = self._build_nodes()
+        active = []
+        for key in sorted(nodes, key=lambda key: KINDS.index(key[0])):
+            node = nodes[key]
+            if node.kind in ("config-save", "config-deploy") or node.items:
+                active.append(node)
+            else:
+                msg = f"{self.class_name}.plan: {node.name}: nothing to do. "
+                msg += f"Unchanged: {', '.join(node.unchanged)}"
+                self.log.info(msg)
+        self._add_dependencies(active)
+        self._nodes = active
+        return self.waves()
+
+    def waves(self) -> list[list[PlanNode]]:
+        """
+        Return nodes grouped into waves, in dependency order.
+        """
+        level: dict[int, int] = {}
+        for node in self._nodes:
+            # Dependencies precede their dependents in self._nodes.
+            level[id(node)] = 1 + max((level[id(other)] for other in node.depends_on), default=-1)
+        waves: list[list[PlanNode]] = [[] for _ in range(1 + max(level.values(), default=-1))]
+        for node in self._nodes:
+            waves[level[id(node)]].append(node)
+        return waves
+
+    def _new_rest_send(self, timeout: int, send_interval: int):
+        """
+        Return a new RestSend using the sender of rest_send.
+
+        RestSend holds per-request state (path, verb, response), so nodes
+        running concurrently each need their own.  They share one Sender,
+        which is thread-safe, and retries transient failures itself.
+        """
+        from plugins.module_utils.common.response_handler import ResponseHandler
+        from plugins.module_utils.common.rest_send_v2 import RestSend
+
+        rest_send = RestSend({})
+        rest_send.sender = self.rest_send.sender
+        rest_send.response_handler = ResponseHandler()
+        rest_send.send_interval = send_interval
+        rest_send.timeout = timeout
+        return rest_send
+
+    @staticmethod
+    def _results():
+        """
+        Return a new Results instance.
+        """
+        from plugins.module_utils.common.results import Results
+
+        return Results()
+
+    def _run_bulk(self, node: PlanNode) -> None:
+        """
+        Run a create or attach node with its Bulk class.
+        """
+        if node.kind == "vrf-create":
+            from ndfc_python.vrf_create_bulk import VrfCreateBulk
+
+            instance = VrfCreateBulk()
+            instance.max_workers = self.max_workers
+        elif node.kind == "network-create":
+            from ndfc_python.network_create_bulk import NetworkCreateBulk
+
+            instance = NetworkCreateBulk()
+            instance.max_workers = self.max_workers
+        elif node.kind == "vrf-attach":
+            from ndfc_python.vrf_attach_bulk import VrfAttachBulk
+
+            instance = VrfAttachBulk()
+            instance.chunk_size = self.chunk_size
+            instance.results = self._results()
+        else:
+            from ndfc_python.network_attach_bulk import NetworkAttachBulk
+
+            instance = NetworkAttachBulk()
+            instance.chunk_size = self.chunk_size
+            instance.results = self._results()
+        instance.rest_send = self._new_rest_send(timeout=1, send_interval=1)
+        instance.config = node.items
+        instance.commit()
+        node.item_results = instance.item_results
+        failed = [item for item in node.item_results if item["success"] is False]
+        if failed:
+            msg = f"{len(failed)} of {len(node.item_results)} item(s) failed. "
+            msg += "; ".join(item["message"] for item in failed)
+            raise ValueError(msg)
+
+    def _run_fabric_action(self, node: PlanNode) -> None:
+        """
+        Run a config-save or config-deploy node.
+        """
+        if node.kind == "config-save":
+            from ndfc_python.config_save import ConfigSave
+
+            instance = ConfigSave()
+        else:
+            from ndfc_python.config_deploy import ConfigDeploy
+
+            instance = ConfigDeploy()
+        # Give Nexus Dashboard time to complete the request.
+        instance.rest_send = self._new_rest_send(timeout=300, send_interval=5)
+        instance.results = self._results()
+        instance.fabric_name = node.fabric_name
+        instance.commit()
+        node.message = str(instance.status)
+
+    def _run(self, node: PlanNode) -> None:
+        """
+        Run node, and set its status and message.
+        """
+        method_name = "_run"
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"{node.name}: starting"
+        self.log.info(msg)
+        try:
+            if node.kind in ("config-save", "config-deploy"):
+                self._run_fabric_action(node)
+            else:
+                self._run_bulk(node)
+        except (TypeError, ValueError) as error:
+            node.status = "failed"
+            node.message = str(error)
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{node.name}: failed. Error detail: {error}"
+            self.log.error(msg)
+            return
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            # Any other error (e.g. a KeyError on an unexpected controller
+            # response) fails this node only, so that independent nodes
+            # still run and apply() reports on every node.
+            node.status = "failed"
+            node.message = f"{type(error).__name__}: {error}"
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{node.name}: failed. Error detail: {node.message}"
+            self.log.error(msg)
+            return
+        node.status = "succeeded"
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"{node.name}: succeeded"
+        self.log.info(msg)
+
+    def apply(self) -> None:
+        """
+        # Summary
+
+        Run the plan (calling plan() first if it has not been called),
+        at most max_parallel nodes at a time, each as soon as all of its
+        dependencies have succeeded.  Nodes that depend on a failed or
+        skipped node are skipped.
+
+        ## Raises
+
+        - ValueError if mandatory properties are not set, the controller
+          cannot be queried while planning, or any node failed.
+        """
+        method_name = "apply"
+        if not self._nodes:
+            self.plan()
+        pending = list(self._nodes)
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.max_parallel, thread_name_prefix="plan_apply") as executor:
+            while pending or running:
+                for node in list(pending):
+                    blocked = [other for other in node.depends_on if other.status in ("failed", "skipped")]
+                    if blocked:
+                        node.status = "skipped"
+                        node.message = f"Skipped because {blocked[0].name} {blocked[0].status}."
+                        pending.remove(node)
+                    elif len(running) < self.max_parallel and all(other.status == "succeeded" for other in node.depends_on):
+                        node.status = "running"
+                        running[executor.submit(self._run, node)] = node
+                        pending.remove(node)
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    running.pop(future)
+                    future.result()
+
+        failed = [node for node in self._nodes if node.status != "succeeded"]
+        if failed:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{len(failed)} of {len(self._nodes)} step(s) did not succeed. "
+            msg += "; ".join(f"{node.name}: {node.status}. {node.message}" for node in failed)
+            raise ValueError(msg)
+
+    @property
+    def chunk_size(self) -> int:
+        """
+        Maximum number of items per attach request.
+        """
+        return self._chunk_size
+
+    @chunk_size.setter
+    def chunk_size(self, value: int) -> None:
+        method_name = "chunk_size"
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Expected a positive integer. Got {value}."
+            raise ValueError(msg)
+        self._chunk_size = value
+
+    @property
+    def config(self) -> PlanConfig | None:
+        """
+        The desired state.
+        """
+        return self._config
+
+    @config.setter
+    def config(self, value: PlanConfig) -> None:
+        method_name = "config"
+        if not isinstance(value, PlanConfig):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Expected PlanConfig. Got {type(value).__name__}."
+            raise TypeError(msg)
+        self._config = value
+        self._nodes = []
+
+    @property
+    def max_parallel(self) -> int:
+        """
+        Maximum number of nodes running at once.
+        """
+        return self._max_parallel
+
+    @max_parallel.setter
+    def max_parallel(self, value: int) -> None:
+        method_name = "max_parallel"
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Expected a positive integer. Got {value}."
+            raise ValueError(msg)
+        self._max_parallel = value
+
+    @property
+    def max_workers(self) -> int:
+        """
+        Maximum number of create requests in flight per node.
+        """
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, value: int) -> None:
+        method_name = "max_workers"
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Expected a positive integer. Got {value}."
+            raise ValueError(msg)
+        self._max_workers = value
+
+    @property
+    def nodes(self) -> list[PlanNode]:
+        """
+        The plan, in dependency order.
+        """
+        return self._nodes
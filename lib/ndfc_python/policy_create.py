@@ -7,7 +7,6 @@ Create ND policies
 
 # We use isort for import linting
 # pylint: disable=wrong-import-order
-import inspect
 import json
 import logging
 import sys
@@ -57,7 +56,7 @@ class PolicyCreate:
         """
         build the payload from the current property values
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_build_payload"
         self.payload["description"] = self.description
         self.payload["entityName"] = self.entity_name
         self.payload["entityType"] = self.entity_type
@@ -76,7 +75,7 @@ class PolicyCreate:
         """
         final verification of all parameters
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_final_verification"
         if self.rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.rest_send must be set before calling "
@@ -96,7 +95,7 @@ class PolicyCreate:
         """
         Create a policy
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
 
         self._final_verification()
         self._populate_policies_switch()
@@ -135,6 +134,7 @@ class PolicyCreate:
         Return False otherwise.
         """
         self.fabrics_info.rest_send = self.rest_send
+        self.fabrics_info.use_cache = True
         self.fabrics_info.commit()
         self.fabrics_info.filter = self.fabric_name
         return self.fabrics_info.fabric_exists
@@ -152,7 +152,7 @@ class PolicyCreate:
         - ValueError: if the policy already exists on the switch
 
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_validate_no_policy_name_conflict"
         for policy in self.policies:
             if policy.get("description") == self.description:
                 policy_id = policy.get("policyId", "N/A")
@@ -173,7 +173,7 @@ class PolicyCreate:
         - ValueError: if FabricInventory raises
 
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_populate_policies_switch"
         if not self._fabric_inventory_populated:
             self.populate_fabric_inventory()
 
@@ -203,7 +203,7 @@ class PolicyCreate:
         - ValueError: if FabricInventory raises
 
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "populate_fabric_inventory"
         try:
             self.fabric_inventory.fabric_name = self.fabric_name
             self.fabric_inventory.rest_send = self.rest_send
@@ -7,7 +7,6 @@ Delete switch policies
 
 # We use isort for import linting
 # pylint: disable=wrong-import-order
-import inspect
 import logging
 
 from ndfc_python.common.fabric.fabric_inventory import FabricInventory
@@ -40,7 +39,7 @@ class PolicyDeleteEndpoint:
         final verification of all parameters
         """
         if not self.policy_ids:
-            method_name = inspect.stack()[0][3]
+            method_name = "_final_verification"
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.policy_ids must be set before calling "
             msg += f"{self.class_name}.commit"
@@ -64,7 +63,7 @@ class PolicyDeleteEndpoint:
         instance.commit() must be called before accessing this property.
         """
         if not self._committed:
-            method_name = inspect.stack()[0][3]
+            method_name = "path"
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.commit() must be called before accessing "
             msg += f"{self.class_name}.{method_name}"
@@ -90,7 +89,7 @@ class PolicyDeleteEndpoint:
     @policy_ids.setter
     def policy_ids(self, value: list) -> None:
         if not isinstance(value, list):
-            method_name = inspect.stack()[0][3]
+            method_name = "policy_ids"
             msg = f"{self.class_name}.{method_name}: "
             msg += f"exiting. expected type {type(value).__name__}, "
             msg += f"with value {value}."
@@ -138,7 +137,7 @@ class PolicyDelete:
         """
         final verification of all parameters
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_final_verification"
         if self.rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.rest_send must be set before calling "
@@ -182,7 +181,7 @@ class PolicyDelete:
         """
         Create a policy
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
 
         self._final_verification()
         self._populate_policies_switch()
@@ -215,7 +214,7 @@ class PolicyDelete:
             raise ValueError(msg)
 
     def _set_policy_ids(self) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = "_set_policy_ids"
         if not self._policies_populated:
             self._populate_policies_switch()
 
@@ -243,6 +242,7 @@ class PolicyDelete:
         Return False otherwise.
         """
         self.fabrics_info.rest_send = self.rest_send
+        self.fabrics_info.use_cache = True
         self.fabrics_info.commit()
         self.fabrics_info.filter = self.fabric_name
         return self.fabrics_info.fabric_exists
@@ -267,7 +267,7 @@ class PolicyDelete:
         - ValueError: if FabricInventory raises
 
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_populate_policies_switch"
         if not self._fabric_inventory_populated:
             self.populate_fabric_inventory()
 
@@ -297,7 +297,7 @@ class PolicyDelete:
         - ValueError: if FabricInventory raises
 
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "populate_fabric_inventory"
         try:
             self.fabric_inventory.fabric_name = self.fabric_name
             self.fabric_inventory.rest_send = self.rest_send
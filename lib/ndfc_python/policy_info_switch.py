@@ -17,12 +17,13 @@ Path: /appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/policies/switches?ser
 # We are using isort for import sorting.
 # pylint: disable=wrong-import-order
 
-import inspect
 import logging
+from collections.abc import Iterator
 
 from ndfc_python.common.fabric.fabric_inventory import FabricInventory
 from ndfc_python.common.fabric.fabrics_info import FabricsInfo
 from ndfc_python.common.properties import Properties
+from ndfc_python.json_stream import iter_response_items
 
 
 class PolicyInfoSwitchEndpoint:
@@ -44,7 +45,7 @@ class PolicyInfoSwitchEndpoint:
         """
         final verification of all parameters
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_final_verification"
         if not self.serial_number:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.serial_number must be set before calling "
@@ -65,9 +66,9 @@ class PolicyInfoSwitchEndpoint:
 
         instance.commit() must be called before accessing this property.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "path"
         if not self._committed:
-            method_name = inspect.stack()[0][3]
+            method_name = "path"
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.commit() must be called before accessing "
             msg += f"{self.class_name}.{method_name}"
@@ -99,6 +100,9 @@ class PolicyInfoSwitch:
 
     Get switch policy information
 
+    Use commit() and policies to retrieve all policies at once, or
+    iter_policies() to process policies one at a time as they arrive.
+
     ## Example switch policy info request
 
     ### See
@@ -127,7 +131,7 @@ class PolicyInfoSwitch:
         """
         final verification of all parameters
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_final_verification"
         if self.rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.rest_send must be set before calling "
@@ -164,7 +168,7 @@ class PolicyInfoSwitch:
         """
         Retrieve switch policy information from the controller.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         self._final_verification()
 
         self.endpoint.serial_number = self.fabric_inventory.switch_name_to_serial_number(self.switch_name)
@@ -182,12 +186,82 @@ class PolicyInfoSwitch:
 
         self._populate_policies()
 
+    def iter_policies(self) -> Iterator[dict]:
+        """
+        # Summary
+
+        Yield the policies of switch_name one at a time, as they are
+        received from the controller, without storing them in policies.
+
+        Peak memory is independent of the number of policies on the switch.
+
+        ## Raises
+
+        - ValueError if fabric_name or switch_name is invalid, or the request fails.
+        """
+        method_name = "iter_policies"
+        self._final_verification()
+
+        endpoint = PolicyInfoSwitchEndpoint()
+        endpoint.serial_number = self.fabric_inventory.switch_name_to_serial_number(self.switch_name)
+        endpoint.commit()
+        try:
+            yield from iter_response_items(self.rest_send, endpoint.path)
+        except (TypeError, ValueError) as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Unable to retrieve switch policies for switch {self.switch_name} "
+            msg += f"in fabric {self.fabric_name}. "
+            msg += f"Error details: {error}"
+            raise ValueError(msg) from error
+
+    async def commit_async(self, sender) -> None:
+        """
+        # Summary
+
+        Same as commit(), but send the requests with an AsyncSender instead
+        of rest_send.  Use with AsyncSender.gather() to retrieve the
+        policies of many switches concurrently.
+
+        The fabric existence check is skipped; an unknown fabric is reported
+        by the fabric inventory request.
+
+        ## Raises
+
+        - ValueError if fabric_name or switch_name is not set, or a request fails.
+        """
+        method_name = "commit_async"
+        if not self.fabric_name or not self.switch_name:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{self.class_name}.fabric_name and {self.class_name}.switch_name "
+            msg += f"must be set before calling {self.class_name}.{method_name}"
+            raise ValueError(msg)
+
+        if not self._fabric_inventory_populated:
+            self.fabric_inventory.fabric_name = self.fabric_name
+            await self.fabric_inventory.commit_async(sender)
+            self._fabric_inventory_populated = True
+
+        endpoint = PolicyInfoSwitchEndpoint()
+        endpoint.serial_number = self.fabric_inventory.switch_name_to_serial_number(self.switch_name)
+        endpoint.commit()
+        try:
+            response = await sender.request(endpoint.verb, endpoint.path)
+        except (TypeError, ValueError) as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Unable to populate switch policies for switch {self.switch_name} "
+            msg += f"in fabric {self.fabric_name}. "
+            msg += f"Error details: {error}"
+            raise ValueError(msg) from error
+        self._policies = response.get("DATA", [])
+        self._policies_populated = True
+
     def fabric_exists(self) -> bool:
         """
         Return True if self.fabric_name exists on the controller.
         Return False otherwise.
         """
         self.fabrics_info.rest_send = self.rest_send
+        self.fabrics_info.use_cache = True
         self.fabrics_info.commit()
         self.fabrics_info.filter = self.fabric_name
         return self.fabrics_info.fabric_exists
@@ -218,7 +292,7 @@ class PolicyInfoSwitch:
         - ValueError: if FabricInventory raises
 
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_populate_policies"
         switch_policy_endpoint = PolicyInfoSwitchEndpoint()
         switch_policy_endpoint.serial_number = self.fabric_inventory.switch_name_to_serial_number(self.switch_name)
         switch_policy_endpoint.commit()
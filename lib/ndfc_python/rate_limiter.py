@@ -0,0 +1,422 @@
+"""
+# Name
+
+rate_limiter.py
+
+# Description
+
+Client-side limits on the requests sent to one controller: a token-bucket
+request rate, a maximum number of requests in flight, and an optional
+AIMD (additive increase, multiplicative decrease) mode that adapts the
+in-flight limit to the controller's latency and 429/503 responses.
+
+Bulk classes, RequestPipeline and PlanApply send requests in parallel.
+Several of them, in one or more threads, can together overwhelm a single
+Nexus Dashboard cluster.  A RateLimiter shared by every Sender talking to
+the same controller (RateLimiter.shared()) bounds their combined load.
+"""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+
+# Upper bound for the in-flight limit in adaptive mode, if max_in_flight is 0.
+ADAPTIVE_MAX_IN_FLIGHT = 16
+# Status codes that mean the controller is overloaded.
+CONGESTION_STATUSES = frozenset({429, 503})
+# Weight of the newest latency in the latency moving average.
+LATENCY_ALPHA = 0.2
+
+
+class RateLimiter:
+    """
+    # Summary
+
+    Token-bucket rate limiter and in-flight governor for one controller.
+
+    - rate: requests per second, with bursts of up to burst requests.  0
+      disables rate limiting.
+    - max_in_flight: maximum requests awaiting a response.  0 disables
+      the limit (unless adaptive is True).
+    - adaptive: adjust the in-flight limit (limit) with AIMD.  After a
+      429 or 503, a connection error, or when the moving average of
+      latency exceeds latency_target, limit is halved (at most once per
+      cooldown seconds, down to min_in_flight).  After limit consecutive
+      responses without congestion, limit grows by one, up to
+      max_in_flight (ADAPTIVE_MAX_IN_FLIGHT if max_in_flight is 0).
+
+    Sender calls acquire() before, and release() after, each HTTP request.
+    AsyncSender awaits acquire_async() instead, so as not to block the
+    event loop.
+
+    ## Usage
+
+    ```python
+    limiter = RateLimiter.shared("10.1.1.1")
+    limiter.rate = 20
+    limiter.max_in_flight = 8
+    limiter.adaptive = True
+    sender.rate_limiter = limiter
+    ...
+    print(limiter.limit, limiter.stats)
+    ```
+
+    ## Raises
+
+    - TypeError, ValueError from the property setters if values are invalid.
+
+    ## Properties
+
+    - adaptive (bool): getter/setter: adapt limit with AIMD.  Default False
+    - burst (int): getter/setter: token bucket size.  0 means max(1, ceil(rate)).  Default 0
+    - cooldown (float): getter/setter: minimum seconds between decreases.  Default 1
+    - latency_target (float): getter/setter: moving-average latency, in seconds, above which limit is decreased.  Default 2
+    - limit (int): getter: current in-flight limit.  0 means unlimited.
+    - max_in_flight (int): getter/setter: maximum requests in flight.  Default 0 (unlimited)
+    - min_in_flight (int): getter/setter: lowest limit in adaptive mode.  Default 1
+    - rate (float): getter/setter: requests per second.  Default 0 (unlimited)
+    - stats (dict): getter: requests, seconds waited, decreases and increases
+    """
+
+    _shared: dict = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
+
+        self._condition = threading.Condition()
+        # (event loop, future) of each coroutine in acquire_async() waiting
+        # for an in-flight slot.
+        self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+        self._adaptive = False
+        self._burst = 0
+        self._cooldown = 1.0
+        self._latency_target = 2.0
+        self._max_in_flight = 0
+        self._min_in_flight = 1
+        self._rate = 0.0
+
+        self._decreased_at = 0.0
+        self._in_flight = 0
+        self._latency = None
+        self._limit = 0
+        self._refilled_at = time.monotonic()
+        self._successes = 0
+        self._tokens = 0.0
+        self._stats = {"requests": 0, "waited": 0.0, "decreases": 0, "increases": 0}
+
+    @classmethod
+    def shared(cls, controller: str) -> "RateLimiter":
+        """
+        # Summary
+
+        Return the process-wide RateLimiter for controller (e.g. its IP
+        address, or ndfc_python.common.ttl_cache.normalize_controller()
+        of its nodes), creating it on first use, so that every Sender
+        talking to the same controller shares one set of limits.
+        """
+        with cls._shared_lock:
+            if controller not in cls._shared:
+                cls._shared[controller] = cls()
+            return cls._shared[controller]
+
+    def _capacity(self) -> float:
+        """
+        Return the token bucket size.
+        """
+        if self._burst:
+            return float(self._burst)
+        return float(max(1, math.ceil(self._rate)))
+
+    def reserve(self) -> float:
+        """
+        # Summary
+
+        Take a token from the bucket and return the seconds the caller
+        must wait before sending.  Callers that reserve while the bucket
+        is empty queue behind each other, so waits are spread at 1/rate
+        second intervals.  Returns 0.0 if rate is 0.
+        """
+        with self._condition:
+            self._stats["requests"] += 1
+            if not self._rate:
+                return 0.0
+            now = time.monotonic()
+            self._tokens = min(self._capacity(), self._tokens + (now - self._refilled_at) * self._rate)
+            self._refilled_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            wait = -self._tokens / self._rate
+            self._stats["waited"] += wait
+            return wait
+
+    def acquire(self) -> None:
+        """
+        # Summary
+
+        Wait for a token and an in-flight slot.  Call release() when the
+        response arrives (or the request fails).
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        with self._condition:
+            started = time.monotonic()
+            while self._limit and self._in_flight >= self._limit:
+                self._condition.wait()
+            self._in_flight += 1
+            self._stats["waited"] += time.monotonic() - started
+
+    async def acquire_async(self) -> None:
+        """
+        # Summary
+
+        Same as acquire(), for coroutines: wait for a token and an
+        in-flight slot without blocking the event loop.  release(), from
+        any thread or event loop, wakes the coroutines waiting for a slot.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        loop = asyncio.get_running_loop()
+        started = time.monotonic()
+        while True:
+            with self._condition:
+                if not self._limit or self._in_flight < self._limit:
+                    self._in_flight += 1
+                    self._stats["waited"] += time.monotonic() - started
+                    return
+                future = loop.create_future()
+                self._waiters.append((loop, future))
+            await future
+
+    @staticmethod
+    def _wake(future: asyncio.Future) -> None:
+        """
+        Wake the coroutine awaiting future, unless it was cancelled.
+        """
+        if not future.done():
+            future.set_result(None)
+
+    def _notify_all(self) -> None:
+        """
+        Wake every thread in acquire() and coroutine in acquire_async()
+        waiting for an in-flight slot.  Called with _condition held.
+        """
+        self._condition.notify_all()
+        waiters, self._waiters = self._waiters, []
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(self._wake, future)
+            except RuntimeError:
+                # The waiter's event loop is closed.
+                pass
+
+    def release(self, status_code: int | None, latency: float) -> None:
+        """
+        # Summary
+
+        Return an in-flight slot, and, if adaptive, adjust limit given
+        the response status_code (None if the request failed without a
+        response) and latency in seconds.
+        """
+        with self._condition:
+            self._in_flight = max(0, self._in_flight - 1)
+            if self._adaptive:
+                self._adapt(status_code, latency)
+            self._notify_all()
+
+    def _adapt(self, status_code: int | None, latency: float) -> None:
+        """
+        Apply AIMD to limit.  Called with _condition held.
+        """
+        method_name = "_adapt"
+        if self._latency is None:
+            self._latency = latency
+        else:
+            self._latency = LATENCY_ALPHA * latency + (1 - LATENCY_ALPHA) * self._latency
+        congested = status_code is None or status_code in CONGESTION_STATUSES or self._latency > self._latency_target
+        upper = self._max_in_flight or ADAPTIVE_MAX_IN_FLIGHT
+        if congested:
+            self._successes = 0
+            now = time.monotonic()
+            if now - self._decreased_at < self._cooldown or self._limit <= self._min_in_flight:
+                return
+            self._decreased_at = now
+            self._limit = max(self._min_in_flight, self._limit // 2)
+            self._stats["decreases"] += 1
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Congestion (status {status_code}, latency average {self._latency:.3f}s). "
+            msg += f"In-flight limit decreased to {self._limit}."
+            self.log.info(msg)
+            return
+        self._successes += 1
+        if self._successes >= self._limit and self._limit < upper:
+            self._successes = 0
+            self._limit += 1
+            self._stats["increases"] += 1
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"In-flight limit increased to {self._limit}."
+                self.log.debug(msg)
+
+    def _reset_limit(self) -> None:
+        """
+        Set limit from max_in_flight and adaptive.  Called with _condition held.
+        """
+        if self._adaptive:
+            self._limit = self._max_in_flight or ADAPTIVE_MAX_IN_FLIGHT
+        else:
+            self._limit = self._max_in_flight
+        self._successes = 0
+        self._notify_all()
+
+    def _verify_number(self, name: str, value, minimum: float = 0) -> None:
+        """
+        ## Raises
+
+        - TypeError if value is not a number
+        - ValueError if value is less than minimum
+        """
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            msg = f"{self.class_name}.{name}: "
+            msg += f"{name} must be a number. Got {type(value).__name__}."
+            raise TypeError(msg)
+        if value < minimum:
+            msg = f"{self.class_name}.{name}: "
+            msg += f"{name} must be >= {minimum}. Got {value}."
+            raise ValueError(msg)
+
+    def _verify_int(self, name: str, value, minimum: int = 0) -> None:
+        """
+        ## Raises
+
+        - TypeError if value is not an int
+        - ValueError if value is less than minimum
+        """
+        if isinstance(value, bool) or not isinstance(value, int):
+            msg = f"{self.class_name}.{name}: "
+            msg += f"{name} must be an int. Got {type(value).__name__}."
+            raise TypeError(msg)
+        self._verify_number(name, value, minimum)
+
+    @property
+    def adaptive(self) -> bool:
+        """
+        If True, adapt the in-flight limit with AIMD.
+        """
+        return self._adaptive
+
+    @adaptive.setter
+    def adaptive(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            msg = f"{self.class_name}.adaptive: "
+            msg += f"adaptive must be a bool. Got {type(value).__name__}."
+            raise TypeError(msg)
+        with self._condition:
+            self._adaptive = value
+            self._reset_limit()
+
+    @property
+    def burst(self) -> int:
+        """
+        Token bucket size: the number of requests that can be sent at
+        once after an idle period.  0 means max(1, ceil(rate)).
+        """
+        return self._burst
+
+    @burst.setter
+    def burst(self, value: int) -> None:
+        self._verify_int("burst", value)
+        with self._condition:
+            self._burst = value
+            self._tokens = min(self._tokens, self._capacity())
+
+    @property
+    def cooldown(self) -> float:
+        """
+        Minimum seconds between two decreases of the in-flight limit, so
+        that one burst of 429s halves the limit once, not once per request.
+        """
+        return self._cooldown
+
+    @cooldown.setter
+    def cooldown(self, value: float) -> None:
+        self._verify_number("cooldown", value)
+        self._cooldown = float(value)
+
+    @property
+    def latency_target(self) -> float:
+        """
+        Moving-average latency, in seconds, above which the in-flight
+        limit is decreased (adaptive mode).
+        """
+        return self._latency_target
+
+    @latency_target.setter
+    def latency_target(self, value: float) -> None:
+        self._verify_number("latency_target", value)
+        self._latency_target = float(value)
+
+    @property
+    def limit(self) -> int:
+        """
+        The current in-flight limit.  0 means unlimited.
+        """
+        return self._limit
+
+    @property
+    def max_in_flight(self) -> int:
+        """
+        Maximum number of requests in flight.  0 means unlimited (or
+        ADAPTIVE_MAX_IN_FLIGHT in adaptive mode).
+        """
+        return self._max_in_flight
+
+    @max_in_flight.setter
+    def max_in_flight(self, value: int) -> None:
+        self._verify_int("max_in_flight", value)
+        with self._condition:
+            self._max_in_flight = value
+            self._reset_limit()
+
+    @property
+    def min_in_flight(self) -> int:
+        """
+        Lowest in-flight limit that adaptive mode decreases to.
+        """
+        return self._min_in_flight
+
+    @min_in_flight.setter
+    def min_in_flight(self, value: int) -> None:
+        self._verify_int("min_in_flight", value, minimum=1)
+        self._min_in_flight = value
+
+    @property
+    def rate(self) -> float:
+        """
+        Maximum requests per second.  0 means unlimited.
+        """
+        return self._rate
+
+    @rate.setter
+    def rate(self, value: float) -> None:
+        self._verify_number("rate", value)
+        with self._condition:
+            self._rate = float(value)
+            self._tokens = self._capacity()
+            self._refilled_at = time.monotonic()
+
+    @property
+    def stats(self) -> dict:
+        """
+        Requests admitted ("requests"), total seconds callers waited
+        ("waited"), and adaptive decreases and increases of the limit.
+        """
+        with self._condition:
+            return dict(self._stats)
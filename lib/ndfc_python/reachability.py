@@ -50,13 +50,14 @@ The JSON payload constructed by this class is shown below.
 # We're using isort for import linting
 # pylint: disable=wrong-import-order
 
-import inspect
 import logging
 import sys
 from ipaddress import AddressValueError
 
+from ndfc_python.common.fabric.fabric_inventory_cache import FabricInventoryCache
 from ndfc_python.common.fabric.fabrics_info import FabricsInfo
 from ndfc_python.common.properties import Properties
+from ndfc_python.common.ttl_cache import controller_key
 from ndfc_python.validations import Validations
 from plugins.module_utils.common.api.v1.lan_fabric.rest.control.fabrics.fabrics import EpFabrics
 from plugins.module_utils.common.conversion import ConversionUtils
@@ -156,7 +157,7 @@ class Reachability:
         """
         verify all mandatory parameters are set
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_final_verification"
         # TODO: If fabric is EasyFabric, and preserve_config is True
         # need to throw an error and exit here.
         if self.rest_send is None:
@@ -179,6 +180,7 @@ class Reachability:
         Return False otherwise.
         """
         self.fabrics_info.rest_send = self.rest_send
+        self.fabrics_info.use_cache = True
         self.fabrics_info.commit()
         self.fabrics_info.filter = self.fabric_name
         return self.fabrics_info.fabric_exists
@@ -187,7 +189,7 @@ class Reachability:
         """
         Send a POST request to the controller to the test-reachability endpoint
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         self._preprocess_payload()
         self._final_verification()
 
@@ -217,6 +219,10 @@ class Reachability:
             msg += f"Error details: {error}"
             raise ValueError(msg) from error
 
+        # Reachability precedes adding switches to the fabric, so any cached
+        # inventory for the fabric may be about to change.
+        FabricInventoryCache().invalidate(controller_key(self.rest_send), self.fabric_name)
+
         self._response_data = self.rest_send.response_current.get("DATA")[0]
         if self.response_data is None:
             msg = f"{self.class_name}.{method_name} failed: response "
@@ -230,7 +236,7 @@ class Reachability:
 
         See accessor properties
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_get"
         if self.response_data is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Call {self.class_name}.commit before calling "
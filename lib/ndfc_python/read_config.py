@@ -1,7 +1,7 @@
 import copy
-import inspect
 import logging
 
+from ndfc_python.read_only_dict import ReadOnlyDict
 from ndfc_python.yaml_reader import YamlReader
 
 
@@ -49,6 +49,7 @@ class ReadConfig:
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
         self.reader = YamlReader()
+        self._contents = None
         self._filename = None
 
     def commit(self):
@@ -62,7 +63,7 @@ class ReadConfig:
             - filename is not set
             - YamlRead().commit() raises ValueError
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         if self.filename is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.filename must be set before calling "
@@ -99,9 +100,23 @@ class ReadConfig:
         """
         # Summary
         The contents of filename, as a python dict.
+
+        If the contents are a dict, they are returned as a ReadOnlyDict,
+        without copying.  Nested values are shared and must not be
+        modified.  Use contents_copy for a mutable copy.
         """
-        return copy.deepcopy(self._contents)
+        return self._contents
 
     @contents.setter
     def contents(self, value):
+        if isinstance(value, dict) and not isinstance(value, ReadOnlyDict):
+            value = ReadOnlyDict(value)
         self._contents = value
+
+    @property
+    def contents_copy(self):
+        """
+        # Summary
+        Return a mutable deep copy of contents.
+        """
+        return copy.deepcopy(self._contents)
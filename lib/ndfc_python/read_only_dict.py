@@ -0,0 +1,75 @@
+"""
+# Name
+
+read_only_dict.py
+
+# Description
+
+A dict that cannot be modified, used to hand out controller responses
+and configuration file contents without copying them on every access.
+"""
+
+import copy
+
+
+class ReadOnlyDict(dict):
+    """
+    # Summary
+
+    A dict subclass whose keys cannot be added, changed or removed.
+
+    ReadOnlyDict is still a dict, so isinstance(value, dict), json.dumps(),
+    **value and RestSend/ResponseHandler type checks all work unchanged.
+    It is read-only at the top level only.  Nested values (e.g. the DATA of
+    a controller response) are shared, not copied, and must be treated as
+    read-only by callers.
+
+    Copies are opt-in and mutable:
+
+    - copy.deepcopy(value) returns a plain dict with all nested values copied
+    - copy.copy(value) and value.copy() return a plain dict sharing nested values
+
+    ## Usage
+
+    ```python
+    response = ReadOnlyDict({"RETURN_CODE": 200, "DATA": data})
+    response["DATA"]              # no copy
+    response["RETURN_CODE"] = 500  # TypeError
+    mutable = copy.deepcopy(response)
+    ```
+
+    ## Raises
+
+    - TypeError on any attempt to modify the dict
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        msg = f"{self.__class__.__name__} is read-only. "
+        msg += "Use copy.deepcopy() to get a mutable copy."
+        raise TypeError(msg)
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __ior__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {copy.deepcopy(key, memo): copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    def copy(self):
+        """
+        Return a mutable, shallow copy, as a plain dict.
+        """
+        return dict(self)
@@ -0,0 +1,187 @@
+"""
+# Name
+
+request_pipeline.py
+
+# Description
+
+Send many independent REST requests to the controller with a bounded
+number of requests in flight.
+
+RestSend holds per-request state (path, verb, payload, response_current)
+and so can only send one request at a time.  RequestPipeline instead calls
+the thread-safe Sender.send() from a ThreadPoolExecutor of at most
+max_workers threads, over the Sender already attached to rest_send.
+
+Sender.send() retries transient failures as its retry_policy allows, so
+even a single request is sent through it, rather than through RestSend,
+which sleeps send_interval seconds after any unsuccessful attempt.
+
+If the Sender has no thread-safe send() (e.g. AsyncSender, or a Sender
+from ansible-dcnm), requests are sent one at a time through rest_send.
+"""
+
+# We are using isort for import sorting.
+# pylint: disable=wrong-import-order
+
+import inspect
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from ndfc_python.common.properties import Properties
+from ndfc_python.sender_request import SenderRequest
+
+
+class RequestPipeline:
+    """
+    # Summary
+
+    Send a list of SenderRequest concurrently, with at most max_workers
+    requests in flight, and return the responses in request order.
+
+    ## Usage
+
+    ```python
+    pipeline = RequestPipeline()
+    pipeline.rest_send = rest_send
+    pipeline.max_workers = 8
+    requests = [SenderRequest("POST", path, payload) for payload in payloads]
+    for request, response in zip(requests, pipeline.commit(requests)):
+        print(request.path, response["RETURN_CODE"])
+    ```
+
+    ## Responses
+
+    Each response is a RestSend-compatible dictionary with keys RETURN_CODE,
+    DATA, MESSAGE, METHOD and REQUEST_PATH.  If a request could not be sent
+    at all, RETURN_CODE is None and MESSAGE contains the error.
+
+    ## Raises
+
+    - TypeError from commit() if requests is not a list of SenderRequest
+    - ValueError from commit() if rest_send is not set
+
+    ## Properties
+
+    - max_workers (int): getter/setter: maximum requests in flight.  Default 8.
+    - rest_send (RestSend): getter/setter: RestSend instance whose Sender is used
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
+
+        self.properties = Properties()
+        self.rest_send = self.properties.rest_send
+
+        self._max_workers = 8
+
+    @property
+    def concurrent(self) -> bool:
+        """
+        Return True if the Sender attached to rest_send has a thread-safe,
+        synchronous send() method.
+        """
+        send = getattr(getattr(self.rest_send, "sender", None), "send", None)
+        if send is None:
+            return False
+        return not inspect.iscoroutinefunction(send)
+
+    @staticmethod
+    def _error_response(request: SenderRequest, error: Exception) -> dict:
+        """
+        Return a RestSend-compatible response for a request that could not be sent.
+        """
+        response = {}
+        response["RETURN_CODE"] = None
+        response["DATA"] = {}
+        response["MESSAGE"] = str(error)
+        response["METHOD"] = request.verb
+        response["REQUEST_PATH"] = request.path
+        return response
+
+    def _send(self, request: SenderRequest) -> dict:
+        """
+        Send one request through the thread-safe Sender.send()
+        """
+        try:
+            return self.rest_send.sender.send(request).as_dict()
+        except (TypeError, ValueError) as error:
+            return self._error_response(request, error)
+
+    def _send_serial(self, request: SenderRequest) -> dict:
+        """
+        Send one request through rest_send
+        """
+        try:
+            self.rest_send.path = request.path
+            self.rest_send.verb = request.verb
+            self.rest_send.payload = request.payload
+            self.rest_send.commit()
+        except (TypeError, ValueError) as error:
+            return self._error_response(request, error)
+        return self.rest_send.response_current
+
+    def commit(self, requests: list[SenderRequest]) -> list[dict]:
+        """
+        # Summary
+
+        Send every request and return the responses, in the same order
+        as requests.
+
+        ## Raises
+
+        - TypeError if requests is not a list of SenderRequest
+        - ValueError if rest_send is not set
+        """
+        method_name = "commit"
+        if self.rest_send is None:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{self.class_name}.rest_send must be set before calling "
+            msg += f"{self.class_name}.commit"
+            raise ValueError(msg)
+        if not isinstance(requests, list) or not all(isinstance(request, SenderRequest) for request in requests):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "requests must be a list of SenderRequest."
+            raise TypeError(msg)
+        if not requests:
+            return []
+
+        if not self.concurrent:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Sending {len(requests)} requests serially through rest_send."
+            self.log.debug(msg)
+            return [self._send_serial(request) for request in requests]
+
+        if self.max_workers == 1 or len(requests) == 1:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Sending {len(requests)} requests serially."
+            self.log.debug(msg)
+            return [self._send(request) for request in requests]
+
+        max_workers = min(self.max_workers, len(requests))
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"Sending {len(requests)} requests, "
+        msg += f"max {max_workers} in flight."
+        self.log.debug(msg)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._send, requests))
+
+    @property
+    def max_workers(self) -> int:
+        """
+        Maximum number of requests in flight.
+        """
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, value: int) -> None:
+        if isinstance(value, bool) or not isinstance(value, int):
+            msg = f"{self.class_name}.max_workers: "
+            msg += f"max_workers must be an int. Got {type(value).__name__}."
+            raise TypeError(msg)
+        if value < 1:
+            msg = f"{self.class_name}.max_workers: "
+            msg += f"max_workers must be >= 1. Got {value}."
+            raise ValueError(msg)
+        self._max_workers = value
@@ -0,0 +1,322 @@
+"""
+# Name
+
+response_cache.py
+
+# Description
+
+Cache GET responses in Sender, so that library classes that repeat the
+same GET within seconds of each other (control/fabrics, switchesByFabric,
+top-down/fabrics/{fabric}/networks, control/policies/switches) get the
+response from memory instead of from the controller.
+
+Entries expire after a TTL that can be set per path pattern, the cache
+evicts the least recently used entries to stay within max_bytes, and a
+successful write (POST, PUT, DELETE) under a fabric drops the cached
+responses for that fabric.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+
+# The fabric name in a path, e.g. .../control/fabrics/SITE1/... or
+# .../top-down/fabrics/SITE1/..., or its fabricName query parameter.
+FABRIC_PATTERN = re.compile(r"/fabrics/([^/?]+)|[?&]fabricName=([^&]+)")
+# Bytes counted for each entry in addition to its body.
+ENTRY_OVERHEAD = 200
+
+
+class ResponseCache:
+    """
+    # Summary
+
+    A TTL and LRU cache of GET responses, keyed on path.
+
+    Sender stores the raw body of each successful GET, and decodes it
+    again on every hit, so callers never share (and cannot corrupt) a
+    cached response.
+
+    - An entry expires after the ttl of the first rule (add_rule()) whose
+      pattern matches its path, else after ttl seconds.  A ttl of 0
+      disables caching for the matching paths.
+    - When the cached bodies exceed max_bytes, the least recently used
+      entries are evicted.
+    - invalidate(path), which Sender calls after each successful write,
+      drops the entries for the fabric in path, and the entries whose
+      path names no fabric (e.g. control/fabrics).  A write whose path
+      names no fabric drops every entry.
+
+    ## Usage
+
+    ```python
+    cache = ResponseCache()
+    cache.ttl = 30
+    cache.add_rule(r"/control/fabrics$", 120)
+    cache.add_rule(r"/inventory/switchesByFabric", 60)
+    sender.response_cache = cache
+    ...
+    print(cache.stats)
+    ```
+
+    ## Raises
+
+    - TypeError, ValueError from the property setters and add_rule() if values are invalid.
+
+    ## Properties
+
+    - max_bytes (int): getter/setter: maximum bytes of cached bodies.  Default 64 MiB
+    - stats (dict): getter: hits, misses, invalidations, evictions, entries and bytes
+    - ttl (float): getter/setter: seconds a response is cached, for paths matching no rule.  Default 30
+    """
+
+    _shared: dict = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+        self._generation = 0
+        self._rules: list[tuple[re.Pattern, float]] = []
+        self._size = 0
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0, "evictions": 0}
+
+        self._max_bytes = 64 * 1024 * 1024
+        self._ttl = 30.0
+
+    @classmethod
+    def shared(cls, controller: str) -> "ResponseCache":
+        """
+        # Summary
+
+        Return the process-wide ResponseCache for controller (e.g. its IP
+        address, or ndfc_python.common.ttl_cache.normalize_controller()
+        of its nodes), creating it on first use, so that every Sender
+        talking to the same controller shares its cached responses and
+        invalidations.
+        """
+        with cls._shared_lock:
+            if controller not in cls._shared:
+                cls._shared[controller] = cls()
+            return cls._shared[controller]
+
+    @staticmethod
+    def fabric_name(path: str) -> str | None:
+        """
+        Return the fabric named in path, or None if path names no fabric.
+        """
+        match = FABRIC_PATTERN.search(path)
+        if match is None:
+            return None
+        return match.group(1) or match.group(2)
+
+    def add_rule(self, pattern: str, ttl: float) -> None:
+        """
+        # Summary
+
+        Cache the responses to paths matching the regular expression
+        pattern (re.search()) for ttl seconds.  Rules are tried in the
+        order they were added.
+
+        ## Raises
+
+        - TypeError if ttl is not a number
+        - ValueError if pattern is not a valid regular expression, or ttl is negative
+        """
+        method_name = "add_rule"
+        ttl = self._verify_number(method_name, "ttl", ttl)
+        try:
+            compiled = re.compile(pattern)
+        except (re.error, TypeError) as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Invalid pattern {pattern}. Error detail: {error}"
+            raise ValueError(msg) from error
+        with self._lock:
+            self._rules.append((compiled, ttl))
+
+    def ttl_for(self, path: str) -> float:
+        """
+        Return the seconds a response to path is cached.
+        """
+        for pattern, ttl in self._rules:
+            if pattern.search(path):
+                return ttl
+        return self._ttl
+
+    def get(self, path: str):
+        """
+        # Summary
+
+        Return the value cached for path, or None if there is none or it
+        has expired.  Counts a hit or a miss, unless path is not cached
+        (its ttl is 0).
+        """
+        if self.ttl_for(path) <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and time.monotonic() >= entry[0]:
+                self._remove(path)
+                entry = None
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(path)
+            self._stats["hits"] += 1
+            return entry[3]
+
+    @property
+    def generation(self) -> int:
+        """
+        A counter incremented by each invalidate().  Pass the generation
+        read before sending a GET to set(), so that a response that was
+        in flight during a write is not cached.
+        """
+        return self._generation
+
+    def set(self, path: str, value, size: int, generation: int | None = None) -> None:
+        """
+        # Summary
+
+        Cache value, whose size is about size bytes, for path, evicting
+        least recently used entries as needed to stay within max_bytes.
+        If generation is given, and invalidate() has been called since it
+        was read, value is not cached.
+        """
+        ttl = self.ttl_for(path)
+        size += ENTRY_OVERHEAD + len(path)
+        if ttl <= 0 or size > self._max_bytes:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            if path in self._entries:
+                self._remove(path)
+            self._entries[path] = (time.monotonic() + ttl, self.fabric_name(path), size, value)
+            self._size += size
+            self._evict()
+
+    def invalidate(self, path: str) -> None:
+        """
+        # Summary
+
+        Drop the entries that a write to path may have made stale: those
+        for the fabric in path and those that name no fabric, or every
+        entry if path names no fabric.
+        """
+        method_name = "invalidate"
+        fabric_name = self.fabric_name(path)
+        with self._lock:
+            self._generation += 1
+            if fabric_name is None:
+                stale = list(self._entries)
+            else:
+                stale = [key for key, entry in self._entries.items() if entry[1] in (fabric_name, None)]
+            for key in stale:
+                self._remove(key)
+            self._stats["invalidations"] += len(stale)
+        if stale and self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Write to {path}. Dropped {len(stale)} cached responses."
+            self.log.debug(msg)
+
+    def clear(self) -> None:
+        """
+        Drop every entry.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def reset_stats(self) -> None:
+        """
+        Reset the hit, miss, invalidation and eviction counters to zero.
+        """
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0
+
+    def _remove(self, path: str) -> None:
+        """
+        Remove path.  Called with _lock held.
+        """
+        entry = self._entries.pop(path)
+        self._size -= entry[2]
+
+    def _evict(self) -> None:
+        """
+        Evict least recently used entries until within max_bytes.  Called
+        with _lock held.
+        """
+        while self._size > self._max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._size -= entry[2]
+            self._stats["evictions"] += 1
+
+    def _verify_number(self, method_name: str, name: str, value) -> float:
+        """
+        Return value as a float if it is a number >= 0.
+
+        ## Raises
+
+        - TypeError if value is not a number
+        - ValueError if value is negative
+        """
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{name} must be a number. Got {type(value).__name__}."
+            raise TypeError(msg)
+        if value < 0:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{name} must be >= 0. Got {value}."
+            raise ValueError(msg)
+        return float(value)
+
+    @property
+    def max_bytes(self) -> int:
+        """
+        Maximum bytes of cached response bodies (plus a small overhead
+        per entry).  Responses larger than max_bytes are not cached.
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        if isinstance(value, bool) or not isinstance(value, int):
+            msg = f"{self.class_name}.max_bytes: "
+            msg += f"max_bytes must be an int. Got {type(value).__name__}."
+            raise TypeError(msg)
+        self._verify_number("max_bytes", "max_bytes", value)
+        with self._lock:
+            self._max_bytes = value
+            self._evict()
+
+    @property
+    def stats(self) -> dict:
+        """
+        Cache hits and misses, entries dropped by invalidate()
+        ("invalidations") and to stay within max_bytes ("evictions"),
+        and the current number of entries and bytes.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["bytes"] = self._size
+            return stats
+
+    @property
+    def ttl(self) -> float:
+        """
+        Seconds a response is cached, for paths that match no rule.  0
+        caches only the paths that match a rule.
+        """
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, value: float) -> None:
+        self._ttl = self._verify_number("ttl", "ttl", value)
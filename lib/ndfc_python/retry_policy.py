@@ -0,0 +1,350 @@
+"""
+# Name
+
+retry_policy.py
+
+# Description
+
+Decide whether, and after how long, Sender retries a request that failed
+with a transient error.
+
+RestSend retries a failed request after a fixed send_interval (5 seconds
+in the example scripts), whatever the failure.  Most failures are not
+worth retrying at all (a 400 for an invalid payload fails again), and
+those that are (429, 503) usually succeed again well within a second.
+
+RetryPolicy retries only retryable status codes, and connection errors
+for idempotent verbs, with exponential backoff and full jitter, honoring
+the controller's Retry-After header, until max_attempts or an overall
+deadline is reached.
+"""
+
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+# Verbs that can be repeated without changing the result.
+IDEMPOTENT_VERBS = frozenset({"DELETE", "GET", "HEAD", "OPTIONS", "PUT"})
+# Retryable status codes for idempotent verbs.
+RETRYABLE_IDEMPOTENT = frozenset({429, 500, 502, 503, 504})
+# Retryable status codes for other verbs (POST).  429 and 503 mean the
+# request was refused, not processed, so a retry cannot create a duplicate.
+RETRYABLE_OTHER = frozenset({429, 503})
+
+
+class RetryPolicy:
+    """
+    # Summary
+
+    Retry policy for Sender: which responses to retry, how long to wait
+    between attempts, and when to give up.
+
+    The delay before retry n (1, 2, ...) is a random value between 0 and
+    min(max_delay, base_delay * multiplier ** (n - 1)) ("full jitter"),
+    so that many clients retrying at once do not retry in lockstep.  If
+    the response has a Retry-After header, the delay is Retry-After
+    instead, which max_delay does not cap: the controller's request is
+    honored.  No retry is made if it would start after deadline seconds
+    from the first attempt, so a Retry-After beyond the deadline ends the
+    retries.
+
+    By default, idempotent verbs (GET, PUT, DELETE) are retried on 429,
+    500, 502, 503 and 504, and on connection errors.  Other verbs (POST)
+    are retried only on 429 and 503.  add_rule() overrides the
+    retryable status codes for the paths that start with a prefix.
+
+    ## Usage
+
+    ```python
+    policy = RetryPolicy()
+    policy.max_attempts = 5
+    policy.deadline = 30
+    policy.add_rule("/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics", {429, 503}, verbs={"POST"})
+    sender.retry_policy = policy
+    ```
+
+    ## Raises
+
+    - TypeError, ValueError from the property setters and add_rule() if values are invalid.
+
+    ## Properties
+
+    - base_delay (float): getter/setter: seconds before the first retry, before jitter.  Default 0.25
+    - deadline (float): getter/setter: seconds, from the first attempt, after which no retry starts.  Default 60
+    - jitter (bool): getter/setter: randomize delays (full jitter).  Default True
+    - max_attempts (int): getter/setter: attempts per request, including the first.  1 disables retries.  Default 5
+    - max_delay (float): getter/setter: maximum seconds of backoff between attempts.  Default 8
+    - multiplier (float): getter/setter: backoff multiplier.  Default 2
+    - stats (dict): getter: retries made and seconds slept, since the last reset_stats()
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
+
+        self._lock = threading.Lock()
+        self._random = random.Random()
+        self._rules: list[tuple[str, frozenset, frozenset | None]] = []
+        self._retries = 0
+        self._slept = 0.0
+
+        self._base_delay = 0.25
+        self._deadline = 60.0
+        self._jitter = True
+        self._max_attempts = 5
+        self._max_delay = 8.0
+        self._multiplier = 2.0
+
+    def add_rule(self, path_prefix: str, statuses, verbs=None) -> None:
+        """
+        # Summary
+
+        Retry requests whose path starts with path_prefix (and whose verb
+        is in verbs, if given) only on the status codes in statuses.  An
+        empty statuses disables retries for those requests.  The longest
+        matching path_prefix wins.
+
+        ## Raises
+
+        - TypeError if path_prefix is not a str, or statuses or verbs
+          are not collections of int and str respectively.
+        """
+        method_name = "add_rule"
+        if not isinstance(path_prefix, str):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"path_prefix must be a str. Got {type(path_prefix).__name__}."
+            raise TypeError(msg)
+        try:
+            statuses = frozenset(int(status) for status in statuses)
+            if verbs is not None:
+                verbs = frozenset(verb.upper() for verb in verbs)
+        except (AttributeError, TypeError, ValueError) as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "statuses must be a collection of int, and verbs a collection of str. "
+            msg += f"Error detail: {error}"
+            raise TypeError(msg) from error
+        with self._lock:
+            self._rules.append((path_prefix, statuses, verbs))
+            self._rules.sort(key=lambda rule: len(rule[0]), reverse=True)
+
+    def retryable_statuses(self, verb: str, path: str) -> frozenset:
+        """
+        # Summary
+
+        Return the status codes that are retried for verb and path.
+        """
+        for path_prefix, statuses, verbs in self._rules:
+            if path.startswith(path_prefix) and (verbs is None or verb in verbs):
+                return statuses
+        if verb in IDEMPOTENT_VERBS:
+            return RETRYABLE_IDEMPOTENT
+        return RETRYABLE_OTHER
+
+    def retry_status(self, verb: str, path: str, status_code: int) -> bool:
+        """
+        Return True if a response with status_code is retryable for verb and path.
+        """
+        return status_code in self.retryable_statuses(verb, path)
+
+    @staticmethod
+    def retry_error(verb: str) -> bool:
+        """
+        Return True if a connection error is retryable for verb.  A
+        non-idempotent request may have reached the controller, so it is
+        not retried.
+        """
+        return verb in IDEMPOTENT_VERBS
+
+    @staticmethod
+    def parse_retry_after(value) -> float | None:
+        """
+        # Summary
+
+        Return the delay, in seconds, given by a Retry-After header value
+        (delay-seconds or an HTTP-date), or None if value is missing or
+        invalid.
+        """
+        if value is None:
+            return None
+        value = str(value).strip()
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at is None:
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+
+    def delay(self, attempt: int, retry_after=None) -> float:
+        """
+        # Summary
+
+        Return the seconds to wait before retry number attempt (1 for the
+        first retry), given the Retry-After header value, if any.  A
+        Retry-After delay is returned as is, even if above max_delay.
+        """
+        retry_after_seconds = self.parse_retry_after(retry_after)
+        if retry_after_seconds is not None:
+            return retry_after_seconds
+        ceiling = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        if not self.jitter:
+            return ceiling
+        return self._random.uniform(0, ceiling)
+
+    def next_delay(self, attempt: int, started: float, retry_after=None) -> float | None:
+        """
+        # Summary
+
+        Return the seconds to wait before retry number attempt, or None
+        if no retry should be made: attempt would exceed max_attempts, or
+        the retry would start after the deadline.  started is the
+        time.monotonic() of the first attempt.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        delay = self.delay(attempt, retry_after)
+        if time.monotonic() + delay - started > self.deadline:
+            return None
+        return delay
+
+    def record(self, delay: float) -> None:
+        """
+        Count a retry after delay seconds in stats.  For callers that
+        sleep themselves, e.g. with asyncio.sleep().
+        """
+        with self._lock:
+            self._retries += 1
+            self._slept += delay
+
+    def sleep(self, delay: float) -> None:
+        """
+        Sleep for delay seconds, and count the retry in stats.
+        """
+        self.record(delay)
+        time.sleep(delay)
+
+    def reset_stats(self) -> None:
+        """
+        Reset stats to zero.
+        """
+        with self._lock:
+            self._retries = 0
+            self._slept = 0.0
+
+    @property
+    def stats(self) -> dict:
+        """
+        Retries made ("retries") and seconds slept before them ("slept"),
+        since the last reset_stats().
+        """
+        with self._lock:
+            return {"retries": self._retries, "slept": self._slept}
+
+    def _verify_seconds(self, name: str, value) -> float:
+        """
+        Return value as a float if it is a number >= 0.
+
+        ## Raises
+
+        - TypeError if value is not a number
+        - ValueError if value is negative
+        """
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            msg = f"{self.class_name}.{name}: "
+            msg += f"{name} must be a number. Got {type(value).__name__}."
+            raise TypeError(msg)
+        if value < 0:
+            msg = f"{self.class_name}.{name}: "
+            msg += f"{name} must be >= 0. Got {value}."
+            raise ValueError(msg)
+        return float(value)
+
+    @property
+    def base_delay(self) -> float:
+        """
+        Seconds before the first retry, before jitter.
+        """
+        return self._base_delay
+
+    @base_delay.setter
+    def base_delay(self, value: float) -> None:
+        self._base_delay = self._verify_seconds("base_delay", value)
+
+    @property
+    def deadline(self) -> float:
+        """
+        Seconds, from the first attempt, after which no retry is started.
+        """
+        return self._deadline
+
+    @deadline.setter
+    def deadline(self, value: float) -> None:
+        self._deadline = self._verify_seconds("deadline", value)
+
+    @property
+    def jitter(self) -> bool:
+        """
+        If True, each delay is a random value between 0 and the backoff delay.
+        """
+        return self._jitter
+
+    @jitter.setter
+    def jitter(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            msg = f"{self.class_name}.jitter: "
+            msg += f"jitter must be a bool. Got {type(value).__name__}."
+            raise TypeError(msg)
+        self._jitter = value
+
+    @property
+    def max_attempts(self) -> int:
+        """
+        Attempts per request, including the first.  1 disables retries.
+        """
+        return self._max_attempts
+
+    @max_attempts.setter
+    def max_attempts(self, value: int) -> None:
+        if isinstance(value, bool) or not isinstance(value, int):
+            msg = f"{self.class_name}.max_attempts: "
+            msg += f"max_attempts must be an int. Got {type(value).__name__}."
+            raise TypeError(msg)
+        if value < 1:
+            msg = f"{self.class_name}.max_attempts: "
+            msg += f"max_attempts must be >= 1. Got {value}."
+            raise ValueError(msg)
+        self._max_attempts = value
+
+    @property
+    def max_delay(self) -> float:
+        """
+        Maximum seconds of backoff between attempts.  Does not apply to a
+        Retry-After delay, which is limited only by deadline.
+        """
+        return self._max_delay
+
+    @max_delay.setter
+    def max_delay(self, value: float) -> None:
+        self._max_delay = self._verify_seconds("max_delay", value)
+
+    @property
+    def multiplier(self) -> float:
+        """
+        Factor by which the backoff delay grows with each retry.
+        """
+        return self._multiplier
+
+    @multiplier.setter
+    def multiplier(self, value: float) -> None:
+        value = self._verify_seconds("multiplier", value)
+        if value < 1:
+            msg = f"{self.class_name}.multiplier: "
+            msg += f"multiplier must be >= 1. Got {value}."
+            raise ValueError(msg)
+        self._multiplier = value
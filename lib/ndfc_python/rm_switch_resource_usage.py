@@ -17,7 +17,6 @@ Payload is not required for GET requests.
 # We are using isort for import sorting.
 # pylint: disable=wrong-import-order
 
-import inspect
 import logging
 
 from ndfc_python.common.fabric.fabric_inventory import FabricInventory
@@ -88,7 +87,7 @@ class RmSwitchResourceUsage:
         self.properties = {}
 
     def _validate_rest_send_requirements(self):
-        method_name = inspect.stack()[0][3]
+        method_name = "_validate_rest_send_requirements"
         # pylint: disable=no-member
         if self.rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -105,7 +104,7 @@ class RmSwitchResourceUsage:
         """
         populate fabric inventory
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_populate_fabric_inventory"
         # pylint: disable=no-member
         self._validate_rest_send_requirements()
 
@@ -125,7 +124,7 @@ class RmSwitchResourceUsage:
         """
         final verification of all parameters
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_final_verification"
         self._validate_rest_send_requirements()
 
         if self.switch_name in (None, ""):
@@ -142,7 +141,7 @@ class RmSwitchResourceUsage:
         """
         Retrieve switch resource usage by sending a GET request to the controller.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
 
         if not self._inventory_populated:
             self._populate_fabric_inventory()
@@ -0,0 +1,499 @@
+#
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+__author__ = "Allen Robel"
+
+import asyncio
+import time
+
+from ndfc_python.sender_request import SenderRequest
+from ndfc_python.sender_requests import Sender
+from ndfc_python.single_flight import SingleFlight
+
+try:
+    import aiohttp
+
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+if HAS_AIOHTTP is False:
+    msg_outer = "aiohttp is not installed. "
+    msg_outer += "install with e.g. pip install aiohttp"
+    raise ImportError(msg_outer)
+
+
+class AsyncSender(Sender):
+    """
+    ### Summary
+    An asyncio implementation of ``Sender``.  Responses are retrieved
+    using the aiohttp library.
+
+    ``AsyncSender`` exposes the same credential properties, login/token
+    handling and response format (``RETURN_CODE``, ``DATA``, ``MESSAGE``,
+    ``METHOD``, ``REQUEST_PATH``) as ``Sender``, but ``commit()``,
+    ``login()`` and ``refresh_login()`` are coroutines.
+
+    Because ``commit()`` must be awaited, ``AsyncSender`` cannot be
+    injected into ``RestSend``, and ``implements`` returns
+    ``sender_async_v1`` rather than ``sender_v1``.
+
+    ### Token lifetime
+    As in ``Sender``, once logged in, each request first logs in again if
+    ``token_manager.needs_refresh()``, and a request that returns 401 is
+    retried once after logging in again.  Concurrent requests log in
+    again only once.  ``token_manager.background`` is not supported (the
+    timer thread cannot await a login), and is ignored.
+
+    ### Raises
+    Same as ``Sender``, plus:
+
+    -   ``TypeError`` if:
+            -   ``max_concurrency`` is not an ``int``.
+    -   ``ValueError`` if:
+            -   ``max_concurrency`` is less than one.
+
+    ### Default values
+    -   ``max_concurrency``: 10
+
+    ### Usage
+
+    ``send()`` and ``request()`` keep no per-call state on the instance, so
+    many requests can be awaited concurrently against one logged-in session.
+    ``gather()`` bounds how many awaitables run at once.
+
+    ```python
+    import asyncio
+
+    from ndfc_python.sender_aiohttp import AsyncSender
+
+
+    async def main():
+        async with AsyncSender() as sender:
+            await sender.login()
+            paths = [f"{ep_fabrics}/{fabric}/inventory/switchesByFabric" for fabric in fabrics]
+            responses = await sender.gather(*[sender.request("GET", path) for path in paths], limit=5)
+
+
+    asyncio.run(main())
+    ```
+
+    The property-based API matches ``Sender``:
+
+    ```python
+    sender.path = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics"
+    sender.verb = "GET"
+    await sender.commit()
+    print(sender.response)
+    ```
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._implements = "sender_async_v1"
+        self._async_login_lock = None
+        self._client_session = None
+        self._max_concurrency = 10
+        self._refresh_lock = None
+        self._semaphore = None
+        # Tokens are refreshed before a request, or after a 401, never from
+        # the token_manager background timer.
+        self.token_manager.refresh = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):  # pylint: disable=invalid-overridden-method
+        """
+        ### Summary
+        Close the aiohttp client session and release its connections.
+
+        ### Raises
+        None
+        """
+        if self._client_session is not None:
+            await self._client_session.close()
+        self._async_login_lock = None
+        self._client_session = None
+        self._refresh_lock = None
+        self._semaphore = None
+
+    def _get_client_session(self):
+        """
+        Return the aiohttp ClientSession, creating it if needed.  Must be
+        called from within a running event loop.
+        """
+        if self._client_session is None or self._client_session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, ssl=False)
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+            self._client_session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._client_session
+
+    def _get_request_headers(self):
+        """
+        Return the headers to use for a request.  Before login (no token)
+        only Content-Type is sent, since aiohttp rejects None header values.
+        """
+        if self.token is None:
+            return {"Content-Type": "application/json"}
+        return self.get_headers()
+
+    async def send(self, request):  # pylint: disable=invalid-overridden-method
+        """
+        ### Summary
+        Send ``request`` (a ``SenderRequest``) to the controller and return
+        a ``SenderResponse``.
+
+        ``send()`` reads and writes no per-call instance state (other than
+        the token and request history), so it is safe to await many calls
+        concurrently.  Transient failures are retried as ``retry_policy``
+        allows, with ``asyncio.sleep()`` between attempts, and fail over
+        to another node if ``cluster`` is set.  Identical GETs awaited at
+        the same time share one HTTP request (``single_flight``), unless
+        a write completed between them.
+
+        ### Raises
+        -   ``TypeError`` if ``request`` is not a ``SenderRequest``.
+        -   ``ValueError`` if the controller cannot be reached.
+        """
+        method_name = "send"
+        if not isinstance(request, SenderRequest):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "request must be a SenderRequest. "
+            msg += f"Got type {type(request).__name__}."
+            raise TypeError(msg)
+        url = self.build_url(request.path)
+        cache = self.response_cache
+        generation = None
+        if cache is not None and request.verb == "GET":
+            cached = cache.get(request.path)
+            if cached is not None:
+                return self._decode_response(cached)
+            generation = cache.generation
+        if request.path != "/login" and self.logged_in is True and self.token_manager.needs_refresh():
+            await self._refresh_token(self.token)
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"verb {request.verb}, url {url}"
+        self.log.debug(msg)
+
+        data = None
+        if request.payload is not None:
+            data = self.json_codec.dumps(request.payload)
+        if self.single_flight is not None and request.verb == "GET":
+            key = SingleFlight.key(request.verb, url, data, self._write_generation)
+            entry = await self.single_flight.do_async(key, lambda: self._fetch(request, url, data))
+        else:
+            entry = await self._fetch(request, url, data)
+        sender_response = self._decode_response(entry)
+        if request.verb != "GET" and sender_response.success:
+            self._written()
+        if cache is not None and sender_response.success:
+            if request.verb == "GET":
+                cache.set(request.path, entry, len(entry[1]), generation)
+            elif request.path != "/login":
+                cache.invalidate(request.path)
+        return sender_response
+
+    async def _fetch(self, request, url, data):
+        """
+        ### Summary
+        Send ``request``, with body ``data``, and return the raw response
+        (return_code, body, reason, method, url), retrying transient
+        failures as ``retry_policy`` allows and failing over to another
+        node if ``cluster`` is set.  If the controller returns 401, log in
+        again and retry once (not for ``/login`` itself).
+
+        ### Raises
+        -   ``ValueError`` if the controller cannot be reached, or the
+            re-login fails.
+        """
+        method_name = "_fetch"
+        session = self._get_client_session()
+        started = time.monotonic()
+        attempt = 1
+        failovers = 0
+        refresh = request.path != "/login" and self.logged_in is True
+        retried = False
+        while True:
+            retry_after = None
+            host = None
+            token = self.token
+            if self.cluster is not None:
+                host = self.cluster.select(request.verb)
+                url = self.build_url(request.path, host)
+            try:
+                async with self._semaphore:
+                    await self._acquire_rate_limiter()
+                    sent = time.monotonic()
+                    status_code = None
+                    try:
+                        async with session.request(request.verb, url, headers=self._get_request_headers(), data=data) as response:
+                            status_code = response.status
+                            body = await response.read()
+                            self.update_token_from_headers(response.headers)
+                            entry = (response.status, body, response.reason, response.method, str(response.url))
+                            retry_after = response.headers.get("Retry-After")
+                    finally:
+                        if self.rate_limiter is not None:
+                            self.rate_limiter.release(status_code, time.monotonic() - sent)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as error:
+                if host is not None:
+                    self.cluster.mark_down(host)
+                    failover = self.retry_policy.retry_error(request.verb) or isinstance(error, aiohttp.ClientConnectorError)
+                    if failover and failovers < len(self.cluster.hosts) - 1:
+                        failovers += 1
+                        msg = f"{self.class_name}.{method_name}: "
+                        msg += f"{request.verb} {url} failed ({error.__class__.__name__}). "
+                        msg += "Failing over to another node."
+                        self.log.info(msg)
+                        continue
+                delay = None
+                if self.retry_policy.retry_error(request.verb):
+                    delay = self.retry_policy.next_delay(attempt, started)
+                if delay is None:
+                    msg = f"{self.class_name}.{method_name}: "
+                    msg += "Error connecting to the controller. "
+                    msg += f"Error detail: {error}"
+                    raise ValueError(msg) from error
+                reason = f"failed ({error.__class__.__name__})"
+            else:
+                if host is not None:
+                    self.cluster.record(host, time.monotonic() - sent)
+                if status_code == 401 and refresh and not retried:
+                    msg = f"{self.class_name}.{method_name}: "
+                    msg += f"{request.verb} {url} returned 401. "
+                    msg += "Logging in again and retrying once."
+                    self.log.info(msg)
+                    await self._refresh_token(token)
+                    retried = True
+                    continue
+                if not self.retry_policy.retry_status(request.verb, request.path, status_code):
+                    return entry
+                delay = self.retry_policy.next_delay(attempt, started, retry_after)
+                if delay is None:
+                    return entry
+                reason = f"returned {status_code}"
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{request.verb} {url} {reason}. "
+            msg += f"Retrying in {delay:.2f} seconds (attempt {attempt + 1} of {self.retry_policy.max_attempts})."
+            self.log.info(msg)
+            self.retry_policy.record(delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _refresh_token(self, stale_token):  # pylint: disable=invalid-overridden-method
+        """
+        ### Summary
+        Log in again and replace the token, unless another coroutine has
+        already replaced ``stale_token``.
+
+        Uses ``send()`` directly, so the ``path``, ``verb``, ``payload``
+        and ``response`` of a ``commit()`` in progress are not touched.
+
+        ### Raises
+        -   ``ValueError`` if the login fails.
+        """
+        method_name = "_refresh_token"
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            if self.token != stale_token:
+                return
+            response = await self.send(SenderRequest("POST", "/login", self._login_payload()))
+            token = response.data.get("jwttoken") if isinstance(response.data, dict) else None
+            if not response.success or token is None:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Unable to log in again. Controller response: {response.as_dict()}"
+                raise ValueError(msg)
+            with self._token_lock:
+                self.token = token
+            self.jwttoken = token
+            self.rbac = response.data.get("rbac")
+            self.token_manager.update(token)
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "Logged in again with a new token."
+            self.log.debug(msg)
+
+    async def _acquire_rate_limiter(self):
+        """
+        ### Summary
+        Wait, without blocking the event loop, for a token and an
+        in-flight slot from ``rate_limiter``, if set.
+        """
+        if self.rate_limiter is None:
+            return
+        await self.rate_limiter.acquire_async()
+
+    async def request(self, verb, path, payload=None):
+        """
+        ### Summary
+        Convenience wrapper around ``send()``.  Send a request to the
+        controller and return the response dictionary (same format as
+        ``response``).
+
+        ### Raises
+        -   ``ValueError`` if:
+                -   ``path`` or ``verb`` is not set.
+                -   The controller cannot be reached.
+        -   ``TypeError`` if ``payload`` is not a ``dict`` or ``list``.
+        """
+        sender_response = await self.send(SenderRequest(verb, path, payload))
+        return sender_response.as_dict()
+
+    async def gather(self, *aws, limit=None):
+        """
+        ### Summary
+        Await ``aws`` (coroutines or futures) concurrently, running at most
+        ``limit`` of them at a time, and return their results in order.
+
+        ``limit`` defaults to ``max_concurrency``.
+
+        ### Raises
+        -   Any exception raised by an awaitable in ``aws``.
+        """
+        if limit is None:
+            limit = self.max_concurrency
+        semaphore = asyncio.Semaphore(limit)
+
+        async def _bounded(awaitable):
+            async with semaphore:
+                return await awaitable
+
+        return await asyncio.gather(*[_bounded(awaitable) for awaitable in aws])
+
+    async def commit(self):  # pylint: disable=invalid-overridden-method
+        """
+        Send the REST request to the controller
+
+        ### Raises
+            -   ``ValueError`` if:
+                    -   ``path`` is not set.
+                    -   ``verb`` is not set.
+
+        ### Properties read
+            -   ``verb``: HTTP verb e.g. GET, POST, PUT, DELETE
+            -   ``path``: HTTP path e.g. http://controller_ip/path/to/endpoint
+            -   ``payload`` Optional HTTP payload
+
+        ## Properties written
+            -   ``response``: raw response from the controller
+        """
+        method_name = "commit"
+        try:
+            self._verify_commit_parameters()
+        except ValueError as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "Not all mandatory parameters are set. "
+            msg += f"Error detail: {error}"
+            raise ValueError(msg) from error
+        request = SenderRequest(self.verb, self.path, self.payload)
+        self._local.payload = None
+        response = await self.send(request)
+        self.url = response.url
+        self.return_code = response.return_code
+        self.response = response.as_dict()
+
+    async def login(self):  # pylint: disable=invalid-overridden-method
+        """
+        Log in to the server.  Coroutines calling login() concurrently
+        wait for the first one's login, rather than each logging in.
+        """
+        if self.logged_in is True:
+            return
+        msg = ""
+        if self.username is None:
+            msg = "call AsyncSender.username before calling AsyncSender.login()"
+        if self.password is None:
+            msg = "call AsyncSender.password before calling AsyncSender.login()"
+        if self.domain is None:
+            msg = "call AsyncSender.domain before calling AsyncSender.login()"
+        if msg != "":
+            self.log.debug(msg)
+            raise ValueError(msg)
+        if self._async_login_lock is None:
+            self._async_login_lock = asyncio.Lock()
+        async with self._async_login_lock:
+            if self.logged_in is True:
+                return
+            if self.token_manager.background:
+                msg = f"{self.class_name}.login: "
+                msg += "token_manager.background is not supported and is ignored. "
+                msg += "The token is refreshed before the request that needs it."
+                self.log.warning(msg)
+            self.logged_in = "Pending"
+            payload = {}
+            payload["userName"] = self.username
+            payload["userPasswd"] = self.password
+            payload["domain"] = self.domain
+            self.path = "/login"
+            self.verb = "POST"
+            self.payload = payload
+            await self.commit()
+            self.update_token()
+            self.logged_in = True
+
+    async def refresh_login(self):  # pylint: disable=invalid-overridden-method
+        """
+        Refresh the login session.
+        """
+        method_name = "refresh_login"
+        msg = f"{self.class_name}.{method_name}: "
+        msg += "ENTERED"
+        self.log.debug(msg)
+        payload = {}
+        payload["userName"] = self.username
+        payload["userPasswd"] = self.password
+        payload["domain"] = self.domain
+        self.path = "/refresh"
+        self.verb = "POST"
+        self.payload = payload
+        await self.commit()
+        self.update_token()
+
+    @property
+    def max_concurrency(self):
+        """
+        ### Summary
+        Maximum number of requests in flight at once, and the connection
+        limit of the underlying aiohttp connector.
+
+        ### Raises
+        -   ``TypeError`` if value is not an ``int``.
+        -   ``ValueError`` if value is less than one.
+        """
+        return self._max_concurrency
+
+    @max_concurrency.setter
+    def max_concurrency(self, value):
+        method_name = "max_concurrency"
+        if isinstance(value, bool) or not isinstance(value, int):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{method_name} must be an int. "
+            msg += f"Got type {type(value).__name__}, "
+            msg += f"value {value}."
+            raise TypeError(msg)
+        if value < 1:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{method_name} must be >= 1. "
+            msg += f"Got {value}."
+            raise ValueError(msg)
+        self._max_concurrency = value
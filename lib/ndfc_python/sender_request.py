@@ -0,0 +1,176 @@
+#
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+__author__ = "Allen Robel"
+
+
+class SenderRequest:
+    """
+    ### Summary
+    A single REST request, passed to ``Sender.send()``.
+
+    ``SenderRequest`` is read-only once created, so one instance can be
+    sent from any thread without copying.
+
+    ### Raises
+    -   ``ValueError`` if:
+            -   ``verb`` is not set.
+            -   ``path`` is not set.
+    -   ``TypeError`` if:
+            -   ``payload`` is not ``None``, a ``dict``, or a ``list``.
+
+    ### Usage
+    ```python
+    request = SenderRequest("GET", "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics")
+    response = sender.send(request)
+    print(response.return_code, response.data)
+    ```
+    """
+
+    __slots__ = ("_path", "_payload", "_verb")
+
+    def __init__(self, verb, path, payload=None):
+        class_name = self.__class__.__name__
+        if not verb:
+            msg = f"{class_name}: verb must be set."
+            raise ValueError(msg)
+        if not path:
+            msg = f"{class_name}: path must be set."
+            raise ValueError(msg)
+        if payload is not None and not isinstance(payload, (dict, list)):
+            msg = f"{class_name}: payload must be a list or dict. "
+            msg += f"Got type {type(payload).__name__}, "
+            msg += f"value {payload}."
+            raise TypeError(msg)
+        self._verb = verb.upper()
+        self._path = path
+        self._payload = payload
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(verb={self._verb!r}, path={self._path!r})"
+
+    @property
+    def path(self):
+        """
+        Endpoint path for the REST request.
+
+        ### Example
+        ``/appcenter/cisco/ndfc...etc...``
+        """
+        return self._path
+
+    @property
+    def payload(self):
+        """
+        Optional payload (``dict`` or ``list``) for the REST request.
+        """
+        return self._payload
+
+    @property
+    def verb(self):
+        """
+        HTTP verb e.g. GET, POST, PUT, DELETE
+        """
+        return self._verb
+
+
+class SenderResponse:
+    """
+    ### Summary
+    The controller response to a ``SenderRequest``, returned by
+    ``Sender.send()``.
+
+    ``as_dict()`` returns the dictionary format expected by ``RestSend``
+    and ``ResponseHandler``:
+
+    -   ``RETURN_CODE``: HTTP status code
+    -   ``DATA``: decoded JSON body, or ``{"INVALID_JSON": text}``
+    -   ``MESSAGE``: HTTP reason phrase
+    -   ``METHOD``: HTTP verb
+    -   ``REQUEST_PATH``: URL of the request
+
+    ### Raises
+    None
+    """
+
+    __slots__ = ("_data", "_message", "_method", "_return_code", "_url")
+
+    def __init__(self, return_code, data, message, method, url):
+        self._return_code = return_code
+        self._data = data
+        self._message = message
+        self._method = method
+        self._url = url
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(return_code={self._return_code!r}, method={self._method!r}, url={self._url!r})"
+
+    def as_dict(self):
+        """
+        ### Summary
+        Return the response as a ``RestSend``-compatible dictionary.
+        """
+        response_dict = {}
+        response_dict["RETURN_CODE"] = self._return_code
+        response_dict["DATA"] = self._data
+        response_dict["MESSAGE"] = self._message
+        response_dict["METHOD"] = self._method
+        response_dict["REQUEST_PATH"] = self._url
+        return response_dict
+
+    @property
+    def data(self):
+        """
+        Decoded response body.
+        """
+        return self._data
+
+    @property
+    def message(self):
+        """
+        HTTP reason phrase e.g. OK, Not Found
+        """
+        return self._message
+
+    @property
+    def method(self):
+        """
+        HTTP verb of the request
+        """
+        return self._method
+
+    @property
+    def return_code(self):
+        """
+        HTTP status code
+        """
+        return self._return_code
+
+    @property
+    def success(self):
+        """
+        True if return_code is 2xx
+        """
+        return isinstance(self._return_code, int) and 200 <= self._return_code < 300
+
+    @property
+    def url(self):
+        """
+        URL of the request
+        """
+        return self._url
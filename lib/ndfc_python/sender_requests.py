@@ -19,12 +19,22 @@ __metaclass__ = type
 __author__ = "Allen Robel"
 
 import copy
-import inspect
-import json
 import logging
+import sys
+import threading
+import time
 from collections import deque
 from os import environ
 
+from ndfc_python.json_codec import JsonCodec
+from ndfc_python.json_stream import iter_json_array
+from ndfc_python.read_only_dict import ReadOnlyDict
+from ndfc_python.retry_policy import RetryPolicy
+from ndfc_python.sender_request import SenderRequest, SenderResponse
+from ndfc_python.sender_session import SenderSession
+from ndfc_python.single_flight import SingleFlight
+from ndfc_python.token_manager import TokenManager
+
 try:
     import requests
 
@@ -49,6 +59,10 @@ if HAS_URLLIB3 is False:
     msg_outer += "install with e.g. pip install urllib3"
     raise ImportError(msg_outer)
 
+# Controllers typically use self-signed certificates.  Disable the warning
+# once per process, rather than in every Sender().
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
 
 class Sender:
     """
@@ -112,17 +126,100 @@ class Sender:
     # etc...
     # See rest_send_v2.py for RestSend() usage.
     ```
+
+    ### Connection pooling
+    Requests are sent over a pooled, keep-alive ``SenderSession``.  By
+    default each ``Sender`` owns its own session.  To share one pool
+    across every ``Sender`` in a process, set ``session`` to
+    ``SenderSession.shared()``.  Call ``close()``, or use ``Sender`` as a
+    context manager, to release pooled connections.
+
+    ```python
+    with Sender() as sender:
+        sender.session = SenderSession.shared()
+        sender.login()
+        # etc...
+    ```
+
+    ### JSON
+    Payloads are encoded, and responses decoded from the raw body bytes,
+    by ``json_codec`` (a ``JsonCodec``), which uses orjson or msgspec if
+    installed, else the standard library.  Set
+    ``NDFC_PYTHON_JSON_BACKEND``, or ``sender.json_codec.backend``, to
+    choose a backend.
+
+    ### Token lifetime
+    ``token_manager`` (a ``TokenManager``) tracks the expiry of the JWT
+    returned by ``login()``.  Once logged in, each request first logs in
+    again if the token expires within ``token_manager.refresh_ahead``
+    seconds (default 60), and a request that returns 401 is retried once
+    after logging in again.  Set ``token_manager.background = True`` to
+    refresh from a background timer instead of before a request.
+
+    ### Rate limiting
+    If ``rate_limiter`` (a ``RateLimiter``, default None) is set, each
+    HTTP request first waits for its request rate and in-flight limits,
+    and reports its status code and latency back to it.  Set it to
+    ``RateLimiter.shared(controller)`` to share one set of limits across
+    every ``Sender`` talking to the same controller.
+
+    ### Clusters
+    If ``cluster`` (a ``ControllerCluster``, default None) is set, each
+    attempt of a request is sent to the node it selects, rather than to
+    ``get_host()``.  If a node cannot be reached, ``Sender`` marks it down
+    and fails over to another node at once.  Requests that may have
+    reached the node are failed over only if the verb is idempotent.
+
+    ### Response cache
+    If ``response_cache`` (a ``ResponseCache``, default None) is set,
+    ``send()`` (and so ``commit()``) answers a GET from the cache when it
+    can, caches the body of each successful GET, and, after each
+    successful write, drops the cached responses for the fabric written.
+
+    ### Request coalescing
+    Identical GETs (same verb, URL and body) sent from several threads at
+    once share one HTTP request: the first is sent, and the others wait
+    for its response (``single_flight``, a ``SingleFlight``).  Each caller
+    decodes the shared body into its own ``SenderResponse``.  A GET sent
+    after a successful write (POST, PUT, DELETE) through this ``Sender``
+    never shares the response of a GET sent before the write.  Set
+    ``single_flight`` to None to send every request.
+
+    ### Thread safety
+    ``send()`` takes a ``SenderRequest`` and returns a ``SenderResponse``
+    without storing per-call state on the instance.  The property-based
+    API (``path``, ``verb``, ``payload``, ``commit()``, ``response``) is a
+    shim over ``send()`` whose state is kept per-thread, so one logged-in
+    ``Sender`` can be shared by one ``RestSend`` per worker thread.
     """
 
     def __init__(self):
         self.class_name = self.__class__.__name__
         self._implements = "sender_v1"
 
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
         self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
 
         self.TIMEOUT = 10  # seconds
 
+        self.json_codec = JsonCodec()
+        self.token_manager = TokenManager()
+        self.token_manager.refresh = self._refresh_token
+        self.retry_policy = RetryPolicy()
+        self.rate_limiter = None
+        self.cluster = None
+        self.response_cache = None
+        self.single_flight = SingleFlight()
+
+        # Per-call state (path, verb, payload, response, url, return_code)
+        # used by the commit() shim.  Kept per-thread so that one Sender
+        # can be shared across threads.
+        self._local = threading.local()
+        self._login_lock = threading.RLock()
+        self._token_lock = threading.Lock()
+        # Successful writes sent so far, part of the single_flight key.
+        self._write_generation = 0
+        self._write_generation_lock = threading.Lock()
+
         self._domain = environ.get("ND_DOMAIN", "local")
         self._headers = None
         self._history_rc = deque(maxlen=50)
@@ -133,17 +230,30 @@ class Sender:
         self._last_rc = None
         self._logged_in = False
         self._password = environ.get("ND_PASSWORD", None)
-        self._path = None
-        self._payload = None
         self._rbac = None
-        self._response = None
+        self._session = None
         self._timeout = self.TIMEOUT
         self._token = None
         self.last_url = None
-        self.return_code = None
-        self.url = None
         self._username = environ.get("ND_USERNAME", "admin")
-        self._verb = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        ### Summary
+        Release the pooled connections held by ``session``.
+
+        ### Raises
+        None
+        """
+        self.token_manager.stop()
+        if self._session is not None:
+            self._session.close()
 
     def _verify_commit_parameters(self):
         """
@@ -154,7 +264,7 @@ class Sender:
         -   ``ValueError`` if ``verb`` is not set
         -   ``ValueError`` if ``path`` is not set
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_verify_commit_parameters"
         if self.ip4 is None and self.ip6 is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "ip4 or ip6 must be set before calling commit()."
@@ -172,6 +282,11 @@ class Sender:
         """
         Send the REST request to the controller
 
+        ``commit()`` is a shim over ``send()``.  ``path``, ``verb``,
+        ``payload`` and ``response`` are stored per-thread, so one
+        ``Sender`` can be shared by ``RestSend`` instances running in
+        different threads.
+
         ### Raises
             -   ``ValueError`` if:
                     -   ``path`` is not set.
@@ -185,12 +300,13 @@ class Sender:
         ## Properties written
             -   ``response``: raw response from the controller
         """
-        method_name = inspect.stack()[0][3]
-        caller = inspect.stack()[1][3]
-        method_name = inspect.stack()[0][3]
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"Caller: {caller}, ENTERED"
-        self.log.debug(msg)
+        method_name = "commit"
+        if self.log.isEnabledFor(logging.DEBUG):
+            # sys._getframe() is O(1); inspect.stack() reads source for every frame.
+            caller = sys._getframe(1).f_code.co_name  # pylint: disable=protected-access
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Caller: {caller}, ENTERED"
+            self.log.debug(msg)
 
         try:
             self._verify_commit_parameters()
@@ -199,43 +315,341 @@ class Sender:
             msg += "Not all mandatory parameters are set. "
             msg += f"Error detail: {error}"
             raise ValueError(msg) from error
-        self.get_url()
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"caller: {caller}.  "
-        msg += "Calling requests with: "
-        msg += f"verb {self.verb}, "
-        msg += f"path {self.path}, "
-        msg += f"url {self.url}, "
-        try:
-            if self.payload is None:
-                self.log.debug(msg)
-                msg = f"self.timeout: {self.timeout}"
-                self.log.debug(msg)
-                response = requests.request(self.verb, self.url, headers=self.get_headers(), verify=False, timeout=self.timeout)
-            else:
-                msg_payload = copy.copy(self.payload)
+        request = SenderRequest(self.verb, self.path, self.payload)
+        self._local.payload = None
+        response = self.send(request)
+        self.url = response.url
+        self.return_code = response.return_code
+        self.response = response.as_dict()
+
+    def send(self, request):
+        """
+        ### Summary
+        Send ``request`` (a ``SenderRequest``) to the controller and return
+        a ``SenderResponse``.
+
+        ``send()`` reads and writes no per-call state on the instance.  Only
+        the shared session, token and request history are touched, so it
+        is safe to call from many threads at once, e.g. from a
+        ``ThreadPoolExecutor``, over one logged-in ``Sender``.
+
+        ### Raises
+        -   ``TypeError`` if ``request`` is not a ``SenderRequest``.
+        -   ``ValueError`` if the controller cannot be reached.
+
+        ### Usage
+        ```python
+        from concurrent.futures import ThreadPoolExecutor
+
+        sender.login()
+        requests = [SenderRequest("GET", path) for path in paths]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(executor.map(sender.send, requests))
+        ```
+        """
+        method_name = "send"
+        if not isinstance(request, SenderRequest):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "request must be a SenderRequest. "
+            msg += f"Got type {type(request).__name__}."
+            raise TypeError(msg)
+        url = self.build_url(request.path)
+        cache = self.response_cache
+        generation = None
+        if cache is not None and request.verb == "GET":
+            cached = cache.get(request.path)
+            if cached is not None:
+                return self._decode_response(cached)
+            generation = cache.generation
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "Calling requests with: "
+            msg += f"verb {request.verb}, "
+            msg += f"path {request.path}, "
+            msg += f"url {url}"
+            if request.payload is not None:
+                msg_payload = copy.copy(request.payload)
                 if "userPasswd" in msg_payload:
                     msg_payload["userPasswd"] = "********"
                 msg += ", payload: "
-                msg += f"{json.dumps(msg_payload, indent=4, sort_keys=True)}"
-                self.log.debug(msg)
-                msg = f"self.timeout: {self.timeout}"
-                self.log.debug(msg)
-                response = requests.request(
-                    self.verb,
-                    self.url,
+                msg += f"{self.json_codec.dumps_pretty(msg_payload)}"
+            self.log.debug(msg)
+        data = None
+        if request.payload is not None:
+            data = self.json_codec.dumps(request.payload)
+        if self.single_flight is not None and request.verb == "GET":
+            key = SingleFlight.key(request.verb, url, data, self._write_generation)
+            response = self.single_flight.do(key, lambda: self._request(request, url, data))
+        else:
+            response = self._request(request, url, data)
+        sender_response = self.build_response(response)
+        if request.verb != "GET" and sender_response.success:
+            self._written()
+        if cache is not None and sender_response.success:
+            if request.verb == "GET":
+                cached = (response.status_code, response.content, response.reason, response.request.method, response.url)
+                cache.set(request.path, cached, len(response.content), generation)
+            elif request.path != "/login":
+                cache.invalidate(request.path)
+        self.add_history_rc(sender_response.return_code)
+        self._history_path.appendleft(url)
+        return sender_response
+
+    def _written(self):
+        """
+        Count a successful write, so that GETs sent from now on do not
+        share the response of a GET that was in flight during the write.
+        """
+        with self._write_generation_lock:
+            self._write_generation += 1
+
+    def _decode_response(self, entry):
+        """
+        ### Summary
+        Return a ``SenderResponse`` built from a raw response ``entry``
+        (return_code, body, reason, method, url), e.g. from
+        ``response_cache``, and add it to the request history.  The body
+        is decoded for each call, so that each caller gets its own copy
+        of the data.
+        """
+        return_code, body, message, method, url = entry
+        try:
+            data = self.json_codec.loads(body)
+        except ValueError:
+            data = {}
+            data["INVALID_JSON"] = body.decode("utf-8", errors="replace")
+        self.add_history_rc(return_code)
+        self._history_path.appendleft(url)
+        return SenderResponse(return_code, data, message, method, url)
+
+    def stream(self, request, chunk_size=65536):
+        """
+        ### Summary
+        Send ``request`` (a ``SenderRequest``) to the controller and yield
+        the elements of the JSON array in the response body as they
+        arrive, rather than buffering and parsing the whole body.
+
+        Use for large GET responses, e.g. switchesByFabric, top-down
+        networks, or switch policies.  Peak memory is about one
+        ``chunk_size`` chunk plus one element, however large the response.
+        Elements are decoded one at a time with the standard library, so
+        ``stream()`` uses more CPU than ``send()``; prefer ``send()`` for
+        responses that fit comfortably in memory.
+
+        Like ``send()``, ``stream()`` is safe to call from many threads.
+        Exhaust or close the generator to release the connection.
+
+        ### Raises
+        -   ``TypeError`` if ``request`` is not a ``SenderRequest``.
+        -   ``ValueError`` if:
+                -   The controller cannot be reached.
+                -   The controller returns a non-2xx status.
+                -   The response body is not a JSON array.
+
+        ### Usage
+        ```python
+        request = SenderRequest("GET", path)
+        for switch in sender.stream(request):
+            print(switch["logicalName"])
+        ```
+        """
+        method_name = "stream"
+        if not isinstance(request, SenderRequest):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "request must be a SenderRequest. "
+            msg += f"Got type {type(request).__name__}."
+            raise TypeError(msg)
+        url = self.build_url(request.path)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"verb {request.verb}, url {url}"
+            self.log.debug(msg)
+        data = None
+        if request.payload is not None:
+            data = self.json_codec.dumps(request.payload)
+        response = self._request(request, url, data, stream=True)
+        with response:
+            self.update_token_from_headers(response.headers)
+            self.add_history_rc(response.status_code)
+            self._history_path.appendleft(url)
+            if not 200 <= response.status_code < 300:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"{request.verb} {url} returned {response.status_code} {response.reason}. "
+                msg += f"Response: {response.text}"
+                raise ValueError(msg)
+            try:
+                yield from iter_json_array(response.iter_content(chunk_size=chunk_size))
+            except ValueError as error:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Unable to parse the response to {request.verb} {url}. "
+                msg += f"Error detail: {error}"
+                raise ValueError(msg) from error
+            except requests.exceptions.RequestException as error:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Error reading the response to {request.verb} {url}. "
+                msg += f"Error detail: {error}"
+                raise ValueError(msg) from error
+
+    def _request(self, request, url, data, stream=False):
+        """
+        ### Summary
+        Send one request with ``_request_once()`` and return the requests
+        response, retrying transient failures as ``retry_policy`` allows.
+
+        If ``cluster`` is set, each attempt goes to the node it selects,
+        and a connection error fails over to another node without waiting.
+
+        ### Raises
+        -   ``ValueError`` if the controller cannot be reached (after any
+            retries and failovers), or a re-login fails.
+        """
+        method_name = "_request"
+        started = time.monotonic()
+        attempt = 1
+        failovers = 0
+        while True:
+            host = None
+            if self.cluster is not None:
+                host = self.cluster.select(request.verb)
+                url = self.build_url(request.path, host)
+            sent = time.monotonic()
+            try:
+                response = self._request_once(request, url, data, stream)
+            except ValueError as error:
+                if not isinstance(error.__cause__, requests.exceptions.ConnectionError):
+                    raise
+                if host is not None:
+                    self.cluster.mark_down(host)
+                    failover = self.retry_policy.retry_error(request.verb) or self._not_sent(error.__cause__)
+                    if failover and failovers < len(self.cluster.hosts) - 1:
+                        failovers += 1
+                        msg = f"{self.class_name}.{method_name}: "
+                        msg += f"{request.verb} {url} failed ({error.__cause__.__class__.__name__}). "
+                        msg += "Failing over to another node."
+                        self.log.info(msg)
+                        continue
+                if not self.retry_policy.retry_error(request.verb):
+                    raise
+                delay = self.retry_policy.next_delay(attempt, started)
+                if delay is None:
+                    raise
+                reason = f"failed ({error.__cause__.__class__.__name__})"
+            else:
+                if host is not None:
+                    self.cluster.record(host, time.monotonic() - sent)
+                if not self.retry_policy.retry_status(request.verb, request.path, response.status_code):
+                    return response
+                delay = self.retry_policy.next_delay(attempt, started, response.headers.get("Retry-After"))
+                if delay is None:
+                    return response
+                reason = f"returned {response.status_code}"
+                # Read the (small) error body so that the connection can be reused.
+                _ = response.content
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{request.verb} {url} {reason}. "
+            msg += f"Retrying in {delay:.2f} seconds (attempt {attempt + 1} of {self.retry_policy.max_attempts})."
+            self.log.info(msg)
+            self.retry_policy.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _not_sent(error):
+        """
+        Return True if the requests ConnectionError ``error`` means that
+        the request was never sent (the connection could not be opened),
+        so it can be sent to another node whatever its verb.
+        """
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(reason, urllib3.exceptions.NewConnectionError)
+
+    def _request_once(self, request, url, data, stream=False):
+        """
+        ### Summary
+        Send one request over ``session`` and return the requests response.
+
+        If logged in, and the token is about to expire, log in again
+        first.  If the controller returns 401, log in again and retry
+        once.  Neither applies to ``/login`` itself.
+
+        ### Raises
+        -   ``ValueError`` if the controller cannot be reached, or the
+            re-login fails.
+        """
+        method_name = "_request_once"
+        refresh = request.path != "/login" and self.logged_in is True
+        if refresh and self.token_manager.needs_refresh():
+            self._refresh_token(self.token)
+        retried = False
+        while True:
+            token = self.token
+            rate_limiter = self.rate_limiter
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            sent = time.monotonic()
+            status_code = None
+            try:
+                response = self.session.request(
+                    request.verb,
+                    url,
                     headers=self.get_headers(),
-                    data=json.dumps(self.payload),
+                    data=data,
                     verify=False,
                     timeout=self.timeout,
+                    stream=stream,
                 )
-        except requests.exceptions.ConnectionError as error:
+                status_code = response.status_code
+            except requests.exceptions.ConnectionError as error:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += "Error connecting to the controller. "
+                msg += f"Error detail: {error}"
+                raise ValueError(msg) from error
+            finally:
+                if rate_limiter is not None:
+                    rate_limiter.release(status_code, time.monotonic() - sent)
+            if response.status_code != 401 or not refresh or retried:
+                return response
             msg = f"{self.class_name}.{method_name}: "
-            msg = "Error connecting to the controller. "
-            msg += f"Error detail: {error}"
-            raise ValueError(msg) from error
-        self._payload = None
-        self.gen_response(response)
+            msg += f"{request.verb} {url} returned 401. "
+            msg += "Logging in again and retrying once."
+            self.log.info(msg)
+            # Read the (small) error body so that the connection can be reused.
+            _ = response.content
+            self._refresh_token(token)
+            retried = True
+
+    def _refresh_token(self, stale_token):
+        """
+        ### Summary
+        Log in again and replace the token, unless another thread has
+        already replaced ``stale_token``.
+
+        Uses ``send()`` directly, so the per-thread ``path``, ``verb``,
+        ``payload`` and ``response`` of a ``commit()`` in progress are
+        not touched.
+
+        ### Raises
+        -   ``ValueError`` if the login fails.
+        """
+        method_name = "_refresh_token"
+        with self._login_lock:
+            if self.token != stale_token:
+                return
+            response = self.send(SenderRequest("POST", "/login", self._login_payload()))
+            token = response.data.get("jwttoken") if isinstance(response.data, dict) else None
+            if not response.success or token is None:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Unable to log in again. Controller response: {response.as_dict()}"
+                raise ValueError(msg)
+            with self._token_lock:
+                self.token = token
+            self.jwttoken = token
+            self.rbac = response.data.get("rbac")
+            self.token_manager.update(token)
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "Logged in again with a new token."
+            self.log.debug(msg)
 
     def get_headers(self):
         """Get the headers to include in the request.
@@ -255,7 +669,7 @@ class Sender:
         Returns the server IP address to use based on the values
         of ip4 and ip6.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "get_host"
         if self.ip4 is not None:
             return self.ip4
         if self.ip6 is not None:
@@ -266,23 +680,36 @@ class Sender:
         self.log.debug(msg)
         raise ValueError(msg)
 
-    def get_url(self):
-        """Get the URL to use for the request.
+    def build_url(self, path, host=None):
+        """
+        ### Summary
+        Return the URL for ``path`` on ``host`` (default ``get_host()``)
+        without modifying instance state.
 
-        Raises:
-            ValueError: If the path is not set.
+        ### Raises
+        -   ``ValueError`` if ``path`` is not set.
         """
-        method_name = inspect.stack()[0][3]
-        if self.path is None:
+        method_name = "build_url"
+        if not path:
             msg = f"{self.class_name}.{method_name}: "
             msg += "call Sender.path before calling "
             msg += f"{self.class_name}.commit()"
             self.log.debug(msg)
             raise ValueError(msg)
-        if self.path[0] == "/":
-            self.url = f"https://{self.get_host()}{self.path}"
-        else:
-            self.url = f"https://{self.get_host()}/{self.path}"
+        if host is None:
+            host = self.get_host()
+        if path[0] == "/":
+            return f"https://{host}{path}"
+        return f"https://{host}/{path}"
+
+    def get_url(self):
+        """Get the URL to use for the request.
+
+        Raises:
+            ValueError: If the path is not set.
+        """
+        method_name = "get_url"
+        self.url = self.build_url(self.path)
         msg = f"{self.class_name}.{method_name}: "
         msg += f"Set url to {self.url}"
         self.log.debug(msg)
@@ -308,40 +735,76 @@ class Sender:
         self.add_history_rc(self.return_code)
         self.add_history_path()
 
-    def gen_response(self, response):
+    def update_token_from_headers(self, headers):
         """
-        Generate a response dictionary from the requests response object.
+        Set the token to the value of Set-Cookie in the response
+        headers (if present).
         """
-        method_name = inspect.stack()[0][3]
-        # set the token to the value of Set-Cookie in the
-        # response headers (if present)
-        token = response.headers.get("Set-Cookie", None)
-        if token is not None:
-            token = token.split("=")[1]
-            token = token.split(";")[0]
+        method_name = "update_token_from_headers"
+        token = headers.get("Set-Cookie", None)
+        if token is None:
+            return
+        token = token.split("=")[1]
+        token = token.split(";")[0]
+        with self._token_lock:
             self.token = token
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"Set new token to {self.token}"
-            self.log.debug(msg)
+        self.token_manager.update(token)
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"Set new token to {self.token}"
+        self.log.debug(msg)
 
-        response_dict = {}
-        self.return_code = response.status_code
-        response_dict["RETURN_CODE"] = response.status_code
+    def build_response(self, response):
+        """
+        ### Summary
+        Return a ``SenderResponse`` built from the requests response object,
+        updating the token from Set-Cookie if present.
+        """
+        self.update_token_from_headers(response.headers)
         try:
-            response_dict["DATA"] = json.loads(response.text)
-        except json.JSONDecodeError:
+            data = self.json_codec.loads(response.content)
+        except ValueError:
             data = {}
             data["INVALID_JSON"] = response.text
-            response_dict["DATA"] = data
-        response_dict["MESSAGE"] = response.reason
-        response_dict["METHOD"] = response.request.method
-        response_dict["REQUEST_PATH"] = response.url
-        self.response = copy.deepcopy(response_dict)
+        return SenderResponse(response.status_code, data, response.reason, response.request.method, response.url)
+
+    def gen_response(self, response):
+        """
+        Generate a response dictionary from the requests response object.
+        """
+        sender_response = self.build_response(response)
+        self.return_code = sender_response.return_code
+        self.response = sender_response.as_dict()
 
     def login(self):
         """
         Log in to the server.
         """
+        with self._login_lock:
+            self._login()
+
+    def login_with_token(self, jwttoken, rbac=None):
+        """
+        ### Summary
+        Use a token from an earlier login (e.g. from ``TokenCache``)
+        instead of POSTing /login.
+
+        If the controller rejects the token, the first request gets a 401,
+        and ``Sender`` logs in with ``username``, ``password`` and
+        ``domain`` and retries, as it does when a token expires.
+        """
+        with self._login_lock:
+            with self._token_lock:
+                self.token = jwttoken
+            self.jwttoken = jwttoken
+            self.rbac = rbac
+            self.logged_in = True
+            self.token_manager.update(jwttoken)
+
+    def _login(self):
+        """
+        Log in to the server.  Called by login() while holding _login_lock
+        so that concurrent callers log in only once.
+        """
         if self.logged_in is True:
             return
         _raise = False
@@ -364,11 +827,7 @@ class Sender:
         self.logged_in = "Pending"
         self.path = "/login"
         self.get_url()
-        payload = {}
-        payload["userName"] = self.username
-        payload["userPasswd"] = self.password
-        payload["domain"] = self.domain
-        self.payload = copy.copy(payload)
+        self.payload = self._login_payload()
         headers = {}
         headers["Content-Type"] = "application/json"
         self.headers = copy.copy(headers)
@@ -377,11 +836,21 @@ class Sender:
         self.update_token()
         self.logged_in = True
 
+    def _login_payload(self):
+        """
+        Return the payload for POST /login.
+        """
+        payload = {}
+        payload["userName"] = self.username
+        payload["userPasswd"] = self.password
+        payload["domain"] = self.domain
+        return payload
+
     def update_token(self):
         """
         Update the authentication token.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "update_token"
         msg = f"{self.class_name}.{method_name}: "
         msg += "ENTERED"
         self.log.debug(msg)
@@ -395,12 +864,13 @@ class Sender:
             msg += f"{self.response}"
             self.log.debug(msg)
             raise ValueError(msg) from error
+        self.token_manager.update(self.token)
 
     def refresh_login(self):
         """
         Refresh the login session.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "refresh_login"
         msg = f"{self.class_name}.{method_name}: "
         msg += "ENTERED"
         self.log.debug(msg)
@@ -576,17 +1046,19 @@ class Sender:
         """
         Endpoint path for the REST request.
 
+        Per-thread.
+
         ### Raises
         None
 
         ### Example
         ``/appcenter/cisco/ndfc...etc...``
         """
-        return self._path
+        return getattr(self._local, "path", None)
 
     @path.setter
     def path(self, value):
-        self._path = value
+        self._local.path = value
 
     @property
     def payload(self):
@@ -595,19 +1067,21 @@ class Sender:
 
         ### Raises
         -   ``TypeError`` if value is not a ``dict``.
+
+        Per-thread.
         """
-        return self._payload
+        return getattr(self._local, "payload", None)
 
     @payload.setter
     def payload(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "payload"
         if not isinstance(value, dict) and not isinstance(value, list):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{method_name} must be a list or dict. "
             msg += f"Got type {type(value).__name__}, "
             msg += f"value {value}."
             raise TypeError(msg)
-        self._payload = value
+        self._local.payload = value
 
     @property
     def rbac(self):
@@ -629,21 +1103,70 @@ class Sender:
         ### Raises
         -   ``TypeError`` if value is not a ``dict``.
 
-        -   getter: Return a copy of ``response``
+        -   getter: Return ``response`` as a ``ReadOnlyDict``, without copying.
+            Nested values, e.g. ``DATA``, are shared and must not be modified.
+            Use ``response_copy`` for a mutable copy.
         -   setter: Set ``response``
+
+        Per-thread.
         """
-        return copy.deepcopy(self._response)
+        return getattr(self._local, "response", None)
 
     @response.setter
     def response(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "response"
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{method_name} must be a dict. "
             msg += f"Got type {type(value).__name__}, "
             msg += f"value {value}."
             raise TypeError(msg)
-        self._response = value
+        if not isinstance(value, ReadOnlyDict):
+            value = ReadOnlyDict(value)
+        self._local.response = value
+
+    @property
+    def response_copy(self):
+        """
+        ### Summary
+        A mutable deep copy of ``response``, as a plain ``dict``, or ``None``
+        if no response has been received in this thread.
+        """
+        return copy.deepcopy(getattr(self._local, "response", None))
+
+    @property
+    def return_code(self):
+        """
+        HTTP status code of the most recent commit() in this thread.
+        """
+        return getattr(self._local, "return_code", None)
+
+    @return_code.setter
+    def return_code(self, value):
+        self._local.return_code = value
+
+    @property
+    def session(self):
+        """
+        ### Summary
+        The ``SenderSession`` used to send requests.  Created on first
+        access if not set.
+
+        ### Raises
+        -   ``TypeError`` if value is not a ``SenderSession``.
+        """
+        if self._session is None:
+            self._session = SenderSession()
+        return self._session
+
+    @session.setter
+    def session(self, value):
+        if not isinstance(value, SenderSession):
+            msg = f"{self.class_name}.session: "
+            msg += "session must be a SenderSession. "
+            msg += f"Got type {type(value).__name__}."
+            raise TypeError(msg)
+        self._session = value
 
     @property
     def timeout(self):
@@ -656,6 +1179,17 @@ class Sender:
     def timeout(self, value):
         self._timeout = value
 
+    @property
+    def url(self):
+        """
+        URL of the most recent commit() in this thread.
+        """
+        return getattr(self._local, "url", None)
+
+    @url.setter
+    def url(self, value):
+        self._local.url = value
+
     @property
     def username(self):
         """
@@ -680,13 +1214,14 @@ class Sender:
         Raises:
             ValueError: If the verb is not set.
         """
-        if self._verb is None:
+        verb = getattr(self._local, "verb", None)
+        if verb is None:
             raise ValueError("HTTP verb is not set.")
-        return self._verb
+        return verb
 
     @verb.setter
     def verb(self, value):
-        self._verb = value
+        self._local.verb = value
 
     @property
     def token(self):
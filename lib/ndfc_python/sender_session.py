@@ -0,0 +1,292 @@
+#
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+__author__ = "Allen Robel"
+
+import logging
+import threading
+import time
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    HAS_REQUESTS = True
+except ImportError:
+    HAS_REQUESTS = False
+
+if HAS_REQUESTS is False:
+    msg_outer = "requests is not installed. "
+    msg_outer += "install with e.g. pip install requests"
+    raise ImportError(msg_outer)
+
+
+class SenderSession:
+    """
+    ### Summary
+    A pooled, keep-alive ``requests.Session`` used by ``Sender`` to send
+    requests to the controller.
+
+    Reusing one session across requests avoids a new TCP and TLS handshake
+    for every REST call.  The session is created lazily on first use and
+    is recycled (closed and re-created) once it is older than
+    ``max_connection_age`` seconds.
+
+    ### Raises
+    -   ``TypeError`` if:
+            -   ``keep_alive`` is not a ``bool``.
+            -   ``max_connection_age`` is not an ``int``.
+            -   ``pool_connections`` is not an ``int``.
+            -   ``pool_maxsize`` is not an ``int``.
+    -   ``ValueError`` if:
+            -   ``max_connection_age`` is less than zero.
+            -   ``pool_connections`` is less than one.
+            -   ``pool_maxsize`` is less than one.
+
+    ### Default values
+    -   ``keep_alive``: True
+    -   ``max_connection_age``: 300 (seconds, 0 disables recycling)
+    -   ``pool_connections``: 10
+    -   ``pool_maxsize``: 10
+
+    ### Usage
+    ```python
+    with SenderSession() as session:
+        session.pool_maxsize = 20
+        sender = Sender()
+        sender.session = session
+        sender.login()
+        # etc...
+    ```
+
+    To share one pool across every ``Sender`` in a process, use
+    ``SenderSession.shared()``.
+
+    ```python
+    sender = Sender()
+    sender.session = SenderSession.shared()
+    ```
+    """
+
+    _shared_instance = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self.class_name = self.__class__.__name__
+        self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
+
+        self._created = 0.0
+        self._keep_alive = True
+        self._lock = threading.Lock()
+        self._max_connection_age = 300
+        self._pool_connections = 10
+        self._pool_maxsize = 10
+        self._session = None
+
+    @classmethod
+    def shared(cls):
+        """
+        ### Summary
+        Return the process-wide ``SenderSession`` instance, creating it on
+        first call.
+
+        ### Raises
+        None
+        """
+        with cls._shared_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+            return cls._shared_instance
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _build_session(self):
+        """
+        ### Summary
+        Return a new ``requests.Session`` with an ``HTTPAdapter`` mounted
+        for ``https://`` using the configured pool sizes.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if self.keep_alive is False:
+            session.headers["Connection"] = "close"
+        return session
+
+    def _expired(self):
+        """
+        Return True if the current session is older than max_connection_age.
+        """
+        if self.max_connection_age == 0:
+            return False
+        return (time.monotonic() - self._created) > self.max_connection_age
+
+    def get_session(self):
+        """
+        ### Summary
+        Return the underlying ``requests.Session``, creating it if needed and
+        recycling it if it is older than ``max_connection_age``.
+
+        ### Raises
+        None
+        """
+        with self._lock:
+            if self._session is not None and self._expired():
+                msg = f"{self.class_name}.get_session: "
+                msg += f"Session older than {self.max_connection_age} seconds. "
+                msg += "Recycling."
+                self.log.debug(msg)
+                self._session.close()
+                self._session = None
+            if self._session is None:
+                self._session = self._build_session()
+                self._created = time.monotonic()
+            return self._session
+
+    def request(self, verb, url, **kwargs):
+        """
+        ### Summary
+        Send a request using the pooled session.  Arguments are passed
+        unchanged to ``requests.Session.request()``.
+
+        ### Raises
+        -   ``requests.exceptions.ConnectionError`` if the controller is
+            unreachable.
+        """
+        return self.get_session().request(verb, url, **kwargs)
+
+    def close(self):
+        """
+        ### Summary
+        Close the underlying session and release all pooled connections.
+        The next request opens a new session.
+
+        ### Raises
+        None
+        """
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+
+    @property
+    def keep_alive(self):
+        """
+        ### Summary
+        Keep connections open between requests.
+
+        ### Raises
+        -   ``TypeError`` if value is not a ``bool``.
+        """
+        return self._keep_alive
+
+    @keep_alive.setter
+    def keep_alive(self, value):
+        if not isinstance(value, bool):
+            msg = f"{self.class_name}.keep_alive: "
+            msg += "keep_alive must be a bool. "
+            msg += f"Got type {type(value).__name__}, "
+            msg += f"value {value}."
+            raise TypeError(msg)
+        self._keep_alive = value
+        self.close()
+
+    @property
+    def max_connection_age(self):
+        """
+        ### Summary
+        Maximum age, in seconds, of the pooled session before it is closed
+        and re-created.  0 disables recycling.
+
+        ### Raises
+        -   ``TypeError`` if value is not an ``int``.
+        -   ``ValueError`` if value is less than zero.
+        """
+        return self._max_connection_age
+
+    @max_connection_age.setter
+    def max_connection_age(self, value):
+        if isinstance(value, bool) or not isinstance(value, int):
+            msg = f"{self.class_name}.max_connection_age: "
+            msg += "max_connection_age must be an int. "
+            msg += f"Got type {type(value).__name__}, "
+            msg += f"value {value}."
+            raise TypeError(msg)
+        if value < 0:
+            msg = f"{self.class_name}.max_connection_age: "
+            msg += "max_connection_age must be >= 0. "
+            msg += f"Got {value}."
+            raise ValueError(msg)
+        self._max_connection_age = value
+
+    @property
+    def pool_connections(self):
+        """
+        ### Summary
+        Number of connection pools (one per host) to cache.
+
+        ### Raises
+        -   ``TypeError`` if value is not an ``int``.
+        -   ``ValueError`` if value is less than one.
+        """
+        return self._pool_connections
+
+    @pool_connections.setter
+    def pool_connections(self, value):
+        self._verify_pool_value("pool_connections", value)
+        self._pool_connections = value
+        self.close()
+
+    @property
+    def pool_maxsize(self):
+        """
+        ### Summary
+        Maximum number of connections kept open per host.
+
+        ### Raises
+        -   ``TypeError`` if value is not an ``int``.
+        -   ``ValueError`` if value is less than one.
+        """
+        return self._pool_maxsize
+
+    @pool_maxsize.setter
+    def pool_maxsize(self, value):
+        self._verify_pool_value("pool_maxsize", value)
+        self._pool_maxsize = value
+        self.close()
+
+    def _verify_pool_value(self, name, value):
+        """
+        Verify that a pool size is an int >= 1.
+        """
+        if isinstance(value, bool) or not isinstance(value, int):
+            msg = f"{self.class_name}.{name}: "
+            msg += f"{name} must be an int. "
+            msg += f"Got type {type(value).__name__}, "
+            msg += f"value {value}."
+            raise TypeError(msg)
+        if value < 1:
+            msg = f"{self.class_name}.{name}: "
+            msg += f"{name} must be >= 1. "
+            msg += f"Got {value}."
+            raise ValueError(msg)
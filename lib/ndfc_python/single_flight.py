@@ -0,0 +1,172 @@
+"""
+# Name
+
+single_flight.py
+
+# Description
+
+Coalesce identical requests that are in flight at the same time.
+
+When the workers of a bulk run each check that a fabric exists, or load
+the same FabricInventory, they send the same GET at the same moment.
+With SingleFlight, the first caller (the leader) sends the request, and
+the callers that ask for the same key while it is in flight wait for,
+and share, its result.
+"""
+
+import hashlib
+import threading
+
+
+class _Call:
+    """
+    A call in flight: its waiters block on done until result or error is set.
+    """
+
+    __slots__ = ("done", "error", "future", "result")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.error = None
+        self.future = None
+        self.result = None
+
+
+class SingleFlight:
+    """
+    # Summary
+
+    Run at most one call per key at a time, and hand its result (or
+    exception) to every caller that asked for the same key meanwhile.
+
+    do() is for threads, do_async() for coroutines.  The two keep
+    separate calls in flight, and do_async() must be used from one event
+    loop.
+
+    ## Usage
+
+    ```python
+    single_flight = SingleFlight()
+    key = SingleFlight.key("GET", url, generation=writes)
+    response = single_flight.do(key, lambda: session.get(url))
+
+    response = await single_flight.do_async(key, lambda: fetch(url))
+    ```
+
+    ## Properties
+
+    - stats (dict): getter: calls made ("calls"), and calls that waited for another's result ("coalesced")
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self._lock = threading.Lock()
+        self._calls: dict = {}
+        self._async_calls: dict = {}
+        self._stats = {"calls": 0, "coalesced": 0}
+
+    @staticmethod
+    def key(verb: str, url: str, body: bytes | str | None = None, generation: int = 0) -> tuple:
+        """
+        Return the key for a request: (verb, url, SHA-256 of body, or None,
+        generation).  Pass as generation a counter of the caller's writes,
+        so that a request made after a write never joins one that started
+        before it, and returns data from before the write.
+        """
+        if body is None:
+            return (verb, url, None, generation)
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        return (verb, url, hashlib.sha256(body).hexdigest(), generation)
+
+    def _join(self, calls: dict, key) -> tuple[_Call, bool]:
+        """
+        Return the call in flight for key, and whether the caller is its
+        leader (the call is new).
+        """
+        with self._lock:
+            call = calls.get(key)
+            if call is not None:
+                self._stats["coalesced"] += 1
+                return call, False
+            call = _Call()
+            calls[key] = call
+            self._stats["calls"] += 1
+            return call, True
+
+    def do(self, key, function):
+        """
+        # Summary
+
+        Return function(), or, if a call with key is already in flight in
+        another thread, wait for it and return its result.
+
+        ## Raises
+
+        - Whatever function() raises, in the leader and every waiter.
+        """
+        call, leader = self._join(self._calls, key)
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key, function):
+        """
+        # Summary
+
+        Return await function(), or, if a call with key is already in
+        flight in this event loop, wait for it and return its result.
+
+        ## Raises
+
+        - Whatever function() raises, in the leader and every waiter.
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        call, leader = self._join(self._async_calls, key)
+        if not leader:
+            try:
+                return await asyncio.shield(call.future)
+            except asyncio.CancelledError:
+                if not call.future.cancelled():
+                    raise
+            # The leader was cancelled, not this caller.  Make the call again.
+            return await self.do_async(key, function)
+        call.future = asyncio.get_running_loop().create_future()
+        try:
+            result = await function()
+        except asyncio.CancelledError:
+            call.future.cancel()
+            raise
+        except BaseException as error:
+            call.future.set_exception(error)
+            # Mark the exception retrieved, in case no caller waited.
+            call.future.exception()
+            raise
+        else:
+            call.future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._async_calls[key]
+
+    @property
+    def stats(self) -> dict:
+        """
+        Calls made ("calls"), and calls that waited for the result of an
+        identical call in flight instead ("coalesced").
+        """
+        with self._lock:
+            return dict(self._stats)
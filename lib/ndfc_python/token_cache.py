@@ -0,0 +1,417 @@
+"""
+# Name
+
+token_cache.py
+
+# Description
+
+An on-disk cache of controller login tokens, shared by every script
+invocation of the same user, so that a script can reuse a still-valid
+token instead of POSTing /login again.
+
+Tokens are keyed on controller, username and login domain, and are
+returned only while their JWT exp claim is at least min_lifetime seconds
+in the future.  The cache file is created with mode 0600 in a directory
+with mode 0700, and is ignored if it is readable by anyone else.
+
+If vault_password (e.g. token_cache_password() of the Ansible Vault
+secrets used to read the credentials) or vault_secrets is set, each entry
+is encrypted with it using Ansible Vault's AES256 format.  An encrypted
+entry is never replaced by an unencrypted one.
+
+set() and invalidate() hold an exclusive lock (fcntl.flock(), where
+available) on a lock file next to the cache file while they read and
+rewrite it, so that scripts updating the cache at the same time do not
+drop each other's entries.
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import stat
+import tempfile
+import time
+from importlib.util import find_spec
+from pathlib import Path
+
+try:
+    import fcntl
+
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+from ndfc_python.token_manager import TokenManager
+
+# ansible is imported only when entries are encrypted or decrypted.
+HAS_ANSIBLE_VAULT = find_spec("ansible") is not None
+# PBKDF2 iterations of token_cache_password(), as for an Ansible Vault key,
+# so that the cache is no cheaper to attack than the vault itself.
+TOKEN_CACHE_PASSWORD_ITERATIONS = 10000
+TOKEN_CACHE_PASSWORD_SALT = b"ndfc-python token cache"
+
+
+def default_token_cache_path() -> Path:
+    """
+    # Summary
+
+    Return the default cache file: $XDG_CACHE_HOME/ndfc-python/tokens.json,
+    or ~/.cache/ndfc-python/tokens.json if XDG_CACHE_HOME is not set.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "ndfc-python" / "tokens.json"
+
+
+def token_cache_password(vault_secrets) -> bytes | None:
+    """
+    # Summary
+
+    Return the password with which to encrypt cached tokens for the
+    credentials in an Ansible Vault: a PBKDF2 hash of the first of
+    vault_secrets (as returned by ansible.cli.CLI.setup_vault_secrets()).
+    The vault password itself is never stored or shared, e.g. by the
+    credentials agent.
+
+    Returns None if vault_secrets contains no secret.
+    """
+    for _, secret in vault_secrets or []:
+        secret_bytes = getattr(secret, "bytes", None)
+        if secret_bytes:
+            key = hashlib.pbkdf2_hmac("sha256", secret_bytes, TOKEN_CACHE_PASSWORD_SALT, TOKEN_CACHE_PASSWORD_ITERATIONS)
+            return key.hex().encode("ascii")
+    return None
+
+
+class TokenCache:
+    """
+    # Summary
+
+    Read and write controller login tokens in a private file.
+
+    ## Usage
+
+    ```python
+    cache = TokenCache()
+    cache.path = "/home/me/.cache/ndfc-python/tokens.json"  # optional
+    cache.vault_password = token_cache_password(vault_secrets)  # optional, encrypts entries
+    entry = cache.get("10.1.1.1", "admin", "local")
+    if entry is None:
+        sender.login()
+        cache.set("10.1.1.1", "admin", "local", sender.token, sender.rbac)
+    else:
+        sender.login_with_token(entry["jwttoken"], entry["rbac"])
+    ```
+
+    ## Raises
+
+    - TypeError, ValueError from the property setters if values are invalid.
+
+    get() and set() do not raise.  Unreadable, insecure or corrupt cache
+    files are logged and treated as empty, and write errors are logged.
+
+    ## Properties
+
+    - encrypted (bool): getter: True if vault_password or vault_secrets is set
+    - lock_path (Path): getter: lock file held by set() and invalidate()
+    - min_lifetime (float): getter/setter: seconds a cached token must still be valid for.  Default 60
+    - path (Path): getter/setter: cache file.  Default: default_token_cache_path()
+    - vault_password (bytes | None): getter/setter: password with which to
+      encrypt entries.  Default None (not encrypted)
+    - vault_secrets (list | None): getter/setter: Ansible Vault secrets, as
+      returned by ansible.cli.CLI.setup_vault_secrets(), with which to
+      encrypt entries if vault_password is not set.  Default None (not encrypted)
+    """
+
+    VERSION = 1
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
+
+        self._min_lifetime = 60.0
+        self._path = default_token_cache_path()
+        self._vault_password = None
+        self._vault_secrets = None
+
+    @staticmethod
+    def key(controller: str, username: str, domain: str) -> str:
+        """
+        # Summary
+
+        Return the cache key for controller, username and domain.  The key
+        is a hash, so the cache file does not reveal usernames or controllers.
+        """
+        return hashlib.sha256(f"{controller}\0{username}\0{domain}".encode("utf-8")).hexdigest()
+
+    def _read(self) -> dict:
+        """
+        Return the cached entries, keyed on key(), or {} if the file is
+        missing, insecure or corrupt.
+        """
+        method_name = "_read"
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                info = os.fstat(handle.fileno())
+                if info.st_uid != os.getuid() or stat.S_IMODE(info.st_mode) & 0o077:
+                    msg = f"{self.class_name}.{method_name}: "
+                    msg += f"Ignoring token cache {self.path}. "
+                    msg += "It must be owned by the current user with mode 0600."
+                    self.log.warning(msg)
+                    return {}
+                contents = json.load(handle)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Ignoring unreadable token cache {self.path}. "
+            msg += f"Error detail: {error}"
+            self.log.warning(msg)
+            return {}
+        if not isinstance(contents, dict) or contents.get("version") != self.VERSION:
+            return {}
+        entries = contents.get("tokens")
+        return entries if isinstance(entries, dict) else {}
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """
+        Hold an exclusive lock on lock_path while the caller reads and
+        rewrites the cache file.  Without fcntl (Windows) the caller runs
+        unlocked.  If the lock cannot be taken, this is logged and the
+        caller runs unlocked.
+        """
+        method_name = "_locked"
+        descriptor = None
+        if HAS_FCNTL:
+            try:
+                self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+                descriptor = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+                fcntl.flock(descriptor, fcntl.LOCK_EX)
+            except OSError as error:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Unable to lock token cache {self.path}. "
+                msg += f"Error detail: {error}"
+                self.log.warning(msg)
+                if descriptor is not None:
+                    os.close(descriptor)
+                    descriptor = None
+        try:
+            yield
+        finally:
+            # Closing the descriptor releases the lock.
+            if descriptor is not None:
+                os.close(descriptor)
+
+    def _write(self, entries: dict) -> None:
+        """
+        Atomically replace the cache file with entries, with mode 0600.
+        """
+        method_name = "_write"
+        contents = {"version": self.VERSION, "tokens": entries}
+        try:
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            descriptor, temporary = tempfile.mkstemp(dir=self.path.parent, prefix=".tokens.", suffix=".tmp")
+            try:
+                with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+                    json.dump(contents, handle)
+                os.replace(temporary, self.path)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+        except OSError as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Unable to write token cache {self.path}. "
+            msg += f"Error detail: {error}"
+            self.log.warning(msg)
+
+    def _vault_lib(self):
+        """
+        Return an ansible VaultLib for vault_password, else vault_secrets.
+        """
+        # pylint: disable=import-outside-toplevel
+        from ansible.parsing.vault import VaultLib, VaultSecret
+
+        if self._vault_password:
+            return VaultLib([("default", VaultSecret(self._vault_password))])
+        return VaultLib(self._vault_secrets)
+
+    def _encode(self, value: dict) -> dict:
+        """
+        Return the stored form of value, encrypted if encrypted is True.
+        """
+        if not self.encrypted:
+            return value
+        plaintext = json.dumps(value).encode("utf-8")
+        return {"vault": self._vault_lib().encrypt(plaintext).decode("ascii")}
+
+    def _decode(self, stored: dict) -> dict | None:
+        """
+        Return the entry from its stored form, or None if it cannot be
+        decrypted, or is not encrypted although encrypted is True.
+        """
+        method_name = "_decode"
+        if not self.encrypted:
+            return None if "vault" in stored else stored
+        if "vault" not in stored:
+            return None
+        from ansible.errors import AnsibleError  # pylint: disable=import-outside-toplevel
+
+        try:
+            value = json.loads(self._vault_lib().decrypt(stored["vault"]))
+        except (AnsibleError, ValueError) as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Unable to decrypt a cached token. Error detail: {error}"
+            self.log.debug(msg)
+            return None
+        return value if isinstance(value, dict) else None
+
+    def get(self, controller: str, username: str, domain: str) -> dict | None:
+        """
+        # Summary
+
+        Return {"jwttoken": str, "rbac": ...} for controller, username and
+        domain, or None if there is no cached token valid for at least
+        min_lifetime more seconds.
+        """
+        stored = self._read().get(self.key(controller, username, domain))
+        if not isinstance(stored, dict):
+            return None
+        entry = self._decode(stored)
+        if entry is None or not isinstance(entry.get("jwttoken"), str):
+            return None
+        expires_at = TokenManager.decode_expiry(entry["jwttoken"])
+        if expires_at is None or expires_at - time.time() < self.min_lifetime:
+            return None
+        return {"jwttoken": entry["jwttoken"], "rbac": entry.get("rbac")}
+
+    def set(self, controller: str, username: str, domain: str, jwttoken: str, rbac=None) -> None:
+        """
+        # Summary
+
+        Store jwttoken and rbac for controller, username and domain, and
+        drop expired entries.  Tokens without a JWT exp claim are not
+        stored, since their validity cannot be checked.
+
+        If encrypted is False, and the stored token for controller,
+        username and domain is encrypted, it is kept, and a warning is
+        logged, rather than replaced with an unencrypted token.
+        """
+        method_name = "set"
+        expires_at = TokenManager.decode_expiry(jwttoken)
+        if expires_at is None:
+            return
+        key = self.key(controller, username, domain)
+        entry = {"expires_at": expires_at, **self._encode({"jwttoken": jwttoken, "rbac": rbac})}
+        with self._locked():
+            now = time.time()
+            entries = {key: value for key, value in self._read().items() if isinstance(value, dict) and value.get("expires_at", 0) > now}
+            if not self.encrypted and "vault" in entries.get(key, {}):
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Not replacing an encrypted token in {self.path} with an unencrypted one. "
+                msg += "Read the credentials from the same Ansible Vault to reuse it."
+                self.log.warning(msg)
+                return
+            entries[key] = entry
+            self._write(entries)
+
+    def invalidate(self, controller: str, username: str, domain: str) -> None:
+        """
+        # Summary
+
+        Remove the cached token for controller, username and domain.
+        """
+        with self._locked():
+            entries = self._read()
+            if entries.pop(self.key(controller, username, domain), None) is not None:
+                self._write(entries)
+
+    @property
+    def encrypted(self) -> bool:
+        """
+        True if entries are encrypted (vault_password or vault_secrets is set).
+        """
+        return bool(self._vault_password or self._vault_secrets)
+
+    @property
+    def min_lifetime(self) -> float:
+        """
+        Seconds a cached token must still be valid for to be returned by get().
+        """
+        return self._min_lifetime
+
+    @min_lifetime.setter
+    def min_lifetime(self, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            msg = f"{self.class_name}.min_lifetime: "
+            msg += f"min_lifetime must be a number. Got {type(value).__name__}."
+            raise TypeError(msg)
+        if value < 0:
+            msg = f"{self.class_name}.min_lifetime: "
+            msg += f"min_lifetime must be >= 0. Got {value}."
+            raise ValueError(msg)
+        self._min_lifetime = float(value)
+
+    @property
+    def lock_path(self) -> Path:
+        """
+        The lock file for path: path with ".lock" appended.
+        """
+        return self.path.with_name(f"{self.path.name}.lock")
+
+    @property
+    def path(self) -> Path:
+        """
+        The cache file.
+        """
+        return self._path
+
+    @path.setter
+    def path(self, value) -> None:
+        self._path = Path(value).expanduser()
+
+    @property
+    def vault_password(self) -> bytes | None:
+        """
+        Password with which to encrypt entries, e.g. from
+        token_cache_password(), or None to use vault_secrets.
+
+        ## Raises
+
+        - ValueError if set while ansible is not installed
+        """
+        return self._vault_password
+
+    @vault_password.setter
+    def vault_password(self, value: bytes | str | None) -> None:
+        if value and not HAS_ANSIBLE_VAULT:
+            msg = f"{self.class_name}.vault_password: "
+            msg += "ansible is not installed. "
+            msg += "install with e.g. pip install ansible"
+            raise ValueError(msg)
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        self._vault_password = value
+
+    @property
+    def vault_secrets(self):
+        """
+        Ansible Vault secrets with which to encrypt entries, if
+        vault_password is not set, or None to store entries unencrypted
+        (the file is still mode 0600).
+
+        ## Raises
+
+        - ValueError if set while ansible is not installed
+        """
+        return self._vault_secrets
+
+    @vault_secrets.setter
+    def vault_secrets(self, value) -> None:
+        if value and not HAS_ANSIBLE_VAULT:
+            msg = f"{self.class_name}.vault_secrets: "
+            msg += "ansible is not installed. "
+            msg += "install with e.g. pip install ansible"
+            raise ValueError(msg)
+        self._vault_secrets = value
@@ -0,0 +1,263 @@
+"""
+# Name
+
+token_manager.py
+
+# Description
+
+Track the expiry of the controller's JWT and decide when to refresh it,
+so that long-running jobs do not fail partway through when the token
+expires.
+"""
+
+import base64
+import binascii
+import json
+import logging
+import threading
+import time
+
+
+class TokenManager:
+    """
+    # Summary
+
+    Track a JWT's expiry (its exp claim) and refresh it ahead of time.
+
+    Sender calls update() whenever it receives a new token and checks
+    needs_refresh() before each request, re-logging in (lazily) if the
+    token is within refresh_ahead seconds of expiry.  If background is
+    True, a daemon timer also calls refresh refresh_ahead seconds before
+    expiry, so that no request has to wait for the re-login.
+
+    refresh_ahead is capped at half the token's lifetime, so that a
+    short-lived token is not refreshed on every request.
+
+    Tokens without a readable exp claim never need refreshing here.
+    Sender still re-logs in and retries once if the controller returns 401.
+
+    ## Usage
+
+    ```python
+    manager = TokenManager()
+    manager.refresh_ahead = 120
+    manager.background = True
+    manager.refresh = sender_refresh_function  # called with the stale token
+    manager.on_update = save_function  # optional, called with each new token
+    manager.update(jwttoken)
+    if manager.needs_refresh():
+        ...
+    manager.stop()
+    ```
+
+    ## Raises
+
+    - TypeError, ValueError from the property setters if values are invalid.
+
+    ## Properties
+
+    - background (bool): getter/setter: refresh from a daemon timer.  Default False
+    - expires_at (float | None): getter: token expiry, seconds since the epoch
+    - on_update (callable | None): getter/setter: called with each new token
+    - refresh (callable | None): getter/setter: called with the current token to refresh it
+    - refresh_ahead (float): getter/setter: seconds before expiry to refresh.  Default 60
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
+
+        self._lock = threading.Lock()
+        self._timer = None
+
+        self._background = False
+        self._expires_at = None
+        self._on_update = None
+        self._refresh = None
+        self._refresh_ahead = 60.0
+        self._token = None
+        self._updated_at = None
+
+    @staticmethod
+    def decode_expiry(token) -> float | None:
+        """
+        # Summary
+
+        Return the exp claim of JWT token, in seconds since the epoch, or
+        None if token is not a JWT or has no exp claim.  The signature is
+        not verified.
+        """
+        if not isinstance(token, str) or token.count(".") != 2:
+            return None
+        payload = token.split(".")[1]
+        try:
+            claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            return None
+        if not isinstance(claims, dict):
+            return None
+        expiry = claims.get("exp")
+        if isinstance(expiry, bool) or not isinstance(expiry, (int, float)):
+            return None
+        return float(expiry)
+
+    def update(self, token) -> None:
+        """
+        # Summary
+
+        Record a new token and its expiry, and call on_update (if set).
+        If background is True, (re)schedule the background refresh.
+        """
+        method_name = "update"
+        with self._lock:
+            self._token = token
+            self._expires_at = self.decode_expiry(token)
+            self._updated_at = time.time()
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Token expires at {self._expires_at}."
+                self.log.debug(msg)
+            self._schedule()
+        if self._on_update is not None:
+            self._on_update(token)
+
+    def needs_refresh(self) -> bool:
+        """
+        # Summary
+
+        Return True if the token expires within refresh_ahead seconds.
+        """
+        refresh_at = self._refresh_at()
+        if refresh_at is None:
+            return False
+        return time.time() >= refresh_at
+
+    def _refresh_at(self) -> float | None:
+        """
+        Return the time at which the token should be refreshed, or None if
+        its expiry is unknown.
+        """
+        expires_at = self._expires_at
+        if expires_at is None:
+            return None
+        lifetime = max(0.0, expires_at - self._updated_at)
+        return expires_at - min(self.refresh_ahead, lifetime / 2)
+
+    def _schedule(self) -> None:
+        """
+        Cancel any pending background refresh and, if background is True,
+        schedule one for the refresh time.  Called with _lock held.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        refresh_at = self._refresh_at()
+        if not self._background or refresh_at is None or self._refresh is None:
+            return
+        delay = max(0.0, refresh_at - time.time())
+        self._timer = threading.Timer(delay, self._background_refresh, args=(self._token,))
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _background_refresh(self, token) -> None:
+        """
+        Called from the background timer.  Errors are logged, not raised;
+        the next request refreshes lazily instead.
+        """
+        method_name = "_background_refresh"
+        try:
+            self._refresh(token)
+        except (TypeError, ValueError) as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "Background token refresh failed. "
+            msg += "The next request will retry. "
+            msg += f"Error detail: {error}"
+            self.log.warning(msg)
+
+    def stop(self) -> None:
+        """
+        # Summary
+
+        Cancel any pending background refresh.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    @property
+    def background(self) -> bool:
+        """
+        If True, refresh the token from a daemon timer refresh_ahead
+        seconds before it expires.
+        """
+        return self._background
+
+    @background.setter
+    def background(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            msg = f"{self.class_name}.background: "
+            msg += f"background must be a bool. Got {type(value).__name__}."
+            raise TypeError(msg)
+        with self._lock:
+            self._background = value
+            self._schedule()
+
+    @property
+    def expires_at(self) -> float | None:
+        """
+        Expiry of the current token, in seconds since the epoch, or None
+        if unknown.
+        """
+        return self._expires_at
+
+    @property
+    def on_update(self):
+        """
+        Callable called with each new token, e.g. to save it in a
+        TokenCache, or None.
+        """
+        return self._on_update
+
+    @on_update.setter
+    def on_update(self, value) -> None:
+        if value is not None and not callable(value):
+            msg = f"{self.class_name}.on_update: "
+            msg += f"on_update must be callable. Got {type(value).__name__}."
+            raise TypeError(msg)
+        self._on_update = value
+
+    @property
+    def refresh(self):
+        """
+        Callable that refreshes the token.  Called with the token that
+        needs refreshing, so that concurrent callers refresh only once.
+        """
+        return self._refresh
+
+    @refresh.setter
+    def refresh(self, value) -> None:
+        if value is not None and not callable(value):
+            msg = f"{self.class_name}.refresh: "
+            msg += f"refresh must be callable. Got {type(value).__name__}."
+            raise TypeError(msg)
+        self._refresh = value
+
+    @property
+    def refresh_ahead(self) -> float:
+        """
+        Seconds before expiry at which the token is refreshed.
+        """
+        return self._refresh_ahead
+
+    @refresh_ahead.setter
+    def refresh_ahead(self, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            msg = f"{self.class_name}.refresh_ahead: "
+            msg += f"refresh_ahead must be a number. Got {type(value).__name__}."
+            raise TypeError(msg)
+        if value < 0:
+            msg = f"{self.class_name}.refresh_ahead: "
+            msg += f"refresh_ahead must be >= 0. Got {value}."
+            raise ValueError(msg)
+        self._refresh_ahead = float(value)
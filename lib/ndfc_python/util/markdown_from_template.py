@@ -1,4 +1,3 @@
-import inspect
 import logging
 import sys
 
@@ -62,7 +61,7 @@ class MarkdownFromTemplate:
         Open the YAML self.property_map, and load its contents
         into self.property_map
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "load_property_map"
         if self.property_map_file is None:
             self.property_map = {}
             return
@@ -94,7 +93,7 @@ class MarkdownFromTemplate:
         Open the YAML self.template_path, and load its contents
         into self.contents
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "load_template"
         try:
             with open(self.template_file, "r", encoding="utf-8") as handle:
                 self.contents = yaml.safe_load(handle)
@@ -122,7 +121,7 @@ class MarkdownFromTemplate:
         """
         Generate the markdown.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "make_markdown"
         options = self.contents.get("options", {})
         config = options.get("config", {})
         if config.get("elements") != "dict":
@@ -160,7 +159,7 @@ class MarkdownFromTemplate:
 
         Called from commit()
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "validate"
         if self.markdown_file is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Exiting.  Set {self.class_name}.markdown_file "
@@ -0,0 +1,36 @@
+from pydantic import BaseModel, Field
+
+from .config_deploy import ConfigDeployConfig
+from .config_save import ConfigSaveConfig
+from .network_attach import NetworkAttachConfig
+from .network_create import NetworkCreateConfig
+from .vrf_attach import VrfAttachConfig
+from .vrf_create import VrfCreateConfig
+
+
+class PlanConfig(BaseModel):
+    """
+    # Summary
+
+    Desired state for PlanApply.  Each list takes the same items as the
+    config of the corresponding script (vrf_create.py, network_create.py,
+    vrf_attach.py, network_attach.py, config_save.py, config_deploy.py).
+    Every list is optional.
+    """
+
+    vrfs: list[VrfCreateConfig] = Field(default=[])
+    networks: list[NetworkCreateConfig] = Field(default=[])
+    vrf_attachments: list[VrfAttachConfig] = Field(default=[])
+    network_attachments: list[NetworkAttachConfig] = Field(default=[])
+    config_save: list[ConfigSaveConfig] = Field(default=[])
+    config_deploy: list[ConfigDeployConfig] = Field(default=[])
+
+
+class PlanConfigValidator(BaseModel):
+    """
+    # Summary
+
+    config is a PlanConfig
+    """
+
+    config: PlanConfig
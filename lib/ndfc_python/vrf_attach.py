@@ -37,11 +37,11 @@ Send vrf attach POST requests to the controller
 # We are using isort for import sorting.
 # pylint: disable=wrong-import-order
 
-import inspect
 import json
 import logging
 
 from ndfc_python.common.fabric.fabric_inventory import FabricInventory
+from ndfc_python.common.fabric.fabric_overlay_index import FabricOverlayIndex
 from ndfc_python.common.fabric.fabrics_info import FabricsInfo
 from ndfc_python.common.properties import Properties
 from ndfc_python.validations import Validations
@@ -67,6 +67,7 @@ class VrfAttach:
 
         self.fabric_inventory = FabricInventory()
         self.fabrics_info = FabricsInfo()
+        self.overlay_index = FabricOverlayIndex()
         self.properties = Properties()
         self.validations = Validations()
 
@@ -104,7 +105,7 @@ class VrfAttach:
         """
         final verification of all parameters
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_final_verification"
         if self.rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.rest_send must be set before calling "
@@ -174,6 +175,7 @@ class VrfAttach:
         Return False otherwise.
         """
         self.fabrics_info.rest_send = self.rest_send
+        self.fabrics_info.use_cache = True
         self.fabrics_info.commit()
         self.fabrics_info.filter = self.fabric_name
         return self.fabrics_info.fabric_exists
@@ -183,29 +185,16 @@ class VrfAttach:
         Return True if self.vrf exists in self.fabric_name.
         Else, return False
         """
-        method_name = inspect.stack()[0][3]
-        # TODO: update when this path is added to ansible-dcnm
-        path = f"{self.ep_fabrics}/{self.fabric_name}/vrfs"
-        verb = "GET"
-
+        method_name = "vrf_name_exists_in_fabric"
+        self.overlay_index.rest_send = self.rest_send
+        self.overlay_index.fabric_name = self.fabric_name
         try:
-            self.rest_send.path = path
-            self.rest_send.verb = verb
-            self.rest_send.commit()
-        except (TypeError, ValueError) as error:
+            return self.overlay_index.vrf_name_exists(self.vrf_name)
+        except ValueError as error:
             msg = f"{self.class_name}.{method_name}: "
-            msg += f"Unable to send {self.rest_send.verb} request to the controller. "
-            msg += f"Error details: {error}"
+            msg += f"{error}"
             raise ValueError(msg) from error
 
-        for item in self.rest_send.response_current["DATA"]:
-            if item.get("fabric") != self.fabric_name:
-                continue
-            if item.get("vrfName") != self.vrf_name:
-                continue
-            return True
-        return False
-
     def populate_fabric_inventory(self) -> None:
         """
         Get switch inventory for a specific fabric.
@@ -240,21 +229,54 @@ class VrfAttach:
         outer["MULTISITE_CONN"] = json.dumps({"MULTISITE_CONN": []})
         return json.dumps(outer)
 
-    def _build_lan_attach_list_item(self, switch_name: str) -> dict:
+    def build_instance_values(self, value: InstanceValues | dict) -> str:
+        """
+        Build the instanceValues property from an InstanceValues object
+        (or dict) and return it as a JSON string.
+        """
+        if isinstance(value, dict):
+            value = InstanceValues.model_validate(value)
+        return json.dumps(value.model_dump())
+
+    def _build_lan_attach_list_item(self, switch_name: str, extension_values: str, instance_values: str) -> dict:
         """
         Build the lanAttachList item for the payload.
+
+        extension_values and instance_values are the already-serialized
+        JSON strings, so that they are built once per attach rather than
+        once per switch.
         """
         _lan_attach_list_item = {}
         _lan_attach_list_item["deployment"] = True
-        _lan_attach_list_item["extensionValues"] = self.build_extension_values(self.extension_values)
+        _lan_attach_list_item["extensionValues"] = extension_values
         _lan_attach_list_item["fabric"] = self.fabric_name
         _lan_attach_list_item["freeformConfig"] = self.freeform_config
-        _lan_attach_list_item["instanceValues"] = json.dumps(self._instance_values.model_dump())
+        _lan_attach_list_item["instanceValues"] = instance_values
         _lan_attach_list_item["serialNumber"] = self.fabric_inventory.switch_name_to_serial_number(switch_name)
         _lan_attach_list_item["vlan"] = self.vlan
         _lan_attach_list_item["vrfName"] = self.vrf_name
         return _lan_attach_list_item
 
+    def build_lan_attach_list(self, extension_values: str | None = None, instance_values: str | None = None) -> list[dict]:
+        """
+        Build and return the lanAttachList items for switch_name and, if set,
+        peer_switch_name.
+
+        extension_values and instance_values are optional pre-serialized JSON
+        strings.  If None, they are built from the extension_values and
+        instance_values properties.  VrfAttachBulk passes them in so that
+        identical values are serialized only once per batch.
+        """
+        if extension_values is None:
+            extension_values = self.build_extension_values(self.extension_values)
+        if instance_values is None:
+            instance_values = self.build_instance_values(self.instance_values)
+        _lan_attach_list = []
+        _lan_attach_list.append(self._build_lan_attach_list_item(self.switch_name, extension_values, instance_values))
+        if self.peer_switch_name:
+            _lan_attach_list.append(self._build_lan_attach_list_item(self.peer_switch_name, extension_values, instance_values))
+        return _lan_attach_list
+
     def _build_payload(self) -> list[dict]:
         """
         Build and return the payload for the API request
@@ -262,12 +284,7 @@ class VrfAttach:
         _payload = []
         _payload_item = {}
         _payload_item["vrfName"] = self.vrf_name
-        _lan_attach_list = []
-        _lan_attach_list.append(self._build_lan_attach_list_item(self.switch_name))
-        if self.peer_switch_name:
-            _lan_attach_list.append(self._build_lan_attach_list_item(self.peer_switch_name))
-
-        _payload_item["lanAttachList"] = _lan_attach_list
+        _payload_item["lanAttachList"] = self.build_lan_attach_list()
         _payload.append(_payload_item)
         return _payload
 
@@ -275,7 +292,7 @@ class VrfAttach:
         """
         Attach a vrf to a switch
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         if not self._fabric_inventory_populated:
             self.populate_fabric_inventory()
 
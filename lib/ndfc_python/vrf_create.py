@@ -5,11 +5,12 @@ Description: Create VRFs
 
 # We use isort for import linting
 # pylint: disable=wrong-import-order
-import inspect
+import copy
 import json
 import logging
 from ipaddress import AddressValueError
 
+from ndfc_python.common.fabric.fabric_overlay_index import FabricOverlayIndex
 from ndfc_python.common.fabric.fabrics_info import FabricsInfo
 from ndfc_python.common.properties import Properties
 from ndfc_python.validations import Validations
@@ -25,6 +26,7 @@ class VrfCreate:
         self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
 
         self.fabrics_info = FabricsInfo()
+        self.overlay_index = FabricOverlayIndex()
         self.properties = Properties()
         self.validations = Validations()
 
@@ -141,21 +143,16 @@ class VrfCreate:
         self.template_config["vrfName"] = self.vrf_name
         self.template_config["vrfSegmentId"] = self.vrf_id
 
-    def _final_verification(self) -> None:
+    def _verify_mandatory_parameters(self) -> None:
         """
-        verify the following:
+        Verify that all mandatory payload and template_config
+        parameters are set.
 
-        - verify rest_send is set
-        - all mandatory parameters are set
-        - self.vrf does not already exist in self.fabric_name
-        """
-        method_name = inspect.stack()[0][3]
-        if self.rest_send is None:
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"{self.class_name}.rest_send must be set before calling "
-            msg += f"{self.class_name}.commit"
-            raise ValueError(msg)
+        # Raises
 
+        - ValueError if a mandatory parameter is not set
+        """
+        method_name = "_verify_mandatory_parameters"
         for param in self.mandatory_payload_set:
             if self.payload[param] == "":
                 msg = f"{self.class_name}.{method_name}: "
@@ -170,6 +167,43 @@ class VrfCreate:
                 msg += f"{self.class_name}.commit"
                 raise ValueError(msg)
 
+    def build_payload(self) -> dict:
+        """
+        # Summary
+
+        Verify mandatory parameters and return a copy of the VRF create
+        payload, with vrfTemplateConfig serialized, without contacting the
+        controller.
+
+        Used by VrfCreateBulk, which verifies the fabric and VRF against
+        the cached fabric list and overlay index itself.
+
+        # Raises
+
+        - ValueError if a mandatory parameter is not set
+        """
+        self._verify_mandatory_parameters()
+        payload = copy.deepcopy(self.payload)
+        payload["vrfTemplateConfig"] = json.dumps(self.template_config)
+        return payload
+
+    def _final_verification(self) -> None:
+        """
+        verify the following:
+
+        - verify rest_send is set
+        - all mandatory parameters are set
+        - self.vrf does not already exist in self.fabric_name
+        """
+        method_name = "_final_verification"
+        if self.rest_send is None:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{self.class_name}.rest_send must be set before calling "
+            msg += f"{self.class_name}.commit"
+            raise ValueError(msg)
+
+        self._verify_mandatory_parameters()
+
         if not self.fabric_exists():
             msg = f"{self.class_name}.{method_name}: "
             msg += f"fabric_name {self.fabric_name} "
@@ -190,7 +224,7 @@ class VrfCreate:
         # Raises
         - ValueError if unable to send request to the controller
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         self._final_verification()
 
         # path = f"{self.ndfc.url_top_down_fabrics}/{self.fabric_name}/vrfs"
@@ -217,45 +251,36 @@ class VrfCreate:
             msg += f"{self.rest_send.response_current.get('DATA', {}).get('message')}"
             raise ValueError(msg)
 
+        self.overlay_index.add_vrf(self.payload)
+
     def fabric_exists(self) -> bool:
         """
         Return True if self.fabric_name exists on the controller.
         Return False otherwise.
         """
         self.fabrics_info.rest_send = self.rest_send
+        self.fabrics_info.use_cache = True
         self.fabrics_info.commit()
         self.fabrics_info.filter = self.fabric_name
         return self.fabrics_info.fabric_exists
 
     def vrf_exists_in_fabric(self) -> bool:
         """
-        Return True if self.vrf exists in self.fabric_name.
+        Return True if self.vrf_name or self.vrf_id is in use in self.fabric_name.
         Else, return False
         """
-        method_name = inspect.stack()[0][3]
-        # TODO: update when this path is added to ansible-dcnm
-        path = f"/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/top-down/fabrics/{self.fabric_name}/vrfs"
-        verb = "GET"
-
+        method_name = "vrf_exists_in_fabric"
+        self.overlay_index.rest_send = self.rest_send
+        self.overlay_index.fabric_name = self.fabric_name
         try:
-            self.rest_send.path = path
-            self.rest_send.verb = verb
-            self.rest_send.payload = self.payload
-            self.rest_send.commit()
-        except (TypeError, ValueError) as error:
+            if self.overlay_index.vrf_name_exists(self.vrf_name):
+                return True
+            return self.overlay_index.vrf_id_exists(self.vrf_id)
+        except ValueError as error:
             msg = f"{self.class_name}.{method_name}: "
-            msg += f"Unable to send {self.rest_send.verb} request to the controller. "
-            msg += f"Error details: {error}"
+            msg += f"{error}"
             raise ValueError(msg) from error
 
-        for item in self.rest_send.response_current["DATA"]:
-            if item.get("fabric") != self.fabric_name:
-                continue
-            if item.get("vrfId") != self.vrf_id:
-                continue
-            return True
-        return False
-
     # top_level properties
     @property
     def display_name(self) -> str:
@@ -356,7 +381,7 @@ class VrfCreate:
 
     @advertise_host_route_flag.setter
     def advertise_host_route_flag(self, param: bool) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = "advertise_host_route_flag"
         try:
             self.validations.verify_boolean(param)
         except TypeError as error:
@@ -375,7 +400,7 @@ class VrfCreate:
 
     @advertise_default_route_flag.setter
     def advertise_default_route_flag(self, param: bool) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = "advertise_default_route_flag"
         try:
             self.validations.verify_boolean(param)
         except TypeError as error:
@@ -404,7 +429,7 @@ class VrfCreate:
 
     @bgp_password_key_type.setter
     def bgp_password_key_type(self, param: str) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = "bgp_password_key_type"
         try:
             self.validations.verify_bgp_password_key_type(param)
         except ValueError as error:
@@ -423,7 +448,7 @@ class VrfCreate:
 
     @configure_static_default_route_flag.setter
     def configure_static_default_route_flag(self, param: bool) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = "configure_static_default_route_flag"
         try:
             self.validations.verify_boolean(param)
         except TypeError as error:
@@ -441,7 +466,7 @@ class VrfCreate:
 
     @enable_netflow.setter
     def enable_netflow(self, param: bool) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = "enable_netflow"
         try:
             self.validations.verify_boolean(param)
         except TypeError as error:
@@ -459,7 +484,7 @@ class VrfCreate:
 
     @ipv6_link_local_flag.setter
     def ipv6_link_local_flag(self, param: bool) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = "ipv6_link_local_flag"
         try:
             self.validations.verify_boolean(param)
         except TypeError as error:
@@ -477,7 +502,7 @@ class VrfCreate:
 
     @is_rp_external.setter
     def is_rp_external(self, param: bool) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = "is_rp_external"
         try:
             self.validations.verify_boolean(param)
         except TypeError as error:
@@ -495,7 +520,7 @@ class VrfCreate:
 
     @l3_vni_mcast_group.setter
     def l3_vni_mcast_group(self, param: str) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = "l3_vni_mcast_group"
         try:
             self.validations.verify_ipv4_multicast_address(param)
         except AddressValueError as error:
@@ -513,7 +538,7 @@ class VrfCreate:
 
     @loopback_number.setter
     def loopback_number(self, param: str) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = "loopback_number"
         try:
             self.validations.verify_loopback_id(param)
         except ValueError as error:
@@ -531,7 +556,7 @@ class VrfCreate:
 
     @max_bgp_paths.setter
     def max_bgp_paths(self, param: int) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = "max_bgp_paths"
         try:
             self.validations.verify_max_bgp_paths(param)
         except ValueError as error:
@@ -549,7 +574,7 @@ class VrfCreate:
 
     @max_ibgp_paths.setter
     def max_ibgp_paths(self, param: int) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = "max_ibgp_paths"
         try:
             self.validations.verify_max_bgp_paths(param)
         except ValueError as error:
@@ -567,7 +592,7 @@ class VrfCreate:
 
     @multicast_group.setter
     def multicast_group(self, param: str) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = "multicast_group"
         try:
             self.validations.verify_ipv4_multicast_address(param)
         except AddressValueError as error:
@@ -585,7 +610,7 @@ class VrfCreate:
 
     @mtu.setter
     def mtu(self, param: str) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = "mtu"
         try:
             self.validations.verify_mtu(param)
         except ValueError as error:
@@ -614,7 +639,7 @@ class VrfCreate:
 
     @nve_id.setter
     def nve_id(self, param: str) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = "nve_id"
         try:
             self.validations.verify_nve_id(param)
         except ValueError as error:
@@ -632,7 +657,7 @@ class VrfCreate:
 
     @rp_address.setter
     def rp_address(self, param: str) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = "rp_address"
         try:
             self.validations.verify_ipv4_address(param)
         except AddressValueError as error:
@@ -650,7 +675,7 @@ class VrfCreate:
 
     @tag.setter
     def tag(self, param: str) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = "tag"
         try:
             self.validations.verify_routing_tag(param)
         except ValueError as error:
@@ -668,7 +693,7 @@ class VrfCreate:
 
     @trm_bgw_msite_enabled.setter
     def trm_bgw_msite_enabled(self, param: bool) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = "trm_bgw_msite_enabled"
         try:
             self.validations.verify_boolean(param)
         except TypeError as error:
@@ -686,7 +711,7 @@ class VrfCreate:
 
     @trm_enabled.setter
     def trm_enabled(self, param: bool) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = "trm_enabled"
         try:
             self.validations.verify_boolean(param)
         except TypeError as error:
@@ -737,7 +762,7 @@ class VrfCreate:
 
     @vrf_vlan_id.setter
     def vrf_vlan_id(self, param: str) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = "vrf_vlan_id"
         try:
             self.validations.verify_vrf_vlan_id(param)
         except ValueError as error:
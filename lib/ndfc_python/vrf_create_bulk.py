@@ -0,0 +1,320 @@
+"""
+# Name
+
+vrf_create_bulk.py
+
+# Description
+
+Create many VRFs, validated together against one overlay snapshot,
+with at most max_workers create requests in flight.
+
+VrfCreate validates and sends one VRF at a time.  VrfCreateBulk validates
+an entire configuration up front, against the cached fabric list and a
+single FabricOverlayIndex snapshot per fabric, including duplicate vrfName,
+vrfId and vrfVlanId within the configuration itself.  Nothing is sent if
+any item is invalid.
+
+The controller's VRF create endpoint takes one VRF per POST, so the POSTs
+are sent concurrently through RequestPipeline.  As each VRF is created, it
+is added to the overlay index so that a following NetworkCreateBulk or
+VrfAttachBulk in the same process sees it without re-reading the fabric.
+
+RestSend sends one request at a time, so the POSTs bypass it: RestSend's
+response_handler is not used, and nothing is recorded in a Results
+instance.  item_results and responses report the outcome of each VRF
+instead.  rest_send.check_mode is honored: if True, nothing is sent and
+each VRF is reported as created.
+"""
+
+# We are using isort for import sorting.
+# pylint: disable=wrong-import-order
+
+import logging
+
+from ndfc_python.common.fabric.fabric_overlay_index import FabricOverlayIndex
+from ndfc_python.common.fabric.fabrics_info import FabricsInfo
+from ndfc_python.common.properties import Properties
+from ndfc_python.request_pipeline import RequestPipeline
+from ndfc_python.sender_request import SenderRequest
+from ndfc_python.validators.vrf_create import VrfCreateConfig
+from ndfc_python.vrf_create import VrfCreate
+
+
+class VrfCreateBulk:
+    """
+    # Summary
+
+    Create many VRFs with concurrent requests.
+
+    ## Usage
+
+    ```python
+    instance = VrfCreateBulk()
+    instance.rest_send = rest_send
+    instance.config = validator.config  # list[VrfCreateConfig]
+    instance.max_workers = 8
+    instance.commit()
+    for item in instance.item_results:
+        print(item)
+    ```
+
+    ## Raises
+
+    - ValueError from commit() if rest_send is not set, or if
+      any config item fails validation.  All validation errors are
+      reported together and nothing is sent.
+
+    ## Properties
+
+    - config (list[VrfCreateConfig]): getter/setter: VRFs to create
+    - item_results (list[dict]): getter: one result per VRF, with keys
+      fabric_name, vrf_name, vrf_id, success (bool) and message (str)
+    - max_workers (int): getter/setter: maximum requests in flight.  Default 8.
+    - responses (list[dict]): getter: controller response for each POST
+    - rest_send (RestSend): getter/setter: RestSend instance whose sender,
+      and check_mode, are used for REST calls
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
+
+        self.fabrics_info = FabricsInfo()
+        self.overlay_index = FabricOverlayIndex()
+        self.pipeline = RequestPipeline()
+        self.properties = Properties()
+        self.rest_send = self.properties.rest_send
+
+        self.api_v1 = "/appcenter/cisco/ndfc/api/v1"
+        self.ep_fabrics = f"{self.api_v1}/lan-fabric/rest/top-down/fabrics"
+
+        self._config = []
+        self._item_results = []
+        self._responses = []
+
+    def _final_verification(self) -> None:
+        """
+        Verify that mandatory properties are set.
+        """
+        method_name = "_final_verification"
+        if self.rest_send is None:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{self.class_name}.rest_send must be set before calling "
+            msg += f"{self.class_name}.commit"
+            raise ValueError(msg)
+
+    def _create_instance(self, cfg: VrfCreateConfig) -> VrfCreate:
+        """
+        Return a VrfCreate instance populated from cfg.  VrfCreate
+        performs the same conversions and validation as for a single create.
+        """
+        instance = VrfCreate()
+        instance.rest_send = self.rest_send
+        instance.display_name = cfg.vrf_display_name
+        instance.fabric_name = cfg.fabric_name
+        instance.vrf_id = cfg.vrf_id
+        instance.vrf_name = cfg.vrf_name
+        instance.vrf_vlan_id = cfg.vrf_vlan_id
+        return instance
+
+    def _missing_fabrics(self) -> set[str]:
+        """
+        Return the fabric names in config that do not exist on the controller,
+        checking each distinct fabric once against the cached fabric list.
+        """
+        self.fabrics_info.rest_send = self.rest_send
+        self.fabrics_info.use_cache = True
+        self.fabrics_info.commit()
+        missing_fabrics = set()
+        for fabric_name in {cfg.fabric_name for cfg in self.config}:
+            self.fabrics_info.filter = fabric_name
+            if self.fabrics_info.fabric_exists is False:
+                missing_fabrics.add(fabric_name)
+        return missing_fabrics
+
+    def _verify_item(self, cfg: VrfCreateConfig, missing_fabrics: set[str], seen: dict[str, dict[str, set]]) -> None:
+        """
+        Verify one config item against the fabrics missing from the
+        controller (missing_fabrics), the overlay index, and the items
+        already verified in this config (seen).
+
+        ## Raises
+
+        - ValueError if the item is invalid.
+        """
+        if cfg.fabric_name in missing_fabrics:
+            msg = f"fabric_name {cfg.fabric_name} does not exist on the controller."
+            raise ValueError(msg)
+
+        self.overlay_index.rest_send = self.rest_send
+        self.overlay_index.fabric_name = cfg.fabric_name
+        if self.overlay_index.vrf_name_exists(cfg.vrf_name):
+            msg = f"VRF {cfg.vrf_name} already exists in fabric {cfg.fabric_name}."
+            raise ValueError(msg)
+        if self.overlay_index.vrf_id_exists(cfg.vrf_id):
+            msg = f"vrfId {cfg.vrf_id} already exists in fabric {cfg.fabric_name}."
+            raise ValueError(msg)
+        if self.overlay_index.vlan_id_in_use(cfg.vrf_vlan_id):
+            msg = f"vrfVlanId {cfg.vrf_vlan_id} is already in use in fabric {cfg.fabric_name}."
+            raise ValueError(msg)
+
+        fabric_seen = seen.setdefault(cfg.fabric_name, {"vrf_id": set(), "vrf_name": set(), "vrf_vlan_id": set()})
+        if cfg.vrf_name in fabric_seen["vrf_name"]:
+            msg = f"VRF {cfg.vrf_name} appears more than once for fabric {cfg.fabric_name}."
+            raise ValueError(msg)
+        if cfg.vrf_id in fabric_seen["vrf_id"]:
+            msg = f"vrfId {cfg.vrf_id} appears more than once for fabric {cfg.fabric_name}."
+            raise ValueError(msg)
+        if cfg.vrf_vlan_id in fabric_seen["vrf_vlan_id"]:
+            msg = f"vrfVlanId {cfg.vrf_vlan_id} appears more than once for fabric {cfg.fabric_name}."
+            raise ValueError(msg)
+        fabric_seen["vrf_id"].add(cfg.vrf_id)
+        fabric_seen["vrf_name"].add(cfg.vrf_name)
+        fabric_seen["vrf_vlan_id"].add(cfg.vrf_vlan_id)
+
+    def _build_payloads(self) -> list[dict]:
+        """
+        # Summary
+
+        Validate every config item and return one payload per VRF, in
+        config order.
+
+        ## Raises
+
+        - ValueError listing every invalid config item.
+        """
+        method_name = "_build_payloads"
+        errors = []
+        payloads = []
+        seen: dict[str, dict[str, set]] = {}
+        missing_fabrics = self._missing_fabrics()
+        for index, cfg in enumerate(self.config):
+            try:
+                self._verify_item(cfg, missing_fabrics, seen)
+                payloads.append(self._create_instance(cfg).build_payload())
+            except (TypeError, ValueError) as error:
+                errors.append(f"config[{index}] (fabric {cfg.fabric_name}, vrf {cfg.vrf_name}): {error}")
+
+        if errors:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{len(errors)} invalid config item(s). Nothing was sent. "
+            msg += "; ".join(errors)
+            raise ValueError(msg)
+
+        return payloads
+
+    def _record_result(self, payload: dict, response: dict) -> None:
+        """
+        Append an item_results entry for payload and, if the VRF was
+        created (not merely simulated in check_mode), add it to the overlay
+        index.
+        """
+        return_code = response.get("RETURN_CODE")
+        success = return_code in (200, 201)
+        message = ""
+        if not success:
+            data = response.get("DATA")
+            if isinstance(data, dict) and data.get("message"):
+                message = str(data["message"])
+            else:
+                message = str(response.get("MESSAGE") or data)
+        result = {}
+        result["fabric_name"] = payload["fabric"]
+        result["vrf_name"] = payload["vrfName"]
+        result["vrf_id"] = payload["vrfId"]
+        result["success"] = success
+        result["message"] = message
+        self._item_results.append(result)
+
+        if success and not response.get("CHECK_MODE"):
+            self.overlay_index.fabric_name = payload["fabric"]
+            self.overlay_index.add_vrf(payload)
+
+    @staticmethod
+    def _check_mode_response(request: SenderRequest) -> dict:
+        """
+        Return the simulated response for request, which is not sent, in
+        check_mode.
+        """
+        response = {}
+        response["CHECK_MODE"] = True
+        response["DATA"] = {"simulated": "check-mode-response", "status": "Success"}
+        response["MESSAGE"] = "OK"
+        response["METHOD"] = request.verb
+        response["REQUEST_PATH"] = request.path
+        response["RETURN_CODE"] = 200
+        return response
+
+    def commit(self) -> None:
+        """
+        # Summary
+
+        Validate the whole config, then create all VRFs with at most
+        max_workers requests in flight.
+
+        A failed request does not stop the remaining requests.  Check
+        item_results for the outcome of each VRF.
+
+        ## Raises
+
+        - ValueError if mandatory properties are not set, or any config
+          item is invalid.
+        """
+        self._final_verification()
+        self._item_results = []
+        self._responses = []
+        payloads = self._build_payloads()
+
+        requests = []
+        for payload in payloads:
+            path = f"{self.ep_fabrics}/{payload['fabric']}/vrfs"
+            requests.append(SenderRequest("POST", path, payload))
+
+        if self.rest_send.check_mode is True:
+            responses = [self._check_mode_response(request) for request in requests]
+        else:
+            self.pipeline.rest_send = self.rest_send
+            responses = self.pipeline.commit(requests)
+        for payload, response in zip(payloads, responses):
+            self._responses.append(response)
+            self._record_result(payload, response)
+
+    @property
+    def config(self) -> list[VrfCreateConfig]:
+        """
+        The list of VRF create config items.
+        """
+        return self._config
+
+    @config.setter
+    def config(self, value: list[VrfCreateConfig]) -> None:
+        if not isinstance(value, list):
+            msg = f"{self.class_name}.config: "
+            msg += f"config must be a list of VrfCreateConfig. Got {type(value).__name__}."
+            raise TypeError(msg)
+        self._config = value
+
+    @property
+    def item_results(self) -> list[dict]:
+        """
+        One result dictionary per VRF, populated by commit().
+        """
+        return self._item_results
+
+    @property
+    def max_workers(self) -> int:
+        """
+        Maximum number of create requests in flight.
+        """
+        return self.pipeline.max_workers
+
+    @max_workers.setter
+    def max_workers(self, value: int) -> None:
+        self.pipeline.max_workers = value
+
+    @property
+    def responses(self) -> list[dict]:
+        """
+        The controller response for each POST, populated by commit().
+        """
+        return self._responses
@@ -5,11 +5,10 @@ Description: Delete VRFs
 
 # We use isort for import linting
 # pylint: disable=wrong-import-order
-import copy
-import inspect
 import logging
 import re
 
+from ndfc_python.common.fabric.fabric_overlay_index import FabricOverlayIndex
 from ndfc_python.common.fabric.fabrics_info import FabricsInfo
 from ndfc_python.common.properties import Properties
 from ndfc_python.validations import Validations
@@ -31,6 +30,7 @@ class VrfDelete:
         self.log = logging.getLogger(f"ndfc_python.{self.class_name}")
 
         self.fabrics_info = FabricsInfo()
+        self.overlay_index = FabricOverlayIndex()
         self.properties = Properties()
         self.validations = Validations()
 
@@ -38,33 +38,6 @@ class VrfDelete:
 
         self._fabric_name = None
 
-        # _vrf_cache is keyed on fabric_name
-        # The value is a dictionary, keyed on vrf_name.
-        # _vrf_cache = {
-        #     "fabric_1": {
-        #        "vrf_1": {
-        #            "fabric": "fabric_1",
-        #            "vrfName": "vrf_1",
-        #            "vrfTemplate": "Default_VRF_Universal",
-        #            "vrfExtensionTemplate": "Default_VRF_Extension_Universal",
-        #            "vrfTemplateConfig": "stringified template config key/value pairs"
-        #            "id": 12,
-        #            "vrfId": 50002,
-        #            "tenantName": "",
-        #            "vrfServiceTemplate": null,
-        #            "source": null,
-        #            "vrfStatus": "NA",
-        #            "hierarchicalKey": "fabric_1"
-        #            etc...
-        #        },
-        #        "vrf_2": {vrf info for vrf_2}
-        #     },
-        #    "fabric_2": {
-        #        "vrf_3": {vrf info for vrf_3},
-        #        "vrf_4": {vrf info for vrf_4}
-        #    }
-        # }
-        self._vrf_cache = {}
         self._vrf_names = None
 
     def _final_verification(self) -> None:
@@ -80,7 +53,7 @@ class VrfDelete:
 
         - `ValueError` if above verifications fail.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_final_verification"
         if self.rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.rest_send must be set before calling "
@@ -124,7 +97,7 @@ class VrfDelete:
 
         - ValueError if an error is encountered while sending the request.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         self._final_verification()
 
         vrf_names = ",".join(self.vrf_names)
@@ -143,6 +116,8 @@ class VrfDelete:
             raise ValueError(msg) from error
 
         if self.rest_send.result_current.get("success") is False:
+            # Some VRFs may have been deleted.  Discard the index rather than guess.
+            self.overlay_index.invalidate()
             failure_list = self.rest_send.response_current.get("DATA", {}).get("failureList", [])
             errmsg = ", ".join([item.get("message", "") for item in failure_list])
             errmsg = re.sub(r"\t", " ", errmsg)
@@ -152,12 +127,16 @@ class VrfDelete:
             msg += f"More detail (if any): {errmsg}"
             raise ValueError(msg)
 
+        for vrf_name in self.vrf_names:
+            self.overlay_index.remove_vrf(vrf_name)
+
     def fabric_exists(self) -> bool:
         """
         Return True if self.fabric_name exists on the controller.
         Return False otherwise.
         """
         self.fabrics_info.rest_send = self.rest_send
+        self.fabrics_info.use_cache = True
         self.fabrics_info.commit()
         self.fabrics_info.filter = self.fabric_name
         return self.fabrics_info.fabric_exists
@@ -166,47 +145,20 @@ class VrfDelete:
         """
         # Summary
 
-        Get information for all vrfs in self.fabric_name and cache the results.
-
-        For each vrf in self.fabric_name, set:
-
-        self._vrf_cache[self.fabric_name][vrf_name] = {vrf_info dict}
+        Retrieve (if not already indexed) information for all vrfs in
+        self.fabric_name.  See FabricOverlayIndex.
 
         ## Raises
 
         -   `ValueError` if errors are encountered retrieving VRF information
             from the controller.
         """
-        if self._vrf_cache.get(self.fabric_name) is not None:
-            return
-        method_name = inspect.stack()[0][3]
-        # TODO: update when this path is added to ansible-dcnm
-        path = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/top-down/fabrics"
-        path += f"/{self.fabric_name}/vrfs"
-        verb = "GET"
-
+        method_name = "get_vrfs"
+        self.overlay_index.rest_send = self.rest_send
+        self.overlay_index.fabric_name = self.fabric_name
         try:
-            self.rest_send.path = path
-            self.rest_send.verb = verb
-            self.rest_send.commit()
-            data = self.rest_send.response_current["DATA"]
-            if not isinstance(data, list):
-                if data.get("message") == "Resource not found":
-                    error = f"Fabric {self.fabric_name} does not exist "
-                    error += "on the controller."
-                else:
-                    error = data.get("message")
-                raise ValueError(error)
-
-            if self.fabric_name not in self._vrf_cache:
-                self._vrf_cache[self.fabric_name] = {}
-
-            for item in data:
-                vrf_name = item.get("vrfName")
-                if vrf_name is None:
-                    continue
-                self._vrf_cache[self.fabric_name][vrf_name] = copy.deepcopy(item)
-        except (TypeError, ValueError) as error:
+            self.overlay_index.load_vrfs()
+        except ValueError as error:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{error}"
             raise ValueError(msg) from error
@@ -219,11 +171,7 @@ class VrfDelete:
 
         Return False otherwise.
         """
-        if self.fabric_name not in self._vrf_cache:
-            return False
-        if vrf_name not in self._vrf_cache[self.fabric_name]:
-            return False
-        return True
+        return self.overlay_index.vrf_name_exists(vrf_name)
 
     @property
     def fabric_name(self) -> str:
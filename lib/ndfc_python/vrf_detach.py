@@ -33,10 +33,10 @@ Send vrf detach POST requests to the controller
 # We are using isort for import sorting.
 # pylint: disable=wrong-import-order
 
-import inspect
 import logging
 
 from ndfc_python.common.fabric.fabric_inventory import FabricInventory
+from ndfc_python.common.fabric.fabric_overlay_index import FabricOverlayIndex
 from ndfc_python.common.fabric.fabrics_info import FabricsInfo
 from ndfc_python.common.properties import Properties
 from ndfc_python.validations import Validations
@@ -71,6 +71,7 @@ class VrfDetach:
 
         self.fabric_inventory = FabricInventory()
         self.fabrics_info = FabricsInfo()
+        self.overlay_index = FabricOverlayIndex()
         self.properties = Properties()
         self.validations = Validations()
 
@@ -92,7 +93,7 @@ class VrfDetach:
         ValueError
             If any required parameter is missing or invalid
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_final_verification"
         if self.rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.rest_send must be set before calling "
@@ -161,29 +162,16 @@ class VrfDetach:
         ValueError
             Unable to send GET request to the controller
         """
-        method_name = inspect.stack()[0][3]
-        # TODO: update when this path is added to ansible-dcnm
-        path = f"/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/top-down/fabrics/{self.fabric_name}/vrfs"
-        verb = "GET"
-
+        method_name = "vrf_name_exists_in_fabric"
+        self.overlay_index.rest_send = self.rest_send
+        self.overlay_index.fabric_name = self.fabric_name
         try:
-            self.rest_send.path = path
-            self.rest_send.verb = verb
-            self.rest_send.commit()
-        except (TypeError, ValueError) as error:
+            return self.overlay_index.vrf_name_exists(self.vrf_name)
+        except ValueError as error:
             msg = f"{self.class_name}.{method_name}: "
-            msg += f"Unable to send {self.rest_send.verb} request to the controller. "
-            msg += f"Error details: {error}"
+            msg += f"{error}"
             raise ValueError(msg) from error
 
-        for item in self.rest_send.response_current["DATA"]:
-            if item.get("fabric") != self.fabric_name:
-                continue
-            if item.get("vrfName") != self.vrf_name:
-                continue
-            return True
-        return False
-
     def _build_payload(self) -> list[dict]:
         """
         Build and return the payload for the API request
@@ -213,7 +201,7 @@ class VrfDetach:
         """
         Detach a vrf from a switch
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         self._final_verification()
         self.fabric_inventory.fabric_name = self.fabric_name
         self.fabric_inventory.rest_send = self.rest_send
@@ -1,7 +1,7 @@
 import copy
-import inspect
 
 import yaml
+from ndfc_python.read_only_dict import ReadOnlyDict
 
 
 class YamlReader:
@@ -47,7 +47,7 @@ class YamlReader:
         # Raises
         - ValueError if user input is invalid
         """
-        method_name = inspect.stack()[1][0]
+        method_name = "validate"
         if self.filename is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.filename must be set before "
@@ -63,7 +63,7 @@ class YamlReader:
         # Raises
         - ValueError if ``filename`` cannot be read.
         """
-        method_name = inspect.stack()[1][0]
+        method_name = "commit"
         self.validate()
         try:
             with open(self.filename, "r", encoding="UTF-8") as file:
@@ -91,9 +91,23 @@ class YamlReader:
         """
         # Summary
         Return the contents of ``filename`` as a python dictionary.
+
+        If the contents are a dict, they are returned as a ReadOnlyDict,
+        without copying.  Nested values are shared and must not be
+        modified.  Use contents_copy for a mutable copy.
         """
-        return copy.deepcopy(self._contents)
+        return self._contents
 
     @contents.setter
     def contents(self, value):
+        if isinstance(value, dict) and not isinstance(value, ReadOnlyDict):
+            value = ReadOnlyDict(value)
         self._contents = value
+
+    @property
+    def contents_copy(self):
+        """
+        # Summary
+        Return a mutable deep copy of contents.
+        """
+        return copy.deepcopy(self._contents)